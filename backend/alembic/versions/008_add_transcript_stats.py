@@ -0,0 +1,91 @@
+"""Add transcript_stats projection.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+# Same as app.modules.transcripts.stats (migrations don't import app code)
+PREVIEW_SEGMENTS = 3
+PREVIEW_CHARS = 240
+
+
+def upgrade() -> None:
+    """Create transcript_stats table and backfill one row per existing transcript."""
+    op.create_table(
+        'transcript_stats',
+        sa.Column('transcript_id', sa.Integer(), nullable=False),
+        sa.Column('segments_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('total_chars', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('avg_confidence', sa.Float(), nullable=True),
+        sa.Column('preview', sa.Text(), nullable=False, server_default=''),
+        sa.Column('last_segment_end_ms', sa.Integer(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['transcript_id'], ['transcripts.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('transcript_id')
+    )
+
+    # Same values as stats.compute_stats() - listings and autonomy checks read
+    # the projection, a missing row would look like an empty transcript
+    op.execute(
+        """
+        INSERT INTO transcript_stats (
+            transcript_id, segments_count, total_chars, avg_confidence, preview,
+            last_segment_end_ms, updated_at
+        )
+        SELECT
+            t.id,
+            COUNT(s.id),
+            COALESCE(SUM(LENGTH(s.text)), 0),
+            AVG(s.confidence),
+            '',
+            MAX(s.end_ms),
+            CURRENT_TIMESTAMP
+        FROM transcripts t
+        LEFT JOIN transcript_segments s ON s.transcript_id = t.id
+        GROUP BY t.id
+        """
+    )
+
+    # Preview: first PREVIEW_SEGMENTS texts by start_ms, joined and truncated
+    bind = op.get_bind()
+    first_segments = bind.execute(sa.text(
+        """
+        SELECT transcript_id, text FROM (
+            SELECT transcript_id, text,
+                   ROW_NUMBER() OVER (PARTITION BY transcript_id ORDER BY start_ms) AS n
+            FROM transcript_segments
+        ) AS numbered
+        WHERE n <= :segments
+        ORDER BY transcript_id, n
+        """
+    ), {"segments": PREVIEW_SEGMENTS})
+    texts = {}
+    for transcript_id, text in first_segments:
+        texts.setdefault(transcript_id, []).append(text)
+    previews = []
+    for transcript_id, segment_texts in texts.items():
+        preview = " ".join(segment_texts)
+        if len(preview) > PREVIEW_CHARS:
+            preview = preview[:PREVIEW_CHARS] + "..."
+        previews.append({"transcript_id": transcript_id, "preview": preview})
+    if previews:
+        bind.execute(
+            sa.text("UPDATE transcript_stats SET preview = :preview WHERE transcript_id = :transcript_id"),
+            previews,
+        )
+
+
+def downgrade() -> None:
+    """Drop transcript_stats table."""
+    op.drop_table('transcript_stats')
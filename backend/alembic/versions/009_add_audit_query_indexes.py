@@ -0,0 +1,33 @@
+"""Add composite indexes for audit trail queries.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create (filter, created_at) indexes for keyset pagination."""
+    op.create_index('idx_project_audit_project_created', 'project_audit_events', ['project_id', 'created_at'], unique=False)
+    op.create_index('idx_project_audit_action_created', 'project_audit_events', ['action', 'created_at'], unique=False)
+    op.create_index('idx_transcript_audit_transcript_created', 'transcript_audit_events', ['transcript_id', 'created_at'], unique=False)
+    op.create_index('idx_transcript_audit_action_created', 'transcript_audit_events', ['action', 'created_at'], unique=False)
+    op.create_index('idx_transcript_audit_created', 'transcript_audit_events', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop audit query indexes."""
+    op.drop_index('idx_transcript_audit_created', table_name='transcript_audit_events')
+    op.drop_index('idx_transcript_audit_action_created', table_name='transcript_audit_events')
+    op.drop_index('idx_transcript_audit_transcript_created', table_name='transcript_audit_events')
+    op.drop_index('idx_project_audit_action_created', table_name='project_audit_events')
+    op.drop_index('idx_project_audit_project_created', table_name='project_audit_events')
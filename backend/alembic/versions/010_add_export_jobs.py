@@ -0,0 +1,49 @@
+"""Add export_jobs table for background record exports.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create export_jobs table."""
+    op.create_table(
+        'export_jobs',
+        sa.Column('id', sa.String(length=36), nullable=False),
+        sa.Column('receipt_id', sa.String(length=36), nullable=False),
+        sa.Column('transcript_id', sa.Integer(), nullable=False),
+        sa.Column('audio_mode', sa.String(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False, server_default='queued'),
+        sa.Column('bytes_done', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('bytes_total', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('zip_path', sa.String(), nullable=True),
+        sa.Column('error_type', sa.String(), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['transcript_id'], ['transcripts.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_export_jobs_transcript_id'), 'export_jobs', ['transcript_id'], unique=False)
+    op.create_index(op.f('ix_export_jobs_status'), 'export_jobs', ['status'], unique=False)
+    op.create_index(op.f('ix_export_jobs_created_at'), 'export_jobs', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop export_jobs table."""
+    op.drop_index(op.f('ix_export_jobs_created_at'), table_name='export_jobs')
+    op.drop_index(op.f('ix_export_jobs_status'), table_name='export_jobs')
+    op.drop_index(op.f('ix_export_jobs_transcript_id'), table_name='export_jobs')
+    op.drop_table('export_jobs')
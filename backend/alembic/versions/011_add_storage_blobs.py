@@ -0,0 +1,61 @@
+"""Add reference-counted storage_blobs; allow shared blobs across assets.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create storage_blobs, backfill refcounts, drop sha256 uniqueness, add FKs."""
+    op.create_table(
+        'storage_blobs',
+        sa.Column('sha256', sa.String(length=64), nullable=False),
+        sa.Column('size_bytes', sa.Integer(), nullable=False),
+        sa.Column('ref_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('sha256')
+    )
+
+    # One reference per existing asset row
+    op.execute(
+        """
+        INSERT INTO storage_blobs (sha256, size_bytes, ref_count, created_at, updated_at)
+        SELECT sha256, MAX(size_bytes), COUNT(*), MIN(created_at), MIN(created_at)
+        FROM (
+            SELECT sha256, size_bytes, created_at FROM audio_assets
+            UNION ALL
+            SELECT sha256, size_bytes, created_at FROM project_files
+        ) AS refs
+        GROUP BY sha256
+        """
+    )
+
+    # Same content may now back several assets
+    op.drop_index('ix_audio_assets_sha256', table_name='audio_assets')
+    op.create_index('ix_audio_assets_sha256', 'audio_assets', ['sha256'], unique=False)
+    op.drop_constraint('project_files_sha256_key', 'project_files', type_='unique')
+
+    op.create_foreign_key('fk_audio_assets_sha256_storage_blobs', 'audio_assets', 'storage_blobs', ['sha256'], ['sha256'])
+    op.create_foreign_key('fk_project_files_sha256_storage_blobs', 'project_files', 'storage_blobs', ['sha256'], ['sha256'])
+
+
+def downgrade() -> None:
+    """Drop storage_blobs (fails if assets share a blob)."""
+    op.drop_constraint('fk_project_files_sha256_storage_blobs', 'project_files', type_='foreignkey')
+    op.drop_constraint('fk_audio_assets_sha256_storage_blobs', 'audio_assets', type_='foreignkey')
+    op.create_unique_constraint('project_files_sha256_key', 'project_files', ['sha256'])
+    op.drop_index('ix_audio_assets_sha256', table_name='audio_assets')
+    op.create_index('ix_audio_assets_sha256', 'audio_assets', ['sha256'], unique=True)
+    op.drop_table('storage_blobs')
@@ -0,0 +1,33 @@
+"""Add size_bytes and expires_at to export_jobs (export registry).
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add export registry columns and expires_at index.
+
+    Existing rows keep expires_at NULL - purge expires them by created_at.
+    """
+    op.add_column('export_jobs', sa.Column('size_bytes', sa.BigInteger(), nullable=True))
+    op.add_column('export_jobs', sa.Column('expires_at', sa.DateTime(), nullable=True))
+    op.create_index(op.f('ix_export_jobs_expires_at'), 'export_jobs', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop export registry columns."""
+    op.drop_index(op.f('ix_export_jobs_expires_at'), table_name='export_jobs')
+    op.drop_column('export_jobs', 'expires_at')
+    op.drop_column('export_jobs', 'size_bytes')
@@ -0,0 +1,41 @@
+"""Add integrity_nodes table (Merkle manifest per project).
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create integrity_nodes.
+
+    Existing projects have no manifest until the backfill runs:
+        python -m app.modules.projects.merkle_runner
+    """
+    op.create_table(
+        'integrity_nodes',
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('path', sa.String(), nullable=False),
+        sa.Column('parent_path', sa.String(), nullable=True),
+        sa.Column('hash', sa.String(length=64), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('project_id', 'path'),
+    )
+    op.create_index('idx_integrity_nodes_parent', 'integrity_nodes', ['project_id', 'parent_path'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop integrity_nodes."""
+    op.drop_index('idx_integrity_nodes_parent', table_name='integrity_nodes')
+    op.drop_table('integrity_nodes')
@@ -0,0 +1,40 @@
+"""Add blob_integrity_status table (background scrubber results).
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create blob_integrity_status (empty - every blob is due on the first scrub)."""
+    op.create_table(
+        'blob_integrity_status',
+        sa.Column('sha256', sa.String(length=64), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('ciphertext_sha256', sa.String(length=64), nullable=True),
+        sa.Column('error_type', sa.String(), nullable=True),
+        sa.Column('checked_at', sa.DateTime(), nullable=False),
+        sa.Column('last_ok_at', sa.DateTime(), nullable=True),
+        sa.Column('failures', sa.Integer(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('sha256'),
+    )
+    op.create_index(op.f('ix_blob_integrity_status_status'), 'blob_integrity_status', ['status'], unique=False)
+    op.create_index(op.f('ix_blob_integrity_status_checked_at'), 'blob_integrity_status', ['checked_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop blob_integrity_status."""
+    op.drop_index(op.f('ix_blob_integrity_status_checked_at'), table_name='blob_integrity_status')
+    op.drop_index(op.f('ix_blob_integrity_status_status'), table_name='blob_integrity_status')
+    op.drop_table('blob_integrity_status')
@@ -0,0 +1,95 @@
+"""Add project_activity table (per-project activity projection).
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create project_activity and backfill one row per existing project."""
+    op.create_table(
+        'project_activity',
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('transcripts_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('notes_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('files_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('audio_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('bytes_stored', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('last_activity_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('project_id'),
+    )
+    op.create_index(op.f('ix_project_activity_files_count'), 'project_activity', ['files_count'], unique=False)
+    op.create_index(op.f('ix_project_activity_last_activity_at'), 'project_activity', ['last_activity_at'], unique=False)
+
+    # Same aggregates as activity.compute_activity() - has_files and
+    # sort=last_activity read only the projection, so every project needs a row
+    op.execute(
+        """
+        INSERT INTO project_activity (
+            project_id, transcripts_count, notes_count, files_count, audio_count,
+            bytes_stored, last_activity_at, updated_at
+        )
+        SELECT
+            p.id,
+            COALESCE(t.n, 0),
+            COALESCE(n.n, 0),
+            COALESCE(f.n, 0),
+            COALESCE(a.n, 0),
+            COALESCE(f.size, 0) + COALESCE(a.size, 0),
+            l.last,
+            CURRENT_TIMESTAMP
+        FROM projects p
+        LEFT JOIN (
+            SELECT project_id, COUNT(*) AS n FROM transcripts
+            WHERE project_id IS NOT NULL GROUP BY project_id
+        ) AS t ON t.project_id = p.id
+        LEFT JOIN (
+            SELECT project_id, COUNT(*) AS n FROM project_notes GROUP BY project_id
+        ) AS n ON n.project_id = p.id
+        LEFT JOIN (
+            SELECT project_id, COUNT(*) AS n, SUM(size_bytes) AS size FROM project_files GROUP BY project_id
+        ) AS f ON f.project_id = p.id
+        LEFT JOIN (
+            SELECT tr.project_id, COUNT(*) AS n, SUM(aa.size_bytes) AS size
+            FROM audio_assets aa JOIN transcripts tr ON tr.id = aa.transcript_id
+            WHERE tr.project_id IS NOT NULL AND aa.destroy_status != 'destroyed'
+            GROUP BY tr.project_id
+        ) AS a ON a.project_id = p.id
+        LEFT JOIN (
+            SELECT project_id, MAX(at) AS last FROM (
+                SELECT id AS project_id, updated_at AS at FROM projects
+                UNION ALL
+                SELECT project_id, updated_at FROM transcripts WHERE project_id IS NOT NULL
+                UNION ALL
+                SELECT project_id, updated_at FROM project_notes
+                UNION ALL
+                SELECT project_id, created_at FROM project_files
+                UNION ALL
+                SELECT tr.project_id, aa.created_at
+                FROM audio_assets aa JOIN transcripts tr ON tr.id = aa.transcript_id
+                WHERE tr.project_id IS NOT NULL AND aa.destroy_status != 'destroyed'
+            ) AS activity
+            GROUP BY project_id
+        ) AS l ON l.project_id = p.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop project_activity."""
+    op.drop_index(op.f('ix_project_activity_last_activity_at'), table_name='project_activity')
+    op.drop_index(op.f('ix_project_activity_files_count'), table_name='project_activity')
+    op.drop_table('project_activity')
@@ -0,0 +1,61 @@
+"""Add project list indexes (composite filters + name search).
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-18
+
+PostgreSQL: pg_trgm GIN index on projects.name (CREATE EXTENSION needs a
+role allowed to create extensions - or create pg_trgm beforehand).
+SQLite: FTS5 trigram table projects_name_fts, kept in sync by triggers.
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+
+SQLITE_NAME_INDEX = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS projects_name_fts "
+    "USING fts5(name, content='projects', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS projects_name_fts_ai AFTER INSERT ON projects BEGIN "
+    "INSERT INTO projects_name_fts(rowid, name) VALUES (new.id, new.name); END",
+    "CREATE TRIGGER IF NOT EXISTS projects_name_fts_ad AFTER DELETE ON projects BEGIN "
+    "INSERT INTO projects_name_fts(projects_name_fts, rowid, name) VALUES ('delete', old.id, old.name); END",
+    "CREATE TRIGGER IF NOT EXISTS projects_name_fts_au AFTER UPDATE OF name ON projects BEGIN "
+    "INSERT INTO projects_name_fts(projects_name_fts, rowid, name) VALUES ('delete', old.id, old.name); "
+    "INSERT INTO projects_name_fts(rowid, name) VALUES (new.id, new.name); END",
+    "INSERT INTO projects_name_fts(projects_name_fts) VALUES ('rebuild')",
+)
+
+
+def upgrade() -> None:
+    """Create composite indexes and the dialect's name search index."""
+    op.create_index('idx_projects_status_due_date', 'projects', ['status', 'due_date'], unique=False)
+    op.create_index('idx_projects_sensitivity_created_at', 'projects', ['sensitivity', 'created_at'], unique=False)
+
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute("CREATE INDEX IF NOT EXISTS idx_projects_name_trgm ON projects USING gin (name gin_trgm_ops)")
+    elif dialect == 'sqlite':
+        for statement in SQLITE_NAME_INDEX:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    """Drop name search index and composite indexes (pg_trgm extension is left installed)."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute("DROP INDEX IF EXISTS idx_projects_name_trgm")
+    elif dialect == 'sqlite':
+        for trigger in ('projects_name_fts_ai', 'projects_name_fts_ad', 'projects_name_fts_au'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS projects_name_fts")
+
+    op.drop_index('idx_projects_sensitivity_created_at', table_name='projects')
+    op.drop_index('idx_projects_status_due_date', table_name='projects')
@@ -0,0 +1,46 @@
+"""Shared test fixtures (SQLite database, temp blob storage)."""
+import pytest
+from cryptography.fernet import Fernet
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core import database
+from app.core.config import settings
+from app.modules.audit import pipeline
+from app.modules.projects import file_storage
+from app.modules.record.models import AudioAsset  # noqa: F401 - registers audio_assets table
+
+
+@pytest.fixture
+def sqlite_db(monkeypatch, tmp_path):
+    """In-memory SQLite database wired into app.core.database (all tables created).
+
+    One connection shared by every session (StaticPool). Audit events go
+    through the pipeline (fallback file in tmp_path), drained on teardown.
+
+    Yields:
+        Engine
+    """
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    database.Base.metadata.create_all(engine)
+    monkeypatch.setattr(database, "engine", engine)
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(bind=engine))
+    monkeypatch.setattr(settings, "database_url", "sqlite://")
+    monkeypatch.setattr(settings, "audit_fallback_path", str(tmp_path / "audit-fallback.jsonl"))
+    monkeypatch.setattr(pipeline, "_stopped", False)
+    yield engine
+    pipeline.stop(timeout=2)
+
+
+@pytest.fixture
+def blob_storage(monkeypatch, tmp_path):
+    """Temp blob storage dir with a fresh PROJECT_FILES_KEY.
+
+    Returns:
+        Storage dir (tmp_path / "files")
+    """
+    storage_dir = tmp_path / "files"
+    monkeypatch.setenv("PROJECT_FILES_KEY", Fernet.generate_key().decode())
+    monkeypatch.setattr(file_storage, "_STORAGE_DIR", storage_dir)
+    return storage_dir
@@ -96,8 +96,42 @@ class Settings(BaseSettings):
     # Retention Policy
     retention_days_default: int = Field(default=30, description="Default retention days for projects")
     retention_days_sensitive: int = Field(default=7, description="Retention days for sensitive projects")
+    recorder_retention_days: int = Field(default=14, description="Record retention before purge (days)")
+    recorder_purge_dry_run: bool = Field(default=False, description="Purge only logs what would be deleted")
+    recorder_purge_batch_size: int = Field(default=500, description="Expired transcripts per purge batch")
+    recorder_purge_checkpoint_path: str = Field(default="/app/data/purge-checkpoint.json", description="Purge progress (resume after interruption)")
     temp_file_ttl_hours: int = Field(default=24, description="TTL for temporary files (hours)")
     
+    # Audit pipeline (batched async writes)
+    audit_queue_max_size: int = Field(default=10000, description="Max queued audit events (overflow goes to fallback file)")
+    audit_batch_size: int = Field(default=200, description="Audit events per bulk insert")
+    audit_flush_interval_seconds: float = Field(default=0.5, description="Max delay before queued audit events are written")
+    audit_drain_timeout_seconds: float = Field(default=5.0, description="Max wait for audit queue drain on shutdown")
+    audit_fallback_path: str = Field(default="/app/data/audit-fallback.jsonl", description="Append-only audit fallback file (DB unavailable)")
+    
+    # Record export jobs (background worker pool)
+    export_max_workers: int = Field(default=2, description="Concurrent export package builds")
+    export_max_attempts: int = Field(default=3, description="Export job attempts before it is marked failed (restarts count)")
+    export_retention_days: int = Field(default=14, description="Days an export ZIP stays downloadable before purge (export_jobs.expires_at)")
+    
+    # Secure delete of blobs (best effort on SSD, see file_storage.delete_file)
+    secure_delete_passes: int = Field(default=1, description="Overwrite passes before unlink (last pass zeros, earlier passes random)")
+    secure_delete_workers: int = Field(default=4, description="Threads for batch shredding (destroy/purge)")
+    destroy_batch_size: int = Field(default=200, description="Transcripts per transaction in (bulk) record destroy")
+    
+    # Project integrity verification
+    integrity_workers: int = Field(default=4, description="Threads hashing blobs during integrity verification")
+    integrity_cache_size: int = Field(default=100000, description="Verified artifacts remembered (unchanged ones are not re-read)")
+    storage_io_workers: int = Field(default=4, description="Threads for blob I/O and encryption from async routes")
+    
+    # Background integrity scrubber (re-reads stored blobs)
+    scrubber_enabled: bool = Field(default=False, description="Run the blob scrubber as an in-process background thread")
+    scrubber_max_mb_per_sec: float = Field(default=10.0, description="Scrubber read budget (MB/s, 0 = unthrottled)")
+    scrubber_max_iops: int = Field(default=50, description="Scrubber read operations per second (0 = unthrottled)")
+    scrubber_interval_days: int = Field(default=7, description="Days before a blob is scrubbed again")
+    scrubber_batch_size: int = Field(default=100, description="Blobs per scrubber batch/commit")
+    scrubber_idle_seconds: float = Field(default=300.0, description="Scrubber sleep when no blob is due")
+    
     # Secrets (read from /run/secrets/ in prod_brutal, env vars in dev)
     fernet_key: Optional[str] = Field(default=None, description="Fernet encryption key")
     openai_api_key: Optional[str] = Field(default=None, description="OpenAI API key")
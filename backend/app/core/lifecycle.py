@@ -57,6 +57,14 @@ async def startup() -> None:
         
         logger.info("startup_prod_brutal_checks_passed", extra={"profile": "prod_brutal"})
 
+    # Parse blob encryption keys once (invalid keys are logged here, not on first upload)
+    if os.getenv("PROJECT_FILES_KEY"):
+        try:
+            from app.modules.projects import keyring
+            logger.info("keyring_loaded", extra={"key_count": len(keyring.load().keys)})
+        except Exception as e:
+            logger.error("keyring_load_failed", extra={"error_type": type(e).__name__})
+
     # Initialize database if DATABASE_URL is set
     if settings.database_url:
         logger.info("db_init_start", extra={"database_url": "***"})
@@ -78,6 +86,34 @@ async def startup() -> None:
                 except Exception as e:
                     logger.error("db_migration_failed", extra={"error_type": type(e).__name__})
                     # Don't fail startup - migrations might be run manually
+                
+                # Audit pipeline (replays fallback file written while DB was down)
+                try:
+                    from app.modules.audit import pipeline as audit_pipeline
+                    audit_pipeline.start()
+                except Exception as e:
+                    logger.error("audit_pipeline_start_failed", extra={"error_type": type(e).__name__})
+                
+                # Export worker pool (re-queues jobs interrupted by restart)
+                try:
+                    from app.modules.record import export_jobs
+                    export_jobs.start()
+                except Exception as e:
+                    logger.error("export_jobs_start_failed", extra={"error_type": type(e).__name__})
+                
+                # Finish destroys interrupted by a crash (assets left "pending")
+                try:
+                    from app.modules.record import destroy
+                    destroy.resume_pending()
+                except Exception as e:
+                    logger.error("record_destroy_resume_failed", extra={"error_type": type(e).__name__})
+                
+                # Background blob scrubber (only with SCRUBBER_ENABLED)
+                try:
+                    from app.modules.projects import scrubber
+                    scrubber.start()
+                except Exception as e:
+                    logger.error("blob_scrubber_start_failed", extra={"error_type": type(e).__name__})
         except Exception as e:
             logger.error("db_init_failed", extra={"error_type": type(e).__name__})
             # Don't fail startup - DB might be unavailable
@@ -91,6 +127,26 @@ async def shutdown() -> None:
     """Application shutdown hook."""
     logger.info("app_shutdown_start")
 
+    # Interrupt running exports (resumed on next startup) - they emit audit events
+    from app.modules.record import export_jobs
+
+    export_jobs.stop()
+
+    # Stop scrubber at its next read (it emits audit events)
+    from app.modules.projects import scrubber
+
+    scrubber.stop()
+
+    # Drain queued audit events before closing DB connections
+    from app.modules.audit import pipeline as audit_pipeline
+
+    audit_pipeline.stop()
+
+    # Finish in-flight blob writes
+    from app.modules.projects import storage_async
+
+    storage_async.stop()
+
     # Close database connections
     from app.core.database import engine
 
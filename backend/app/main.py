@@ -20,6 +20,7 @@ from app.modules.record.router import router as record_router
 from app.modules.console.router import router as console_router
 from app.modules.privacy_shield.router import router as privacy_shield_router
 from app.modules.draft.router import router as draft_router
+from app.modules.audit.router import router as audit_router
 from app.routers import health, meta, ready
 
 # Create FastAPI app
@@ -59,6 +60,7 @@ app.include_router(record_router, prefix="/api/v1/record", tags=["record"])
 app.include_router(console_router, prefix="/api/v1", tags=["console"])
 app.include_router(privacy_shield_router, prefix="/api/v1/privacy", tags=["privacy"])
 app.include_router(draft_router, prefix="/api/v1", tags=["draft"])
+app.include_router(audit_router, prefix="/api/v1/audit", tags=["audit"])
 
 # Register global exception handlers
 app.add_exception_handler(StarletteHTTPException, http_exception_handler)
@@ -0,0 +1,4 @@
+"""Audit module - asynchronous audit pipeline and audit trail API (NO CONTENT, only metadata)."""
+from .router import router
+
+__all__ = ["router"]
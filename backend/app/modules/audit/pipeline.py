@@ -0,0 +1,407 @@
+"""Asynchronous audit pipeline - batched writes off the request path.
+
+Requests enqueue sanitized audit records; a background writer thread flushes
+them to project_audit_events / transcript_audit_events in batches (by size
+or time) with one bulk insert per table.
+
+Durability:
+- DB unavailable or insert failed -> batch appended to AUDIT_FALLBACK_PATH (JSONL)
+- Queue full -> record appended to the fallback file directly (never blocks)
+- Fallback file is replayed into the DB on startup
+- Queue is drained on shutdown (lifecycle)
+
+Records whose transcript/project no longer exists at flush time are dropped,
+the same outcome as CASCADE delete of audit events written synchronously.
+"""
+import json
+import os
+import queue
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.logging import logger
+from app.core.privacy_guard import sanitize_for_logging, assert_no_content
+from app.modules.projects.models import Project, ProjectAuditEvent
+from app.modules.transcripts.models import Transcript, TranscriptAuditEvent
+
+
+@dataclass
+class AuditRecord:
+    """Queued audit event (metadata already sanitized)."""
+
+    kind: str  # project|transcript
+    action: str
+    project_id: Optional[int] = None
+    transcript_id: Optional[int] = None
+    severity: str = "info"
+    actor: str = "system"
+    request_id: Optional[str] = None
+    metadata: Optional[Dict[str, Any]] = None
+    mirror_to_project: bool = False  # transcript event also written as project event
+    created_at: datetime = field(default_factory=datetime.utcnow)
+
+    def to_json(self) -> str:
+        """Serialize for the fallback file."""
+        data = asdict(self)
+        data["created_at"] = self.created_at.isoformat()
+        return json.dumps(data, ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, line: str) -> "AuditRecord":
+        """Deserialize from the fallback file."""
+        data = json.loads(line)
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+        return cls(**data)
+
+
+_queue: "queue.Queue[AuditRecord]" = queue.Queue(maxsize=settings.audit_queue_max_size)
+_state_lock = threading.Lock()
+_fallback_lock = threading.Lock()
+_writer: Optional[threading.Thread] = None
+_stop_event = threading.Event()
+_stopped = False
+
+
+def _has_db() -> bool:
+    """Check if database is available."""
+    # Import engine from module to get current value (not cached import)
+    from app.core.database import engine
+    return engine is not None
+
+
+def emit_project_event(
+    project_id: int,
+    action: str,
+    severity: str = "info",
+    actor: str = "system",
+    request_id: Optional[str] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Enqueue project audit event (NO CONTENT, only metadata).
+
+    Args:
+        project_id: Project ID
+        action: Action type
+        severity: Severity (info|warning|critical)
+        actor: Actor (system|user|autonomy_guard)
+        request_id: Request ID (for correlation)
+        metadata: Metadata dict (STRICT: counts, ids, format - NEVER content/filenames)
+    """
+    enqueue(AuditRecord(
+        kind="project",
+        action=action,
+        project_id=project_id,
+        severity=severity,
+        actor=actor,
+        request_id=request_id,
+        metadata=metadata,
+    ))
+
+
+def emit_transcript_event(
+    transcript_id: int,
+    action: str,
+    actor: str = "system",
+    request_id: Optional[str] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+    project_id: Optional[int] = None,
+    mirror_to_project: bool = False,
+) -> None:
+    """Enqueue transcript audit event (NO CONTENT, only metadata).
+
+    Args:
+        transcript_id: Transcript ID
+        action: Action type
+        actor: Actor (system|user)
+        request_id: Request ID (for correlation)
+        metadata: Metadata dict (STRICT: counts, ids, format - NEVER content)
+        project_id: Project ID for the mirrored event (looked up from transcript if None)
+        mirror_to_project: Also write a project audit event
+    """
+    enqueue(AuditRecord(
+        kind="transcript",
+        action=action,
+        transcript_id=transcript_id,
+        project_id=project_id,
+        actor=actor,
+        request_id=request_id,
+        metadata=metadata,
+        mirror_to_project=mirror_to_project,
+    ))
+
+
+def enqueue(record: AuditRecord) -> None:
+    """Sanitize and enqueue audit record (never blocks the caller).
+
+    Args:
+        record: Audit record
+
+    Raises:
+        AssertionError: If metadata contains content (privacy guard, DEV mode)
+    """
+    if record.metadata:
+        record.metadata = sanitize_for_logging(record.metadata, context="audit")
+        assert_no_content(record.metadata, context="audit")
+
+    if _stopped:
+        # After shutdown drain - write inline
+        _write_batch([record])
+        return
+
+    _ensure_started()
+    try:
+        _queue.put_nowait(record)
+    except queue.Full:
+        logger.warning("audit_queue_full", extra={"queue_size": _queue.qsize()})
+        _append_fallback([record])
+
+
+def start() -> None:
+    """Start background writer (idempotent) and replay fallback file."""
+    global _stopped
+    with _state_lock:
+        _stopped = False
+    replay_fallback()
+    _ensure_started()
+
+
+def stop(timeout: Optional[float] = None) -> None:
+    """Drain queue and stop background writer (shutdown).
+
+    Args:
+        timeout: Max seconds to wait (default: AUDIT_DRAIN_TIMEOUT_SECONDS)
+    """
+    global _writer, _stopped
+    with _state_lock:
+        _stopped = True
+        writer = _writer
+        _writer = None
+    if writer is not None:
+        _stop_event.set()
+        writer.join(timeout if timeout is not None else settings.audit_drain_timeout_seconds)
+        _stop_event.clear()
+    # Anything left (writer timed out or never started) goes to DB or fallback
+    remaining = _drain_nowait(_queue.qsize())
+    if remaining:
+        _write_batch(remaining)
+    logger.info("audit_pipeline_stopped", extra={"remaining": len(remaining)})
+
+
+def flush() -> None:
+    """Synchronously write everything queued so far (CLI, tests)."""
+    while True:
+        batch = _drain_nowait(settings.audit_batch_size)
+        if not batch:
+            return
+        _write_batch(batch)
+
+
+def pending() -> int:
+    """Number of queued records."""
+    return _queue.qsize()
+
+
+def _ensure_started() -> None:
+    """Start writer thread if not running."""
+    global _writer
+    if _writer is not None and _writer.is_alive():
+        return
+    with _state_lock:
+        if _writer is not None and _writer.is_alive():
+            return
+        _writer = threading.Thread(target=_run, name="audit-writer", daemon=True)
+        _writer.start()
+
+
+def _run() -> None:
+    """Writer loop: flush when batch is full or interval elapsed."""
+    batch_size = settings.audit_batch_size
+    interval = settings.audit_flush_interval_seconds
+
+    while True:
+        batch: List[AuditRecord] = []
+        deadline = time.monotonic() + interval
+        while len(batch) < batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_queue.get(timeout=min(remaining, 0.1)))
+            except queue.Empty:
+                if _stop_event.is_set():
+                    break
+        if batch:
+            _write_batch(batch)
+        if _stop_event.is_set() and _queue.empty():
+            return
+
+
+def _drain_nowait(limit: int) -> List[AuditRecord]:
+    """Take up to `limit` queued records without waiting."""
+    batch: List[AuditRecord] = []
+    while len(batch) < limit:
+        try:
+            batch.append(_queue.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
+
+def _write_batch(batch: List[AuditRecord]) -> None:
+    """Bulk insert batch; on failure append it to the fallback file."""
+    if not batch:
+        return
+    if not _has_db():
+        _append_fallback(batch)
+        return
+    try:
+        _insert_batch(batch)
+    except Exception as e:
+        logger.error("audit_flush_failed", extra={
+            "error_type": type(e).__name__,
+            "batch_size": len(batch),
+        })
+        _append_fallback(batch)
+
+
+def _insert_batch(batch: List[AuditRecord]) -> int:
+    """Insert batch with one bulk insert per table.
+
+    Returns:
+        Number of rows inserted
+    """
+    transcript_ids: Set[int] = {r.transcript_id for r in batch if r.kind == "transcript"}
+
+    with get_db() as db:
+        # One lookup for transcript existence + project_id (mirrored events)
+        transcript_projects: Dict[int, Optional[int]] = {}
+        if transcript_ids:
+            transcript_projects = dict(
+                db.query(Transcript.id, Transcript.project_id).filter(
+                    Transcript.id.in_(transcript_ids)
+                ).all()
+            )
+
+        transcript_rows: List[Dict[str, Any]] = []
+        project_rows: List[Dict[str, Any]] = []
+        dropped = 0
+        for record in batch:
+            if record.kind == "transcript":
+                if record.transcript_id in transcript_projects:
+                    transcript_rows.append({
+                        "transcript_id": record.transcript_id,
+                        "action": record.action,
+                        "actor": record.actor,
+                        "created_at": record.created_at,
+                        "metadata_json": record.metadata,
+                    })
+                else:
+                    # Transcript gone - its trail would have been CASCADE-deleted,
+                    # the project copy (project_id given at emit time) is kept
+                    dropped += 1
+                if not record.mirror_to_project:
+                    continue
+                project_id = record.project_id or transcript_projects.get(record.transcript_id)
+                if not project_id:
+                    continue
+            else:
+                project_id = record.project_id
+            project_rows.append({
+                "project_id": project_id,
+                "action": record.action,
+                "severity": record.severity,
+                "actor": record.actor,
+                "request_id": record.request_id,
+                "created_at": record.created_at,
+                "metadata_json": record.metadata,
+            })
+
+        if project_rows:
+            existing_projects = {
+                row[0] for row in db.query(Project.id).filter(
+                    Project.id.in_({row["project_id"] for row in project_rows})
+                ).all()
+            }
+            kept = [row for row in project_rows if row["project_id"] in existing_projects]
+            dropped += len(project_rows) - len(kept)
+            project_rows = kept
+
+        if transcript_rows:
+            db.execute(insert(TranscriptAuditEvent), transcript_rows)
+        if project_rows:
+            db.execute(insert(ProjectAuditEvent), project_rows)
+        db.commit()
+
+    if dropped:
+        logger.info("audit_records_dropped", extra={"count": dropped})
+    return len(transcript_rows) + len(project_rows)
+
+
+def _fallback_path() -> Path:
+    return Path(settings.audit_fallback_path)
+
+
+def _append_fallback(batch: List[AuditRecord]) -> None:
+    """Append records to the fallback file (append-only JSONL, fsync)."""
+    path = _fallback_path()
+    try:
+        with _fallback_lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                for record in batch:
+                    f.write(record.to_json() + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        logger.warning("audit_fallback_written", extra={"count": len(batch)})
+    except Exception as e:
+        # Last resort - audit lost, but never fail the request
+        logger.error("audit_fallback_failed", extra={
+            "error_type": type(e).__name__,
+            "count": len(batch),
+        })
+
+
+def replay_fallback() -> int:
+    """Replay fallback file into the DB (startup).
+
+    The file is renamed before replay so concurrent appends go to a new file;
+    records that still fail are appended again.
+
+    Returns:
+        Number of records replayed
+    """
+    path = _fallback_path()
+    if not _has_db() or not path.exists():
+        return 0
+
+    replay_path = path.with_suffix(path.suffix + ".replay")
+    with _fallback_lock:
+        if not replay_path.exists():
+            os.replace(path, replay_path)
+
+    records: List[AuditRecord] = []
+    with open(replay_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(AuditRecord.from_json(line))
+            except (ValueError, TypeError, KeyError):
+                logger.warning("audit_fallback_invalid_line")
+
+    batch_size = settings.audit_batch_size
+    for start_idx in range(0, len(records), batch_size):
+        _write_batch(records[start_idx:start_idx + batch_size])
+
+    replay_path.unlink()
+    logger.info("audit_fallback_replayed", extra={"count": len(records)})
+    return len(records)
@@ -0,0 +1,270 @@
+"""Audit trail queries - merged keyset pagination over both audit tables.
+
+Events are ordered newest first by (created_at, source, id), where project
+events sort before transcript events at the same timestamp. The cursor
+encodes the last returned key, so each page is two index range scans
+(one per table, LIMIT n+1) regardless of depth.
+
+Metadata is re-checked with the privacy guard before it leaves the API.
+"""
+import base64
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import and_, or_
+
+from app.core.database import get_db
+from app.core.privacy_guard import sanitize_for_logging, assert_no_content
+from app.modules.projects.models import ProjectAuditEvent
+from app.modules.transcripts.models import Transcript, TranscriptAuditEvent
+
+
+SOURCES = ("project", "transcript")
+
+# Sort rank at equal created_at (descending order: project first)
+_SOURCE_RANK = {"project": 1, "transcript": 0}
+
+# Page size used when streaming NDJSON
+STREAM_PAGE_SIZE = 1000
+
+
+class InvalidCursorError(ValueError):
+    """Cursor could not be decoded."""
+
+
+@dataclass(frozen=True)
+class AuditFilters:
+    """Audit query filters (all optional, combined with AND)."""
+
+    project_id: Optional[int] = None
+    transcript_id: Optional[int] = None
+    action: Optional[str] = None
+    severity: Optional[str] = None
+    actor: Optional[str] = None
+    request_id: Optional[str] = None
+    date_from: Optional[datetime] = None
+    date_to: Optional[datetime] = None
+    source: Optional[str] = None  # project|transcript (None = both)
+
+
+_Cursor = Tuple[datetime, int, int]  # (created_at, source rank, id)
+
+
+def encode_cursor(created_at: datetime, source: str, event_id: int) -> str:
+    """Encode keyset cursor (opaque to clients).
+
+    Args:
+        created_at: Event timestamp
+        source: project|transcript
+        event_id: Event ID
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{created_at.isoformat()}|{_SOURCE_RANK[source]}|{event_id}"
+    return base64.urlsafe_b64encode(raw.encode("ascii")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> _Cursor:
+    """Decode keyset cursor.
+
+    Args:
+        cursor: Cursor from a previous page
+
+    Returns:
+        (created_at, source rank, id)
+
+    Raises:
+        InvalidCursorError: If cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, rank, event_id = base64.urlsafe_b64decode(padded).decode("ascii").split("|")
+        return datetime.fromisoformat(created_at), int(rank), int(event_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+
+def _includes_project(filters: AuditFilters) -> bool:
+    """Project events can match (no transcript_id column)."""
+    return filters.source in (None, "project") and filters.transcript_id is None
+
+
+def _includes_transcript(filters: AuditFilters) -> bool:
+    """Transcript events can match (no severity/request_id columns, implicitly info)."""
+    if filters.source not in (None, "transcript"):
+        return False
+    if filters.request_id is not None:
+        return False
+    return filters.severity in (None, "info")
+
+
+def _after_cursor(created_col, id_col, source: str, cursor: Optional[_Cursor]):
+    """Keyset condition: rows strictly after cursor in (created_at, rank, id) desc order."""
+    if cursor is None:
+        return None
+    created_at, rank, event_id = cursor
+    own_rank = _SOURCE_RANK[source]
+    if own_rank < rank:
+        return created_col <= created_at
+    if own_rank > rank:
+        return created_col < created_at
+    return or_(created_col < created_at, and_(created_col == created_at, id_col < event_id))
+
+
+def _project_page(db, filters: AuditFilters, cursor: Optional[_Cursor], limit: int) -> List[Dict[str, Any]]:
+    query = db.query(ProjectAuditEvent)
+    if filters.project_id is not None:
+        query = query.filter(ProjectAuditEvent.project_id == filters.project_id)
+    if filters.action:
+        query = query.filter(ProjectAuditEvent.action == filters.action)
+    if filters.severity:
+        query = query.filter(ProjectAuditEvent.severity == filters.severity)
+    if filters.actor:
+        query = query.filter(ProjectAuditEvent.actor == filters.actor)
+    if filters.request_id:
+        query = query.filter(ProjectAuditEvent.request_id == filters.request_id)
+    if filters.date_from:
+        query = query.filter(ProjectAuditEvent.created_at >= filters.date_from)
+    if filters.date_to:
+        query = query.filter(ProjectAuditEvent.created_at <= filters.date_to)
+    keyset = _after_cursor(ProjectAuditEvent.created_at, ProjectAuditEvent.id, "project", cursor)
+    if keyset is not None:
+        query = query.filter(keyset)
+
+    events = query.order_by(
+        ProjectAuditEvent.created_at.desc(), ProjectAuditEvent.id.desc()
+    ).limit(limit).all()
+    return [
+        {
+            "source": "project",
+            "id": e.id,
+            "project_id": e.project_id,
+            "transcript_id": None,
+            "action": e.action,
+            "severity": e.severity,
+            "actor": e.actor,
+            "request_id": e.request_id,
+            "created_at": e.created_at,
+            "metadata": e.metadata_json,
+        }
+        for e in events
+    ]
+
+
+def _transcript_page(db, filters: AuditFilters, cursor: Optional[_Cursor], limit: int) -> List[Dict[str, Any]]:
+    query = db.query(TranscriptAuditEvent, Transcript.project_id).join(
+        Transcript, Transcript.id == TranscriptAuditEvent.transcript_id
+    )
+    if filters.project_id is not None:
+        query = query.filter(Transcript.project_id == filters.project_id)
+    if filters.transcript_id is not None:
+        query = query.filter(TranscriptAuditEvent.transcript_id == filters.transcript_id)
+    if filters.action:
+        query = query.filter(TranscriptAuditEvent.action == filters.action)
+    if filters.actor:
+        query = query.filter(TranscriptAuditEvent.actor == filters.actor)
+    if filters.date_from:
+        query = query.filter(TranscriptAuditEvent.created_at >= filters.date_from)
+    if filters.date_to:
+        query = query.filter(TranscriptAuditEvent.created_at <= filters.date_to)
+    keyset = _after_cursor(TranscriptAuditEvent.created_at, TranscriptAuditEvent.id, "transcript", cursor)
+    if keyset is not None:
+        query = query.filter(keyset)
+
+    rows = query.order_by(
+        TranscriptAuditEvent.created_at.desc(), TranscriptAuditEvent.id.desc()
+    ).limit(limit).all()
+    return [
+        {
+            "source": "transcript",
+            "id": e.id,
+            "project_id": project_id,
+            "transcript_id": e.transcript_id,
+            "action": e.action,
+            "severity": "info",
+            "actor": e.actor,
+            "request_id": None,
+            "created_at": e.created_at,
+            "metadata": e.metadata_json,
+        }
+        for e, project_id in rows
+    ]
+
+
+def _sort_key(event: Dict[str, Any]) -> Tuple[datetime, int, int]:
+    return event["created_at"], _SOURCE_RANK[event["source"]], event["id"]
+
+
+def _public_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Serialize event (metadata re-sanitized - NO CONTENT)."""
+    metadata = event["metadata"]
+    if metadata:
+        metadata = sanitize_for_logging(metadata, context="audit")
+        assert_no_content(metadata, context="audit")
+    return {**event, "created_at": event["created_at"].isoformat(), "metadata": metadata}
+
+
+def query_events(
+    filters: AuditFilters,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Get one page of audit events (newest first).
+
+    Args:
+        filters: Query filters
+        limit: Page size
+        cursor: Cursor from previous page (None = first page)
+
+    Returns:
+        Dict with items, next_cursor (None on last page), limit
+
+    Raises:
+        InvalidCursorError: If cursor is malformed
+    """
+    decoded = decode_cursor(cursor) if cursor else None
+
+    events: List[Dict[str, Any]] = []
+    with get_db() as db:
+        # Each table returns at most limit+1 rows; merged top limit+1 decides next page
+        if _includes_project(filters):
+            events.extend(_project_page(db, filters, decoded, limit + 1))
+        if _includes_transcript(filters):
+            events.extend(_transcript_page(db, filters, decoded, limit + 1))
+
+    events.sort(key=_sort_key, reverse=True)
+    page = events[:limit]
+    next_cursor = None
+    if len(events) > limit:
+        last = page[-1]
+        next_cursor = encode_cursor(last["created_at"], last["source"], last["id"])
+
+    return {
+        "items": [_public_event(e) for e in page],
+        "next_cursor": next_cursor,
+        "limit": limit,
+    }
+
+
+def iter_events(filters: AuditFilters, page_size: int = STREAM_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+    """Iterate all matching audit events (newest first), page by page.
+
+    One short-lived session per page, so long compliance pulls don't hold
+    a connection or load the whole trail into memory.
+
+    Args:
+        filters: Query filters
+        page_size: Events per DB round trip
+
+    Yields:
+        Serialized events
+    """
+    cursor: Optional[str] = None
+    while True:
+        page = query_events(filters, limit=page_size, cursor=cursor)
+        yield from page["items"]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return
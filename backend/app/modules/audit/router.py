@@ -0,0 +1,108 @@
+"""Audit router - read API for project and transcript audit trails."""
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from app.core.logging import logger
+from app.modules.audit import pipeline
+from app.modules.audit.query import (
+    SOURCES,
+    AuditFilters,
+    InvalidCursorError,
+    iter_events,
+    query_events,
+)
+
+
+router = APIRouter()
+
+
+def _parse_datetime(name: str, value: Optional[str]) -> Optional[datetime]:
+    """Parse ISO datetime query param to naive UTC (DB convention).
+
+    Raises:
+        HTTPException: 400 if value is not ISO 8601
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid {name} (expected ISO 8601)",
+        )
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+@router.get("")
+async def list_audit_events(
+    project_id: Optional[int] = Query(None, description="Filter by project (includes its transcripts' events)"),
+    transcript_id: Optional[int] = Query(None, description="Filter by transcript"),
+    action: Optional[str] = Query(None, description="Filter by action"),
+    severity: Optional[str] = Query(None, pattern="^(info|warning|critical)$", description="Filter by severity"),
+    actor: Optional[str] = Query(None, description="Filter by actor"),
+    request_id: Optional[str] = Query(None, description="Filter by request ID"),
+    source: Optional[str] = Query(None, pattern="^(project|transcript)$", description="Only project or transcript events"),
+    date_from: Optional[str] = Query(None, description="Created at or after (ISO format)"),
+    date_to: Optional[str] = Query(None, description="Created at or before (ISO format)"),
+    cursor: Optional[str] = Query(None, description="Cursor from previous page"),
+    limit: int = Query(100, ge=1, le=500, description="Max items (default 100, max 500)"),
+    format: str = Query("json", pattern="^(json|ndjson)$", description="json (one page) or ndjson (stream all)"),
+):
+    """List audit events, newest first (NO CONTENT, only metadata).
+
+    json returns one page with next_cursor (keyset pagination).
+    ndjson streams every matching event, one JSON object per line.
+
+    Returns:
+        Dict with items, next_cursor, limit - or NDJSON stream
+    """
+    if not pipeline._has_db():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database not available",
+        )
+
+    filters = AuditFilters(
+        project_id=project_id,
+        transcript_id=transcript_id,
+        action=action,
+        severity=severity,
+        actor=actor,
+        request_id=request_id,
+        date_from=_parse_datetime("date_from", date_from),
+        date_to=_parse_datetime("date_to", date_to),
+        source=source if source in SOURCES else None,
+    )
+
+    logger.info(
+        "audit_list",
+        extra={
+            "format": format,
+            "has_project_filter": project_id is not None,
+            "has_transcript_filter": transcript_id is not None,
+            "limit": limit,
+        },
+    )
+
+    if format == "ndjson":
+        def _stream():
+            for event in iter_events(filters):
+                yield json.dumps(event, ensure_ascii=False) + "\n"
+
+        return StreamingResponse(_stream(), media_type="application/x-ndjson")
+
+    try:
+        result: Dict[str, Any] = query_events(filters, limit=limit, cursor=cursor)
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+    return result
@@ -0,0 +1,78 @@
+"""Tests for asynchronous audit pipeline (batched writes, fallback file)."""
+from datetime import date, datetime
+
+import pytest
+
+from app.core import database
+from app.core.config import settings
+from app.modules.audit import pipeline
+from app.modules.projects.models import Project, ProjectAuditEvent
+from app.modules.transcripts.models import Transcript, TranscriptAuditEvent
+
+
+@pytest.fixture
+def db(sqlite_db):
+    """SQLite database with one project and transcript."""
+    now = datetime.utcnow()
+    with database.get_db() as session:
+        project = Project(name="p", sensitivity="standard", status="active", start_date=date.today(), created_at=now, updated_at=now)
+        session.add(project)
+        session.flush()
+        session.add(Transcript(title="t", source="interview", language="sv", status="ready", project_id=project.id, created_at=now, updated_at=now))
+        session.commit()
+
+
+def _count(model) -> int:
+    with database.get_db() as session:
+        return session.query(model).count()
+
+
+class TestAuditPipeline:
+    """Test queued writes."""
+
+    def test_batched_write_with_mirror(self, db):
+        """Test transcript events are mirrored to the project trail, orphans dropped."""
+        pipeline.emit_transcript_event(1, "exported", metadata={"format": "zip"}, mirror_to_project=True)
+        pipeline.emit_project_event(1, "updated", metadata={"changed_fields": ["name"]})
+        pipeline.emit_transcript_event(999, "exported", mirror_to_project=True)  # Transcript gone
+        pipeline.stop(timeout=2)
+
+        assert _count(TranscriptAuditEvent) == 1
+        assert _count(ProjectAuditEvent) == 2
+
+    def test_transcript_deleted_before_flush_keeps_mirror(self, db, monkeypatch):
+        """Test a destroyed transcript drops its own event but keeps the project copy."""
+        monkeypatch.setattr(settings, "audit_flush_interval_seconds", 30)  # Flushed by stop()
+        pipeline.emit_transcript_event(1, "audio_accessed", project_id=1, mirror_to_project=True)
+        with database.get_db() as session:
+            session.query(Transcript).filter(Transcript.id == 1).delete()
+            session.commit()
+        pipeline.stop(timeout=2)
+
+        assert _count(TranscriptAuditEvent) == 0
+        with database.get_db() as session:
+            assert [e.action for e in session.query(ProjectAuditEvent)] == ["audio_accessed"]
+
+    def test_content_keys_removed(self, db):
+        """Test metadata is sanitized before it is queued."""
+        pipeline.emit_project_event(1, "system_flag", metadata={"why": "x", "text": "secret"})
+        pipeline.stop(timeout=2)
+
+        with database.get_db() as session:
+            event = session.query(ProjectAuditEvent).one()
+        assert event.metadata_json == {"why": "x"}
+
+    def test_fallback_and_replay(self, db, monkeypatch):
+        """Test failed batches go to the fallback file and are replayed on start."""
+        def _fail(batch):
+            raise RuntimeError("db down")
+
+        insert_batch = pipeline._insert_batch
+        monkeypatch.setattr(pipeline, "_insert_batch", _fail)
+        pipeline.emit_project_event(1, "updated")
+        pipeline.stop(timeout=2)
+        assert _count(ProjectAuditEvent) == 0
+
+        monkeypatch.setattr(pipeline, "_insert_batch", insert_batch)
+        assert pipeline.replay_fallback() == 1
+        assert _count(ProjectAuditEvent) == 1
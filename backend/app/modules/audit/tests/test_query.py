@@ -0,0 +1,68 @@
+"""Tests for audit trail queries (merged keyset pagination)."""
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.core import database
+from app.modules.audit.query import AuditFilters, InvalidCursorError, decode_cursor, query_events
+from app.modules.projects.models import Project, ProjectAuditEvent
+from app.modules.transcripts.models import Transcript, TranscriptAuditEvent
+
+
+@pytest.fixture
+def db(sqlite_db):
+    """SQLite database with 5 project and 5 transcript events (pairs share timestamps)."""
+    base = datetime(2025, 1, 1)
+    with database.get_db() as session:
+        project = Project(name="p", sensitivity="standard", status="active", start_date=date.today(), created_at=base, updated_at=base)
+        session.add(project)
+        session.flush()
+        transcript = Transcript(title="t", source="interview", language="sv", status="ready", project_id=project.id, created_at=base, updated_at=base)
+        session.add(transcript)
+        session.flush()
+        for i in range(5):
+            created_at = base + timedelta(minutes=i // 2)
+            session.add(ProjectAuditEvent(
+                project_id=project.id, action="updated", severity="warning" if i == 0 else "info",
+                actor="system", request_id=f"req-{i}", created_at=created_at, metadata_json={"i": i, "text": "x"},
+            ))
+            session.add(TranscriptAuditEvent(
+                transcript_id=transcript.id, action="exported", actor="system", created_at=created_at, metadata_json={"i": i},
+            ))
+        session.commit()
+
+
+class TestAuditQuery:
+    """Test filtering and pagination."""
+
+    def test_pages_cover_all_events_once(self, db):
+        """Test keyset pages are disjoint, ordered newest first and complete."""
+        seen = []
+        cursor = None
+        while True:
+            page = query_events(AuditFilters(), limit=3, cursor=cursor)
+            seen.extend((e["created_at"], e["source"], e["id"]) for e in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        assert len(seen) == 10
+        assert len(set(seen)) == 10
+        assert [s[0] for s in seen] == sorted((s[0] for s in seen), reverse=True)
+
+    def test_filters_select_table(self, db):
+        """Test severity/request_id only match project events, transcript_id only transcript events."""
+        assert len(query_events(AuditFilters(severity="warning"))["items"]) == 1
+        assert [e["request_id"] for e in query_events(AuditFilters(request_id="req-3"))["items"]] == ["req-3"]
+        items = query_events(AuditFilters(transcript_id=1))["items"]
+        assert {e["source"] for e in items} == {"transcript"}
+        assert all(e["project_id"] == 1 for e in items)
+
+    def test_no_content_in_metadata(self, db):
+        """Test content keys never leave the API."""
+        items = query_events(AuditFilters(source="project"))["items"]
+        assert all("text" not in e["metadata"] for e in items)
+
+    def test_invalid_cursor(self):
+        """Test malformed cursor is rejected."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor("not-a-cursor")
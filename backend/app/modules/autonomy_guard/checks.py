@@ -4,9 +4,10 @@ from typing import Dict, List, Any, Optional
 
 from app.core.database import get_db
 from app.core.config import settings
-from app.core.privacy_guard import sanitize_for_logging, assert_no_content
+from app.modules.audit import pipeline as audit_pipeline
 from app.modules.projects.models import Project, ProjectNote, ProjectFile, ProjectAuditEvent
-from app.modules.transcripts.models import Transcript, TranscriptSegment
+from app.modules.transcripts.models import Transcript, TranscriptStats
+from app.modules.transcripts.stats import resolve_stats
 
 
 def check_project(project_id: int) -> List[Dict[str, Any]]:
@@ -27,13 +28,17 @@ def check_project(project_id: int) -> List[Dict[str, Any]]:
         if not project:
             return results
         
+        # Stats projection - one row per transcript, no segment scans
+        transcript_rows = db.query(Transcript, TranscriptStats).outerjoin(
+            TranscriptStats, TranscriptStats.transcript_id == Transcript.id
+        ).filter(Transcript.project_id == project_id).all()
+        transcripts = [transcript for transcript, _ in transcript_rows]
+        # Rows missing from the projection are computed from segments, not read as 0
+        stats_by_id = resolve_stats(db, [(transcript.id, stats) for transcript, stats in transcript_rows])
+        
         # Check 1: Unusually short transcript
-        transcripts = db.query(Transcript).filter(Transcript.project_id == project_id).all()
         for transcript in transcripts:
-            segments = db.query(TranscriptSegment).filter(
-                TranscriptSegment.transcript_id == transcript.id
-            ).all()
-            total_chars = sum(len(s.text) for s in segments)
+            total_chars = stats_by_id[transcript.id]["total_chars"]
             if total_chars < 100:  # Threshold: 100 chars
                 results.append({
                     "severity": "warning",
@@ -43,11 +48,8 @@ def check_project(project_id: int) -> List[Dict[str, Any]]:
         
         # Check 2: Low average confidence
         for transcript in transcripts:
-            segments = db.query(TranscriptSegment).filter(
-                TranscriptSegment.transcript_id == transcript.id
-            ).filter(TranscriptSegment.confidence.isnot(None)).all()
-            if segments:
-                avg_confidence = sum(s.confidence for s in segments) / len(segments)
+            avg_confidence = stats_by_id[transcript.id]["avg_confidence"]
+            if avg_confidence is not None:
                 if avg_confidence < 0.7:  # Threshold: 70%
                     results.append({
                         "severity": "warning",
@@ -110,24 +112,16 @@ def flag_project(project_id: int, checks: List[Dict[str, Any]], request_id: Opti
     if not engine or not checks:
         return
     
-    with get_db() as db:
-        for check in checks:
-            # Sanitize metadata (ensure no content)
-            metadata = sanitize_for_logging({
+    for check in checks:
+        # Queued - sanitized (no content) and bulk-written by the audit pipeline
+        audit_pipeline.emit_project_event(
+            project_id=project_id,
+            action="system_flag",
+            severity=check["severity"],
+            actor="autonomy_guard",
+            request_id=request_id,
+            metadata={
                 "message": check["message"],
                 "why": check["why"],
-            }, context="audit")
-            assert_no_content(metadata, context="audit")
-            
-            audit = ProjectAuditEvent(
-                project_id=project_id,
-                action="system_flag",
-                severity=check["severity"],
-                actor="autonomy_guard",
-                request_id=request_id,
-                created_at=datetime.utcnow(),
-                metadata_json=metadata,
-            )
-            db.add(audit)
-        db.commit()
-
+            },
+        )
@@ -0,0 +1,274 @@
+"""Project activity projection (project_activity table).
+
+One row per project: artifact counts (transcripts, notes, files, audio),
+bytes stored (plaintext size of files + audio) and last_activity_at, so
+project lists can sort and filter by activity with an index instead of
+aggregating per row.
+
+Maintained by writes, in the same transaction as the change:
+- create(): row for a new project, computed from what it already holds
+- record(): atomic deltas (UPDATE ... SET files_count = files_count + 1) -
+  safe under concurrent writers; last_activity_at only moves forward
+- Transcripts moving or going away: move_transcripts() / remove_transcripts()
+  carry their audio along
+
+Migration 015 backfills a row for every existing project - has_files and
+sort=last_activity read only the projection. A project that still lacks a
+row (e.g. a database made with create_all before this table existed) is
+left alone by writes and computed on read with compute_activity() (five
+grouped queries for any number of projects) until rebuilt; --all repairs
+drift:
+    python -m app.modules.projects.activity_runner [--all]
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import case, func, insert, or_
+from sqlalchemy.orm import Session
+
+from app.modules.projects.models import Project, ProjectActivity, ProjectFile, ProjectNote
+from app.modules.transcripts.models import Transcript
+
+# SQLite default max host parameters is 999
+_ID_BATCH = 500
+
+
+def empty_activity() -> Dict[str, Any]:
+    """Activity of a project without artifacts."""
+    return {
+        "transcripts_count": 0,
+        "notes_count": 0,
+        "files_count": 0,
+        "audio_count": 0,
+        "bytes_stored": 0,
+        "last_activity_at": None,
+    }
+
+
+def _batches(ids: List[int]) -> Iterable[List[int]]:
+    for i in range(0, len(ids), _ID_BATCH):
+        yield ids[i:i + _ID_BATCH]
+
+
+def compute_activity(db: Session, project_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+    """Aggregate activity from the artifact tables (five grouped queries, caller's session).
+
+    last_activity_at is the latest of project.updated_at, notes.updated_at,
+    files.created_at, transcripts.updated_at and audio created_at.
+
+    Args:
+        db: Database session
+        project_ids: Projects to compute
+
+    Returns:
+        Dict project_id -> activity dict (missing projects are absent)
+    """
+    from app.modules.record.models import AudioAsset
+
+    ids = list(dict.fromkeys(project_ids))
+    result: Dict[int, Dict[str, Any]] = {}
+    latest: Dict[int, List[Optional[datetime]]] = {}
+    for batch in _batches(ids):
+        for row in db.query(Project.id, Project.updated_at).filter(Project.id.in_(batch)):
+            result[row.id] = empty_activity()
+            latest[row.id] = [row.updated_at]
+
+        for project_id, count, last in db.query(
+            Transcript.project_id, func.count(Transcript.id), func.max(Transcript.updated_at)
+        ).filter(Transcript.project_id.in_(batch)).group_by(Transcript.project_id):
+            result[project_id]["transcripts_count"] = count
+            latest[project_id].append(last)
+
+        for project_id, count, last in db.query(
+            ProjectNote.project_id, func.count(ProjectNote.id), func.max(ProjectNote.updated_at)
+        ).filter(ProjectNote.project_id.in_(batch)).group_by(ProjectNote.project_id):
+            result[project_id]["notes_count"] = count
+            latest[project_id].append(last)
+
+        for project_id, count, size, last in db.query(
+            ProjectFile.project_id, func.count(ProjectFile.id), func.sum(ProjectFile.size_bytes), func.max(ProjectFile.created_at)
+        ).filter(ProjectFile.project_id.in_(batch)).group_by(ProjectFile.project_id):
+            result[project_id]["files_count"] = count
+            result[project_id]["bytes_stored"] += size or 0
+            latest[project_id].append(last)
+
+        for project_id, count, size, last in db.query(
+            Transcript.project_id, func.count(AudioAsset.id), func.sum(AudioAsset.size_bytes), func.max(AudioAsset.created_at)
+        ).join(Transcript, Transcript.id == AudioAsset.transcript_id).filter(
+            Transcript.project_id.in_(batch),
+            AudioAsset.destroy_status != "destroyed",
+        ).group_by(Transcript.project_id):
+            result[project_id]["audio_count"] = count
+            result[project_id]["bytes_stored"] += size or 0
+            latest[project_id].append(last)
+
+    for project_id, values in latest.items():
+        last_activity = max((value for value in values if value is not None), default=None)
+        result[project_id]["last_activity_at"] = last_activity
+    return result
+
+
+def activity_dict(row: ProjectActivity) -> Dict[str, Any]:
+    """Activity values of a projection row."""
+    return {
+        "transcripts_count": row.transcripts_count,
+        "notes_count": row.notes_count,
+        "files_count": row.files_count,
+        "audio_count": row.audio_count,
+        "bytes_stored": row.bytes_stored,
+        "last_activity_at": row.last_activity_at,
+    }
+
+
+def get_activity(db: Session, project_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+    """Activity for many projects - projection rows, computed for projects without one.
+
+    Returns:
+        Dict project_id -> activity dict
+    """
+    ids = list(dict.fromkeys(project_ids))
+    found: Dict[int, Dict[str, Any]] = {}
+    for batch in _batches(ids):
+        for row in db.query(ProjectActivity).filter(ProjectActivity.project_id.in_(batch)):
+            found[row.project_id] = activity_dict(row)
+    missing = [project_id for project_id in ids if project_id not in found]
+    if missing:
+        found.update(compute_activity(db, missing))
+    return found
+
+
+def _insert(db: Session, values: Dict[int, Dict[str, Any]]) -> None:
+    now = datetime.utcnow()
+    if values:
+        db.execute(insert(ProjectActivity), [
+            {"project_id": project_id, **activity, "updated_at": now}
+            for project_id, activity in values.items()
+        ])
+
+
+def create(db: Session, project_id: int, at: Optional[datetime] = None) -> None:
+    """Insert the row for a new project (caller commits, project flushed).
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        at: Time of creation (default: now)
+    """
+    at = at or datetime.utcnow()
+    db.flush()
+    values = compute_activity(db, [project_id])
+    for activity in values.values():
+        if activity["last_activity_at"] is None or activity["last_activity_at"] < at:
+            activity["last_activity_at"] = at
+    _insert(db, values)
+
+
+def record(
+    db: Session,
+    project_id: Optional[int],
+    transcripts: int = 0,
+    notes: int = 0,
+    files: int = 0,
+    audio: int = 0,
+    bytes_stored: int = 0,
+    at: Optional[datetime] = None,
+) -> None:
+    """Apply a change to a project's activity row (caller commits).
+
+    Projects without a row are left alone - see rebuild().
+
+    Args:
+        db: Database session
+        project_id: Project ID (None is ignored - unattached transcripts)
+        transcripts: Change in transcripts_count
+        notes: Change in notes_count
+        files: Change in files_count
+        audio: Change in audio_count
+        bytes_stored: Change in bytes_stored
+        at: Time of the activity (default: now)
+    """
+    if project_id is None:
+        return
+    at = at or datetime.utcnow()
+    db.query(ProjectActivity).filter(ProjectActivity.project_id == project_id).update({
+        ProjectActivity.transcripts_count: ProjectActivity.transcripts_count + transcripts,
+        ProjectActivity.notes_count: ProjectActivity.notes_count + notes,
+        ProjectActivity.files_count: ProjectActivity.files_count + files,
+        ProjectActivity.audio_count: ProjectActivity.audio_count + audio,
+        ProjectActivity.bytes_stored: ProjectActivity.bytes_stored + bytes_stored,
+        ProjectActivity.last_activity_at: case(
+            (or_(ProjectActivity.last_activity_at.is_(None), ProjectActivity.last_activity_at < at), at),
+            else_=ProjectActivity.last_activity_at,
+        ),
+        ProjectActivity.updated_at: datetime.utcnow(),
+    }, synchronize_session=False)
+
+
+def _transcript_totals(db: Session, transcript_ids: List[int]) -> Dict[Optional[int], Dict[str, int]]:
+    """Per current project (None = unattached): transcripts, their audio assets and audio bytes."""
+    from app.modules.record.models import AudioAsset
+
+    totals: Dict[Optional[int], Dict[str, int]] = {}
+    for batch in _batches(transcript_ids):
+        for project_id, count in db.query(Transcript.project_id, func.count(Transcript.id)).filter(
+            Transcript.id.in_(batch)
+        ).group_by(Transcript.project_id):
+            totals.setdefault(project_id, {"transcripts": 0, "audio": 0, "bytes_stored": 0})
+            totals[project_id]["transcripts"] += count
+        for project_id, count, size in db.query(
+            Transcript.project_id, func.count(AudioAsset.id), func.sum(AudioAsset.size_bytes)
+        ).join(Transcript, Transcript.id == AudioAsset.transcript_id).filter(
+            AudioAsset.transcript_id.in_(batch),
+            AudioAsset.destroy_status != "destroyed",
+        ).group_by(Transcript.project_id):
+            totals[project_id]["audio"] += count
+            totals[project_id]["bytes_stored"] += size or 0
+    return totals
+
+
+def remove_transcripts(db: Session, transcript_ids: List[int]) -> None:
+    """Subtract transcripts (with audio) from their projects - call before deleting them."""
+    for project_id, total in _transcript_totals(db, transcript_ids).items():
+        record(db, project_id, **{key: -value for key, value in total.items()})
+
+
+def move_transcripts(db: Session, transcript_ids: List[int], project_id: int) -> None:
+    """Move transcripts (with audio) to another project - call before changing project_id.
+
+    Args:
+        db: Database session
+        transcript_ids: Transcripts changing project (any current project, or none)
+        project_id: Target project
+    """
+    moved = {"transcripts": 0, "audio": 0, "bytes_stored": 0}
+    for old_project_id, total in _transcript_totals(db, transcript_ids).items():
+        record(db, old_project_id, **{key: -value for key, value in total.items()})
+        for key in moved:
+            moved[key] += total[key]
+    record(db, project_id, **moved)
+
+
+def rebuild(db: Session, project_ids: Optional[List[int]] = None, only_missing: bool = True) -> int:
+    """Recompute projection rows from the artifact tables (caller commits).
+
+    Args:
+        db: Database session
+        project_ids: Projects to rebuild (default: all)
+        only_missing: Only projects without a row
+
+    Returns:
+        Number of rows written
+    """
+    query = db.query(Project.id)
+    if project_ids is not None:
+        query = query.filter(Project.id.in_(project_ids))
+    if only_missing:
+        query = query.filter(~Project.id.in_(db.query(ProjectActivity.project_id)))
+    ids = [row.id for row in query.order_by(Project.id)]
+    written = 0
+    for batch in _batches(ids):
+        db.query(ProjectActivity).filter(ProjectActivity.project_id.in_(batch)).delete(synchronize_session=False)
+        values = compute_activity(db, batch)
+        _insert(db, values)
+        written += len(values)
+    return written
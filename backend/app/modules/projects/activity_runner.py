@@ -0,0 +1,85 @@
+"""CLI entrypoint for building the project activity projection.
+
+Usage:
+    python -m app.modules.projects.activity_runner [--all] [--project-id N]
+
+This is a standalone CLI tool - not part of the API.
+Migration 015 backfills every existing project; the default run only fills
+projects still without a row (e.g. databases made with create_all). --all
+recomputes every row from the artifact tables (repairs drift).
+"""
+import argparse
+import sys
+
+from app.core.config import settings
+from app.core.database import get_db, init_db
+from app.core.logging import logger
+from app.modules.projects import activity
+
+
+def main() -> int:
+    """CLI entrypoint for activity projection backfill.
+
+    Returns:
+        0 on success, 1 on error
+    """
+    parser = argparse.ArgumentParser(
+        description="Build the project activity projection (project_activity)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Build rows for projects without one
+  python -m app.modules.projects.activity_runner
+
+  # Recompute every row
+  python -m app.modules.projects.activity_runner --all
+
+  # Recompute one project
+  python -m app.modules.projects.activity_runner --project-id 12
+        """,
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Recompute every project (default: only projects without a row)",
+    )
+    parser.add_argument(
+        "--project-id",
+        type=int,
+        default=None,
+        help="Recompute only this project",
+    )
+
+    args = parser.parse_args()
+
+    try:
+        if not settings.database_url:
+            print("Error: DATABASE_URL not set", file=sys.stderr)
+            return 1
+        init_db(settings.database_url)
+
+        logger.info("activity_backfill_started", extra={"rebuild_all": args.all, "project_id": args.project_id})
+
+        with get_db() as db:
+            project_ids = [args.project_id] if args.project_id is not None else None
+            written = activity.rebuild(db, project_ids, only_missing=not (args.all or args.project_id is not None))
+            db.commit()
+
+        print("Activity backfill complete:")
+        print(f"  Projects processed: {written}")
+
+        logger.info("activity_backfill_complete", extra={"projects_processed": written})
+        return 0
+
+    except KeyboardInterrupt:
+        logger.warning("activity_backfill_interrupted")
+        return 130  # Standard exit code for SIGINT
+    except Exception as e:
+        error_type = type(e).__name__
+        logger.error("activity_backfill_failed", extra={"error_type": error_type})
+        print(f"Error: {error_type}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
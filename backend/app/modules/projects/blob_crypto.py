@@ -0,0 +1,345 @@
+"""Chunked authenticated encryption container for stored blobs.
+
+Layout (version 2):
+
+    header  = MAGIC(4) | version(1) | frame_size(4, BE) | key_id(4) | salt(16) | header_mac(32)
+    frame_i = AES-256-GCM(plaintext[i*F:(i+1)*F]) | tag(16)
+
+Version 1 (read only) has no key_id - readers try each known master key
+until the header MAC verifies.
+
+- key_id: fingerprint of the master key (key_id_for) - selects the key on
+  read, so several master keys can be active during rotation (see keyring)
+- Per-blob keys: HKDF-SHA256(master key, salt) -> encryption key + header MAC key
+- Nonce of frame i: 8 zero bytes | i (4, BE) - unique because keys are per blob
+- AAD of frame i: header | final flag (1 byte) - frames cannot be moved between
+  blobs, and truncation is detected (only the last frame has the final flag)
+- All frames except the last hold exactly frame_size plaintext bytes, so frame
+  offsets are computable and any byte range can be decrypted on its own
+
+Plaintext is processed frame by frame - memory is bounded by frame_size.
+Write with FrameEncryptor, read with BlobReader (random access by byte range).
+"""
+import hashlib
+import hmac
+import io
+import os
+import struct
+from typing import BinaryIO, Iterator, List, Mapping, Optional, Tuple, Union
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+
+MAGIC = b"\x89CPB"  # Non-base64 first byte - never collides with Fernet tokens ("gAAAA...")
+VERSION = 2
+FRAME_SIZE = 1024 * 1024  # 1MiB plaintext per frame
+TAG_SIZE = 16
+SALT_SIZE = 16
+MAC_SIZE = 32
+KEY_ID_SIZE = 4
+_HEADER_PREFIX = struct.Struct(">4sBI")  # magic, version, frame_size
+_HEADER_SIZES = {
+    1: _HEADER_PREFIX.size + SALT_SIZE + MAC_SIZE,
+    2: _HEADER_PREFIX.size + KEY_ID_SIZE + SALT_SIZE + MAC_SIZE,
+}
+HEADER_SIZE = _HEADER_SIZES[VERSION]
+
+# Master key, or key_id -> master key (keyring)
+Keys = Union[bytes, Mapping[bytes, bytes]]
+
+
+class BlobIntegrityError(ValueError):
+    """Container is malformed, truncated or fails authentication."""
+
+
+def is_container(prefix: bytes) -> bool:
+    """Check if data starts with a container header.
+
+    Args:
+        prefix: First bytes of stored blob (at least 4)
+
+    Returns:
+        True if chunked container, False otherwise (e.g. legacy Fernet)
+    """
+    return prefix[:len(MAGIC)] == MAGIC
+
+
+def key_id_for(master_key: bytes) -> bytes:
+    """Key id stored in container headers (truncated SHA256 fingerprint).
+
+    Args:
+        master_key: Master key (32 bytes)
+
+    Returns:
+        KEY_ID_SIZE bytes
+    """
+    return hashlib.sha256(b"copy-paste blob key id" + master_key).digest()[:KEY_ID_SIZE]
+
+
+def parse_header(prefix: bytes) -> Tuple[int, Optional[bytes], int]:
+    """Parse container header fields needed before decryption.
+
+    Args:
+        prefix: First bytes of container (at least HEADER_SIZE, or the whole blob)
+
+    Returns:
+        Tuple of (version, key_id or None for version 1, header size)
+
+    Raises:
+        BlobIntegrityError: If not a container, unsupported version or truncated
+    """
+    if len(prefix) < _HEADER_PREFIX.size or not is_container(prefix):
+        raise BlobIntegrityError("Not a blob container")
+    _, version, _ = _HEADER_PREFIX.unpack_from(prefix)
+    size = _HEADER_SIZES.get(version)
+    if size is None:
+        raise BlobIntegrityError(f"Unsupported container version {version}")
+    if len(prefix) < size:
+        raise BlobIntegrityError("Container truncated")
+    key_id = prefix[_HEADER_PREFIX.size:_HEADER_PREFIX.size + KEY_ID_SIZE] if version >= 2 else None
+    return version, key_id, size
+
+
+def _derive_keys(master_key: bytes, salt: bytes) -> Tuple[bytes, bytes]:
+    """Derive per-blob encryption and header MAC keys."""
+    okm = HKDF(
+        algorithm=hashes.SHA256(),
+        length=64,
+        salt=salt,
+        info=b"copy-paste blob container v1",
+    ).derive(master_key)
+    return okm[:32], okm[32:]
+
+
+def _nonce(index: int) -> bytes:
+    return b"\x00" * 8 + struct.pack(">I", index)
+
+
+def _aad(header: bytes, final: bool) -> bytes:
+    return header + (b"\x01" if final else b"\x00")
+
+
+class FrameEncryptor:
+    """Streaming encryptor - feed plaintext chunks, get container bytes back.
+
+    Usage:
+        enc = FrameEncryptor(master_key)
+        out.write(enc.header)
+        for chunk in chunks:
+            out.write(enc.update(chunk))
+        out.write(enc.finalize())
+    """
+
+    def __init__(self, master_key: bytes, frame_size: int = FRAME_SIZE, key_id: Optional[bytes] = None) -> None:
+        if frame_size <= 0:
+            raise ValueError("frame_size must be positive")
+        key_id = key_id_for(master_key) if key_id is None else key_id
+        if len(key_id) != KEY_ID_SIZE:
+            raise ValueError(f"key_id must be {KEY_ID_SIZE} bytes")
+        salt = os.urandom(SALT_SIZE)
+        enc_key, mac_key = _derive_keys(master_key, salt)
+        prefix = _HEADER_PREFIX.pack(MAGIC, VERSION, frame_size) + key_id + salt
+        self.key_id = key_id
+        self.header = prefix + hmac.new(mac_key, prefix, hashlib.sha256).digest()
+        self.frame_size = frame_size
+        self._aead = AESGCM(enc_key)
+        self._buffer = bytearray()
+        self._index = 0
+        self._finalized = False
+
+    def update(self, data: bytes) -> bytes:
+        """Encrypt complete frames (last partial frame is kept until more data or finalize).
+
+        Args:
+            data: Plaintext chunk (any size)
+
+        Returns:
+            Encrypted frames (may be empty)
+        """
+        if self._finalized:
+            raise ValueError("Encryptor already finalized")
+        self._buffer += data
+        out = bytearray()
+        # Keep at least one byte buffered: the final frame must carry the final flag
+        while len(self._buffer) > self.frame_size:
+            out += self._seal(bytes(self._buffer[:self.frame_size]), final=False)
+            del self._buffer[:self.frame_size]
+        return bytes(out)
+
+    def finalize(self) -> bytes:
+        """Encrypt the final frame (may be empty for empty plaintext).
+
+        Returns:
+            Final encrypted frame
+        """
+        if self._finalized:
+            raise ValueError("Encryptor already finalized")
+        self._finalized = True
+        out = self._seal(bytes(self._buffer), final=True)
+        self._buffer.clear()
+        return out
+
+    def _seal(self, plaintext: bytes, final: bool) -> bytes:
+        sealed = self._aead.encrypt(_nonce(self._index), plaintext, _aad(self.header, final))
+        self._index += 1
+        return sealed
+
+
+def _candidate_keys(keys: Keys, key_id: Optional[bytes]) -> List[bytes]:
+    """Master keys to try for a header (one for version 2, all for version 1)."""
+    if isinstance(keys, (bytes, bytearray)):
+        return [bytes(keys)]
+    if key_id is None:
+        return list(keys.values())
+    if key_id not in keys:
+        raise BlobIntegrityError(f"Unknown key id {key_id.hex()} (key not in keyring)")
+    return [keys[key_id]]
+
+
+class FrameDecryptor:
+    """Decrypts frames of one container (header verified on construction)."""
+
+    def __init__(self, keys: Keys, header: bytes) -> None:
+        version, key_id, header_size = parse_header(header)
+        header = header[:header_size]
+        _, _, frame_size = _HEADER_PREFIX.unpack_from(header)
+        if frame_size <= 0:
+            raise BlobIntegrityError("Invalid frame size")
+        salt_start = header_size - MAC_SIZE - SALT_SIZE
+        salt = header[salt_start:salt_start + SALT_SIZE]
+        for master_key in _candidate_keys(keys, key_id):
+            enc_key, mac_key = _derive_keys(master_key, salt)
+            expected_mac = hmac.new(mac_key, header[:-MAC_SIZE], hashlib.sha256).digest()
+            if hmac.compare_digest(expected_mac, header[-MAC_SIZE:]):
+                break
+        else:
+            raise BlobIntegrityError("Header authentication failed (wrong key or tampered)")
+        self.version = version
+        self.key_id = key_id
+        self.header = header
+        self.header_size = header_size
+        self.frame_size = frame_size
+        self._aead = AESGCM(enc_key)
+
+    @property
+    def sealed_frame_size(self) -> int:
+        """Size of a full encrypted frame on disk."""
+        return self.frame_size + TAG_SIZE
+
+    def decrypt(self, index: int, sealed: bytes, final: bool) -> bytes:
+        """Decrypt one frame.
+
+        Args:
+            index: Frame index
+            sealed: Encrypted frame (ciphertext + tag)
+            final: Whether this is the last frame of the blob
+
+        Returns:
+            Plaintext
+
+        Raises:
+            BlobIntegrityError: If authentication fails
+        """
+        try:
+            return self._aead.decrypt(_nonce(index), sealed, _aad(self.header, final))
+        except InvalidTag as e:
+            raise BlobIntegrityError(f"Frame {index} authentication failed") from e
+
+
+class BlobReader:
+    """Random-access reader over a container file (decrypts only the frames needed).
+
+    Usage:
+        with open(path, "rb") as f:
+            reader = BlobReader(f, keys)
+            for chunk in reader.iter_range(start, end):
+                ...
+    """
+
+    def __init__(self, fileobj: BinaryIO, keys: Keys) -> None:
+        self._file = fileobj
+        self._file.seek(0)
+        self._decryptor = FrameDecryptor(keys, self._file.read(max(_HEADER_SIZES.values())))
+        self.key_id = self._decryptor.key_id
+        self._header_size = self._decryptor.header_size
+        self._file.seek(0, os.SEEK_END)
+        body_size = self._file.tell() - self._header_size
+        step = self._decryptor.sealed_frame_size
+        if body_size < TAG_SIZE:
+            raise BlobIntegrityError("Container truncated")
+        self.frame_count = (body_size + step - 1) // step
+        last_sealed = body_size - (self.frame_count - 1) * step
+        if last_sealed < TAG_SIZE:
+            raise BlobIntegrityError("Container truncated")
+        self.frame_size = self._decryptor.frame_size
+        self.size = (self.frame_count - 1) * self.frame_size + last_sealed - TAG_SIZE
+
+    def read_frame(self, index: int) -> bytes:
+        """Read and decrypt one frame.
+
+        Args:
+            index: Frame index (0-based)
+
+        Returns:
+            Frame plaintext
+        """
+        if not 0 <= index < self.frame_count:
+            raise IndexError(f"Frame {index} out of range")
+        step = self._decryptor.sealed_frame_size
+        self._file.seek(self._header_size + index * step)
+        sealed = self._file.read(step)
+        return self._decryptor.decrypt(index, sealed, final=index == self.frame_count - 1)
+
+    def iter_range(self, start: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+        """Yield plaintext for byte range [start, end) frame by frame.
+
+        Args:
+            start: First byte (inclusive)
+            end: Last byte (exclusive, default: end of blob)
+
+        Yields:
+            Plaintext chunks (at most frame_size bytes each)
+        """
+        end = self.size if end is None else min(end, self.size)
+        start = max(start, 0)
+        if start >= end:
+            if self.size == 0:
+                self.read_frame(0)  # Still authenticate empty blobs
+            return
+        for index in range(start // self.frame_size, (end - 1) // self.frame_size + 1):
+            frame_start = index * self.frame_size
+            plaintext = self.read_frame(index)
+            yield plaintext[max(start - frame_start, 0):end - frame_start]
+
+
+def encrypt_bytes(data: bytes, master_key: bytes) -> bytes:
+    """Encrypt data held in memory into a container.
+
+    Args:
+        data: Plaintext
+        master_key: Master key (32 bytes)
+
+    Returns:
+        Container bytes
+    """
+    encryptor = FrameEncryptor(master_key)
+    return encryptor.header + encryptor.update(data) + encryptor.finalize()
+
+
+def decrypt_bytes(data: bytes, keys: Keys) -> bytes:
+    """Decrypt a whole container held in memory.
+
+    Args:
+        data: Container bytes
+        keys: Master key (32 bytes) or key_id -> master key mapping
+
+    Returns:
+        Plaintext
+
+    Raises:
+        BlobIntegrityError: If container is malformed or fails authentication
+    """
+    return b"".join(BlobReader(io.BytesIO(data), keys).iter_range())
@@ -0,0 +1,149 @@
+"""Local index of stored blobs (SQLite file in the storage dir).
+
+One row per blob on disk: plaintext sha256, ciphertext size, ciphertext
+sha256 and created_at. Integrity and orphan scans read the index instead of
+stat()ing every file; file_storage keeps it current on write/delete.
+
+The index is a cache of the storage dir - if it is lost or stale, rebuild it:
+    python -m app.modules.projects.blob_layout_runner --rebuild-index
+"""
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+INDEX_FILENAME = "index.sqlite3"
+
+# SQLite default max host parameters is 999
+_LOOKUP_BATCH = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    sha256 TEXT PRIMARY KEY,
+    size_bytes INTEGER NOT NULL,
+    ciphertext_sha256 TEXT NOT NULL,
+    created_at TEXT NOT NULL
+)
+"""
+
+_init_lock = threading.Lock()
+_initialized: set = set()
+
+
+def index_path() -> Path:
+    """Path of index file (next to the blobs)."""
+    from app.modules.projects.file_storage import _ensure_storage_dir
+
+    return _ensure_storage_dir() / INDEX_FILENAME
+
+
+def _connect() -> sqlite3.Connection:
+    path = index_path()
+    conn = sqlite3.connect(str(path), timeout=10)
+    if path not in _initialized:
+        with _init_lock:
+            if path not in _initialized:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(_SCHEMA)
+                conn.commit()
+                _initialized.add(path)
+    return conn
+
+
+def _row_dict(row: tuple) -> Dict[str, Any]:
+    return {
+        "sha256": row[0],
+        "size_bytes": row[1],
+        "ciphertext_sha256": row[2],
+        "created_at": row[3],
+    }
+
+
+def record(
+    sha256: str,
+    size_bytes: int,
+    ciphertext_sha256: str,
+    created_at: Optional[datetime] = None,
+) -> None:
+    """Insert or replace index entry for a blob.
+
+    Args:
+        sha256: Plaintext hash (blob name)
+        size_bytes: Ciphertext file size
+        ciphertext_sha256: SHA256 of the file on disk
+        created_at: Defaults to now (UTC)
+    """
+    created = (created_at or datetime.utcnow()).isoformat()
+    conn = _connect()
+    try:
+        conn.execute(
+            "INSERT OR REPLACE INTO blobs (sha256, size_bytes, ciphertext_sha256, created_at) VALUES (?, ?, ?, ?)",
+            (sha256, size_bytes, ciphertext_sha256, created),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def remove(sha256: str) -> None:
+    """Remove index entry (no-op if missing)."""
+    conn = _connect()
+    try:
+        conn.execute("DELETE FROM blobs WHERE sha256 = ?", (sha256,))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def get(sha256: str) -> Optional[Dict[str, Any]]:
+    """Get index entry for a blob, or None."""
+    return lookup([sha256]).get(sha256)
+
+
+def lookup(sha256_values: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """Get index entries for many blobs (batched queries).
+
+    Args:
+        sha256_values: Blob hashes
+
+    Returns:
+        Dict sha256 -> entry (missing blobs are absent)
+    """
+    values = list(dict.fromkeys(sha256_values))
+    found: Dict[str, Dict[str, Any]] = {}
+    if not values:
+        return found
+    conn = _connect()
+    try:
+        for i in range(0, len(values), _LOOKUP_BATCH):
+            batch = values[i:i + _LOOKUP_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(
+                f"SELECT sha256, size_bytes, ciphertext_sha256, created_at FROM blobs WHERE sha256 IN ({placeholders})",
+                batch,
+            )
+            for row in rows:
+                found[row[0]] = _row_dict(row)
+    finally:
+        conn.close()
+    return found
+
+
+def iter_entries() -> Iterator[Dict[str, Any]]:
+    """Yield all index entries ordered by sha256."""
+    conn = _connect()
+    try:
+        for row in conn.execute("SELECT sha256, size_bytes, ciphertext_sha256, created_at FROM blobs ORDER BY sha256"):
+            yield _row_dict(row)
+    finally:
+        conn.close()
+
+
+def count() -> int:
+    """Number of indexed blobs."""
+    conn = _connect()
+    try:
+        return conn.execute("SELECT COUNT(*) FROM blobs").fetchone()[0]
+    finally:
+        conn.close()
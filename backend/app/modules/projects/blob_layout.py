@@ -0,0 +1,146 @@
+"""Storage layout maintenance - shard migration, index rebuild, orphan scan.
+
+Blobs used to be stored flat as {sha256}.bin; with many files a single
+directory makes lookups and listings slow. New blobs go to ab/cd/{sha256}.bin
+(file_storage.blob_path still finds flat ones). This module moves flat blobs
+into shards (atomic rename, same filesystem) and records them in blob_index.
+
+Safe to interrupt and re-run - already sharded blobs are skipped.
+"""
+import hashlib
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+
+from app.core.database import get_db
+from app.core.logging import logger
+from app.modules.projects import blob_index, file_storage
+from app.modules.projects.models import ProjectFile, StorageBlob
+from app.modules.projects.secure_delete import shred_file
+
+# Read size when hashing ciphertext
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _ciphertext_sha256(path) -> str:
+    """SHA256 of a stored (encrypted) file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _index_file(path, sha256: str) -> None:
+    stat = path.stat()
+    blob_index.record(
+        sha256,
+        stat.st_size,
+        _ciphertext_sha256(path),
+        created_at=datetime.utcfromtimestamp(stat.st_mtime),
+    )
+
+
+def migrate_to_sharded(
+    dry_run: bool = False,
+    limit: Optional[int] = None,
+    pause_seconds: float = 0.0,
+) -> Dict[str, Any]:
+    """Move flat {sha256}.bin blobs into ab/cd/ shards and index them.
+
+    Args:
+        dry_run: Only count flat blobs
+        limit: Max blobs to move in this run
+        pause_seconds: Sleep between blobs (throttle for background runs)
+
+    Returns:
+        Dict with flat, moved, errors, dry_run
+    """
+    storage_dir = file_storage._ensure_storage_dir()
+    result: Dict[str, Any] = {"flat": 0, "moved": 0, "errors": 0, "dry_run": dry_run}
+
+    for path in sorted(storage_dir.glob("*.bin")):
+        result["flat"] += 1
+        if dry_run:
+            continue
+        if limit is not None and result["moved"] >= limit:
+            continue
+
+        sha256 = path.stem
+        target = storage_dir / file_storage.relative_blob_path(sha256)
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if target.exists():
+                # Same content re-uploaded after sharding - flat copy is redundant
+                shred_file(path)
+            else:
+                os.replace(path, target)
+            _index_file(target, sha256)
+            result["moved"] += 1
+        except Exception as e:
+            result["errors"] += 1
+            logger.error("blob_shard_failed", extra={"error_type": type(e).__name__})
+
+        if pause_seconds:
+            time.sleep(pause_seconds)
+
+    logger.info("blob_shard_complete", extra=dict(result))
+    return result
+
+
+def rebuild_index(pause_seconds: float = 0.0) -> Dict[str, Any]:
+    """Rebuild blob_index from the storage dir (hashes every blob).
+
+    Args:
+        pause_seconds: Sleep between blobs (throttle for background runs)
+
+    Returns:
+        Dict with indexed, removed (stale entries), errors
+    """
+    result: Dict[str, Any] = {"indexed": 0, "removed": 0, "errors": 0}
+    on_disk: Set[str] = set()
+
+    for path in file_storage.iter_blob_paths():
+        sha256 = path.stem
+        on_disk.add(sha256)
+        try:
+            _index_file(path, sha256)
+            result["indexed"] += 1
+        except Exception as e:
+            result["errors"] += 1
+            logger.error("blob_index_rebuild_failed", extra={"error_type": type(e).__name__})
+        if pause_seconds:
+            time.sleep(pause_seconds)
+
+    stale = [entry["sha256"] for entry in blob_index.iter_entries() if entry["sha256"] not in on_disk]
+    for sha256 in stale:
+        blob_index.remove(sha256)
+    result["removed"] = len(stale)
+
+    logger.info("blob_index_rebuild_complete", extra=dict(result))
+    return result
+
+
+def find_orphans() -> List[str]:
+    """Find indexed blobs that no asset references (no per-file stat).
+
+    A blob is referenced if its storage_blobs row has ref_count > 0, or if a
+    ProjectFile/AudioAsset row still points at it (pre-refcount blobs).
+
+    Returns:
+        Sorted list of orphaned blob hashes
+    """
+    from app.modules.record.models import AudioAsset
+
+    with get_db() as db:
+        referenced: Set[str] = {
+            row.sha256 for row in db.query(StorageBlob.sha256).filter(StorageBlob.ref_count > 0)
+        }
+        referenced.update(row.sha256 for row in db.query(ProjectFile.sha256).distinct())
+        referenced.update(
+            row.sha256
+            for row in db.query(AudioAsset.sha256).filter(AudioAsset.destroy_status != "destroyed").distinct()
+        )
+
+    return [entry["sha256"] for entry in blob_index.iter_entries() if entry["sha256"] not in referenced]
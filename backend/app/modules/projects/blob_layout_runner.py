@@ -0,0 +1,94 @@
+"""CLI entrypoint for storage layout maintenance.
+
+Usage:
+    python -m app.modules.projects.blob_layout_runner [--dry-run] [--limit N] [--pause-ms N]
+    python -m app.modules.projects.blob_layout_runner --rebuild-index
+    python -m app.modules.projects.blob_layout_runner --orphans [--shred]
+
+This is a standalone CLI tool - not part of the API.
+Run in the background (cron, nohup) - the API keeps serving flat blobs meanwhile.
+"""
+import argparse
+import sys
+
+from app.core.logging import logger
+from app.modules.projects import blob_store
+from app.modules.projects.blob_layout import find_orphans, migrate_to_sharded, rebuild_index
+
+
+def main() -> int:
+    """CLI entrypoint for layout migration, index rebuild and orphan scan.
+
+    Returns:
+        0 on success, 1 on error
+    """
+    parser = argparse.ArgumentParser(
+        description="Move blobs into the sharded layout, rebuild the blob index or report orphans",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Count flat (unsharded) blobs
+  python -m app.modules.projects.blob_layout_runner --dry-run
+
+  # Throttled background migration, 1000 blobs at a time
+  python -m app.modules.projects.blob_layout_runner --limit 1000 --pause-ms 10
+
+  # Rebuild index after restore/manual changes to the storage dir
+  python -m app.modules.projects.blob_layout_runner --rebuild-index
+
+  # Report unreferenced blobs (add --shred to delete them)
+  python -m app.modules.projects.blob_layout_runner --orphans
+        """,
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only count flat blobs")
+    parser.add_argument("--limit", type=int, help="Max blobs to move in this run")
+    parser.add_argument("--pause-ms", type=int, default=0, help="Pause between blobs (default: 0)")
+    parser.add_argument("--rebuild-index", action="store_true", help="Rebuild blob index from storage dir")
+    parser.add_argument("--orphans", action="store_true", help="Report blobs without references")
+    parser.add_argument("--shred", action="store_true", help="With --orphans: shred orphaned blobs")
+
+    args = parser.parse_args()
+
+    try:
+        if args.rebuild_index:
+            result = rebuild_index(pause_seconds=args.pause_ms / 1000)
+            print("Index rebuild complete:")
+            print(f"  Blobs indexed: {result['indexed']}")
+            print(f"  Stale entries removed: {result['removed']}")
+            print(f"  Errors: {result['errors']}")
+            return 1 if result["errors"] > 0 else 0
+
+        if args.orphans:
+            orphans = find_orphans()
+            print(f"Orphaned blobs: {len(orphans)}")
+            if args.shred and orphans:
+                # collect() re-checks references under row lock before shredding
+                shredded = blob_store.collect(orphans)
+                print(f"  Shredded: {shredded}")
+            return 0
+
+        result = migrate_to_sharded(
+            dry_run=args.dry_run,
+            limit=args.limit,
+            pause_seconds=args.pause_ms / 1000,
+        )
+        print("Shard migration complete:")
+        print(f"  Dry run: {result['dry_run']}")
+        print(f"  Flat blobs: {result['flat']}")
+        print(f"  Moved: {result['moved']}")
+        print(f"  Errors: {result['errors']}")
+
+        return 1 if result["errors"] > 0 else 0
+
+    except KeyboardInterrupt:
+        logger.warning("blob_layout_interrupted")
+        return 130  # Standard exit code for SIGINT
+    except Exception as e:
+        error_type = type(e).__name__
+        logger.error("blob_layout_run_failed", extra={"error_type": error_type})
+        print(f"Error: {error_type}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
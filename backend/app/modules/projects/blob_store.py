@@ -0,0 +1,173 @@
+"""Reference-counted blob store on top of file_storage.
+
+Identical content is stored once (ab/cd/{sha256}.bin). Every ProjectFile and
+AudioAsset row holds one reference in storage_blobs; the blob is shredded
+only when the last reference is released.
+
+Ordering (no blob is shredded while it is being re-uploaded):
+1. acquire() - lock/insert storage_blobs row, ref_count + 1
+2. Place blob on disk (skipped if the blob already exists)
+3. Insert asset row, commit
+
+Release:
+1. release() in the same transaction that deletes the asset row, commit
+2. collect() - per blob: lock row, detach file (rename) + delete row only if
+   ref_count is still 0; detached files are then shredded in parallel
+   (secure_delete, outside the lock - a re-upload writes a fresh blob)
+
+A crash between commit and collect() leaves an unreferenced blob with
+ref_count 0 (or a detached file); collect_unreferenced() picks those up.
+"""
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.logging import logger
+from app.modules.projects import file_storage
+from app.modules.projects.models import BlobIntegrityStatus, ProjectFile, StorageBlob
+from app.modules.projects.secure_delete import shred_files
+
+
+def acquire(db: Session, sha256: str, size_bytes: int) -> bool:
+    """Add one reference to a blob (row locked until the caller commits).
+
+    Args:
+        db: Database session (caller commits)
+        sha256: Blob hash
+        size_bytes: Plaintext size
+
+    Returns:
+        True if the blob was already referenced (content is deduplicated)
+    """
+    now = datetime.utcnow()
+    blob = db.query(StorageBlob).filter(StorageBlob.sha256 == sha256).with_for_update().first()
+    if blob is None:
+        try:
+            with db.begin_nested():
+                db.add(StorageBlob(sha256=sha256, size_bytes=size_bytes, ref_count=1, created_at=now, updated_at=now))
+            return False
+        except IntegrityError:
+            # Concurrent first upload of the same content - take a reference on its row
+            blob = db.query(StorageBlob).filter(StorageBlob.sha256 == sha256).with_for_update().one()
+    shared = blob.ref_count > 0
+    blob.ref_count += 1
+    blob.updated_at = now
+    db.flush()
+    return shared
+
+
+def release(db: Session, sha256: str) -> None:
+    """Drop one reference to a blob (caller commits, then calls collect()).
+
+    Args:
+        db: Database session
+        sha256: Blob hash
+    """
+    blob = db.query(StorageBlob).filter(StorageBlob.sha256 == sha256).with_for_update().first()
+    if blob is None:
+        return  # Untracked (pre-refcount) blob - collect() checks asset rows instead
+    blob.ref_count = max(blob.ref_count - 1, 0)
+    blob.updated_at = datetime.utcnow()
+    db.flush()
+
+
+def release_many(db: Session, sha256_values: Iterable[str]) -> None:
+    """Drop references for many assets in one locked query (batch delete/purge).
+
+    Args:
+        db: Database session (caller commits, then calls collect())
+        sha256_values: One hash per released asset (repeats drop several references)
+    """
+    counts = Counter(sha256_values)
+    if not counts:
+        return
+    now = datetime.utcnow()
+    # Lock in sha256 order - concurrent batches cannot deadlock
+    blobs = db.query(StorageBlob).filter(
+        StorageBlob.sha256.in_(list(counts))
+    ).order_by(StorageBlob.sha256).with_for_update().all()
+    for blob in blobs:
+        blob.ref_count = max(blob.ref_count - counts[blob.sha256], 0)
+        blob.updated_at = now
+    db.flush()
+
+
+def collect(sha256_values: Iterable[str]) -> int:
+    """Shred blobs whose last reference was released (best effort).
+
+    Args:
+        sha256_values: Blob hashes released by the caller
+
+    Returns:
+        Number of blobs shredded
+    """
+    detached: List[Path] = []
+    for sha256 in dict.fromkeys(sha256_values):
+        try:
+            path = _detach_one(sha256)
+            if path is not None:
+                detached.append(path)
+        except Exception as e:
+            logger.error("blob_collect_failed", extra={"error_type": type(e).__name__})
+    return shred_files(detached)
+
+
+def collect_unreferenced(limit: int = 1000) -> int:
+    """Shred blobs left at ref_count 0 (e.g. crash between release and collect).
+
+    Also shreds files left detached by a crash between detach and shred.
+
+    Args:
+        limit: Max blobs per call
+
+    Returns:
+        Number of blobs shredded
+    """
+    leftovers = shred_files(list(file_storage.iter_detached())[:limit])
+    with get_db() as db:
+        sha256_values = [
+            row.sha256
+            for row in db.query(StorageBlob.sha256).filter(StorageBlob.ref_count <= 0).limit(limit)
+        ]
+    return leftovers + collect(sha256_values)
+
+
+def _detach_one(sha256: str) -> Optional[Path]:
+    """Detach one blob if unreferenced (row lock held while detaching).
+
+    Returns:
+        Detached path to shred, or None if still referenced or already gone
+    """
+    with get_db() as db:
+        blob = db.query(StorageBlob).filter(StorageBlob.sha256 == sha256).with_for_update().first()
+        if blob is not None:
+            if blob.ref_count > 0:
+                return None  # Re-uploaded meanwhile
+        elif _count_asset_refs(db, sha256) > 0:
+            return None  # Untracked blob still used
+        detached = file_storage.detach_blob(sha256)
+        if blob is not None:
+            db.delete(blob)
+            # Scrubber result goes with the blob
+            db.query(BlobIntegrityStatus).filter(BlobIntegrityStatus.sha256 == sha256).delete(synchronize_session=False)
+            db.commit()
+        return detached
+
+
+def _count_asset_refs(db: Session, sha256: str) -> int:
+    """Count asset rows referencing a blob (fallback for untracked blobs)."""
+    from app.modules.record.models import AudioAsset
+
+    files = db.query(func.count(ProjectFile.id)).filter(ProjectFile.sha256 == sha256).scalar() or 0
+    audio = db.query(func.count(AudioAsset.id)).filter(
+        AudioAsset.sha256 == sha256,
+        AudioAsset.destroy_status != "destroyed",
+    ).scalar() or 0
+    return files + audio
+
@@ -0,0 +1,45 @@
+"""Artifact counts and last activity for a page of projects.
+
+Read from the project_activity projection (one query per page, in the
+caller's session). Projects without a projection row - created before
+migration 015 and not yet rebuilt - are aggregated with grouped queries
+(see activity.compute_activity), never one query per project.
+
+Benchmark: scripts/bench_project_counts.py
+"""
+from typing import Any, Dict, Iterable
+
+from sqlalchemy.orm import Session
+
+from app.modules.projects.activity import empty_activity, get_activity
+from app.modules.projects.models import Project
+
+
+def empty_counts() -> Dict[str, Any]:
+    """Counts for a project without artifacts (or without DB)."""
+    return empty_activity()
+
+
+def get_project_counts(db: Session, projects: Iterable[Project]) -> Dict[int, Dict[str, Any]]:
+    """Counts and last activity for many projects.
+
+    Args:
+        db: Database session (caller's)
+        projects: Loaded project rows
+
+    Returns:
+        Dict project_id -> {transcripts_count, notes_count, files_count, audio_count,
+        bytes_stored, last_activity_at (ISO string)}
+    """
+    project_ids = [project.id for project in projects]
+    if not project_ids:
+        return {}
+
+    result: Dict[int, Dict[str, Any]] = {}
+    activity = get_activity(db, project_ids)
+    for project_id in project_ids:
+        counts = activity.get(project_id) or empty_counts()
+        last_activity = counts["last_activity_at"]
+        counts["last_activity_at"] = last_activity.isoformat() if last_activity else None
+        result[project_id] = counts
+    return result
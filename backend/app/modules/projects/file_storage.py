@@ -1,69 +1,71 @@
 """File storage with encryption - paranoid security."""
 import base64
-import binascii
 import hashlib
 import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Tuple
+from uuid import uuid4
 
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 from app.core.config import settings
+from app.core.logging import logger
+from app.modules.projects import blob_index
+from app.modules.projects.keyring import get_keyring
+from app.modules.projects.secure_delete import shred_file, shred_files
+from app.modules.projects.blob_crypto import (
+    FRAME_SIZE,
+    BlobReader,
+    FrameEncryptor,
+    decrypt_bytes,
+    encrypt_bytes,
+    is_container,
+)
 
 
 # Storage directory (will be created if needed)
 _STORAGE_DIR = Path("/app/data/files")  # Read-only filesystem except /app/data
 
+# Blobs renamed out of the way before shredding (.shred-{uuid}.tmp)
+DETACHED_PREFIX = ".shred-"
+
+# Last storage dir created by _ensure_storage_dir (avoids mkdir per call)
+_ready_dir: Optional[Path] = None
+
 
 def _get_encryption_key() -> bytes:
-    """Get encryption key from environment (base64 URL-safe encoded).
-    
-    Fernet keys are base64 URL-safe encoded (uses - and _ instead of + and /).
+    """Get current master key (parsed once by keyring, see keyring.py).
     
     Returns:
-        Fernet encryption key (32 bytes)
+        Master key (32 bytes)
         
     Raises:
         ValueError: If PROJECT_FILES_KEY not set or invalid format
     """
-    key_b64 = os.getenv("PROJECT_FILES_KEY")
-    if not key_b64:
-        raise ValueError(
-            "PROJECT_FILES_KEY environment variable not set. "
-            "Required for file encryption. Set a base64 URL-safe encoded Fernet key."
-        )
-    
-    # Strip whitespace (common in .env files)
-    key_b64 = key_b64.strip()
-    
-    try:
-        # Fernet uses URL-safe base64 encoding
-        key_bytes = base64.urlsafe_b64decode(key_b64)
-        # Fernet keys must be exactly 32 bytes
-        if len(key_bytes) != 32:
-            raise ValueError(
-                f"PROJECT_FILES_KEY must decode to exactly 32 bytes, got {len(key_bytes)} bytes. "
-                "Generate a new key with: python -c 'from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())'"
-            )
-        return key_bytes
-    except binascii.Error as e:
-        raise ValueError(f"Invalid PROJECT_FILES_KEY format (must be base64 URL-safe): {e}")
-    except Exception as e:
-        raise ValueError(f"Invalid PROJECT_FILES_KEY format: {e}")
+    return get_keyring().primary_key
 
 
 def _ensure_storage_dir() -> Path:
-    """Ensure storage directory exists.
+    """Ensure storage directory exists (created once per process).
     
     Returns:
         Storage directory path
     """
-    _STORAGE_DIR.mkdir(parents=True, exist_ok=True)
+    global _ready_dir
+    if _ready_dir != _STORAGE_DIR:
+        _STORAGE_DIR.mkdir(parents=True, exist_ok=True)
+        _ready_dir = _STORAGE_DIR
     return _STORAGE_DIR
 
 
+def relative_blob_path(sha256: str) -> str:
+    """Sharded blob path relative to storage dir (ab/cd/{sha256}.bin)."""
+    return f"{sha256[:2]}/{sha256[2:4]}/{sha256}.bin"
+
+
 def compute_file_hash(content: bytes) -> str:
     """Compute SHA256 hash of file content.
     
@@ -77,7 +79,7 @@ def compute_file_hash(content: bytes) -> str:
 
 
 def encrypt_content(content: bytes) -> bytes:
-    """Encrypt file content.
+    """Encrypt file content (chunked AES-GCM container, see blob_crypto).
     
     Args:
         content: File content bytes
@@ -85,16 +87,11 @@ def encrypt_content(content: bytes) -> bytes:
     Returns:
         Encrypted content bytes
     """
-    # Fernet expects the base64-encoded key string, not decoded bytes
-    key_b64 = os.getenv("PROJECT_FILES_KEY", "").strip()
-    if not key_b64:
-        raise ValueError("PROJECT_FILES_KEY not set")
-    fernet = Fernet(key_b64.encode('ascii'))  # Fernet will decode it internally
-    return fernet.encrypt(content)
+    return encrypt_bytes(content, _get_encryption_key())
 
 
 def decrypt_content(encrypted_content: bytes) -> bytes:
-    """Decrypt file content.
+    """Decrypt file content (chunked container or legacy Fernet).
     
     Args:
         encrypted_content: Encrypted content bytes
@@ -102,19 +99,33 @@ def decrypt_content(encrypted_content: bytes) -> bytes:
     Returns:
         Decrypted content bytes
     """
-    # Fernet expects the base64-encoded key string, not decoded bytes
-    key_b64 = os.getenv("PROJECT_FILES_KEY", "").strip()
-    if not key_b64:
-        raise ValueError("PROJECT_FILES_KEY not set")
-    fernet = Fernet(key_b64.encode('ascii'))  # Fernet will decode it internally
-    return fernet.decrypt(encrypted_content)
+    if is_container(encrypted_content):
+        return decrypt_bytes(encrypted_content, get_keyring().keys)
+    return _legacy_fernet_decrypt(encrypted_content)
+
+
+def _legacy_fernet_decrypt(encrypted_content: bytes) -> bytes:
+    """Decrypt legacy whole-file Fernet blob (pre-container format, read-only).
+    
+    Args:
+        encrypted_content: Fernet token bytes
+        
+    Returns:
+        Decrypted content bytes
+    """
+    # MultiFernet tries current key first, then old keys (rotation)
+    return get_keyring().fernet.decrypt(encrypted_content)
 
 
 def store_file(content: bytes, sha256: str) -> str:
-    """Store encrypted file on disk.
+    """Store encrypted file on disk (content-addressed, deduplicated).
+    
+    Files are stored as ab/cd/{sha256}.bin (no original filename on disk).
+    Content is encrypted frame by frame while it is written. If the blob
+    already exists, encryption and the write are skipped.
     
-    Files are stored as {sha256}.bin (no original filename on disk).
-    Content is encrypted before storage.
+    Callers hold a blob_store reference (acquire) before storing, so an
+    existing blob cannot be shredded underneath them.
     
     Args:
         content: File content bytes
@@ -123,30 +134,273 @@ def store_file(content: bytes, sha256: str) -> str:
     Returns:
         Storage path (relative to storage dir)
     """
-    # Verify hash matches
-    actual_hash = compute_file_hash(content)
-    if actual_hash != sha256:
-        raise ValueError(f"Hash mismatch: expected {sha256}, got {actual_hash}")
+    existing = stored_blob_path(sha256)
+    if existing is not None:
+        return existing
+    
+    with BlobWriter() as writer:
+        view = memoryview(content)
+        for offset in range(0, len(content), FRAME_SIZE):
+            writer.write(bytes(view[offset:offset + FRAME_SIZE]))
+        _, _, storage_path = writer.commit(expected_sha256=sha256)
+    return storage_path
+
+
+class BlobWriter:
+    """Streaming encrypted blob writer (bounded memory).
+    
+    Plaintext chunks are hashed (SHA256) and encrypted frame by frame into a
+    temp file in the storage dir, which is atomically renamed to
+    ab/cd/{sha256}.bin on commit and recorded in blob_index (with the hash of
+    the ciphertext, computed while writing). Nothing is left behind if the
+    writer is aborted.
+    
+    Usage:
+        with BlobWriter() as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+            sha256, size_bytes, storage_path = writer.commit()
+    """
     
-    # Encrypt content
-    encrypted = encrypt_content(content)
+    def __init__(self) -> None:
+        storage_dir = _ensure_storage_dir()
+        self._tmp_path = storage_dir / f".upload-{uuid4().hex}.tmp"
+        self._file = open(self._tmp_path, "xb")
+        self._hash = hashlib.sha256()
+        self._ciphertext_hash = hashlib.sha256()
+        self._ciphertext_size = 0
+        keyring = get_keyring()
+        self._encryptor = FrameEncryptor(keyring.primary_key, key_id=keyring.primary_id)
+        self._write_out(self._encryptor.header)
+        self.size_bytes = 0
+        self.sha256: Optional[str] = None
+        self.deduplicated = False
+        self._done = False
     
-    # Ensure storage directory exists
+    def write(self, chunk: bytes) -> None:
+        """Hash and encrypt a plaintext chunk."""
+        self._hash.update(chunk)
+        self.size_bytes += len(chunk)
+        self._write_out(self._encryptor.update(chunk))
+    
+    def _write_out(self, data: bytes) -> None:
+        self._ciphertext_hash.update(data)
+        self._ciphertext_size += len(data)
+        self._file.write(data)
+    
+    def commit(self, expected_sha256: Optional[str] = None, replace: bool = False) -> Tuple[str, int, str]:
+        """Finalize, fsync and move blob into place (finish + place).
+        
+        Args:
+            expected_sha256: Optional hash to verify against
+            replace: Overwrite an existing blob (re-encryption) instead of deduplicating
+        
+        Returns:
+            Tuple of (sha256, size_bytes, storage_path relative to storage dir)
+        
+        Raises:
+            ValueError: If hash does not match expected_sha256
+        """
+        sha256, size_bytes = self.finish(expected_sha256)
+        return sha256, size_bytes, self.place(replace=replace)
+    
+    def finish(self, expected_sha256: Optional[str] = None) -> Tuple[str, int]:
+        """Finalize encryption and fsync the temp file (not yet in place).
+        
+        Use with place() when a blob_store reference must be acquired in
+        between (hash is only known once the stream is finished).
+        
+        Args:
+            expected_sha256: Optional hash to verify against
+        
+        Returns:
+            Tuple of (sha256, size_bytes)
+        
+        Raises:
+            ValueError: If hash does not match expected_sha256
+        """
+        sha256 = self._hash.hexdigest()
+        if expected_sha256 is not None and sha256 != expected_sha256:
+            self.abort()
+            raise ValueError(f"Hash mismatch: expected {expected_sha256}, got {sha256}")
+        self._write_out(self._encryptor.finalize())
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self.sha256 = sha256
+        return sha256, self.size_bytes
+    
+    def place(self, replace: bool = False) -> str:
+        """Move finished blob to ab/cd/{sha256}.bin (discarded if that blob already exists).
+        
+        Args:
+            replace: Overwrite an existing blob in place (re-encryption) instead of deduplicating
+        
+        Returns:
+            Storage path (relative to storage dir)
+        """
+        target = blob_path(self.sha256)
+        if target.exists() and not replace:
+            # Deduplicated: same content already stored
+            self._tmp_path.unlink(missing_ok=True)
+            self.deduplicated = True
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(self._tmp_path, target)
+            _index_record(self.sha256, self._ciphertext_size, self._ciphertext_hash.hexdigest())
+        self._done = True
+        return target.relative_to(_STORAGE_DIR).as_posix()
+    
+    def abort(self) -> None:
+        """Discard temp file (idempotent)."""
+        if self._done:
+            return
+        self._done = True
+        try:
+            if not self._file.closed:
+                self._file.close()
+        finally:
+            self._tmp_path.unlink(missing_ok=True)
+    
+    def __enter__(self) -> "BlobWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if not self._done:
+            self.abort()
+
+
+class _LegacyBlobReader:
+    """BlobReader interface over a legacy Fernet blob (decrypted whole, no random access)."""
+    
+    def __init__(self, encrypted: bytes) -> None:
+        self._plaintext = _legacy_fernet_decrypt(encrypted)
+        self.size = len(self._plaintext)
+    
+    def iter_range(self, start: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+        end = self.size if end is None else min(end, self.size)
+        view = memoryview(self._plaintext)
+        for offset in range(max(start, 0), end, FRAME_SIZE):
+            yield bytes(view[offset:min(offset + FRAME_SIZE, end)])
+
+
+def blob_path(sha256: str) -> Path:
+    """Absolute path of stored blob.
+    
+    Blobs live in two-level shards (ab/cd/{sha256}.bin). Blobs written before
+    sharding stay at {sha256}.bin until moved by blob_layout_runner.
+    
+    Args:
+        sha256: SHA256 hash (filename)
+        
+    Returns:
+        Path to the blob (sharded path if it is not stored yet)
+    """
     storage_dir = _ensure_storage_dir()
+    sharded = storage_dir / relative_blob_path(sha256)
+    if not sharded.exists():
+        flat = storage_dir / f"{sha256}.bin"
+        if flat.exists():
+            return flat
+    return sharded
+
+
+def stored_blob_path(sha256: str) -> Optional[str]:
+    """Storage path of an already stored blob (relative to storage dir, None if not stored)."""
+    path = blob_path(sha256)
+    if not path.exists():
+        return None
+    return path.relative_to(_STORAGE_DIR).as_posix()
+
+
+def iter_blob_paths() -> Iterator[Path]:
+    """Yield paths of all stored blobs (flat legacy layout first, then shards)."""
+    storage_dir = _ensure_storage_dir()
+    yield from sorted(storage_dir.glob("*.bin"))
+    yield from sorted(storage_dir.glob("??/??/*.bin"))
+
+
+def _index_record(sha256: str, size_bytes: int, ciphertext_sha256: str) -> None:
+    """Record blob in blob_index (best effort - index can be rebuilt)."""
+    try:
+        blob_index.record(sha256, size_bytes, ciphertext_sha256)
+    except Exception as e:
+        logger.warning("blob_index_update_failed", extra={"error_type": type(e).__name__})
+
+
+def _index_remove(sha256: str) -> None:
+    """Remove blob from blob_index (best effort - index can be rebuilt)."""
+    try:
+        blob_index.remove(sha256)
+    except Exception as e:
+        logger.warning("blob_index_update_failed", extra={"error_type": type(e).__name__})
+
+
+def is_legacy_blob(sha256: str) -> bool:
+    """Check if stored blob is in the legacy Fernet format.
+    
+    Args:
+        sha256: SHA256 hash (filename)
+        
+    Returns:
+        True if blob predates the chunked container
+    """
+    with open(blob_path(sha256), "rb") as f:
+        return not is_container(f.read(4))
+
+
+@contextmanager
+def open_blob(sha256: str):
+    """Open stored blob for streaming/random-access reads.
     
-    # Store as {sha256}.bin
-    storage_path = storage_dir / f"{sha256}.bin"
+    Yields a reader with `size` (plaintext bytes) and `iter_range(start, end)`.
+    Container blobs decrypt only the frames covering the range; legacy Fernet
+    blobs are decrypted whole (until migrated with reencrypt_runner).
     
-    # Write encrypted content
-    storage_path.write_bytes(encrypted)
+    Args:
+        sha256: SHA256 hash (filename)
+        
+    Yields:
+        Blob reader
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    storage_path = blob_path(sha256)
+    if not storage_path.exists():
+        raise FileNotFoundError(f"File not found: {sha256}")
     
-    # Return relative path
-    return f"{sha256}.bin"
+    with open(storage_path, "rb") as f:
+        if is_container(f.read(4)):
+            yield BlobReader(f, get_keyring().keys)
+        else:
+            f.seek(0)
+            yield _LegacyBlobReader(f.read())
+
+
+def iter_file(sha256: str, start: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+    """Stream decrypted file content (bounded memory for container blobs).
+    
+    Args:
+        sha256: SHA256 hash (filename)
+        start: First byte (inclusive)
+        end: Last byte (exclusive, default: end of file)
+        
+    Yields:
+        Decrypted chunks (at most one frame each)
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    with open_blob(sha256) as reader:
+        yield from reader.iter_range(start, end)
 
 
 def retrieve_file(sha256: str) -> bytes:
     """Retrieve and decrypt file from disk.
     
+    Prefer iter_file/open_blob for large files (this loads the whole file).
+    
     Args:
         sha256: SHA256 hash (filename)
         
@@ -156,21 +410,42 @@ def retrieve_file(sha256: str) -> bytes:
     Raises:
         FileNotFoundError: If file doesn't exist
     """
-    storage_dir = _ensure_storage_dir()
-    storage_path = storage_dir / f"{sha256}.bin"
-    
-    if not storage_path.exists():
-        raise FileNotFoundError(f"File not found: {sha256}")
+    return b"".join(iter_file(sha256))
+
+
+def detach_blob(sha256: str) -> Optional[Path]:
+    """Atomically move blob out of its content address (to be shredded).
     
-    # Read encrypted content
-    encrypted = storage_path.read_bytes()
+    After this, blob_path(sha256) no longer exists - a concurrent upload of
+    the same content writes a fresh blob instead of deduplicating against a
+    file that is being shredded. Callers shred the returned path.
     
-    # Decrypt
-    return decrypt_content(encrypted)
+    Args:
+        sha256: SHA256 hash (filename)
+        
+    Returns:
+        Path of detached file, or None if the blob does not exist
+    """
+    storage_path = blob_path(sha256)
+    detached = _STORAGE_DIR / f"{DETACHED_PREFIX}{uuid4().hex}.tmp"
+    try:
+        os.replace(storage_path, detached)
+    except FileNotFoundError:
+        detached = None
+    _index_remove(sha256)
+    return detached
+
+
+def iter_detached() -> Iterator[Path]:
+    """Yield detached files left behind (crash between detach and shred)."""
+    yield from _ensure_storage_dir().glob(f"{DETACHED_PREFIX}*.tmp")
 
 
 def delete_file(sha256: str) -> None:
-    """Delete file from disk (best-effort secure deletion).
+    """Delete file from disk (best-effort secure deletion, see secure_delete).
+    
+    Unconditional - blobs are shared between assets, so callers release
+    references via blob_store.release() + collect() instead.
     
     **Secure Delete Policy:**
     - On SSD: Cannot guarantee overwrite (wear leveling, TRIM)
@@ -180,25 +455,24 @@ def delete_file(sha256: str) -> None:
     Args:
         sha256: SHA256 hash (filename)
     """
-    storage_dir = _ensure_storage_dir()
-    storage_path = storage_dir / f"{sha256}.bin"
+    detached = detach_blob(sha256)
+    if detached is not None:
+        shred_file(detached)
+
+
+def delete_files(sha256_values: Iterable[str]) -> int:
+    """Delete many blobs (detached one by one, shredded in parallel).
     
-    if storage_path.exists():
-        # Best-effort overwrite (may not work on SSD)
-        try:
-            file_size = storage_path.stat().st_size
-            # Overwrite with zeros
-            storage_path.write_bytes(b"\x00" * file_size)
-            # Sync to disk (if supported)
-            try:
-                os.fsync(storage_path.fileno())
-            except Exception:
-                pass  # Best effort
-        except Exception:
-            pass  # Best effort - continue with deletion
-        
-        # Delete file
-        storage_path.unlink()
+    Unconditional - see delete_file.
+    
+    Args:
+        sha256_values: Blob hashes
+        
+    Returns:
+        Number of blobs removed
+    """
+    detached = [path for path in (detach_blob(sha256) for sha256 in dict.fromkeys(sha256_values)) if path]
+    return shred_files(detached)
 
 
 def generate_encryption_key() -> str:
@@ -1,21 +1,178 @@
-"""Integrity verification for projects."""
-from typing import Dict, List, Any
+"""Integrity verification for projects.
+
+Checks per project:
+- Notes: SHA256 of body_text against note_integrity_hash
+- Transcripts: SHA256 of the segment texts ("\\n"-joined, ordered by start_ms)
+  against raw_integrity_hash - segments of all transcripts are streamed in one
+  ordered query and fed to the hash incrementally (no joined string)
+- Blobs (project files + audio): ciphertext SHA256 against blob_index,
+  hashed in parallel on INTEGRITY_WORKERS threads (one stat per blob)
+
+Verified artifacts are cached as (object, hash, version) - version is
+updated_at for rows and (mtime, size) for blobs. Re-verification only reads
+artifacts whose version changed since they last verified OK; mismatches are
+never cached. full=True ignores the cache.
+
+If the project has a Merkle manifest (merkle.py), the hashes computed above
+are also built into a tree and compared with the stored root; on mismatch
+only the differing subtrees are walked, so issues name the exact segment,
+note, audio or file leaf ("Manifest: transcripts/5/s831 hash mismatch").
+Unchanged (cached) transcripts enter with their stored group hash.
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
 
-from app.core.database import get_db
 from app.core.config import settings
-from app.modules.projects.models import Project, ProjectNote, ProjectFile
-from app.modules.transcripts.models import Transcript, TranscriptSegment
-from app.core.privacy_guard import compute_integrity_hash, verify_integrity
+from app.core.database import get_db
+from app.core.logging import logger
+from app.core.privacy_guard import compute_integrity_hash
+from app.modules.projects import blob_index, merkle
+from app.modules.projects.file_storage import blob_path
+from app.modules.projects.models import Project, ProjectFile, ProjectNote
+from app.modules.transcripts.models import Transcript, TranscriptSegment, TranscriptStats
+
+# Read size when hashing blobs
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Segment rows fetched per round trip while streaming
+SEGMENT_FETCH_SIZE = 1000
+
+_state_lock = threading.Lock()
+_verified: "OrderedDict[Tuple[str, Any], Tuple[str, Hashable]]" = OrderedDict()
+
+
+def _cached(key: Tuple[str, Any], expected_hash: str, version: Hashable) -> bool:
+    """Check if artifact verified OK with the same hash and version."""
+    with _state_lock:
+        entry = _verified.get(key)
+        if entry is None or entry != (expected_hash, version):
+            return False
+        _verified.move_to_end(key)
+        return True
+
+
+def _remember(key: Tuple[str, Any], expected_hash: str, version: Hashable) -> None:
+    """Cache a verified artifact (LRU, INTEGRITY_CACHE_SIZE entries)."""
+    with _state_lock:
+        _verified[key] = (expected_hash, version)
+        _verified.move_to_end(key)
+        while len(_verified) > max(0, settings.integrity_cache_size):
+            _verified.popitem(last=False)
+
+
+def _forget(key: Tuple[str, Any]) -> None:
+    with _state_lock:
+        _verified.pop(key, None)
+
+
+def clear_cache() -> None:
+    """Drop all cached verification results (next run re-reads everything)."""
+    with _state_lock:
+        _verified.clear()
+
+
+def _hash_blob(path) -> Tuple[Optional[str], Optional[Tuple[float, int]]]:
+    """Stat and hash a stored blob (worker thread).
+
+    Returns:
+        Tuple of (ciphertext SHA256, (mtime, size)) - (None, None) if missing
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None, None
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest(), (stat.st_mtime, stat.st_size)
+
+
+def _stat_version(path) -> Optional[Tuple[float, int]]:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime, stat.st_size
+
 
+def _verify_blob(sha256: str, expected: Optional[str], full: bool = False) -> Tuple[str, bool, Optional[str]]:
+    """Verify one blob (worker thread).
 
-def verify_project_integrity(project_id: int) -> Dict[str, Any]:
+    Returns:
+        Tuple of (outcome: ok|cached|missing|unindexed|mismatch, hashed,
+        ciphertext SHA256 on disk - None if missing or unindexed)
+    """
+    path = blob_path(sha256)
+    key = ("blob", sha256)
+    if expected is None:
+        # Predates the index - presence only (rebuild_index records a baseline)
+        return ("unindexed" if _stat_version(path) else "missing"), False, None
+    version = _stat_version(path)
+    if version is None:
+        _forget(key)
+        return "missing", False, None
+    if not full and _cached(key, expected, version):
+        return "cached", False, expected
+    actual, version = _hash_blob(path)
+    if actual is None:
+        return "missing", True, None
+    if actual != expected:
+        _forget(key)
+        return "mismatch", True, actual
+    _remember(key, expected, version)
+    return "ok", True, actual
+
+
+def _stream_segment_hashes(
+    db, transcript_ids: List[int], with_leaves: bool = False
+) -> Iterator[Tuple[int, str, Dict[str, str]]]:
+    """Yield (transcript_id, SHA256 of "\\n"-joined segment texts, segment leaves) in one ordered query.
+
+    Segment leaves (manifest path -> hash) are only computed with with_leaves.
+    Transcripts without segments are not yielded.
+    """
+    rows = db.query(TranscriptSegment.transcript_id, TranscriptSegment.id, TranscriptSegment.text).filter(
+        TranscriptSegment.transcript_id.in_(transcript_ids)
+    ).order_by(
+        TranscriptSegment.transcript_id, TranscriptSegment.start_ms, TranscriptSegment.id
+    ).yield_per(SEGMENT_FETCH_SIZE)
+
+    current: Optional[int] = None
+    digest = None
+    leaves: Dict[str, str] = {}
+    for transcript_id, segment_id, text in rows:
+        if transcript_id != current:
+            if current is not None:
+                yield current, digest.hexdigest(), leaves
+            current = transcript_id
+            digest = hashlib.sha256()
+            leaves = {}
+        else:
+            digest.update(b"\n")
+        digest.update(text.encode("utf-8"))
+        if with_leaves:
+            leaves[f"transcripts/{transcript_id}/s{segment_id}"] = merkle.segment_leaf(text)
+    if current is not None:
+        yield current, digest.hexdigest(), leaves
+
+
+def verify_project_integrity(project_id: int, full: bool = False) -> Dict[str, Any]:
     """Verify integrity of all artifacts in a project.
-    
+
     Args:
         project_id: Project ID
-        
+        full: Re-read everything, ignoring the cache (e.g. to catch bit rot
+            that leaves mtime unchanged)
+
     Returns:
-        Dict with integrity_ok, checked counts, and issues list
+        Dict with integrity_ok, checked counts, cached (unchanged since last
+        successful check, not re-read), unindexed blobs, manifest (root and
+        status ok|mismatch|missing) and issues list
     """
     # Import engine from module to get current value (not cached import)
     from app.core.database import engine
@@ -23,60 +180,165 @@ def verify_project_integrity(project_id: int) -> Dict[str, Any]:
         # No DB mode - return mock
         return {
             "integrity_ok": True,
-            "checked": {"transcripts": 0, "notes": 0, "files": 0},
+            "checked": {"transcripts": 0, "notes": 0, "files": 0, "audio": 0},
+            "cached": 0,
+            "unindexed": 0,
+            "manifest": {"root": None, "status": "missing"},
             "issues": [],
         }
-    
+
+    from app.modules.record.models import AudioAsset
+
     issues: List[str] = []
-    checked = {"transcripts": 0, "notes": 0, "files": 0}
-    
+    checked = {"transcripts": 0, "notes": 0, "files": 0, "audio": 0}
+    cached = 0
+    # Manifest path -> hash of the artifact as it is now
+    leaves: Dict[str, str] = {}
+
     with get_db() as db:
         # Verify project exists
-        project = db.query(Project).filter(Project.id == project_id).first()
-        if not project:
+        if db.query(Project.id).filter(Project.id == project_id).first() is None:
             return {
                 "integrity_ok": False,
                 "checked": checked,
+                "cached": 0,
+                "unindexed": 0,
+                "manifest": {"root": None, "status": "missing"},
                 "issues": [f"Project {project_id} not found"],
             }
-        
-        # Verify notes
-        notes = db.query(ProjectNote).filter(ProjectNote.project_id == project_id).all()
+        manifest_root = merkle.get_root(db, project_id)
+
+        # Notes: body_text loaded only for notes changed since last check
+        notes = db.query(ProjectNote.id, ProjectNote.note_integrity_hash, ProjectNote.updated_at).filter(
+            ProjectNote.project_id == project_id
+        ).all()
+        checked["notes"] = len(notes)
+        expected_notes = {}
         for note in notes:
-            checked["notes"] += 1
-            expected_hash = note.note_integrity_hash
-            actual_hash = compute_integrity_hash(note.body_text)
-            if actual_hash != expected_hash:
-                issues.append(f"Note {note.id}: integrity hash mismatch")
-        
-        # Verify transcripts (if raw_integrity_hash is set)
-        transcripts = db.query(Transcript).filter(Transcript.project_id == project_id).all()
-        for transcript in transcripts:
-            checked["transcripts"] += 1
-            if transcript.raw_integrity_hash:
-                # Recompute hash from segments
-                segments = db.query(TranscriptSegment).filter(
-                    TranscriptSegment.transcript_id == transcript.id
-                ).order_by(TranscriptSegment.start_ms).all()
-                raw_content = "\n".join(s.text for s in segments)
-                actual_hash = compute_integrity_hash(raw_content)
-                if actual_hash != transcript.raw_integrity_hash:
-                    issues.append(f"Transcript {transcript.id}: integrity hash mismatch")
-        
-        # Verify files (check file exists on disk)
-        files = db.query(ProjectFile).filter(ProjectFile.project_id == project_id).all()
-        for file in files:
-            checked["files"] += 1
-            # Check file exists (actual file verification would require decryption)
-            from app.modules.projects.file_storage import _ensure_storage_dir
-            storage_dir = _ensure_storage_dir()
-            storage_path = storage_dir / f"{file.sha256}.bin"
-            if not storage_path.exists():
-                issues.append(f"File {file.id}: storage file missing")
-    
+            if not full and _cached(("note", note.id), note.note_integrity_hash, note.updated_at):
+                cached += 1
+                leaves[f"notes/{note.id}"] = note.note_integrity_hash
+            else:
+                expected_notes[note.id] = (note.note_integrity_hash, note.updated_at)
+        if expected_notes:
+            for note_id, body_text in db.query(ProjectNote.id, ProjectNote.body_text).filter(
+                ProjectNote.id.in_(list(expected_notes))
+            ):
+                expected_hash, updated_at = expected_notes[note_id]
+                actual_hash = compute_integrity_hash(body_text)
+                leaves[f"notes/{note_id}"] = actual_hash
+                if actual_hash != expected_hash:
+                    _forget(("note", note_id))
+                    issues.append(f"Note {note_id}: integrity hash mismatch")
+                else:
+                    _remember(("note", note_id), expected_hash, updated_at)
+
+        # Transcripts (if raw_integrity_hash is set) - version includes the segment projection
+        transcripts = db.query(
+            Transcript.id, Transcript.raw_integrity_hash, Transcript.updated_at,
+            TranscriptStats.updated_at.label("segments_updated_at"), TranscriptStats.segments_count,
+        ).outerjoin(TranscriptStats, TranscriptStats.transcript_id == Transcript.id).filter(
+            Transcript.project_id == project_id
+        ).all()
+        checked["transcripts"] = len(transcripts)
+        # Unchanged transcripts enter the tree with their stored group hash
+        stored_groups = merkle.stored_children(db, project_id, "transcripts") if manifest_root else {}
+        expected_transcripts = {}
+        streamed: List[int] = []
+        for t in transcripts:
+            version = (t.updated_at, t.segments_updated_at, t.segments_count)
+            if t.raw_integrity_hash and not full and _cached(("transcript", t.id), t.raw_integrity_hash, version):
+                cached += 1
+                group = f"transcripts/{t.id}"
+                if group in stored_groups:
+                    leaves[group] = stored_groups[group]
+                continue
+            if t.raw_integrity_hash:
+                expected_transcripts[t.id] = (t.raw_integrity_hash, version)
+            if t.raw_integrity_hash or manifest_root:
+                streamed.append(t.id)
+        if streamed:
+            # No segments = empty content
+            actual = {transcript_id: compute_integrity_hash("") for transcript_id in streamed}
+            for transcript_id, content_hash, segment_leaves in _stream_segment_hashes(
+                db, streamed, with_leaves=manifest_root is not None
+            ):
+                actual[transcript_id] = content_hash
+                leaves.update(segment_leaves)
+            for transcript_id, (expected_hash, version) in expected_transcripts.items():
+                if actual[transcript_id] != expected_hash:
+                    _forget(("transcript", transcript_id))
+                    issues.append(f"Transcript {transcript_id}: integrity hash mismatch")
+                else:
+                    _remember(("transcript", transcript_id), expected_hash, version)
+
+        # Blobs referenced by the project
+        files = db.query(ProjectFile.id, ProjectFile.sha256).filter(ProjectFile.project_id == project_id).all()
+        audio = db.query(AudioAsset.id, AudioAsset.sha256).filter(
+            AudioAsset.transcript_id.in_(db.query(Transcript.id).filter(Transcript.project_id == project_id)),
+            AudioAsset.destroy_status == "none",
+        ).all()
+
+    checked["files"] = len(files)
+    checked["audio"] = len(audio)
+
+    # Each blob once, even if shared by several artifacts
+    indexed = blob_index.lookup([row.sha256 for row in files] + [row.sha256 for row in audio])
+    unique = list(dict.fromkeys(row.sha256 for row in [*files, *audio]))
+    workers = max(1, min(settings.integrity_workers, len(unique) or 1))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="integrity") as executor:
+        outcomes = dict(zip(unique, executor.map(
+            lambda sha256: _verify_blob(sha256, (indexed.get(sha256) or {}).get("ciphertext_sha256"), full),
+            unique,
+        )))
+
+    unindexed = 0
+    blobs_hashed = 0
+    unknown: List[str] = []
+    for kind, group, rows in (("File", "files", files), ("Audio", "audio", audio)):
+        for row in rows:
+            outcome, _, ciphertext = outcomes[row.sha256]
+            if outcome == "missing":
+                issues.append(f"{kind} {row.id}: storage file missing")
+            elif outcome == "mismatch":
+                issues.append(f"{kind} {row.id}: ciphertext hash mismatch")
+            if ciphertext is not None:
+                leaves[f"{group}/{row.id}"] = ciphertext
+            elif outcome == "unindexed":
+                unknown.append(f"{group}/{row.id}")
+    for outcome, hashed, _ in outcomes.values():
+        cached += outcome == "cached"
+        unindexed += outcome == "unindexed"
+        blobs_hashed += hashed
+
+    # Merkle manifest - O(1) root compare, walk only mismatched subtrees
+    manifest_status = "missing"
+    if manifest_root is not None:
+        with get_db() as db:
+            # Unindexed blobs were not hashed - not compared
+            leaves.update(merkle.get_nodes(db, project_id, unknown))
+            problems = merkle.diff(db, project_id, merkle.build_tree(leaves))
+        manifest_status = "mismatch" if problems else "ok"
+        for path, problem in problems:
+            if problem == "mismatch":
+                issues.append(f"Manifest: {path} hash mismatch")
+            elif problem == "missing":
+                issues.append(f"Manifest: {path} recorded but not present")
+            else:
+                issues.append(f"Manifest: {path} not recorded")
+
+    logger.info("project_integrity_verified", extra={
+        "project_id": project_id,
+        "issues": len(issues),
+        "cached": cached,
+        "blobs_hashed": blobs_hashed,
+        "manifest_status": manifest_status,
+    })
     return {
         "integrity_ok": len(issues) == 0,
         "checked": checked,
+        "cached": cached,
+        "unindexed": unindexed,
+        "manifest": {"root": manifest_root, "status": manifest_status},
         "issues": issues,
     }
-
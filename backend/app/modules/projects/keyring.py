@@ -0,0 +1,121 @@
+"""Key management for stored blobs - keys parsed once, reused, rotatable.
+
+Environment:
+    PROJECT_FILES_KEY       Current key (base64 URL-safe, 32 bytes) - new blobs use it
+    PROJECT_FILES_OLD_KEYS  Comma-separated previous keys (read only, during rotation)
+
+Each container header carries the key id of the key it was written with
+(blob_crypto.key_id_for), so readers pick the right key directly. Legacy
+Fernet blobs are tried against all keys (MultiFernet).
+
+Keys are parsed and validated once (startup, or first use) and re-parsed only
+when the environment values change. Rotation:
+1. Set PROJECT_FILES_KEY to the new key, move the old one to PROJECT_FILES_OLD_KEYS
+2. Restart, run: python -m app.modules.projects.rekey_runner
+3. Remove the old key once rekey reports 0 remaining blobs
+"""
+import base64
+import binascii
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from cryptography.fernet import Fernet, MultiFernet
+
+from app.modules.projects.blob_crypto import key_id_for
+
+KEY_ENV = "PROJECT_FILES_KEY"
+OLD_KEYS_ENV = "PROJECT_FILES_OLD_KEYS"
+
+
+class Keyring:
+    """Parsed master keys and reusable cipher objects.
+
+    Attributes:
+        primary_key: Key for new blobs (32 bytes)
+        primary_id: Key id of primary_key
+        keys: key_id -> master key (primary first, then old keys)
+        fernet: MultiFernet over all keys (legacy blobs)
+    """
+
+    def __init__(self, primary_key: bytes, old_keys: Optional[List[bytes]] = None) -> None:
+        self.primary_key = primary_key
+        self.primary_id = key_id_for(primary_key)
+        self.keys: Dict[bytes, bytes] = {self.primary_id: primary_key}
+        for key in old_keys or []:
+            self.keys.setdefault(key_id_for(key), key)
+        self.fernet = MultiFernet([Fernet(base64.urlsafe_b64encode(key)) for key in self.keys.values()])
+
+    @property
+    def key_ids(self) -> List[str]:
+        """Hex key ids (primary first) - safe to log."""
+        return [key_id.hex() for key_id in self.keys]
+
+
+_lock = threading.Lock()
+_cached: Optional[Tuple[Tuple[Optional[str], Optional[str]], Keyring]] = None
+
+
+def _parse_key(value: str, name: str) -> bytes:
+    """Decode and validate one base64 URL-safe key.
+
+    Raises:
+        ValueError: If format or length is invalid
+    """
+    # Strip whitespace (common in .env files)
+    value = value.strip()
+    try:
+        # Fernet uses URL-safe base64 encoding
+        key_bytes = base64.urlsafe_b64decode(value)
+    except (binascii.Error, ValueError) as e:
+        raise ValueError(f"Invalid {name} format (must be base64 URL-safe): {e}")
+    # Fernet keys must be exactly 32 bytes
+    if len(key_bytes) != 32:
+        raise ValueError(
+            f"{name} must decode to exactly 32 bytes, got {len(key_bytes)} bytes. "
+            "Generate a new key with: python -c 'from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())'"
+        )
+    return key_bytes
+
+
+def _build(primary: Optional[str], old: Optional[str]) -> Keyring:
+    if not primary or not primary.strip():
+        raise ValueError(
+            f"{KEY_ENV} environment variable not set. "
+            "Required for file encryption. Set a base64 URL-safe encoded Fernet key."
+        )
+    old_keys = [_parse_key(value, OLD_KEYS_ENV) for value in (old or "").split(",") if value.strip()]
+    return Keyring(_parse_key(primary, KEY_ENV), old_keys)
+
+
+def load() -> Keyring:
+    """Parse and validate keys from the environment (call at startup to fail fast).
+
+    Returns:
+        Keyring
+
+    Raises:
+        ValueError: If PROJECT_FILES_KEY is not set or a key is invalid
+    """
+    global _cached
+    env = (os.environ.get(KEY_ENV), os.environ.get(OLD_KEYS_ENV))
+    with _lock:
+        keyring = _build(*env)
+        _cached = (env, keyring)
+    return keyring
+
+
+def get_keyring() -> Keyring:
+    """Get cached keyring (parsed again only if the environment changed).
+
+    Returns:
+        Keyring
+
+    Raises:
+        ValueError: If PROJECT_FILES_KEY is not set or a key is invalid
+    """
+    cached = _cached
+    env = (os.environ.get(KEY_ENV), os.environ.get(OLD_KEYS_ENV))
+    if cached is not None and cached[0] == env:
+        return cached[1]
+    return load()
@@ -0,0 +1,565 @@
+"""Merkle integrity manifest per project (integrity_nodes table).
+
+Tree paths (one row per node, hashes only - NO CONTENT):
+    ""                      root
+    notes/{note_id}         leaf: note_integrity_hash
+    transcripts/{id}        group: one leaf per segment
+    transcripts/{id}/s{n}   leaf: SHA256 of segment text (n = segment id)
+    audio/{asset_id}        leaf: ciphertext SHA256 of the audio blob
+    files/{file_id}         leaf: ciphertext SHA256 of the file blob
+
+A group hash is the binary Merkle root over its children, sorted by key
+(length, then text). Each child enters as H(0x00 | key | 0x00 | hash), inner
+nodes as H(0x01 | left | right); an odd node is promoted unchanged. Empty
+groups are removed; the root of an empty project is H("").
+
+Writes update the manifest in the same transaction (update()): changed
+leaves are written, then only their ancestors are recomputed, deepest
+first. Projects without a manifest (no root row) are left alone - a
+partial tree would report every other artifact as unrecorded. Writers
+lock the project row (SELECT ... FOR UPDATE, in id order) first, so
+concurrent writes to one manifest run one after the other. The root is a single row - comparing two manifests is O(1), and
+inclusion_proof() proves one artifact against the root without the rest.
+
+diff() walks a stored manifest against freshly computed hashes and only
+descends into subtrees whose hashes differ (used by integrity verification).
+
+Manifests for existing and new projects are built by the backfill CLI:
+    python -m app.modules.projects.merkle_runner
+"""
+import hashlib
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import insert, or_
+from sqlalchemy.orm import Session
+
+from app.modules.projects import blob_index
+from app.modules.projects.file_storage import blob_path
+from app.modules.projects.models import IntegrityNode, Project, ProjectFile, ProjectNote
+from app.modules.transcripts.models import Transcript, TranscriptSegment
+
+ROOT = ""
+
+# Hash of a tree without children
+EMPTY_HASH = hashlib.sha256(b"").hexdigest()
+
+# Read size when a blob is not in blob_index and must be hashed
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Paths per IN (...) clause
+_PATH_BATCH = 500
+
+
+def parent_of(path: str) -> Optional[str]:
+    """Parent path ("" for groups, None for the root)."""
+    if path == ROOT:
+        return None
+    return path.rsplit("/", 1)[0] if "/" in path else ROOT
+
+
+def _depth(path: str) -> int:
+    return 0 if path == ROOT else path.count("/") + 1
+
+
+def _key(path: str) -> str:
+    return path.rsplit("/", 1)[-1]
+
+
+def _sort_key(path: str) -> Tuple[int, str]:
+    key = _key(path)
+    return len(key), key
+
+
+def _entry(path: str, child_hash: str) -> bytes:
+    return hashlib.sha256(b"\x00" + _key(path).encode() + b"\x00" + child_hash.encode()).digest()
+
+
+def _inner(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def _levels(children: Dict[str, str]) -> List[List[bytes]]:
+    """All levels of the binary tree over children (leaf entries first)."""
+    level = [_entry(path, children[path]) for path in sorted(children, key=_sort_key)]
+    levels = [level]
+    while len(level) > 1:
+        level = [
+            _inner(level[i], level[i + 1]) if i + 1 < len(level) else level[i]
+            for i in range(0, len(level), 2)
+        ]
+        levels.append(level)
+    return levels
+
+
+def node_hash(children: Dict[str, str]) -> str:
+    """Hash of a node from its children's hashes.
+
+    Args:
+        children: Dict child path -> hash
+
+    Returns:
+        Hex digest (EMPTY_HASH without children)
+    """
+    if not children:
+        return EMPTY_HASH
+    return _levels(children)[-1][0].hex()
+
+
+def segment_leaf(text: str) -> str:
+    """Leaf hash of a transcript segment."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def blob_leaves(sha256_values: Iterable[str]) -> Dict[str, str]:
+    """Ciphertext hashes of stored blobs (blob_index, file hashed if unindexed).
+
+    Args:
+        sha256_values: Plaintext hashes (blob names)
+
+    Returns:
+        Dict sha256 -> ciphertext SHA256 (missing blobs are absent)
+    """
+    values = list(dict.fromkeys(sha256_values))
+    found = {sha256: entry["ciphertext_sha256"] for sha256, entry in blob_index.lookup(values).items()}
+    for sha256 in values:
+        if sha256 in found:
+            continue
+        digest = hashlib.sha256()
+        try:
+            with open(blob_path(sha256), "rb") as f:
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+        except FileNotFoundError:
+            continue
+        found[sha256] = digest.hexdigest()
+    return found
+
+
+def build_tree(leaves: Dict[str, str]) -> Dict[str, str]:
+    """Compute all node hashes from leaves (in memory).
+
+    A "leaf" may be any node whose hash is already known (e.g. an unchanged
+    transcript group taken from the stored manifest).
+
+    Args:
+        leaves: Dict path -> hash
+
+    Returns:
+        Dict path -> hash for leaves, groups and root
+    """
+    nodes = dict(leaves)
+    children: Dict[str, Dict[str, str]] = {}
+    for path in sorted(leaves, key=_depth, reverse=True):
+        parent = parent_of(path)
+        if parent is not None:
+            children.setdefault(parent, {})[path] = nodes[path]
+    # Inner nodes deepest first - a parent is complete once all deeper nodes are done
+    for depth in range(max((_depth(p) for p in children), default=0), -1, -1):
+        for parent in [p for p in children if _depth(p) == depth]:
+            nodes[parent] = node_hash(children[parent])
+            grandparent = parent_of(parent)
+            if grandparent is not None:
+                children.setdefault(grandparent, {})[parent] = nodes[parent]
+    nodes.setdefault(ROOT, EMPTY_HASH)
+    return nodes
+
+
+def stored_children(db: Session, project_id: int, parent: str) -> Dict[str, str]:
+    """Stored child hashes of a node (Dict path -> hash)."""
+    return {
+        row.path: row.hash
+        for row in db.query(IntegrityNode.path, IntegrityNode.hash).filter(
+            IntegrityNode.project_id == project_id,
+            IntegrityNode.parent_path == parent,
+        )
+    }
+
+
+def _lock(db: Session, project_ids: Iterable[int]) -> None:
+    """Lock project rows until commit (in id order - writers can't deadlock)."""
+    ids = sorted(set(project_ids))
+    for i in range(0, len(ids), _PATH_BATCH):
+        db.query(Project.id).filter(
+            Project.id.in_(ids[i:i + _PATH_BATCH])
+        ).order_by(Project.id).with_for_update().all()
+
+
+def _write(db: Session, project_id: int, nodes: Dict[str, str]) -> None:
+    """Replace node rows (delete + bulk insert, no ORM identity map)."""
+    paths = list(nodes)
+    now = datetime.utcnow()
+    for i in range(0, len(paths), _PATH_BATCH):
+        batch = paths[i:i + _PATH_BATCH]
+        db.query(IntegrityNode).filter(
+            IntegrityNode.project_id == project_id,
+            IntegrityNode.path.in_(batch),
+        ).delete(synchronize_session=False)
+        db.execute(insert(IntegrityNode), [
+            {"project_id": project_id, "path": path, "parent_path": parent_of(path), "hash": nodes[path], "updated_at": now}
+            for path in batch
+        ])
+
+
+def update(
+    db: Session,
+    project_id: int,
+    set_leaves: Optional[Dict[str, str]] = None,
+    remove: Iterable[str] = (),
+    remove_prefixes: Iterable[str] = (),
+) -> Optional[str]:
+    """Change leaves of a project manifest and recompute their ancestors (caller commits).
+
+    No-op for projects without a manifest - merkle_runner builds it.
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        set_leaves: Dict path -> hash to insert or replace
+        remove: Paths to remove (with their subtrees)
+        remove_prefixes: Path prefixes to remove (e.g. "transcripts/5/s" - all segment leaves)
+
+    Returns:
+        New root hash, None if the project has no manifest
+    """
+    _lock(db, [project_id])
+    if get_root(db, project_id) is None:
+        return None
+
+    set_leaves = set_leaves or {}
+    remove = list(remove)
+    remove_prefixes = list(remove_prefixes)
+    affected = set()
+
+    for i in range(0, len(remove), _PATH_BATCH):
+        batch = remove[i:i + _PATH_BATCH]
+        db.query(IntegrityNode).filter(
+            IntegrityNode.project_id == project_id,
+            or_(IntegrityNode.path.in_(batch), *[IntegrityNode.path.like(f"{path}/%") for path in batch]),
+        ).delete(synchronize_session=False)
+        affected.update(parent_of(path) for path in batch)
+    for prefix in remove_prefixes:
+        db.query(IntegrityNode).filter(
+            IntegrityNode.project_id == project_id,
+            IntegrityNode.path.like(f"{prefix}%"),
+        ).delete(synchronize_session=False)
+        affected.add(parent_of(prefix))
+
+    if set_leaves:
+        _write(db, project_id, set_leaves)
+        affected.update(parent_of(path) for path in set_leaves)
+
+    # Every ancestor of a changed node, deepest first
+    pending = set()
+    for path in affected:
+        while path is not None:
+            pending.add(path)
+            path = parent_of(path)
+    for path in sorted(pending, key=_depth, reverse=True):
+        current = stored_children(db, project_id, path)
+        if not current and path != ROOT:
+            db.query(IntegrityNode).filter(
+                IntegrityNode.project_id == project_id,
+                IntegrityNode.path == path,
+            ).delete(synchronize_session=False)
+            continue
+        _write(db, project_id, {path: node_hash(current)})
+
+    return get_root(db, project_id) or EMPTY_HASH
+
+
+def get_root(db: Session, project_id: int) -> Optional[str]:
+    """Root hash of a project manifest, None if no manifest has been built."""
+    row = db.query(IntegrityNode.hash).filter(
+        IntegrityNode.project_id == project_id,
+        IntegrityNode.path == ROOT,
+    ).first()
+    return row.hash if row else None
+
+
+def get_node(db: Session, project_id: int, path: str) -> Optional[str]:
+    """Stored hash of one node, or None."""
+    row = db.query(IntegrityNode.hash).filter(
+        IntegrityNode.project_id == project_id,
+        IntegrityNode.path == path,
+    ).first()
+    return row.hash if row else None
+
+
+def get_nodes(db: Session, project_id: int, paths: List[str]) -> Dict[str, str]:
+    """Stored hashes of several nodes (unrecorded paths are absent)."""
+    found: Dict[str, str] = {}
+    for i in range(0, len(paths), _PATH_BATCH):
+        for row in db.query(IntegrityNode.path, IntegrityNode.hash).filter(
+            IntegrityNode.project_id == project_id,
+            IntegrityNode.path.in_(paths[i:i + _PATH_BATCH]),
+        ):
+            found[row.path] = row.hash
+    return found
+
+
+def manifest_summary(db: Session, project_id: int) -> Dict[str, Any]:
+    """Root and group hashes of a project manifest.
+
+    Returns:
+        Dict with root (None without manifest) and groups {name: hash}
+    """
+    return {
+        "root": get_root(db, project_id),
+        "groups": stored_children(db, project_id, ROOT),
+    }
+
+
+def inclusion_proof(db: Session, project_id: int, path: str) -> Optional[Dict[str, Any]]:
+    """Proof that a node is part of the project root.
+
+    One step per tree level: the node's key and the sibling hashes needed to
+    rebuild its parent's binary tree (["L"|"R", hex] - side of the sibling).
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        path: Node path (e.g. "transcripts/5/s831")
+
+    Returns:
+        Dict with path, hash, root and steps, or None if the node is not recorded
+    """
+    leaf_hash = get_node(db, project_id, path)
+    if leaf_hash is None:
+        return None
+
+    steps = []
+    current = path
+    while current != ROOT:
+        parent = parent_of(current)
+        siblings = stored_children(db, project_id, parent)
+        ordered = sorted(siblings, key=_sort_key)
+        levels = _levels(siblings)
+        index = ordered.index(current)
+        audit_path = []
+        for level in levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(level):
+                audit_path.append(["L" if sibling < index else "R", level[sibling].hex()])
+            index //= 2
+        steps.append({"key": _key(current), "path": audit_path})
+        current = parent
+
+    return {
+        "path": path,
+        "hash": leaf_hash,
+        "root": get_root(db, project_id),
+        "steps": steps,
+    }
+
+
+def verify_proof(proof: Dict[str, Any], leaf_hash: Optional[str] = None) -> bool:
+    """Check an inclusion proof against its root (no database access).
+
+    Args:
+        proof: Result of inclusion_proof()
+        leaf_hash: Freshly computed leaf hash (default: proof["hash"])
+
+    Returns:
+        True if the leaf hashes up to proof["root"]
+    """
+    current = leaf_hash or proof["hash"]
+    for step in proof["steps"]:
+        digest = hashlib.sha256(b"\x00" + step["key"].encode() + b"\x00" + current.encode()).digest()
+        for side, sibling in step["path"]:
+            other = bytes.fromhex(sibling)
+            digest = _inner(other, digest) if side == "L" else _inner(digest, other)
+        current = digest.hex()
+    return current == proof["root"]
+
+
+def diff(db: Session, project_id: int, actual: Dict[str, str]) -> List[Tuple[str, str]]:
+    """Compare stored manifest with computed node hashes, walking only mismatched subtrees.
+
+    Args:
+        db: Database session
+        project_id: Project ID
+        actual: Result of build_tree() over the project's current artifacts
+
+    Returns:
+        List of (path, problem) - problem is "mismatch" (hash differs),
+        "missing" (recorded, no longer present) or "unrecorded" (present,
+        not in the manifest). Empty if the roots match.
+    """
+    if get_root(db, project_id) == actual.get(ROOT, EMPTY_HASH):
+        return []
+
+    actual_children: Dict[str, List[str]] = {}
+    for path in actual:
+        parent = parent_of(path)
+        if parent is not None:
+            actual_children.setdefault(parent, []).append(path)
+
+    problems: List[Tuple[str, str]] = []
+    queue = [ROOT]
+    while queue:
+        parent = queue.pop(0)
+        stored = stored_children(db, project_id, parent)
+        computed = actual_children.get(parent, [])
+        for path in sorted(set(stored) | set(computed), key=lambda p: (_depth(p), _sort_key(p))):
+            if path not in actual:
+                problems.append((path, "missing"))
+            elif path not in stored:
+                problems.append((path, "unrecorded"))
+            elif stored[path] != actual[path]:
+                if actual_children.get(path):
+                    queue.append(path)
+                else:
+                    problems.append((path, "mismatch"))
+    return problems
+
+
+def transcript_leaves(db: Session, transcript_ids: List[int]) -> Dict[str, str]:
+    """Segment and audio leaves of transcripts, computed from stored data."""
+    from app.modules.record.models import AudioAsset
+
+    leaves: Dict[str, str] = {}
+    for i in range(0, len(transcript_ids), _PATH_BATCH):
+        batch = transcript_ids[i:i + _PATH_BATCH]
+        for row in db.query(TranscriptSegment.id, TranscriptSegment.transcript_id, TranscriptSegment.text).filter(
+            TranscriptSegment.transcript_id.in_(batch)
+        ).yield_per(1000):
+            leaves[f"transcripts/{row.transcript_id}/s{row.id}"] = segment_leaf(row.text)
+        assets = db.query(AudioAsset.id, AudioAsset.sha256).filter(
+            AudioAsset.transcript_id.in_(batch),
+            AudioAsset.destroy_status == "none",
+        ).all()
+        hashes = blob_leaves(row.sha256 for row in assets)
+        leaves.update({f"audio/{row.id}": hashes[row.sha256] for row in assets if row.sha256 in hashes})
+    return leaves
+
+
+def transcript_paths(db: Session, transcript_ids: List[int]) -> List[str]:
+    """Manifest paths owned by transcripts (transcript groups and audio leaves)."""
+    from app.modules.record.models import AudioAsset
+
+    asset_ids = [
+        row.id for row in db.query(AudioAsset.id).filter(AudioAsset.transcript_id.in_(transcript_ids))
+    ]
+    return [f"transcripts/{tid}" for tid in transcript_ids] + [f"audio/{aid}" for aid in asset_ids]
+
+
+def move_transcripts(db: Session, transcript_ids: List[int], old_project_ids: Dict[int, Optional[int]], project_id: int) -> None:
+    """Move transcript subtrees to another project manifest (caller commits).
+
+    Recorded leaf hashes are carried over from the old project (so a change
+    made outside the API is still detected); transcripts without recorded
+    leaves are hashed from stored data.
+
+    Args:
+        db: Database session
+        transcript_ids: Transcripts being attached
+        old_project_ids: Dict transcript_id -> previous project_id (or None)
+        project_id: New project ID
+    """
+    if not transcript_ids:
+        return
+    recorded: Dict[str, str] = {}
+    by_old: Dict[int, List[str]] = {}
+    for tid in transcript_ids:
+        old = old_project_ids.get(tid)
+        if old is not None and old != project_id:
+            by_old.setdefault(old, []).append(tid)
+    _lock(db, [project_id, *by_old])
+    for old, tids in by_old.items():
+        owned = transcript_paths(db, tids)
+        groups = [path for path in owned if path.startswith("transcripts/")]
+        conditions = [IntegrityNode.path.like(f"{path}/%") for path in groups]
+        conditions.append(IntegrityNode.path.in_([path for path in owned if path.startswith("audio/")]))
+        for row in db.query(IntegrityNode.path, IntegrityNode.hash).filter(
+            IntegrityNode.project_id == old,
+            or_(*conditions),
+        ):
+            recorded[row.path] = row.hash
+        update(db, old, remove=owned)
+    if get_root(db, project_id) is None:
+        return
+
+    missing = [
+        tid for tid in transcript_ids
+        if not any(path.startswith(f"transcripts/{tid}/") for path in recorded)
+    ]
+    leaves = transcript_leaves(db, missing) if missing else {}
+    leaves.update(recorded)
+    update(db, project_id, set_leaves=leaves)
+
+
+def remove_transcripts(db: Session, transcript_ids: List[int]) -> None:
+    """Drop transcripts (segments and audio) from their projects' manifests (caller commits)."""
+    if not transcript_ids:
+        return
+    by_project: Dict[int, List[int]] = {}
+    for row in db.query(Transcript.id, Transcript.project_id).filter(
+        Transcript.id.in_(transcript_ids),
+        Transcript.project_id.isnot(None),
+    ):
+        by_project.setdefault(row.project_id, []).append(row.id)
+    _lock(db, by_project)
+    for project_id, tids in by_project.items():
+        update(db, project_id, remove=transcript_paths(db, tids))
+
+
+def refresh_blob(db: Session, sha256: str) -> int:
+    """Re-record a blob's ciphertext hash after it was rewritten (re-key, re-encrypt).
+
+    Args:
+        db: Database session
+        sha256: Plaintext hash (blob name)
+
+    Returns:
+        Number of manifests updated
+    """
+    from app.modules.record.models import AudioAsset
+
+    ciphertext = blob_leaves([sha256]).get(sha256)
+    if ciphertext is None:
+        return 0
+    leaves: Dict[int, Dict[str, str]] = {}
+    for row in db.query(ProjectFile.id, ProjectFile.project_id).filter(ProjectFile.sha256 == sha256):
+        leaves.setdefault(row.project_id, {})[f"files/{row.id}"] = ciphertext
+    for row in db.query(AudioAsset.id, Transcript.project_id).join(
+        Transcript, Transcript.id == AudioAsset.transcript_id
+    ).filter(
+        AudioAsset.sha256 == sha256,
+        Transcript.project_id.isnot(None),
+    ):
+        leaves.setdefault(row.project_id, {})[f"audio/{row.id}"] = ciphertext
+    _lock(db, leaves)
+    for project_id, project_leaves in leaves.items():
+        update(db, project_id, set_leaves=project_leaves)
+    return len(leaves)
+
+
+def project_leaves(db: Session, project_id: int) -> Dict[str, str]:
+    """All leaves of a project, computed from stored data."""
+    leaves = {
+        f"notes/{row.id}": row.note_integrity_hash
+        for row in db.query(ProjectNote.id, ProjectNote.note_integrity_hash).filter(ProjectNote.project_id == project_id)
+    }
+    transcript_ids = [row.id for row in db.query(Transcript.id).filter(Transcript.project_id == project_id)]
+    leaves.update(transcript_leaves(db, transcript_ids))
+    files = db.query(ProjectFile.id, ProjectFile.sha256).filter(ProjectFile.project_id == project_id).all()
+    hashes = blob_leaves(row.sha256 for row in files)
+    leaves.update({f"files/{row.id}": hashes[row.sha256] for row in files if row.sha256 in hashes})
+    return leaves
+
+
+def rebuild(db: Session, project_id: int) -> str:
+    """Build a project manifest from stored data, replacing any previous one (caller commits).
+
+    Trusts the current data - run once for existing projects, or after a
+    repair, not to paper over a reported mismatch.
+
+    Returns:
+        Root hash
+    """
+    _lock(db, [project_id])
+    db.query(IntegrityNode).filter(IntegrityNode.project_id == project_id).delete(synchronize_session=False)
+    nodes = build_tree(project_leaves(db, project_id))
+    _write(db, project_id, nodes)
+    return nodes[ROOT]
@@ -0,0 +1,95 @@
+"""CLI entrypoint for building project integrity manifests (Merkle trees).
+
+Usage:
+    python -m app.modules.projects.merkle_runner [--all] [--project-id N]
+
+This is a standalone CLI tool - not part of the API.
+Run after migration 013, then periodically - writes only maintain existing
+manifests, so new projects have none until this runs. The manifest is built from the data as it is
+now - rebuilding a project that reports a mismatch records the corruption
+as the new baseline, so only use --all/--project-id after a repair.
+"""
+import argparse
+import sys
+
+from app.core.config import settings
+from app.core.database import get_db, init_db
+from app.core.logging import logger
+from app.modules.projects import merkle
+from app.modules.projects.models import IntegrityNode, Project
+
+
+def main() -> int:
+    """CLI entrypoint for manifest backfill.
+
+    Returns:
+        0 on success, 1 on error
+    """
+    parser = argparse.ArgumentParser(
+        description="Build project integrity manifests (integrity_nodes)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Build manifests for projects without one
+  python -m app.modules.projects.merkle_runner
+
+  # Rebuild one project's manifest (after a repair)
+  python -m app.modules.projects.merkle_runner --project-id 12
+        """,
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Rebuild every project (default: only projects without a manifest)",
+    )
+    parser.add_argument(
+        "--project-id",
+        type=int,
+        default=None,
+        help="Rebuild only this project",
+    )
+
+    args = parser.parse_args()
+
+    try:
+        if not settings.database_url:
+            print("Error: DATABASE_URL not set", file=sys.stderr)
+            return 1
+        init_db(settings.database_url)
+
+        logger.info("merkle_backfill_started", extra={"rebuild_all": args.all, "project_id": args.project_id})
+
+        with get_db() as db:
+            query = db.query(Project.id)
+            if args.project_id is not None:
+                query = query.filter(Project.id == args.project_id)
+            elif not args.all:
+                query = query.filter(~Project.id.in_(
+                    db.query(IntegrityNode.project_id).filter(IntegrityNode.path == merkle.ROOT)
+                ))
+            project_ids = [row.id for row in query.order_by(Project.id)]
+
+        # One transaction per project
+        for project_id in project_ids:
+            with get_db() as db:
+                merkle.rebuild(db, project_id)
+                db.commit()
+
+        print("Manifest backfill complete:")
+        print(f"  Projects processed: {len(project_ids)}")
+
+        logger.info("merkle_backfill_complete", extra={"projects_processed": len(project_ids)})
+        return 0
+
+    except KeyboardInterrupt:
+        logger.warning("merkle_backfill_interrupted")
+        return 130  # Standard exit code for SIGINT
+    except Exception as e:
+        error_type = type(e).__name__
+        logger.error("merkle_backfill_failed", extra={"error_type": error_type})
+        print(f"Error: {error_type}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
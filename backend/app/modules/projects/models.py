@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import (
+    BigInteger,
     Column,
     Date,
     DateTime,
@@ -13,6 +14,7 @@ from sqlalchemy import (
     Text,
     Boolean,
     Index,
+    func,
 )
 from sqlalchemy.orm import relationship
 
@@ -39,6 +41,12 @@ class Project(Base):
     files = relationship("ProjectFile", back_populates="project", cascade="all, delete-orphan")
     audit_events = relationship("ProjectAuditEvent", back_populates="project", cascade="all, delete-orphan")
 
+    # Project list filters + sort keys (name search index: migration 016, dialect-specific)
+    __table_args__ = (
+        Index("idx_projects_status_due_date", "status", "due_date"),
+        Index("idx_projects_sensitivity_created_at", "sensitivity", "created_at"),
+    )
+
 
 class ProjectNote(Base):
     """Project note - user-created text notes."""
@@ -57,6 +65,18 @@ class ProjectNote(Base):
     project = relationship("Project", back_populates="notes")
 
 
+class StorageBlob(Base):
+    """Stored encrypted blob (ab/cd/{sha256}.bin) - reference counted, shared by assets."""
+
+    __tablename__ = "storage_blobs"
+
+    sha256 = Column(String(64), primary_key=True)
+    size_bytes = Column(Integer, nullable=False)  # Plaintext size
+    ref_count = Column(Integer, nullable=False, default=0)  # ProjectFile + AudioAsset rows
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
 class ProjectFile(Base):
     """Project file - uploaded files with encryption."""
 
@@ -65,11 +85,11 @@ class ProjectFile(Base):
     id = Column(Integer, primary_key=True)
     project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
     original_filename = Column(String, nullable=False)  # Only in DB, never on disk
-    sha256 = Column(String, nullable=False, unique=True, index=True)  # Content hash
+    sha256 = Column(String, ForeignKey("storage_blobs.sha256"), nullable=False, index=True)  # Content hash (shared blob)
     mime_type = Column(String, nullable=False)
     size_bytes = Column(Integer, nullable=False)
     stored_encrypted = Column(Boolean, nullable=False, default=True)
-    storage_path = Column(String, nullable=False)  # Internal path: {sha256}.bin
+    storage_path = Column(String, nullable=False)  # Internal path: ab/cd/{sha256}.bin (legacy: {sha256}.bin)
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
 
     # Relationships
@@ -96,5 +116,52 @@ class ProjectAuditEvent(Base):
     # Index for common queries
     __table_args__ = (
         Index("idx_audit_project_severity", "project_id", "severity"),
+        Index("idx_project_audit_project_created", "project_id", "created_at"),
+        Index("idx_project_audit_action_created", "action", "created_at"),
+    )
+
+
+
+class IntegrityNode(Base):
+    """Merkle manifest node of a project (root, group or leaf) - hashes only, NO CONTENT."""
+
+    __tablename__ = "integrity_nodes"
+
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    path = Column(String, primary_key=True)  # "" (root) | notes/{id} | transcripts/{id}[/s{id}] | audio/{id} | files/{id}
+    parent_path = Column(String, nullable=True)  # NULL for the root
+    hash = Column(String(64), nullable=False)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("idx_integrity_nodes_parent", "project_id", "parent_path"),
     )
 
+
+class BlobIntegrityStatus(Base):
+    """Last scrubber result per stored blob - hashes and timestamps only, NO CONTENT."""
+
+    __tablename__ = "blob_integrity_status"
+
+    sha256 = Column(String(64), primary_key=True)  # storage_blobs.sha256 (row pruned with the blob)
+    status = Column(String, nullable=False, index=True)  # ok|mismatch|undecryptable|missing|error
+    ciphertext_sha256 = Column(String(64), nullable=True)  # Hash found on disk (None if not read)
+    error_type = Column(String, nullable=True)
+    checked_at = Column(DateTime, nullable=False, index=True)
+    last_ok_at = Column(DateTime, nullable=True)
+    failures = Column(Integer, nullable=False, default=0)  # Consecutive failed checks
+
+
+class ProjectActivity(Base):
+    """Activity projection per project - counts, bytes and last activity, maintained by writes."""
+
+    __tablename__ = "project_activity"
+
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    transcripts_count = Column(Integer, nullable=False, default=0)
+    notes_count = Column(Integer, nullable=False, default=0)
+    files_count = Column(Integer, nullable=False, default=0, index=True)
+    audio_count = Column(Integer, nullable=False, default=0)
+    bytes_stored = Column(BigInteger, nullable=False, default=0)  # Plaintext bytes of files + audio
+    last_activity_at = Column(DateTime, nullable=True, index=True)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -0,0 +1,245 @@
+"""Project list queries - indexed filters, sort keys and keyset pagination.
+
+Sort keys (ties broken by id in the same direction, NULLs last):
+- created_at     newest first   (sensitivity, created_at) index for filtered lists
+- start_date     newest first
+- due_date       soonest first  (status, due_date) index serves overdue
+- last_activity  newest first   project_activity.last_activity_at index
+
+The cursor encodes (sort, key, id) of the last returned project, so every
+page is one index range scan regardless of depth. total is only counted
+for the first page.
+
+Name search uses an index where one exists (migration 016):
+- PostgreSQL: pg_trgm GIN index on projects.name serves ILIKE '%q%'
+- SQLite: FTS5 trigram table projects_name_fts (kept in sync by triggers),
+  queried with MATCH for 3+ characters
+Shorter queries, or databases without the index, fall back to ILIKE.
+"""
+import base64
+import weakref
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import Integer, and_, func, or_, text
+from sqlalchemy.orm import Session
+
+from app.modules.projects.models import Project, ProjectActivity
+
+# sort -> (column, descending, nullable)
+SORTS = {
+    "created_at": (Project.created_at, True, False),
+    "start_date": (Project.start_date, True, False),
+    "due_date": (Project.due_date, False, True),
+    "last_activity": (ProjectActivity.last_activity_at, True, True),
+}
+
+_DATE_SORTS = ("start_date", "due_date")
+
+# FTS5 trigram tokens need at least three characters
+_MIN_INDEXED_QUERY = 3
+
+# SQLite name index - same statements as migration 016 (for databases made with create_all)
+SQLITE_NAME_INDEX_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS projects_name_fts "
+    "USING fts5(name, content='projects', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS projects_name_fts_ai AFTER INSERT ON projects BEGIN "
+    "INSERT INTO projects_name_fts(rowid, name) VALUES (new.id, new.name); END",
+    "CREATE TRIGGER IF NOT EXISTS projects_name_fts_ad AFTER DELETE ON projects BEGIN "
+    "INSERT INTO projects_name_fts(projects_name_fts, rowid, name) VALUES ('delete', old.id, old.name); END",
+    "CREATE TRIGGER IF NOT EXISTS projects_name_fts_au AFTER UPDATE OF name ON projects BEGIN "
+    "INSERT INTO projects_name_fts(projects_name_fts, rowid, name) VALUES ('delete', old.id, old.name); "
+    "INSERT INTO projects_name_fts(rowid, name) VALUES (new.id, new.name); END",
+    "INSERT INTO projects_name_fts(projects_name_fts) VALUES ('rebuild')",
+)
+
+# Engine -> SQLite name index exists (checked once per engine)
+_sqlite_name_index: "weakref.WeakKeyDictionary[Any, bool]" = weakref.WeakKeyDictionary()
+
+
+class InvalidCursorError(ValueError):
+    """Cursor could not be decoded (or belongs to another sort)."""
+
+
+@dataclass(frozen=True)
+class ProjectFilters:
+    """Project list filters (all optional, combined with AND)."""
+
+    q: Optional[str] = None
+    status: Optional[str] = None
+    sensitivity: Optional[str] = None
+    has_files: Optional[bool] = None
+    overdue: Optional[bool] = None  # active and due_date before today
+
+
+_Cursor = Tuple[Any, int]  # (sort key value, id)
+
+
+def encode_cursor(sort: str, value: Any, project_id: int) -> str:
+    """Encode keyset cursor (opaque to clients).
+
+    Args:
+        sort: Sort key name
+        value: Sort key of the last returned project (None allowed for nullable keys)
+        project_id: Project ID of the last returned project
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{sort}|{value.isoformat() if value is not None else ''}|{project_id}"
+    return base64.urlsafe_b64encode(raw.encode("ascii")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(sort: str, cursor: str) -> _Cursor:
+    """Decode keyset cursor.
+
+    Args:
+        sort: Sort key the cursor must belong to
+        cursor: Cursor from a previous page
+
+    Returns:
+        (sort key value, id)
+
+    Raises:
+        InvalidCursorError: If cursor is malformed or from another sort
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, value, project_id = base64.urlsafe_b64decode(padded).decode("ascii").split("|")
+        if cursor_sort != sort:
+            raise ValueError("cursor sort mismatch")
+        if value == "":
+            parsed: Any = None
+        elif sort in _DATE_SORTS:
+            parsed = date.fromisoformat(value)
+        else:
+            parsed = datetime.fromisoformat(value)
+        return parsed, int(project_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+
+def create_sqlite_name_index(bind) -> None:
+    """Create the SQLite FTS5 name index (no-op elsewhere or if it exists).
+
+    Args:
+        bind: Engine or connection
+    """
+    if bind.dialect.name != "sqlite":
+        return
+    with bind.begin() as conn:
+        for statement in SQLITE_NAME_INDEX_DDL:
+            conn.execute(text(statement))
+    _sqlite_name_index.pop(getattr(bind, "engine", bind), None)
+
+
+def _has_sqlite_name_index(db: Session) -> bool:
+    engine = db.get_bind().engine
+    if engine not in _sqlite_name_index:
+        found = db.execute(text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'projects_name_fts'"
+        )).first()
+        _sqlite_name_index[engine] = found is not None
+    return _sqlite_name_index[engine]
+
+
+def _name_filter(db: Session, q: str):
+    """Name contains q (case-insensitive), through the name index where possible."""
+    if (
+        db.get_bind().dialect.name == "sqlite"
+        and len(q) >= _MIN_INDEXED_QUERY
+        and _has_sqlite_name_index(db)
+    ):
+        # Quoted phrase - trigram tokens make it a substring match
+        phrase = '"' + q.replace('"', '""') + '"'
+        matches = text(
+            "SELECT rowid FROM projects_name_fts WHERE projects_name_fts MATCH :name_match"
+        ).bindparams(name_match=phrase).columns(rowid=Integer)
+        return Project.id.in_(matches)
+    # PostgreSQL: served by the pg_trgm GIN index
+    return Project.name.ilike(f"%{q}%")
+
+
+def _after_cursor(column, descending: bool, nullable: bool, cursor: _Cursor):
+    """Keyset condition: rows strictly after cursor in (key, id) order, NULL keys last."""
+    value, project_id = cursor
+    tie = Project.id < project_id if descending else Project.id > project_id
+    if value is None:
+        return and_(column.is_(None), tie)
+    later = column < value if descending else column > value
+    condition = or_(later, and_(column == value, tie))
+    if nullable:
+        condition = or_(condition, column.is_(None))
+    return condition
+
+
+def query_projects(
+    db: Session,
+    filters: ProjectFilters,
+    sort: str = "created_at",
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+) -> Dict[str, Any]:
+    """Get one page of projects.
+
+    Args:
+        db: Database session
+        filters: Query filters
+        sort: Sort key (see SORTS)
+        limit: Page size
+        cursor: Cursor from previous page (None = first page, offset applies)
+        offset: Offset for the first page (ignored with cursor)
+
+    Returns:
+        Dict with projects, next_cursor (None on last page), total (None after the first page)
+
+    Raises:
+        InvalidCursorError: If cursor is malformed or from another sort
+    """
+    column, descending, nullable = SORTS[sort]
+    after = decode_cursor(sort, cursor) if cursor else None
+
+    query = db.query(Project, column)
+    if filters.has_files is not None or sort == "last_activity":
+        query = query.outerjoin(ProjectActivity, ProjectActivity.project_id == Project.id)
+    if filters.q:
+        query = query.filter(_name_filter(db, filters.q))
+    if filters.status:
+        query = query.filter(Project.status == filters.status)
+    if filters.sensitivity:
+        query = query.filter(Project.sensitivity == filters.sensitivity)
+    if filters.has_files is True:
+        query = query.filter(ProjectActivity.files_count > 0)
+    elif filters.has_files is False:
+        query = query.filter(func.coalesce(ProjectActivity.files_count, 0) == 0)
+    if filters.overdue is True:
+        query = query.filter(Project.status == "active", Project.due_date < date.today())
+    elif filters.overdue is False:
+        query = query.filter(or_(
+            Project.status != "active", Project.due_date.is_(None), Project.due_date >= date.today()
+        ))
+
+    total = query.count() if after is None else None
+
+    if after is not None:
+        query = query.filter(_after_cursor(column, descending, nullable, after))
+    key_order = column.desc() if descending else column.asc()
+    if nullable:
+        key_order = key_order.nullslast()
+    query = query.order_by(key_order, Project.id.desc() if descending else Project.id.asc())
+    if after is None and offset:
+        query = query.offset(offset)
+    rows = query.limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_project, last_value = rows[-1]
+        next_cursor = encode_cursor(sort, last_value, last_project.id)
+    return {
+        "projects": [project for project, _ in rows],
+        "next_cursor": next_cursor,
+        "total": total,
+    }
@@ -0,0 +1,84 @@
+"""Re-encryption of legacy Fernet blobs into the chunked container format.
+
+Legacy blobs (whole-file Fernet, pre blob_crypto) stay readable, but cannot be
+range-read and need the whole plaintext in memory. This migration rewrites
+them one at a time: decrypt, verify SHA256 against the filename, re-encrypt
+via BlobWriter (temp file + atomic rename over the old blob).
+
+Safe to interrupt and re-run - already migrated blobs are skipped.
+"""
+import time
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.logging import logger
+from app.modules.projects import file_storage, merkle
+from app.modules.projects.blob_crypto import FRAME_SIZE, is_container
+
+
+def _refresh_manifests(sha256: str) -> None:
+    """Re-record the new ciphertext hash in project integrity manifests."""
+    from app.core.database import engine
+    if engine is None or not settings.database_url:
+        return
+    with get_db() as db:
+        merkle.refresh_blob(db, sha256)
+        db.commit()
+
+
+def reencrypt_legacy_blobs(
+    dry_run: bool = False,
+    limit: Optional[int] = None,
+    pause_seconds: float = 0.0,
+) -> Dict[str, Any]:
+    """Migrate legacy Fernet blobs in the storage dir.
+    
+    Args:
+        dry_run: Only count legacy blobs
+        limit: Max blobs to migrate in this run
+        pause_seconds: Sleep between blobs (throttle for background runs)
+        
+    Returns:
+        Dict with scanned, legacy, migrated, errors, dry_run
+    """
+    result: Dict[str, Any] = {
+        "scanned": 0,
+        "legacy": 0,
+        "migrated": 0,
+        "errors": 0,
+        "dry_run": dry_run,
+    }
+    
+    for path in file_storage.iter_blob_paths():
+        result["scanned"] += 1
+        with open(path, "rb") as f:
+            if is_container(f.read(4)):
+                continue
+        result["legacy"] += 1
+        
+        if dry_run:
+            continue
+        if limit is not None and result["migrated"] >= limit:
+            continue
+        
+        sha256 = path.stem
+        try:
+            plaintext = file_storage._legacy_fernet_decrypt(path.read_bytes())
+            with file_storage.BlobWriter() as writer:
+                view = memoryview(plaintext)
+                for offset in range(0, len(plaintext), FRAME_SIZE):
+                    writer.write(bytes(view[offset:offset + FRAME_SIZE]))
+                writer.commit(expected_sha256=sha256, replace=True)
+            _refresh_manifests(sha256)
+            result["migrated"] += 1
+        except Exception as e:
+            # Blob left untouched (BlobWriter only replaces on successful commit)
+            result["errors"] += 1
+            logger.error("blob_reencrypt_failed", extra={"error_type": type(e).__name__})
+        
+        if pause_seconds:
+            time.sleep(pause_seconds)
+    
+    logger.info("blob_reencrypt_complete", extra=dict(result))
+    return result
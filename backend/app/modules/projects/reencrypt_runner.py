@@ -0,0 +1,70 @@
+"""CLI entrypoint for legacy blob re-encryption.
+
+Usage:
+    python -m app.modules.projects.reencrypt_runner [--dry-run] [--limit N] [--pause-ms N]
+
+This is a standalone CLI tool - not part of the API.
+Run in the background (cron, nohup) - the API keeps serving legacy blobs meanwhile.
+"""
+import argparse
+import sys
+
+from app.core.logging import logger
+from app.modules.projects.reencrypt import reencrypt_legacy_blobs
+
+
+def main() -> int:
+    """CLI entrypoint for re-encryption.
+    
+    Returns:
+        0 on success, 1 on error
+    """
+    parser = argparse.ArgumentParser(
+        description="Re-encrypt legacy Fernet blobs into the chunked container format",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Count legacy blobs
+  python -m app.modules.projects.reencrypt_runner --dry-run
+  
+  # Migrate everything
+  python -m app.modules.projects.reencrypt_runner
+  
+  # Throttled background run, 100 blobs at a time
+  python -m app.modules.projects.reencrypt_runner --limit 100 --pause-ms 200
+        """,
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only count legacy blobs")
+    parser.add_argument("--limit", type=int, help="Max blobs to migrate in this run")
+    parser.add_argument("--pause-ms", type=int, default=0, help="Pause between blobs (default: 0)")
+    
+    args = parser.parse_args()
+    
+    try:
+        result = reencrypt_legacy_blobs(
+            dry_run=args.dry_run,
+            limit=args.limit,
+            pause_seconds=args.pause_ms / 1000,
+        )
+        
+        print("Re-encryption complete:")
+        print(f"  Dry run: {result['dry_run']}")
+        print(f"  Blobs scanned: {result['scanned']}")
+        print(f"  Legacy blobs: {result['legacy']}")
+        print(f"  Migrated: {result['migrated']}")
+        print(f"  Errors: {result['errors']}")
+        
+        return 1 if result["errors"] > 0 else 0
+    
+    except KeyboardInterrupt:
+        logger.warning("blob_reencrypt_interrupted")
+        return 130  # Standard exit code for SIGINT
+    except Exception as e:
+        error_type = type(e).__name__
+        logger.error("blob_reencrypt_run_failed", extra={"error_type": error_type})
+        print(f"Error: {error_type}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
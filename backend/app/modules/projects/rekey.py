@@ -0,0 +1,154 @@
+"""Online re-keying - re-encrypt blobs under the current key (key rotation).
+
+A blob needs re-keying if its header key id is not the current key's
+(keyring.primary_id): containers written with an old key, version 1
+containers (no key id) and legacy Fernet blobs.
+
+Each blob is streamed through open_blob -> BlobWriter (bounded memory) and
+atomically renamed over the old file, so readers keep working during the run
+(open file handles still see the old inode). Reads are throttled with
+max_bytes_per_second to leave disk bandwidth to the API.
+
+The rename happens under the storage_blobs row lock (same lock as
+blob_store.collect), so a blob shredded meanwhile is not brought back. The
+new ciphertext hash is recorded in project integrity manifests in the same
+transaction (merkle.refresh_blob).
+
+Safe to interrupt and re-run - blobs already under the current key are skipped.
+"""
+import time
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.logging import logger
+from app.modules.projects import file_storage, merkle
+from app.modules.projects.blob_crypto import HEADER_SIZE, BlobIntegrityError, is_container, parse_header
+from app.modules.projects.keyring import get_keyring
+from app.modules.projects.models import StorageBlob
+
+
+def _has_db() -> bool:
+    """Check if database is available."""
+    # Import engine from module to get current value (not cached import)
+    from app.core.database import engine
+    return engine is not None and settings.database_url is not None
+
+
+def needs_rekey(path, primary_id: bytes) -> bool:
+    """Check if stored blob was written with another key than primary_id.
+
+    Args:
+        path: Blob path
+        primary_id: Current key id
+
+    Returns:
+        True for old-key containers, version 1 containers and legacy Fernet blobs
+    """
+    with open(path, "rb") as f:
+        prefix = f.read(HEADER_SIZE)
+    if not is_container(prefix):
+        return True
+    try:
+        _, key_id, _ = parse_header(prefix)
+    except BlobIntegrityError:
+        return False  # Damaged - left for the integrity scan, re-keying cannot fix it
+    return key_id != primary_id
+
+
+def _throttled(chunks: Iterable[bytes], max_bytes_per_second: Optional[int]) -> Iterator[bytes]:
+    """Yield chunks, sleeping to keep the average rate under max_bytes_per_second."""
+    if not max_bytes_per_second:
+        yield from chunks
+        return
+    started = time.monotonic()
+    done = 0
+    for chunk in chunks:
+        yield chunk
+        done += len(chunk)
+        ahead = done / max_bytes_per_second - (time.monotonic() - started)
+        if ahead > 0:
+            time.sleep(ahead)
+
+
+def _rekey_one(sha256: str, max_bytes_per_second: Optional[int]) -> bool:
+    """Re-encrypt one blob under the current key.
+
+    Returns:
+        True if replaced, False if the blob was deleted meanwhile
+    """
+    with file_storage.BlobWriter() as writer:
+        for chunk in _throttled(file_storage.iter_file(sha256), max_bytes_per_second):
+            writer.write(chunk)
+        writer.finish(expected_sha256=sha256)
+
+        if not _has_db():
+            writer.place(replace=True)
+            return True
+
+        with get_db() as db:
+            # Same row lock as blob_store._detach_one - no shredding while we rename
+            db.query(StorageBlob).filter(StorageBlob.sha256 == sha256).with_for_update().first()
+            if not file_storage.blob_path(sha256).exists():
+                writer.abort()
+                return False
+            writer.place(replace=True)
+            # New ciphertext - re-record it in the manifests of projects using the blob
+            merkle.refresh_blob(db, sha256)
+            db.commit()
+    return True
+
+
+def rekey_blobs(
+    dry_run: bool = False,
+    limit: Optional[int] = None,
+    pause_seconds: float = 0.0,
+    max_bytes_per_second: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Re-encrypt blobs not written with the current key.
+
+    Args:
+        dry_run: Only count blobs that need re-keying
+        limit: Max blobs to re-key in this run
+        pause_seconds: Sleep between blobs
+        max_bytes_per_second: Read throttle per blob (None = unthrottled)
+
+    Returns:
+        Dict with scanned, pending, rekeyed, errors, dry_run
+    """
+    primary_id = get_keyring().primary_id
+    result: Dict[str, Any] = {
+        "scanned": 0,
+        "pending": 0,
+        "rekeyed": 0,
+        "errors": 0,
+        "dry_run": dry_run,
+    }
+
+    for path in file_storage.iter_blob_paths():
+        result["scanned"] += 1
+        try:
+            if not needs_rekey(path, primary_id):
+                continue
+        except FileNotFoundError:
+            continue  # Deleted meanwhile
+        result["pending"] += 1
+
+        if dry_run:
+            continue
+        if limit is not None and result["rekeyed"] >= limit:
+            continue
+
+        try:
+            if _rekey_one(path.stem, max_bytes_per_second):
+                result["rekeyed"] += 1
+        except Exception as e:
+            # Blob left untouched (BlobWriter only replaces on successful place)
+            result["errors"] += 1
+            logger.error("blob_rekey_failed", extra={"error_type": type(e).__name__})
+
+        if pause_seconds:
+            time.sleep(pause_seconds)
+
+    logger.info("blob_rekey_complete", extra=dict(result))
+    return result
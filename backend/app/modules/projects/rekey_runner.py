@@ -0,0 +1,73 @@
+"""CLI entrypoint for online blob re-keying (key rotation).
+
+Usage:
+    python -m app.modules.projects.rekey_runner [--dry-run] [--limit N] [--pause-ms N] [--max-mb-per-sec N]
+
+This is a standalone CLI tool - not part of the API.
+Run in the background (cron, nohup) - the API keeps serving blobs meanwhile.
+Old keys must stay in PROJECT_FILES_OLD_KEYS until the run reports 0 pending.
+"""
+import argparse
+import sys
+
+from app.core.logging import logger
+from app.modules.projects.rekey import rekey_blobs
+
+
+def main() -> int:
+    """CLI entrypoint for re-keying.
+    
+    Returns:
+        0 on success, 1 on error
+    """
+    parser = argparse.ArgumentParser(
+        description="Re-encrypt blobs written with old keys under the current PROJECT_FILES_KEY",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Count blobs not under the current key
+  python -m app.modules.projects.rekey_runner --dry-run
+  
+  # Re-key everything
+  python -m app.modules.projects.rekey_runner
+  
+  # Throttled background run (20 MB/s reads, 100 blobs at a time)
+  python -m app.modules.projects.rekey_runner --limit 100 --max-mb-per-sec 20
+        """,
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only count blobs that need re-keying")
+    parser.add_argument("--limit", type=int, help="Max blobs to re-key in this run")
+    parser.add_argument("--pause-ms", type=int, default=0, help="Pause between blobs (default: 0)")
+    parser.add_argument("--max-mb-per-sec", type=float, help="Read throttle in MB/s (default: unthrottled)")
+    
+    args = parser.parse_args()
+    
+    try:
+        result = rekey_blobs(
+            dry_run=args.dry_run,
+            limit=args.limit,
+            pause_seconds=args.pause_ms / 1000,
+            max_bytes_per_second=int(args.max_mb_per_sec * 1024 * 1024) if args.max_mb_per_sec else None,
+        )
+        
+        print("Re-keying complete:")
+        print(f"  Dry run: {result['dry_run']}")
+        print(f"  Blobs scanned: {result['scanned']}")
+        print(f"  Pending (old key): {result['pending']}")
+        print(f"  Re-keyed: {result['rekeyed']}")
+        print(f"  Errors: {result['errors']}")
+        
+        return 1 if result["errors"] > 0 else 0
+    
+    except KeyboardInterrupt:
+        logger.warning("blob_rekey_interrupted")
+        return 130  # Standard exit code for SIGINT
+    except Exception as e:
+        error_type = type(e).__name__
+        logger.error("blob_rekey_run_failed", extra={"error_type": error_type})
+        print(f"Error: {error_type}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
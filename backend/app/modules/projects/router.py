@@ -1,18 +1,27 @@
 """Projects router - API endpoints for project management."""
+import hashlib
 import os
 from typing import Optional, List, Dict, Any
 from datetime import datetime, date
-from fastapi import APIRouter, Query, HTTPException, status, Request, UploadFile, File
+from fastapi import APIRouter, Query, HTTPException, status, Request, UploadFile, File, Header
 from pydantic import BaseModel, Field, field_validator
+from starlette.concurrency import run_in_threadpool
 
 from app.core.logging import logger
 from app.core.config import settings
 from app.core import database
 from app.core.database import get_db
-from app.core.privacy_guard import sanitize_for_logging, assert_no_content
-from app.modules.projects.models import Project, ProjectNote, ProjectFile, ProjectAuditEvent
+from app.core.privacy_guard import sanitize_for_logging
+from app.modules.audit import pipeline as audit_pipeline
+from app.modules.projects.models import Project, ProjectFile
 from app.modules.projects.integrity import verify_project_integrity
-from app.modules.projects.file_storage import store_file, compute_file_hash
+from app.modules.projects import activity
+from app.modules.projects import blob_store
+from app.modules.projects.counts import empty_counts, get_project_counts
+from app.modules.projects.query import InvalidCursorError, ProjectFilters, query_projects
+from app.modules.projects import merkle
+from app.modules.projects import storage_async
+from app.modules.projects.file_storage import BlobWriter, stored_blob_path
 from app.modules.transcripts.models import Transcript
 
 
@@ -22,6 +31,7 @@ router = APIRouter()
 # File validation constants
 ALLOWED_PROJECT_FILE_EXTENSIONS = {".txt", ".docx", ".pdf"}
 MAX_PROJECT_FILE_SIZE = 25 * 1024 * 1024  # 25MB
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # Streamed upload chunk (hashed + encrypted per chunk)
 
 # Magic bytes for document formats
 PROJECT_FILE_MAGIC_BYTES = {
@@ -146,54 +156,9 @@ def _has_db() -> bool:
     return has_engine and has_url
 
 
-def _get_project_counts(project_id: int) -> Dict[str, Any]:
-    """Get counts for a project."""
-    if not _has_db():
-        return {
-            "transcripts_count": 0,
-            "notes_count": 0,
-            "files_count": 0,
-            "last_activity_at": None,
-        }
-    
-    with get_db() as db:
-        transcripts_count = db.query(Transcript).filter(Transcript.project_id == project_id).count()
-        notes_count = db.query(ProjectNote).filter(ProjectNote.project_id == project_id).count()
-        files_count = db.query(ProjectFile).filter(ProjectFile.project_id == project_id).count()
-        
-        # Get last activity (max of updated_at from all artifacts)
-        last_activity = None
-        project = db.query(Project).filter(Project.id == project_id).first()
-        if project:
-            last_activity = project.updated_at
-        
-        # Check notes
-        latest_note = db.query(ProjectNote).filter(
-            ProjectNote.project_id == project_id
-        ).order_by(ProjectNote.updated_at.desc()).first()
-        if latest_note and (not last_activity or latest_note.updated_at > last_activity):
-            last_activity = latest_note.updated_at
-        
-        # Check files
-        latest_file = db.query(ProjectFile).filter(
-            ProjectFile.project_id == project_id
-        ).order_by(ProjectFile.created_at.desc()).first()
-        if latest_file and (not last_activity or latest_file.created_at > last_activity):
-            last_activity = latest_file.created_at
-        
-        # Check transcripts
-        latest_transcript = db.query(Transcript).filter(
-            Transcript.project_id == project_id
-        ).order_by(Transcript.updated_at.desc()).first()
-        if latest_transcript and (not last_activity or latest_transcript.updated_at > last_activity):
-            last_activity = latest_transcript.updated_at
-        
-        return {
-            "transcripts_count": transcripts_count,
-            "notes_count": notes_count,
-            "files_count": files_count,
-            "last_activity_at": last_activity.isoformat() if last_activity else None,
-        }
+def _get_project_counts(db, project: Project) -> Dict[str, Any]:
+    """Get counts for one project (in the caller's session)."""
+    return get_project_counts(db, [project]).get(project.id) or empty_counts()
 
 
 def _create_audit_event(
@@ -217,21 +182,15 @@ def _create_audit_event(
     if not _has_db():
         return
     
-    # Sanitize metadata (ensure no content/filenames)
-    sanitized_metadata = sanitize_for_logging(metadata or {})
-    
-    with get_db() as db:
-        audit = ProjectAuditEvent(
-            project_id=project_id,
-            action=action,
-            severity=severity,
-            actor=actor,
-            request_id=request_id,
-            metadata_json=sanitized_metadata,
-            created_at=datetime.utcnow(),
-        )
-        db.add(audit)
-        db.commit()
+    # Queued - sanitized and bulk-written by the audit pipeline
+    audit_pipeline.emit_project_event(
+        project_id=project_id,
+        action=action,
+        severity=severity,
+        actor=actor,
+        request_id=request_id,
+        metadata=metadata,
+    )
 
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
@@ -271,6 +230,8 @@ async def create_project(
             updated_at=datetime.utcnow(),
         )
         db.add(project)
+        db.flush()
+        activity.create(db, project.id, at=project.updated_at)
         db.commit()
         db.refresh(project)
         
@@ -285,7 +246,7 @@ async def create_project(
         )
         
         # Get counts
-        counts = _get_project_counts(project.id)
+        counts = _get_project_counts(db, project)
         
         return {
             "id": project.id,
@@ -303,17 +264,34 @@ async def create_project(
 @router.get("/")
 async def list_projects(
     q: Optional[str] = Query(None, description="Search in name"),
-    status: Optional[str] = Query(None, description="Filter by status"),
+    status_filter: Optional[str] = Query(None, alias="status", description="Filter by status"),
     sensitivity: Optional[str] = Query(None, description="Filter by sensitivity"),
+    has_files: Optional[bool] = Query(None, description="Only projects with (true) or without (false) files"),
+    overdue: Optional[bool] = Query(None, description="Only active projects past (true) or not past (false) due_date"),
+    sort: str = Query(
+        "created_at",
+        pattern="^(created_at|start_date|due_date|last_activity)$",
+        description="Sort key (due_date soonest first, others newest first)",
+    ),
+    cursor: Optional[str] = Query(None, description="Cursor from previous page"),
     limit: int = Query(50, ge=1, le=200, description="Max items"),
-    offset: int = Query(0, ge=0, description="Offset"),
+    offset: int = Query(0, ge=0, description="Offset (first page only, use cursor to page)"),
 ) -> Dict[str, Any]:
     """List projects with optional filters.
     
+    Keyset pagination on the chosen sort key: pass next_cursor to get the
+    next page. total is only counted for the first page (without cursor).
+    Sorting by last_activity and the has_files filter use the project_activity
+    projection (indexed); projects without a projection row sort last.
+    
     Args:
         q: Search query (name)
-        status: Filter by status
+        status_filter: Filter by status
         sensitivity: Filter by sensitivity
+        has_files: Filter by whether the project has files
+        overdue: Filter by overdue (active, due_date before today)
+        sort: created_at | start_date | due_date | last_activity
+        cursor: Cursor from previous page
         limit: Max items
         offset: Offset
         
@@ -326,27 +304,28 @@ async def list_projects(
             detail="Database not available",
         )
     
+    filters = ProjectFilters(
+        q=q,
+        status=status_filter,
+        sensitivity=sensitivity,
+        has_files=has_files,
+        overdue=overdue,
+    )
     with get_db() as db:
-        query = db.query(Project)
-        
-        # Filters
-        if q:
-            query = query.filter(Project.name.ilike(f"%{q}%"))
-        if status:
-            query = query.filter(Project.status == status)
-        if sensitivity:
-            query = query.filter(Project.sensitivity == sensitivity)
-        
-        # Get total
-        total = query.count()
-        
-        # Pagination
-        projects = query.order_by(Project.created_at.desc()).offset(offset).limit(limit).all()
+        try:
+            page = query_projects(db, filters, sort=sort, limit=limit, cursor=cursor, offset=offset)
+        except InvalidCursorError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+        projects = page["projects"]
         
-        # Build response with counts
+        # Build response with counts (projection rows for the whole page)
+        page_counts = get_project_counts(db, projects)
         items = []
         for project in projects:
-            counts = _get_project_counts(project.id)
+            counts = page_counts.get(project.id) or empty_counts()
             items.append({
                 "id": project.id,
                 "name": project.name,
@@ -361,9 +340,10 @@ async def list_projects(
         
         return {
             "items": items,
-            "total": total,
+            "total": page["total"],
             "limit": limit,
             "offset": offset,
+            "next_cursor": page["next_cursor"],
         }
 
 
@@ -391,7 +371,7 @@ async def get_project(project_id: int) -> Dict[str, Any]:
                 detail=f"Project {project_id} not found",
             )
         
-        counts = _get_project_counts(project.id)
+        counts = _get_project_counts(db, project)
         
         return {
             "id": project.id,
@@ -477,6 +457,7 @@ async def update_project(
         
         if changed_fields:
             project.updated_at = datetime.utcnow()
+            activity.record(db, project.id, at=project.updated_at)
             db.commit()
             db.refresh(project)
             
@@ -490,7 +471,7 @@ async def update_project(
                 metadata={"changed_fields": changed_fields},
             )
         
-        counts = _get_project_counts(project.id)
+        counts = _get_project_counts(db, project)
         
         return {
             "id": project.id,
@@ -507,14 +488,18 @@ async def update_project(
 
 
 @router.get("/{project_id}/verify")
-async def verify_project(project_id: int) -> Dict[str, Any]:
+async def verify_project(
+    project_id: int,
+    full: bool = Query(False, description="Re-read all artifacts (ignore verification cache)"),
+) -> Dict[str, Any]:
     """Verify project integrity.
     
     Args:
         project_id: Project ID
+        full: Re-read all artifacts, not only those changed since last check
         
     Returns:
-        Integrity verification result
+        Integrity verification result (status ok|failed, checked counts, issues)
     """
     if not _has_db():
         raise HTTPException(
@@ -522,7 +507,8 @@ async def verify_project(project_id: int) -> Dict[str, Any]:
             detail="Database not available",
         )
     
-    result = verify_project_integrity(project_id)
+    # DB streaming + parallel blob hashing - off the event loop
+    result = await run_in_threadpool(verify_project_integrity, project_id, full)
     
     # Sanitize issues (no content/filenames)
     issues = result.get("issues", [])
@@ -533,11 +519,70 @@ async def verify_project(project_id: int) -> Dict[str, Any]:
     
     return {
         "project_id": project_id,
-        "status": result.get("status", "unknown"),
+        "status": "ok" if result["integrity_ok"] else "failed",
+        "checked": result["checked"],
+        "cached": result["cached"],
+        "unindexed": result["unindexed"],
+        "manifest": result["manifest"],
         "issues": sanitized_issues,
     }
 
 
+@router.get("/{project_id}/manifest")
+async def get_project_manifest(project_id: int) -> Dict[str, Any]:
+    """Get root and group hashes of the project integrity manifest.
+    
+    Args:
+        project_id: Project ID
+        
+    Returns:
+        Dict with project_id, root (None if not built yet) and groups
+    """
+    if not _has_db():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database not available",
+        )
+    
+    with get_db() as db:
+        if db.query(Project.id).filter(Project.id == project_id).first() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Project {project_id} not found",
+            )
+        return {"project_id": project_id, **merkle.manifest_summary(db, project_id)}
+
+
+@router.get("/{project_id}/manifest/proof")
+async def get_manifest_proof(
+    project_id: int,
+    path: str = Query(..., description="Manifest path, e.g. notes/3, transcripts/5/s831, files/2"),
+) -> Dict[str, Any]:
+    """Get inclusion proof for one artifact in the project integrity manifest.
+    
+    Args:
+        project_id: Project ID
+        path: Manifest path of the artifact
+        
+    Returns:
+        Proof (path, hash, root, steps) - checkable offline against the root
+    """
+    if not _has_db():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database not available",
+        )
+    
+    with get_db() as db:
+        proof = merkle.inclusion_proof(db, project_id, path)
+    if proof is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Path not in project manifest",
+        )
+    return {"project_id": project_id, **proof}
+
+
 @router.post("/{project_id}/attach")
 async def attach_transcripts(
     project_id: int,
@@ -580,18 +625,27 @@ async def attach_transcripts(
                 detail=f"Transcripts not found: {list(missing_ids)}",
             )
         
+        # Move counts between activity rows (before project_id changes are flushed)
+        activity.move_transcripts(db, [t.id for t in transcripts if t.project_id != project_id], project_id)
+        
         # Attach transcripts
         attached_count = 0
+        previous_projects = {}
         for transcript in transcripts:
             if transcript.project_id != project_id:
+                previous_projects[transcript.id] = transcript.project_id
                 transcript.project_id = project_id
                 attached_count += 1
         
+        # Move segment and audio leaves between integrity manifests (same transaction)
+        merkle.move_transcripts(db, list(previous_projects), previous_projects, project_id)
+        
         # Set started_working_at if not set
         if attached_count > 0 and not project.started_working_at:
             project.started_working_at = datetime.utcnow()
         
         project.updated_at = datetime.utcnow()
+        activity.record(db, project.id, at=project.updated_at)
         db.commit()
         
         # Create audit event
@@ -630,21 +684,75 @@ async def get_security_status() -> Dict[str, Any]:
     }
 
 
+def _unsupported_media_type(request: Optional[Request], message: str) -> HTTPException:
+    """415 with standard error shape (message is safe - no filename/path)."""
+    request_id = getattr(request.state, "request_id", None) if request else None
+    return HTTPException(
+        status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        detail={
+            "error": {
+                "code": "unsupported_media_type",
+                "message": message,
+                "request_id": request_id,
+            }
+        },
+    )
+
+
+async def _receive_upload(file: UploadFile, first_chunk: bytes, op: str, sink) -> int:
+    """Feed an upload to sink chunk by chunk (off the event loop), enforcing the size limit.
+    
+    Args:
+        file: Upload (read in UPLOAD_CHUNK_SIZE chunks after first_chunk)
+        first_chunk: Already read (and validated) first chunk
+        op: storage_async operation name (stats)
+        sink: Called with each chunk (BlobWriter.write or hash update)
+    
+    Returns:
+        Total size in bytes
+    
+    Raises:
+        ValueError: As soon as the upload exceeds MAX_PROJECT_FILE_SIZE
+    """
+    size_bytes = 0
+    chunk = first_chunk
+    while chunk:
+        size_bytes += len(chunk)
+        if size_bytes > MAX_PROJECT_FILE_SIZE:
+            raise ValueError(f"File too large (max: {MAX_PROJECT_FILE_SIZE} bytes)")
+        await storage_async.run(op, sink, chunk)
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+    return size_bytes
+
+
 @router.post("/{project_id}/files", status_code=status.HTTP_201_CREATED)
 async def upload_project_file(
     project_id: int,
     file: UploadFile = File(...),
     request: Request = None,
+    content_sha256: Optional[str] = Header(
+        None,
+        alias="X-Content-SHA256",
+        pattern="^[0-9a-f]{64}$",
+        description="SHA256 of the file (optional) - stored content is then only hashed, not re-encrypted",
+    ),
 ) -> Dict[str, Any]:
     """Upload file to project (multipart/form-data).
     
     Allowed formats: .txt, .docx, .pdf
     Max size: 25MB
     
+    Streamed in chunks: magic bytes are checked on the first chunk, the size
+    limit as bytes arrive, and SHA256 + encryption are updated per chunk
+    into a temp blob (dropped if the content is already stored). With
+    X-Content-SHA256 naming a stored blob, the upload is only hashed and
+    checked against it - nothing is encrypted or written.
+    
     Args:
         project_id: Project ID
         file: File upload
         request: FastAPI request (for request_id)
+        content_sha256: Client-declared SHA256 (optional)
         
     Returns:
         Upload result (file_id, sha256, size_bytes, mime_type, created_at)
@@ -655,27 +763,45 @@ async def upload_project_file(
             detail="Database not available",
         )
     
+    writer: Optional[BlobWriter] = None
     try:
-        # Read file content
-        file_content = await file.read()
+        # Fail fast before reading the body
+        with get_db() as db:
+            if not db.query(Project.id).filter(Project.id == project_id).first():
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Project {project_id} not found",
+                )
         
         # Get filename safely (don't log it)
         filename = file.filename if hasattr(file, 'filename') else None
         
-        # Validate file (magic bytes + extension)
+        # Validate first chunk (magic bytes + extension), then stream the rest
+        first_chunk = await file.read(UPLOAD_CHUNK_SIZE)
         try:
-            detected_format, is_valid = validate_project_file(file_content, filename)
+            detected_format, is_valid = validate_project_file(first_chunk, filename)
         except ValueError as e:
-            request_id = getattr(request.state, "request_id", None) if request else None
+            raise _unsupported_media_type(request, str(e))
+        
+        if content_sha256 and await storage_async.blob_exists(content_sha256):
+            # Known content: hash only
+            hasher = hashlib.sha256()
+            op, sink = "hash_chunk", hasher.update
+        else:
+            writer = BlobWriter()
+            op, sink = "encrypt_chunk", writer.write
+        try:
+            size_bytes = await _receive_upload(file, first_chunk, op, sink)
+        except ValueError as e:
+            raise _unsupported_media_type(request, str(e))
+        if writer is not None:
+            sha256, size_bytes = await storage_async.run("finish", writer.finish)
+        else:
+            sha256 = hasher.hexdigest()
+        if content_sha256 and sha256 != content_sha256:
             raise HTTPException(
-                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
-                detail={
-                    "error": {
-                        "code": "unsupported_media_type",
-                        "message": str(e),
-                        "request_id": request_id,
-                    }
-                },
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="File does not match X-Content-SHA256",
             )
         
         # Map detected format to MIME type
@@ -686,28 +812,6 @@ async def upload_project_file(
         }
         validated_mime_type = format_to_mime.get(detected_format, "application/octet-stream")
         
-        size_bytes = len(file_content)
-        
-        # Compute hash
-        try:
-            sha256 = compute_file_hash(file_content)
-        except Exception as e:
-            logger.error("project_file_hash_failed", extra={"error_type": type(e).__name__})
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to compute file hash",
-            )
-        
-        # Store encrypted file
-        try:
-            storage_path = store_file(file_content, sha256)
-        except Exception as e:
-            logger.error("project_file_storage_failed", extra={"error_type": type(e).__name__})
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to store file",
-            )
-        
         with get_db() as db:
             # Verify project exists
             project = db.query(Project).filter(Project.id == project_id).first()
@@ -717,8 +821,11 @@ async def upload_project_file(
                     detail=f"Project {project_id} not found",
                 )
             
-            # Check if file already exists (by sha256)
-            existing_file = db.query(ProjectFile).filter(ProjectFile.sha256 == sha256).first()
+            # Check if file already exists in this project (by sha256)
+            existing_file = db.query(ProjectFile).filter(
+                ProjectFile.project_id == project_id,
+                ProjectFile.sha256 == sha256,
+            ).first()
             if existing_file:
                 # File already exists, return existing record
                 return {
@@ -729,6 +836,28 @@ async def upload_project_file(
                     "created_at": existing_file.created_at.isoformat(),
                 }
             
+            # Hold a blob reference, then move the temp blob into place (dropped if content already stored)
+            blob_store.acquire(db, sha256, size_bytes)
+            try:
+                if writer is not None:
+                    storage_path = await storage_async.run("place", writer.place)
+                else:
+                    storage_path = await storage_async.run("exists", stored_blob_path, sha256)
+                    if storage_path is None:
+                        # Shredded since the check - encrypt from the spooled upload after all
+                        await file.seek(0)
+                        writer = BlobWriter()
+                        await _receive_upload(file, await file.read(UPLOAD_CHUNK_SIZE), "encrypt_chunk", writer.write)
+                        await storage_async.run("finish", writer.finish, sha256)
+                        storage_path = await storage_async.run("place", writer.place)
+            except Exception as e:
+                db.rollback()
+                logger.error("project_file_storage_failed", extra={"error_type": type(e).__name__})
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Failed to store file",
+                )
+            
             # Create ProjectFile record
             project_file = ProjectFile(
                 project_id=project_id,
@@ -741,12 +870,19 @@ async def upload_project_file(
                 created_at=datetime.utcnow(),
             )
             db.add(project_file)
+            db.flush()
+            
+            # Record ciphertext hash in the integrity manifest (same transaction)
+            ciphertext = merkle.blob_leaves([sha256]).get(sha256)
+            if ciphertext is not None:
+                merkle.update(db, project_id, set_leaves={f"files/{project_file.id}": ciphertext})
             
             # Set started_working_at if not set
             if not project.started_working_at:
                 project.started_working_at = datetime.utcnow()
             
             project.updated_at = datetime.utcnow()
+            activity.record(db, project_id, files=1, bytes_stored=size_bytes, at=project.updated_at)
             db.commit()
             db.refresh(project_file)
             
@@ -789,6 +925,10 @@ async def upload_project_file(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to upload file",
         )
+    finally:
+        # Temp blob of a rejected/duplicate upload (no-op once placed)
+        if writer is not None:
+            writer.abort()
 
 
 @router.get("/{project_id}/files")
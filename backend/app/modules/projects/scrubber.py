@@ -0,0 +1,433 @@
+"""Background integrity scrubber - re-reads stored blobs to find corruption early.
+
+Walks storage_blobs (least recently checked first) and re-reads each blob
+from disk within a read budget (SCRUBBER_MAX_MB_PER_SEC bytes and
+SCRUBBER_MAX_IOPS reads per second, shared by the whole run):
+- Indexed blobs: ciphertext SHA256 against blob_index
+- Unindexed blobs (or decrypt=True): trial decryption - every frame's
+  authentication tag, and the plaintext SHA256 against the blob name
+
+Results go to blob_integrity_status (one row per blob). A blob is due again
+SCRUBBER_INTERVAL_DAYS after its last check. When a blob turns bad (ok ->
+mismatch|undecryptable|missing), every project referencing it gets a
+critical ProjectAuditEvent "integrity_scrub_failed" (ids only) - once per
+transition, not on every pass.
+
+A blob rewritten meanwhile (re-key) or shredded meanwhile (collect) is
+re-checked against the current index entry / skipped, not reported.
+
+Runs as:
+- In-process thread (SCRUBBER_ENABLED, started by lifecycle)
+- CLI: python -m app.modules.projects.scrubber_runner
+
+progress() returns counters (no hashes, no content) and is exposed on /meta;
+status_counts() summarizes blob_integrity_status.
+"""
+import hashlib
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from cryptography.fernet import InvalidToken
+from sqlalchemy import func, or_
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.logging import logger
+from app.modules.audit import pipeline as audit_pipeline
+from app.modules.projects import blob_index, file_storage
+from app.modules.projects.blob_crypto import BlobIntegrityError
+from app.modules.projects.models import BlobIntegrityStatus, ProjectFile, StorageBlob
+from app.modules.transcripts.models import Transcript
+
+# Read size when hashing (one read = one I/O operation in the IOPS budget)
+READ_CHUNK_SIZE = 1024 * 1024
+
+# Statuses that mean the stored blob is damaged or gone
+FAILED_STATUSES = ("mismatch", "undecryptable", "missing")
+
+_state_lock = threading.Lock()
+_thread: Optional[threading.Thread] = None
+_stop_event = threading.Event()
+_progress: Dict[str, Any] = {
+    "running": False,
+    "passes": 0,
+    "checked": 0,
+    "bytes_read": 0,
+    "ok": 0,
+    "failed": 0,
+    "errors": 0,
+    "last_batch_at": None,
+}
+
+
+class _Stopped(Exception):
+    """Raised inside a blob read when the scrubber is stopping."""
+
+
+class ReadBudget:
+    """Shared bytes/s and reads/s budget - consume() sleeps to stay under both."""
+
+    def __init__(
+        self,
+        max_bytes_per_second: Optional[float],
+        max_iops: Optional[float],
+        stop_event: Optional[threading.Event] = None,
+    ) -> None:
+        self.max_bytes_per_second = max_bytes_per_second or None
+        self.max_iops = max_iops or None
+        self._stop_event = stop_event
+        self._started = time.monotonic()
+        self._bytes = 0
+        self._ops = 0
+
+    def consume(self, nbytes: int) -> None:
+        """Account one read of nbytes, sleeping while ahead of the budget.
+
+        Raises:
+            _Stopped: If the stop event is set while waiting
+        """
+        self._bytes += nbytes
+        self._ops += 1
+        due = 0.0
+        if self.max_bytes_per_second:
+            due = max(due, self._bytes / self.max_bytes_per_second)
+        if self.max_iops:
+            due = max(due, self._ops / self.max_iops)
+        ahead = due - (time.monotonic() - self._started)
+        if ahead > 0:
+            if self._stop_event is not None:
+                if self._stop_event.wait(ahead):
+                    raise _Stopped()
+            else:
+                time.sleep(ahead)
+        elif self._stop_event is not None and self._stop_event.is_set():
+            raise _Stopped()
+
+
+def _has_db() -> bool:
+    """Check if database is available."""
+    # Import engine from module to get current value (not cached import)
+    from app.core.database import engine
+    return engine is not None and settings.database_url is not None
+
+
+def _budgeted(chunks: Iterable[bytes], budget: ReadBudget) -> Iterator[bytes]:
+    for chunk in chunks:
+        budget.consume(len(chunk))
+        yield chunk
+
+
+def _hash_ciphertext(sha256: str, budget: ReadBudget) -> Tuple[str, int]:
+    """SHA256 of the blob file as stored.
+
+    Returns:
+        Tuple of (ciphertext SHA256, bytes read)
+    """
+    digest = hashlib.sha256()
+    size = 0
+    with open(file_storage.blob_path(sha256), "rb") as f:
+        for chunk in _budgeted(iter(lambda: f.read(READ_CHUNK_SIZE), b""), budget):
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def _trial_decrypt(sha256: str, budget: ReadBudget) -> Tuple[bool, int]:
+    """Decrypt the whole blob (tags checked per frame), compare plaintext SHA256.
+
+    Returns:
+        Tuple of (plaintext matches its name, bytes read)
+    """
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in _budgeted(file_storage.iter_file(sha256), budget):
+        digest.update(chunk)
+        size += len(chunk)
+    return digest.hexdigest() == sha256, size
+
+
+def check_blob(sha256: str, budget: ReadBudget, decrypt: bool = False) -> Dict[str, Any]:
+    """Re-read one blob.
+
+    Args:
+        sha256: Plaintext hash (blob name)
+        budget: Shared read budget
+        decrypt: Trial-decrypt even if the blob is indexed
+
+    Returns:
+        Dict with status (ok|mismatch|undecryptable|missing|error),
+        ciphertext_sha256, error_type, bytes_read
+    """
+    result: Dict[str, Any] = {"status": "ok", "ciphertext_sha256": None, "error_type": None, "bytes_read": 0}
+    try:
+        entry = blob_index.get(sha256)
+        if entry is not None:
+            actual, size = _hash_ciphertext(sha256, budget)
+            result["bytes_read"] += size
+            if actual != entry["ciphertext_sha256"]:
+                # Rewritten meanwhile (re-key) - check against the new entry once
+                current = blob_index.get(sha256)
+                if current is not None and current["ciphertext_sha256"] != entry["ciphertext_sha256"]:
+                    actual, size = _hash_ciphertext(sha256, budget)
+                    result["bytes_read"] += size
+                    entry = current
+            result["ciphertext_sha256"] = actual
+            if actual != entry["ciphertext_sha256"]:
+                result["status"] = "mismatch"
+                return result
+        if entry is None or decrypt:
+            matches, size = _trial_decrypt(sha256, budget)
+            result["bytes_read"] += size
+            if not matches:
+                result["status"] = "mismatch"
+    except _Stopped:
+        raise
+    except FileNotFoundError:
+        result["status"] = "missing"
+    except (BlobIntegrityError, InvalidToken) as e:
+        # Authentication tag / Fernet token failure - damaged ciphertext or wrong key
+        result["status"] = "undecryptable"
+        result["error_type"] = type(e).__name__
+    except Exception as e:
+        # I/O or other failure - says nothing about the blob itself
+        result["status"] = "error"
+        result["error_type"] = type(e).__name__
+    return result
+
+
+def _due_blobs(db, limit: int, now: datetime) -> List[str]:
+    """Blobs never checked or checked before the interval, oldest first."""
+    cutoff = now - timedelta(days=settings.scrubber_interval_days)
+    rows = db.query(StorageBlob.sha256).outerjoin(
+        BlobIntegrityStatus, BlobIntegrityStatus.sha256 == StorageBlob.sha256
+    ).filter(
+        StorageBlob.ref_count > 0,
+        or_(BlobIntegrityStatus.sha256.is_(None), BlobIntegrityStatus.checked_at < cutoff),
+    ).order_by(
+        BlobIntegrityStatus.checked_at.isnot(None), BlobIntegrityStatus.checked_at, StorageBlob.sha256
+    ).limit(limit)
+    return [row.sha256 for row in rows]
+
+
+def _referencing_projects(db, sha256: str) -> Dict[int, Dict[str, List[int]]]:
+    """Projects using a blob, with the file and audio ids that reference it."""
+    from app.modules.record.models import AudioAsset
+
+    projects: Dict[int, Dict[str, List[int]]] = {}
+    for row in db.query(ProjectFile.id, ProjectFile.project_id).filter(ProjectFile.sha256 == sha256):
+        projects.setdefault(row.project_id, {"file_ids": [], "audio_ids": []})["file_ids"].append(row.id)
+    for row in db.query(AudioAsset.id, Transcript.project_id).join(
+        Transcript, Transcript.id == AudioAsset.transcript_id
+    ).filter(
+        AudioAsset.sha256 == sha256,
+        Transcript.project_id.isnot(None),
+    ):
+        projects.setdefault(row.project_id, {"file_ids": [], "audio_ids": []})["audio_ids"].append(row.id)
+    return projects
+
+
+def _record(db, sha256: str, result: Dict[str, Any], now: datetime) -> bool:
+    """Store a check result.
+
+    Returns:
+        True if the blob turned bad (first failure after ok / never checked)
+    """
+    row = db.query(BlobIntegrityStatus).filter(BlobIntegrityStatus.sha256 == sha256).first()
+    previous = row.status if row else None
+    if row is None:
+        row = BlobIntegrityStatus(sha256=sha256, failures=0)
+        db.add(row)
+    row.status = result["status"]
+    row.ciphertext_sha256 = result["ciphertext_sha256"]
+    row.error_type = result["error_type"]
+    row.checked_at = now
+    if result["status"] == "ok":
+        row.last_ok_at = now
+        row.failures = 0
+    else:
+        row.failures = (row.failures or 0) + 1
+    return result["status"] in FAILED_STATUSES and previous not in FAILED_STATUSES
+
+
+def _update_progress(**counts: int) -> None:
+    with _state_lock:
+        for key, value in counts.items():
+            _progress[key] += value
+        _progress["last_batch_at"] = datetime.utcnow().isoformat()
+
+
+def scrub_batch(budget: ReadBudget, limit: Optional[int] = None, decrypt: bool = False) -> Dict[str, Any]:
+    """Check one batch of due blobs.
+
+    Args:
+        budget: Shared read budget
+        limit: Max blobs (default: SCRUBBER_BATCH_SIZE)
+        decrypt: Trial-decrypt every blob
+
+    Returns:
+        Dict with checked, ok, failed, errors, bytes_read, alerts, stopped
+    """
+    result = {"checked": 0, "ok": 0, "failed": 0, "errors": 0, "bytes_read": 0, "alerts": 0, "stopped": False}
+    now = datetime.utcnow()
+    with get_db() as db:
+        due = _due_blobs(db, max(1, limit or settings.scrubber_batch_size), now)
+
+    for sha256 in due:
+        try:
+            check = check_blob(sha256, budget, decrypt=decrypt)
+        except _Stopped:
+            result["stopped"] = True
+            break
+        alerts = []
+        with get_db() as db:
+            # Shredded while we read - nothing to report
+            blob = db.query(StorageBlob.sha256).filter(StorageBlob.sha256 == sha256).first()
+            if blob is None:
+                continue
+            if _record(db, sha256, check, datetime.utcnow()):
+                alerts = list(_referencing_projects(db, sha256).items())
+            db.commit()
+
+        result["checked"] += 1
+        result["bytes_read"] += check["bytes_read"]
+        if check["status"] == "ok":
+            result["ok"] += 1
+        elif check["status"] == "error":
+            result["errors"] += 1
+        else:
+            result["failed"] += 1
+            logger.error("blob_scrub_failed", extra={"status": check["status"], "error_type": check["error_type"]})
+        for project_id, refs in alerts:
+            audit_pipeline.emit_project_event(
+                project_id=project_id,
+                action="integrity_scrub_failed",
+                severity="critical",
+                metadata={"problem": check["status"], **refs},
+            )
+            result["alerts"] += 1
+
+    _update_progress(
+        checked=result["checked"],
+        bytes_read=result["bytes_read"],
+        ok=result["ok"],
+        failed=result["failed"],
+        errors=result["errors"],
+    )
+    return result
+
+
+def scrub(
+    max_bytes_per_second: Optional[float] = None,
+    max_iops: Optional[float] = None,
+    limit: Optional[int] = None,
+    decrypt: bool = False,
+    stop_event: Optional[threading.Event] = None,
+) -> Dict[str, Any]:
+    """Check all due blobs (one pass), batch by batch.
+
+    Args:
+        max_bytes_per_second: Read budget (None = unthrottled)
+        max_iops: Reads per second (None = unthrottled)
+        limit: Max blobs in this run
+        decrypt: Trial-decrypt every blob (slower - also checks the key)
+        stop_event: Set to stop after the current read
+
+    Returns:
+        Dict with checked, ok, failed, errors, bytes_read, alerts, seconds, stopped
+    """
+    totals = {"checked": 0, "ok": 0, "failed": 0, "errors": 0, "bytes_read": 0, "alerts": 0}
+    budget = ReadBudget(max_bytes_per_second, max_iops, stop_event)
+    started = time.monotonic()
+    stopped = False
+    while limit is None or totals["checked"] < limit:
+        batch_size = settings.scrubber_batch_size if limit is None else min(settings.scrubber_batch_size, limit - totals["checked"])
+        batch = scrub_batch(budget, limit=batch_size, decrypt=decrypt)
+        for key in totals:
+            totals[key] += batch[key]
+        if batch["stopped"]:
+            stopped = True
+            break
+        if batch["checked"] == 0:
+            break
+    if not stopped:
+        with _state_lock:
+            _progress["passes"] += 1
+    totals["seconds"] = round(time.monotonic() - started, 1)
+    totals["stopped"] = stopped
+    logger.info("blob_scrub_complete", extra=dict(totals))
+    return totals
+
+
+def status_counts() -> Dict[str, int]:
+    """Blobs per last scrub status (plus never checked)."""
+    with get_db() as db:
+        counts = {
+            status: count
+            for status, count in db.query(BlobIntegrityStatus.status, func.count()).group_by(BlobIntegrityStatus.status)
+        }
+        counts["unchecked"] = db.query(func.count(StorageBlob.sha256)).outerjoin(
+            BlobIntegrityStatus, BlobIntegrityStatus.sha256 == StorageBlob.sha256
+        ).filter(BlobIntegrityStatus.sha256.is_(None)).scalar() or 0
+    return counts
+
+
+def progress() -> Dict[str, Any]:
+    """Scrubber counters since process start (no hashes, no content)."""
+    with _state_lock:
+        return dict(_progress)
+
+
+def _run() -> None:
+    """Background loop: scrub due blobs, sleep when none are due."""
+    while not _stop_event.is_set():
+        try:
+            result = scrub(
+                max_bytes_per_second=settings.scrubber_max_mb_per_sec * 1024 * 1024,
+                max_iops=settings.scrubber_max_iops,
+                stop_event=_stop_event,
+            )
+            if result["stopped"]:
+                break
+        except Exception as e:
+            logger.error("blob_scrub_loop_failed", extra={"error_type": type(e).__name__})
+        _stop_event.wait(max(1.0, settings.scrubber_idle_seconds))
+
+
+def start() -> bool:
+    """Start background scrubber thread if SCRUBBER_ENABLED (idempotent).
+
+    Returns:
+        True if the thread is running
+    """
+    global _thread
+    if not settings.scrubber_enabled or not _has_db():
+        return False
+    with _state_lock:
+        if _thread is not None and _thread.is_alive():
+            return True
+        _stop_event.clear()
+        _thread = threading.Thread(target=_run, name="blob-scrubber", daemon=True)
+        _thread.start()
+        _progress["running"] = True
+    logger.info("blob_scrubber_started", extra={
+        "max_mb_per_sec": settings.scrubber_max_mb_per_sec,
+        "max_iops": settings.scrubber_max_iops,
+    })
+    return True
+
+
+def stop(timeout: float = 5.0) -> None:
+    """Stop background scrubber (interrupted at the next read)."""
+    global _thread
+    with _state_lock:
+        thread = _thread
+        _thread = None
+    if thread is None:
+        return
+    _stop_event.set()
+    thread.join(timeout)
+    with _state_lock:
+        _progress["running"] = False
+    logger.info("blob_scrubber_stopped")
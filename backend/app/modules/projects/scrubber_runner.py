@@ -0,0 +1,104 @@
+"""CLI entrypoint for the blob integrity scrubber.
+
+Usage:
+    python -m app.modules.projects.scrubber_runner [--limit N] [--max-mb-per-sec N] [--max-iops N] [--decrypt] [--status]
+
+This is a standalone CLI tool - not part of the API.
+Run from cron when the in-process scrubber (SCRUBBER_ENABLED) is off.
+One run checks every blob that is due (not checked in SCRUBBER_INTERVAL_DAYS).
+"""
+import argparse
+import sys
+
+from app.core.config import settings
+from app.core.database import init_db
+from app.core.logging import logger
+from app.modules.audit import pipeline as audit_pipeline
+from app.modules.projects import scrubber
+
+
+def main() -> int:
+    """CLI entrypoint for scrubbing.
+    
+    Returns:
+        0 if no blob failed, 1 on failures or error
+    """
+    parser = argparse.ArgumentParser(
+        description="Re-read stored blobs and verify their ciphertext hashes",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Check all due blobs within the configured budget
+  python -m app.modules.projects.scrubber_runner
+  
+  # Gentle run: 5 MB/s, 20 reads/s, at most 1000 blobs
+  python -m app.modules.projects.scrubber_runner --max-mb-per-sec 5 --max-iops 20 --limit 1000
+  
+  # Also trial-decrypt (checks authentication tags and the key)
+  python -m app.modules.projects.scrubber_runner --decrypt
+  
+  # Only show status counts
+  python -m app.modules.projects.scrubber_runner --status
+        """,
+    )
+    parser.add_argument("--limit", type=int, help="Max blobs to check in this run")
+    parser.add_argument(
+        "--max-mb-per-sec",
+        type=float,
+        default=settings.scrubber_max_mb_per_sec,
+        help=f"Read budget in MB/s, 0 = unthrottled (default: {settings.scrubber_max_mb_per_sec})",
+    )
+    parser.add_argument(
+        "--max-iops",
+        type=int,
+        default=settings.scrubber_max_iops,
+        help=f"Reads per second, 0 = unthrottled (default: {settings.scrubber_max_iops})",
+    )
+    parser.add_argument("--decrypt", action="store_true", help="Trial-decrypt every blob (slower)")
+    parser.add_argument("--status", action="store_true", help="Only print blob counts per status")
+    
+    args = parser.parse_args()
+    
+    try:
+        if not settings.database_url:
+            print("Error: DATABASE_URL not set", file=sys.stderr)
+            return 1
+        init_db(settings.database_url)
+        
+        if not args.status:
+            result = scrubber.scrub(
+                max_bytes_per_second=args.max_mb_per_sec * 1024 * 1024,
+                max_iops=args.max_iops,
+                limit=args.limit,
+                decrypt=args.decrypt,
+            )
+            # Critical audit events are queued - write them before exiting
+            audit_pipeline.flush()
+            
+            print("Scrub complete:")
+            print(f"  Blobs checked: {result['checked']}")
+            print(f"  OK: {result['ok']}")
+            print(f"  Failed: {result['failed']}")
+            print(f"  Errors: {result['errors']}")
+            print(f"  MB read: {result['bytes_read'] / (1024 * 1024):.1f}")
+            print(f"  Seconds: {result['seconds']}")
+            print(f"  Audit alerts: {result['alerts']}")
+        
+        print("Blob status:")
+        for status, count in sorted(scrubber.status_counts().items()):
+            print(f"  {status}: {count}")
+        
+        return 1 if not args.status and (result["failed"] or result["errors"]) else 0
+    
+    except KeyboardInterrupt:
+        logger.warning("blob_scrub_interrupted")
+        return 130  # Standard exit code for SIGINT
+    except Exception as e:
+        error_type = type(e).__name__
+        logger.error("blob_scrub_run_failed", extra={"error_type": error_type})
+        print(f"Error: {error_type}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""Secure delete - chunked overwrite, fsync, unlink (constant memory).
+
+Best effort: on SSDs (wear leveling, TRIM) and copy-on-write filesystems an
+overwrite does not reach the original blocks. The real guarantee is
+encryption-at-rest; overwriting shortens the window for raw-disk recovery.
+
+Passes: the last pass writes zeros, earlier passes random data
+(SECURE_DELETE_PASSES, default 1 = zeros only). Buffers are reused, so memory
+is bounded by SHRED_CHUNK_SIZE regardless of file size.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional
+
+from app.core.config import settings
+from app.core.logging import logger
+
+# Overwrite chunk size
+SHRED_CHUNK_SIZE = 1024 * 1024
+
+_ZEROS = bytes(SHRED_CHUNK_SIZE)
+
+
+def _overwrite(fd: int, size: int, random_pass: bool) -> None:
+    """Overwrite [0, size) of an open file and fsync."""
+    os.lseek(fd, 0, os.SEEK_SET)
+    remaining = size
+    while remaining > 0:
+        n = min(SHRED_CHUNK_SIZE, remaining)
+        buffer = os.urandom(n) if random_pass else memoryview(_ZEROS)[:n]
+        while buffer:
+            written = os.write(fd, buffer)
+            buffer = buffer[written:]
+        remaining -= n
+    os.fsync(fd)
+
+
+def _fsync_dir(path: Path) -> None:
+    """Persist unlink/rename in parent directory (best effort, not on all platforms)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def shred_file(path: Path, passes: Optional[int] = None) -> bool:
+    """Overwrite file in place, fsync and unlink.
+
+    Args:
+        path: File to shred
+        passes: Overwrite passes (default: settings.secure_delete_passes)
+
+    Returns:
+        True if the file existed and was removed
+    """
+    passes = max(1, settings.secure_delete_passes if passes is None else passes)
+    try:
+        fd = os.open(path, os.O_WRONLY)
+    except FileNotFoundError:
+        return False
+
+    try:
+        size = os.fstat(fd).st_size
+        for index in range(passes):
+            _overwrite(fd, size, random_pass=index < passes - 1)
+    except OSError as e:
+        # Best effort - continue with deletion
+        logger.warning("secure_delete_overwrite_failed", extra={"error_type": type(e).__name__})
+    finally:
+        os.close(fd)
+
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        return False
+    _fsync_dir(path.parent)
+    return True
+
+
+def shred_files(paths: Iterable[Path], passes: Optional[int] = None, max_workers: Optional[int] = None) -> int:
+    """Shred many files in parallel on a small thread pool.
+
+    Args:
+        paths: Files to shred
+        passes: Overwrite passes (default: settings.secure_delete_passes)
+        max_workers: Threads (default: settings.secure_delete_workers)
+
+    Returns:
+        Number of files removed (failures are logged, not raised)
+    """
+    paths = list(paths)
+    workers = min(max_workers or settings.secure_delete_workers, len(paths))
+
+    def _shred(path: Path) -> bool:
+        try:
+            return shred_file(path, passes)
+        except Exception as e:
+            logger.error("secure_delete_failed", extra={"error_type": type(e).__name__})
+            return False
+
+    if workers <= 1:
+        return sum(1 for path in paths if _shred(path))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="shred") as executor:
+        return sum(1 for removed in executor.map(_shred, paths) if removed)
@@ -0,0 +1,144 @@
+"""Async facade over file_storage - blob I/O and crypto off the event loop.
+
+Blocking storage calls (encrypt/decrypt, disk reads/writes, fsync, shred) run
+on a dedicated bounded thread pool (STORAGE_IO_WORKERS), separate from
+Starlette's default threadpool, so one large upload cannot starve other
+requests or DB calls on the same worker.
+
+Every call is timed per operation name; stats() returns counts and timings
+(no content, no hashes) and is exposed on /meta.
+
+Usage (in async route handlers):
+    sha256 = await storage_async.run("hash", compute_file_hash, content)
+    storage_path = await storage_async.store_file(content, sha256)
+    return StreamingResponse(storage_async.iter_file(sha256, start, end))
+"""
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Optional, TypeVar
+
+from app.core.config import settings
+from app.core.logging import logger
+from app.modules.projects import file_storage
+
+T = TypeVar("T")
+
+_state_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+_stats: Dict[str, Dict[str, float]] = {}
+
+
+def _ensure_started() -> ThreadPoolExecutor:
+    """Create storage pool on first use."""
+    global _executor
+    with _state_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, settings.storage_io_workers),
+                thread_name_prefix="storage-io",
+            )
+        return _executor
+
+
+def _record(op: str, elapsed_ms: float, failed: bool) -> None:
+    with _state_lock:
+        entry = _stats.setdefault(op, {"calls": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0})
+        entry["calls"] += 1
+        entry["errors"] += int(failed)
+        entry["total_ms"] += elapsed_ms
+        entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+
+
+async def run(op: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking storage call on the storage pool (timed as `op`).
+
+    Args:
+        op: Operation name for metrics (e.g. "store", "encrypt_chunk")
+        fn: Blocking callable
+        *args: Positional arguments
+        **kwargs: Keyword arguments
+
+    Returns:
+        Result of fn
+    """
+    loop = asyncio.get_running_loop()
+    started = time.monotonic()
+    failed = False
+    try:
+        return await loop.run_in_executor(_ensure_started(), functools.partial(fn, *args, **kwargs))
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        _record(op, (time.monotonic() - started) * 1000, failed)
+
+
+async def store_file(content: bytes, sha256: str) -> str:
+    """Async file_storage.store_file (encrypt + write + fsync)."""
+    return await run("store", file_storage.store_file, content, sha256)
+
+
+async def retrieve_file(sha256: str) -> bytes:
+    """Async file_storage.retrieve_file (read + decrypt whole file)."""
+    return await run("retrieve", file_storage.retrieve_file, sha256)
+
+
+async def delete_file(sha256: str) -> None:
+    """Async file_storage.delete_file (unconditional shred)."""
+    await run("delete", file_storage.delete_file, sha256)
+
+
+async def blob_exists(sha256: str) -> bool:
+    """Check if blob is stored (stat on the storage pool)."""
+    return await run("exists", lambda: file_storage.blob_path(sha256).exists())
+
+
+async def iter_file(sha256: str, start: int = 0, end: Optional[int] = None) -> AsyncIterator[bytes]:
+    """Async file_storage.iter_file - each frame is read and decrypted on the storage pool.
+
+    Args:
+        sha256: SHA256 hash (filename)
+        start: First byte (inclusive)
+        end: Last byte (exclusive, default: end of file)
+
+    Yields:
+        Decrypted chunks (at most one frame each)
+    """
+    chunks = file_storage.iter_file(sha256, start, end)
+    try:
+        while True:
+            chunk = await run("read_frame", next, chunks, None)
+            if chunk is None:
+                break
+            yield chunk
+    finally:
+        # Close generator (and blob file) on the pool - client may disconnect mid-stream
+        await run("close", chunks.close)
+
+
+def stats() -> Dict[str, Dict[str, float]]:
+    """Per-operation timing metrics (counts and milliseconds only)."""
+    with _state_lock:
+        return {
+            op: {
+                "calls": int(entry["calls"]),
+                "errors": int(entry["errors"]),
+                "avg_ms": round(entry["total_ms"] / entry["calls"], 2) if entry["calls"] else 0.0,
+                "max_ms": round(entry["max_ms"], 2),
+            }
+            for op, entry in _stats.items()
+        }
+
+
+def stop(wait: bool = True) -> None:
+    """Shut down storage pool (recreated lazily on next use)."""
+    global _executor
+    with _state_lock:
+        executor = _executor
+        _executor = None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+        logger.info("storage_io_stopped")
@@ -0,0 +1,88 @@
+"""Tests for the project activity projection (maintained by writes, read by project lists)."""
+import os
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import database
+from app.modules.projects import activity, blob_store, file_storage
+from app.modules.projects.models import ProjectActivity, ProjectFile
+from app.modules.projects.router import router
+from app.modules.record import service as record_service
+from app.modules.transcripts import service as transcripts_service
+
+app = FastAPI()
+app.include_router(router, prefix="/projects")
+client = TestClient(app)
+
+SEGMENTS = [{"start_ms": 0, "end_ms": 900, "speaker_label": "SPEAKER_1", "text": "Hej."}]
+
+
+def _save_audio(transcript_id: int, size: int) -> None:
+    content = os.urandom(size)
+    sha256 = file_storage.compute_file_hash(content)
+    record_service._save_audio_asset(
+        transcript_id, sha256, "audio/wav", len(content), lambda: file_storage.store_file(content, sha256),
+    )
+
+
+def _rows_match_rebuild() -> None:
+    with database.get_db() as db:
+        stored = {row.project_id: activity.activity_dict(row) for row in db.query(ProjectActivity)}
+        computed = activity.compute_activity(db, list(stored))
+    for project_id, values in stored.items():
+        for key in ("transcripts_count", "notes_count", "files_count", "audio_count", "bytes_stored"):
+            assert values[key] == computed[project_id][key], (project_id, key)
+        assert values["last_activity_at"] >= computed[project_id]["last_activity_at"]
+
+
+@pytest.mark.usefixtures("sqlite_db", "blob_storage")
+class TestActivity:
+    """Test incremental maintenance and list sort/filter."""
+
+    def test_writes_keep_projection_equal_to_rebuild(self):
+        """Test shell, audio, segments, attach and delete keep rows equal to a recompute."""
+        shell = record_service.create_record_project(title="t")
+        first, transcript_id = shell["project_id"], shell["transcript_id"]
+        second = client.post("/projects/", json={"name": "b"}).json()["id"]
+        _save_audio(transcript_id, 1000)
+        _save_audio(transcript_id, 1500)  # Replaces the blob - bytes change, count doesn't
+        transcripts_service.upsert_segments(transcript_id, SEGMENTS)
+        _rows_match_rebuild()
+
+        assert client.post(f"/projects/{second}/attach", json={"transcript_ids": [transcript_id]}).status_code == 200
+        _rows_match_rebuild()
+        with database.get_db() as db:
+            moved = db.query(ProjectActivity).filter(ProjectActivity.project_id == second).one()
+            assert (moved.transcripts_count, moved.audio_count, moved.bytes_stored) == (1, 1, 1500)
+
+        transcripts_service.delete_transcript(transcript_id)
+        _rows_match_rebuild()
+        with database.get_db() as db:
+            assert activity.rebuild(db) == 0  # Every project has a row
+            assert {row.project_id: row.transcripts_count for row in db.query(ProjectActivity)} == {first: 0, second: 0}
+
+    def test_list_sorts_by_activity_and_filters_files(self):
+        """Test sort=last_activity puts recently touched projects first; has_files uses files_count."""
+        ids = [client.post("/projects/", json={"name": name}).json()["id"] for name in ("a", "b", "c")]
+        content = b"x" * 10
+        sha256 = file_storage.compute_file_hash(content)
+        with database.get_db() as db:
+            blob_store.acquire(db, sha256, len(content))
+            db.add(ProjectFile(
+                project_id=ids[0], original_filename="f", sha256=sha256, mime_type="text/plain",
+                size_bytes=len(content), storage_path="x", created_at=datetime.utcnow(),
+            ))
+            activity.record(db, ids[0], files=1, bytes_stored=len(content))
+            db.commit()
+
+        listed = client.get("/projects/", params={"sort": "last_activity"}).json()["items"]
+        assert [item["id"] for item in listed] == [ids[0], ids[2], ids[1]]
+        assert listed[0]["files_count"] == 1 and listed[0]["bytes_stored"] == 10
+
+        with_files = client.get("/projects/", params={"has_files": "true"}).json()
+        assert [item["id"] for item in with_files["items"]] == [ids[0]] and with_files["total"] == 1
+        without = client.get("/projects/", params={"has_files": "false"}).json()["items"]
+        assert sorted(item["id"] for item in without) == ids[1:]
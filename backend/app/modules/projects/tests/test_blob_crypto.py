@@ -0,0 +1,161 @@
+"""Tests for chunked blob encryption container and streaming blob writer."""
+import hashlib
+import hmac
+import io
+import os
+
+import pytest
+from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from app.modules.projects import blob_crypto, file_storage
+from app.modules.projects.blob_crypto import (
+    HEADER_SIZE,
+    BlobIntegrityError,
+    BlobReader,
+    FrameEncryptor,
+    decrypt_bytes,
+    key_id_for,
+)
+from app.modules.projects.reencrypt import reencrypt_legacy_blobs
+from app.modules.projects.rekey import rekey_blobs
+
+FRAME = 1024  # Small frames keep tests fast
+
+
+def _encrypt(data: bytes, key: bytes, chunk: int = 300) -> bytes:
+    encryptor = FrameEncryptor(key, frame_size=FRAME)
+    out = bytearray(encryptor.header)
+    for i in range(0, len(data), chunk):
+        out += encryptor.update(data[i:i + chunk])
+    out += encryptor.finalize()
+    return bytes(out)
+
+
+def _encrypt_v1(data: bytes, key: bytes) -> bytes:
+    """Version 1 container (no key id in header), single frame."""
+    salt = os.urandom(blob_crypto.SALT_SIZE)
+    enc_key, mac_key = blob_crypto._derive_keys(key, salt)
+    prefix = blob_crypto._HEADER_PREFIX.pack(blob_crypto.MAGIC, 1, FRAME) + salt
+    header = prefix + hmac.new(mac_key, prefix, hashlib.sha256).digest()
+    return header + AESGCM(enc_key).encrypt(blob_crypto._nonce(0), data, blob_crypto._aad(header, True))
+
+
+@pytest.fixture
+def storage(monkeypatch, tmp_path):
+    """Temp storage dir + fresh PROJECT_FILES_KEY."""
+    monkeypatch.setenv("PROJECT_FILES_KEY", Fernet.generate_key().decode())
+    monkeypatch.setattr(file_storage, "_STORAGE_DIR", tmp_path)
+    return tmp_path
+
+
+class TestContainer:
+    """Test container round trip and authentication."""
+
+    @pytest.mark.parametrize("size", [0, 1, FRAME, FRAME + 1, 3 * FRAME])
+    def test_round_trip(self, size):
+        """Test frame boundaries (empty, exact multiple, partial last frame)."""
+        key = os.urandom(32)
+        data = os.urandom(size)
+        assert decrypt_bytes(_encrypt(data, key), key) == data
+
+    def test_truncation_detected(self):
+        """Test dropping trailing frames fails (final flag)."""
+        key = os.urandom(32)
+        blob = _encrypt(os.urandom(3 * FRAME), key)
+        with pytest.raises(BlobIntegrityError):
+            decrypt_bytes(blob[:HEADER_SIZE + 2 * (FRAME + 16)], key)
+
+    def test_range_reads_only_covering_frames(self):
+        """Test byte ranges across frame boundaries decrypt only the frames needed."""
+        key = os.urandom(32)
+        data = os.urandom(5 * FRAME + 123)
+        reader = BlobReader(io.BytesIO(_encrypt(data, key)), key)
+        assert reader.size == len(data)
+        for start, end in [(0, 1), (FRAME - 1, FRAME + 1), (2 * FRAME + 5, 4 * FRAME), (5 * FRAME, len(data) + 50)]:
+            assert b"".join(reader.iter_range(start, end)) == data[start:end]
+        assert len(list(reader.iter_range(3 * FRAME + 1, 3 * FRAME + 2))) == 1
+
+    def test_tamper_and_wrong_key(self):
+        """Test modified ciphertext and wrong key are rejected."""
+        key = os.urandom(32)
+        blob = bytearray(_encrypt(b"secret audio", key))
+        with pytest.raises(BlobIntegrityError):
+            decrypt_bytes(bytes(blob), os.urandom(32))
+        blob[-1] ^= 0x01
+        with pytest.raises(BlobIntegrityError):
+            decrypt_bytes(bytes(blob), key)
+
+
+class TestBlobWriter:
+    """Test streaming writer."""
+
+    def test_commit_and_retrieve(self, storage):
+        """Test incremental hash, atomic rename and decrypt."""
+        data = os.urandom(2 * 1024 * 1024 + 17)
+        with file_storage.BlobWriter() as writer:
+            for i in range(0, len(data), 64 * 1024):
+                writer.write(data[i:i + 64 * 1024])
+            sha256, size_bytes, storage_path = writer.commit()
+
+        assert sha256 == hashlib.sha256(data).hexdigest()
+        assert size_bytes == len(data)
+        assert [p.relative_to(storage).as_posix() for p in file_storage.iter_blob_paths()] == [storage_path]
+        assert list(storage.glob(".upload-*")) == []
+        assert file_storage.retrieve_file(sha256) == data
+
+    def test_abort_leaves_nothing(self, storage):
+        """Test failed upload removes temp file."""
+        with pytest.raises(RuntimeError):
+            with file_storage.BlobWriter() as writer:
+                writer.write(b"partial")
+                raise RuntimeError("client disconnected")
+        assert os.listdir(storage) == []
+
+    def test_legacy_fernet_readable_and_migrated(self, storage):
+        """Test existing whole-file Fernet blobs are readable and re-encrypted by the migration."""
+        data = b"old audio" * 1000
+        sha256 = hashlib.sha256(data).hexdigest()
+        fernet = Fernet(os.environ["PROJECT_FILES_KEY"].encode("ascii"))
+        (storage / f"{sha256}.bin").write_bytes(fernet.encrypt(data))
+        assert file_storage.retrieve_file(sha256) == data
+        assert file_storage.is_legacy_blob(sha256)
+
+        result = reencrypt_legacy_blobs()
+        assert (result["legacy"], result["migrated"], result["errors"]) == (1, 1, 0)
+        assert not file_storage.is_legacy_blob(sha256)
+        assert b"".join(file_storage.iter_file(sha256, 5, 12)) == data[5:12]
+        assert reencrypt_legacy_blobs()["legacy"] == 0
+
+
+class TestKeyRotation:
+    """Test key ids in headers, old keys and online re-keying."""
+
+    def test_key_id_selects_key(self):
+        """Test blobs decrypt with the key named in the header, unknown ids fail."""
+        old, new = os.urandom(32), os.urandom(32)
+        blob = _encrypt(b"data" * 500, old)
+        keys = {key_id_for(new): new, key_id_for(old): old}
+        assert decrypt_bytes(blob, keys) == b"data" * 500
+        assert decrypt_bytes(_encrypt_v1(b"v1", old), keys) == b"v1"
+        with pytest.raises(BlobIntegrityError):
+            decrypt_bytes(blob, {key_id_for(new): new})
+
+    def test_rekey_after_rotation(self, storage, monkeypatch):
+        """Test blobs stay readable with the old key and are re-keyed online."""
+        old_key = os.environ["PROJECT_FILES_KEY"]
+        data = os.urandom(3 * 1024 + 5)
+        sha256 = hashlib.sha256(data).hexdigest()
+        file_storage.store_file(data, sha256)
+
+        monkeypatch.setenv("PROJECT_FILES_KEY", Fernet.generate_key().decode())
+        monkeypatch.setenv("PROJECT_FILES_OLD_KEYS", old_key)
+        assert file_storage.retrieve_file(sha256) == data
+        assert rekey_blobs(dry_run=True)["pending"] == 1
+
+        result = rekey_blobs(max_bytes_per_second=1024 * 1024)
+        assert (result["pending"], result["rekeyed"], result["errors"]) == (1, 1, 0)
+
+        monkeypatch.delenv("PROJECT_FILES_OLD_KEYS")
+        assert file_storage.retrieve_file(sha256) == data
+        assert rekey_blobs()["pending"] == 0
@@ -0,0 +1,86 @@
+"""Tests for sharded blob layout, blob index and layout migration."""
+import hashlib
+import os
+from datetime import date, datetime
+
+import pytest
+
+from app.core import database
+from app.modules.projects import blob_index, blob_store, file_storage
+from app.modules.projects.blob_layout import find_orphans, migrate_to_sharded, rebuild_index
+from app.modules.projects.integrity import verify_project_integrity
+from app.modules.projects.models import Project, ProjectFile
+
+
+@pytest.fixture
+def storage(sqlite_db, blob_storage):
+    """Temp storage dir + SQLite database."""
+    return blob_storage
+
+
+def _store(content: bytes) -> str:
+    sha256 = hashlib.sha256(content).hexdigest()
+    file_storage.store_file(content, sha256)
+    return sha256
+
+
+class TestBlobLayout:
+    """Test new blobs are sharded and indexed, flat blobs are migrated."""
+
+    def test_store_writes_sharded_and_indexed(self, storage):
+        """Test store_file places blob in ab/cd/ and records ciphertext hash."""
+        content = os.urandom(10_000)
+        sha256 = hashlib.sha256(content).hexdigest()
+        storage_path = file_storage.store_file(content, sha256)
+
+        assert storage_path == f"{sha256[:2]}/{sha256[2:4]}/{sha256}.bin"
+        path = storage / storage_path
+        entry = blob_index.get(sha256)
+        assert entry["size_bytes"] == path.stat().st_size
+        assert entry["ciphertext_sha256"] == hashlib.sha256(path.read_bytes()).hexdigest()
+        assert file_storage.retrieve_file(sha256) == content
+
+        file_storage.delete_file(sha256)
+        assert not path.exists()
+        assert blob_index.get(sha256) is None
+
+    def test_migrate_flat_blobs(self, storage):
+        """Test flat blobs stay readable and are moved into shards by the migration."""
+        content = os.urandom(5_000)
+        sha256 = _store(content)
+        sharded = storage / file_storage.relative_blob_path(sha256)
+        flat = storage / f"{sha256}.bin"
+        os.replace(sharded, flat)
+        blob_index.remove(sha256)
+        assert file_storage.retrieve_file(sha256) == content
+
+        assert migrate_to_sharded(dry_run=True) == {"flat": 1, "moved": 0, "errors": 0, "dry_run": True}
+        assert migrate_to_sharded()["moved"] == 1
+        assert not flat.exists() and sharded.exists()
+        assert blob_index.get(sha256)["size_bytes"] == sharded.stat().st_size
+        assert migrate_to_sharded()["flat"] == 0
+
+    def test_rebuild_index_and_orphans(self, storage):
+        """Test rebuild drops stale entries and orphan scan uses the index."""
+        referenced = _store(b"referenced")
+        orphan = _store(b"orphan")
+        blob_index.record("0" * 64, 1, "0" * 64)  # Stale: no file on disk
+
+        now = datetime.utcnow()
+        with database.get_db() as db:
+            project = Project(name="p", sensitivity="standard", status="active", start_date=date.today(), created_at=now, updated_at=now)
+            db.add(project)
+            db.flush()
+            blob_store.acquire(db, referenced, 10)
+            db.add(ProjectFile(
+                project_id=project.id, original_filename="a.txt", sha256=referenced, size_bytes=10,
+                mime_type="text/plain", storage_path=file_storage.relative_blob_path(referenced), created_at=now,
+            ))
+            db.commit()
+            project_id = project.id
+
+        assert rebuild_index() == {"indexed": 2, "removed": 1, "errors": 0}
+        assert find_orphans() == [orphan]
+        assert blob_store.collect([orphan]) == 1
+        assert find_orphans() == []
+        assert verify_project_integrity(project_id)["integrity_ok"] is True
@@ -0,0 +1,112 @@
+"""Tests for reference-counted blob store (dedup across audio assets and project files)."""
+import os
+from datetime import date, datetime
+
+import pytest
+
+from app.core import database
+from app.modules.projects import blob_store, file_storage
+from app.modules.projects.models import Project, ProjectFile, StorageBlob
+from app.modules.record import service as record_service
+from app.modules.record.models import AudioAsset
+from app.modules.transcripts.models import Transcript
+
+AUDIO = b"RIFF" + os.urandom(64 * 1024)
+
+
+@pytest.fixture
+def db(sqlite_db, blob_storage):
+    """SQLite database + temp storage, one project with two transcripts."""
+    now = datetime.utcnow()
+    with database.get_db() as session:
+        project = Project(name="p", sensitivity="standard", status="active", start_date=date.today(), created_at=now, updated_at=now)
+        session.add(project)
+        session.flush()
+        for _ in range(2):
+            session.add(Transcript(title="t", source="interview", language="sv", status="ready", project_id=project.id, created_at=now, updated_at=now))
+        session.commit()
+    return blob_storage
+
+
+def _blobs(storage_dir) -> list:
+    return [p.name for p in file_storage.iter_blob_paths()]
+
+
+def _ref_count(sha256: str) -> int:
+    with database.get_db() as session:
+        blob = session.query(StorageBlob).filter(StorageBlob.sha256 == sha256).first()
+        return blob.ref_count if blob else 0
+
+
+class TestBlobStore:
+    """Test shared blobs are stored once and shredded with the last reference."""
+
+    def test_same_audio_on_two_transcripts(self, db, monkeypatch):
+        """Test second upload skips encryption and the write."""
+        first = record_service.upload_audio(1, AUDIO, filename="a.wav")
+
+        def _no_write(*args, **kwargs):
+            raise AssertionError("blob should not be re-encrypted")
+
+        monkeypatch.setattr(file_storage, "BlobWriter", _no_write)
+        second = record_service.upload_audio(2, AUDIO, filename="a.wav")
+
+        assert first["sha256"] == second["sha256"]
+        assert _blobs(db) == [f"{first['sha256']}.bin"]
+        assert _ref_count(first["sha256"]) == 2
+
+    def test_shred_only_at_zero_refs(self, db):
+        """Test destroying one transcript keeps the blob for the other."""
+        sha256 = record_service.upload_audio(1, AUDIO, filename="a.wav")["sha256"]
+        record_service.upload_audio(2, AUDIO, filename="a.wav")
+
+        record_service.destroy_record(1, dry_run=False, confirm=True, reason="klar")
+        assert _ref_count(sha256) == 1
+        assert file_storage.retrieve_file(sha256) == AUDIO
+
+        record_service.destroy_record(2, dry_run=False, confirm=True, reason="klar")
+        assert _blobs(db) == []
+        with database.get_db() as session:
+            assert session.query(StorageBlob).count() == 0
+
+    def test_replaced_audio_releases_old_blob(self, db):
+        """Test re-upload with different content shreds the unshared old blob."""
+        old = record_service.upload_audio(1, AUDIO, filename="a.wav")["sha256"]
+        new = record_service.upload_audio(1, AUDIO + b"x", filename="a.wav")["sha256"]
+
+        assert _blobs(db) == [f"{new}.bin"]
+        assert _ref_count(old) == 0
+        assert _ref_count(new) == 1
+
+    def test_project_file_shares_blob(self, db):
+        """Test a project file with the same content references the same blob."""
+        sha256 = record_service.upload_audio(1, AUDIO, filename="a.wav")["sha256"]
+        with database.get_db() as session:
+            blob_store.acquire(session, sha256, len(AUDIO))
+            session.add(ProjectFile(
+                project_id=1, original_filename="a.wav", sha256=sha256, mime_type="audio/wav",
+                size_bytes=len(AUDIO), storage_path=file_storage.store_file(AUDIO, sha256), created_at=datetime.utcnow(),
+            ))
+            session.commit()
+
+        record_service.destroy_record(1, dry_run=False, confirm=True, reason="klar")
+        assert _ref_count(sha256) == 1
+        assert _blobs(db) == [f"{sha256}.bin"]
+
+    def test_untracked_blob_collected_when_unused(self, db):
+        """Test blobs without a storage_blobs row are shredded only if no asset uses them."""
+        sha256 = file_storage.compute_file_hash(AUDIO)
+        file_storage.store_file(AUDIO, sha256)
+        with database.get_db() as session:
+            session.add(AudioAsset(
+                transcript_id=1, sha256=sha256, mime_type="audio/wav", size_bytes=len(AUDIO),
+                storage_path=f"{sha256}.bin", destroy_status="none", created_at=datetime.utcnow(),
+            ))
+            session.commit()
+
+        assert blob_store.collect([sha256]) == 0
+        with database.get_db() as session:
+            session.query(AudioAsset).delete()
+            session.commit()
+        assert blob_store.collect([sha256]) == 1
+        assert _blobs(db) == []
@@ -0,0 +1,49 @@
+"""Tests for project counts (activity projection, grouped fallback)."""
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.modules.projects import activity
+from app.modules.projects.counts import get_project_counts
+from app.modules.projects.models import Project, ProjectFile, ProjectNote
+from app.modules.transcripts.models import Transcript
+
+
+def test_counts_for_page_in_one_query(sqlite_db):
+    """Test counts for a page come from grouped queries without rows, one query with them."""
+    db = sessionmaker(bind=sqlite_db, expire_on_commit=False)()
+    now = datetime.utcnow()
+    projects = [
+        Project(name=name, sensitivity="standard", status="active", start_date=date.today(), created_at=now, updated_at=now)
+        for name in ("a", "b", "c")
+    ]
+    db.add_all(projects)
+    db.flush()
+    later = now + timedelta(hours=1)
+    db.add(ProjectNote(project_id=projects[0].id, title="n", body_text="x", note_integrity_hash="0" * 64, created_at=now, updated_at=now))
+    db.add(ProjectFile(
+        project_id=projects[0].id, original_filename="f", sha256="a" * 64, mime_type="text/plain",
+        size_bytes=1, storage_path="x", created_at=later,
+    ))
+    for _ in range(2):
+        db.add(Transcript(title="t", source="interview", language="sv", status="ready", project_id=projects[1].id, created_at=now, updated_at=now))
+    db.commit()
+
+    statements = []
+    event.listen(sqlite_db, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    counts = get_project_counts(db, projects)
+
+    assert len(statements) == 6  # Projection lookup + five grouped queries
+    assert counts[projects[0].id] == {
+        "transcripts_count": 0, "notes_count": 1, "files_count": 1, "audio_count": 0,
+        "bytes_stored": 1, "last_activity_at": later.isoformat(),
+    }
+    assert counts[projects[1].id]["transcripts_count"] == 2
+    assert counts[projects[2].id]["last_activity_at"] == now.isoformat()
+
+    assert activity.rebuild(db) == 3
+    db.commit()
+    statements.clear()
+    assert get_project_counts(db, projects) == counts
+    assert len(statements) == 1
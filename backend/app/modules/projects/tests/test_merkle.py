@@ -0,0 +1,125 @@
+"""Tests for project Merkle manifests (incremental updates, proofs, localized verification)."""
+import hashlib
+import os
+from datetime import date, datetime
+
+import pytest
+
+from app.core import database
+from app.core.privacy_guard import compute_integrity_hash
+from app.modules.projects import blob_store, file_storage, integrity, merkle
+from app.modules.projects.integrity import verify_project_integrity
+from app.modules.projects.models import Project, ProjectFile, ProjectNote
+from app.modules.transcripts import service as transcripts_service
+from app.modules.transcripts.models import Transcript, TranscriptSegment
+
+SEGMENTS = [
+    {"start_ms": 0, "end_ms": 900, "speaker_label": "SPEAKER_1", "text": "Hej och välkommen."},
+    {"start_ms": 1000, "end_ms": 1900, "speaker_label": "SPEAKER_2", "text": "Tack."},
+]
+
+
+@pytest.fixture
+def project(sqlite_db, blob_storage):
+    """SQLite database + temp storage, project with note, transcript and file, manifest built."""
+    integrity.clear_cache()
+
+    content = os.urandom(20_000)
+    sha256 = hashlib.sha256(content).hexdigest()
+    file_storage.store_file(content, sha256)
+
+    now = datetime.utcnow()
+    with database.get_db() as db:
+        project = Project(name="p", sensitivity="standard", status="active", start_date=date.today(), created_at=now, updated_at=now)
+        db.add(project)
+        db.flush()
+        db.add(ProjectNote(project_id=project.id, title="n", body_text="anteckning", note_integrity_hash=compute_integrity_hash("anteckning"), created_at=now, updated_at=now))
+        db.add(Transcript(title="t", source="interview", language="sv", status="ready", project_id=project.id, created_at=now, updated_at=now))
+        blob_store.acquire(db, sha256, len(content))
+        db.add(ProjectFile(
+            project_id=project.id, original_filename="a.txt", sha256=sha256, size_bytes=len(content),
+            mime_type="text/plain", storage_path=file_storage.relative_blob_path(sha256), created_at=now,
+        ))
+        db.flush()
+        merkle.rebuild(db, project.id)
+        db.commit()
+        project_id = project.id
+    transcripts_service.upsert_segments(1, SEGMENTS)
+    return project_id
+
+
+def _stored_root(project_id: int) -> str:
+    with database.get_db() as db:
+        return merkle.get_root(db, project_id)
+
+
+def _rebuilt_root(project_id: int) -> str:
+    with database.get_db() as db:
+        return merkle.build_tree(merkle.project_leaves(db, project_id))[merkle.ROOT]
+
+
+class TestMerkle:
+    """Test incremental manifest, proofs and verification."""
+
+    def test_incremental_matches_rebuild(self, project):
+        """Test segment writes and transcript delete keep the root equal to a full rebuild."""
+        root = _stored_root(project)
+        assert root == _rebuilt_root(project)
+
+        transcripts_service.upsert_segments(1, SEGMENTS[:1])
+        assert _stored_root(project) not in (None, root)
+        assert _stored_root(project) == _rebuilt_root(project)
+
+        transcripts_service.delete_transcript(1)
+        assert _stored_root(project) == _rebuilt_root(project)
+        with database.get_db() as db:
+            assert set(merkle.stored_children(db, project, merkle.ROOT)) == {"notes", "files"}
+
+    def test_inclusion_proof(self, project):
+        """Test proof for one segment checks against the root, fails for other content."""
+        with database.get_db() as db:
+            segment_id = db.query(TranscriptSegment.id).order_by(TranscriptSegment.start_ms).first().id
+            proof = merkle.inclusion_proof(db, project, f"transcripts/1/s{segment_id}")
+            assert merkle.inclusion_proof(db, project, "notes/99") is None
+        assert proof["root"] == _stored_root(project)
+        assert merkle.verify_proof(proof, merkle.segment_leaf("Hej och välkommen."))
+        assert not merkle.verify_proof(proof, merkle.segment_leaf("Hej och adjö."))
+
+    def test_verify_localizes_changed_segment(self, project):
+        """Test verification names the changed segment leaf, nothing else."""
+        assert verify_project_integrity(project)["manifest"]["status"] == "ok"
+        with database.get_db() as db:
+            segment = db.query(TranscriptSegment).filter(TranscriptSegment.start_ms == 1000).first()
+            segment_id = segment.id
+            segment.text = "Ändrad."
+            db.commit()
+
+        result = verify_project_integrity(project, full=True)
+        assert result["manifest"]["status"] == "mismatch"
+        assert result["issues"] == [f"Manifest: transcripts/1/s{segment_id} hash mismatch"]
+
+    def test_project_without_manifest_is_left_alone(self, project):
+        """Test writes to a project that was not backfilled record nothing until merkle_runner builds it."""
+        now = datetime.utcnow()
+        with database.get_db() as db:
+            other = Project(name="q", sensitivity="standard", status="active", start_date=date.today(), created_at=now, updated_at=now)
+            db.add(other)
+            db.flush()
+            db.add(Transcript(title="u", source="interview", language="sv", status="ready", project_id=other.id, created_at=now, updated_at=now))
+            db.commit()
+            other_id = other.id
+        transcripts_service.upsert_segments(2, SEGMENTS)
+        with database.get_db() as db:
+            merkle.move_transcripts(db, [1], {1: project}, other_id)
+            db.query(Transcript).filter(Transcript.id == 1).update({"project_id": other_id})
+            db.commit()
+
+        assert _stored_root(other_id) is None
+        assert _stored_root(project) == _rebuilt_root(project)
+        result = verify_project_integrity(other_id, full=True)
+        assert result["manifest"]["status"] == "missing" and result["integrity_ok"]
+
+        with database.get_db() as db:
+            merkle.rebuild(db, other_id)
+            db.commit()
+        assert verify_project_integrity(other_id, full=True)["manifest"]["status"] == "ok"
@@ -0,0 +1,86 @@
+"""Tests for project list queries (sort keys, keyset pagination, overdue, name index)."""
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.core import database
+from app.modules.projects import query
+from app.modules.projects.models import Project
+from app.modules.projects.router import router
+
+app = FastAPI()
+app.include_router(router, prefix="/projects")
+client = TestClient(app)
+
+
+@pytest.fixture
+def engine(sqlite_db):
+    """SQLite database with name index and seven projects (every other one without due_date)."""
+    query.create_sqlite_name_index(sqlite_db)
+    today = date.today()
+    now = datetime.utcnow()
+    with database.get_db() as db:
+        for i, name in enumerate(("Valet 2026", "Hamnen", "Skolvalet", "Budget", "Hamnen II", "Polisen", "Vården")):
+            db.add(Project(
+                name=name, sensitivity="standard", status="active", start_date=today - timedelta(days=30),
+                due_date=today + timedelta(days=i - 2) if i % 2 == 0 else None,
+                created_at=now, updated_at=now,
+            ))
+        db.commit()
+    return sqlite_db
+
+
+def _pages(params: dict) -> list:
+    names, cursor = [], None
+    while True:
+        page = client.get("/projects/", params={**params, "limit": 2, **({"cursor": cursor} if cursor else {})}).json()
+        names.extend(item["name"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return names
+
+
+class TestProjectQuery:
+    """Test sort keys, cursors and filters on the project list."""
+
+    def test_keyset_pages_cover_sort_order(self, engine):
+        """Test cursor pages walk due_date soonest first with NULLs last, ties by id."""
+        assert _pages({"sort": "due_date"}) == [
+            "Valet 2026", "Skolvalet", "Hamnen II", "Vården", "Hamnen", "Budget", "Polisen",
+        ]
+        # Equal created_at - id breaks the tie, newest first
+        assert _pages({"sort": "created_at"})[0] == "Vården"
+
+        first = client.get("/projects/", params={"sort": "due_date", "limit": 2}).json()
+        assert first["total"] == 7
+        second = client.get("/projects/", params={"sort": "due_date", "limit": 2, "cursor": first["next_cursor"]}).json()
+        assert second["total"] is None
+        assert client.get("/projects/", params={"sort": "start_date", "cursor": first["next_cursor"]}).status_code == 400
+        assert client.get("/projects/", params={"cursor": "not-a-cursor"}).status_code == 400
+
+    def test_overdue_filter(self, engine):
+        """Test overdue matches active projects with due_date before today only."""
+        with database.get_db() as db:
+            db.query(Project).filter(Project.name == "Skolvalet").update({"status": "archived"})
+            db.commit()
+        overdue = client.get("/projects/", params={"overdue": "true", "sort": "due_date"}).json()
+        assert [item["name"] for item in overdue["items"]] == ["Valet 2026"]
+        assert client.get("/projects/", params={"overdue": "false"}).json()["total"] == 6
+
+    def test_name_search_uses_index(self, engine):
+        """Test 3+ character search goes through the FTS5 index (case-insensitive, follows renames)."""
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        found = client.get("/projects/", params={"q": "VALET"}).json()["items"]
+        assert sorted(item["name"] for item in found) == ["Skolvalet", "Valet 2026"]
+        assert any("projects_name_fts MATCH" in statement for statement in statements)
+
+        with database.get_db() as db:
+            db.query(Project).filter(Project.name == "Budget").update({"name": "Budgetvalet"})
+            db.commit()
+        assert len(client.get("/projects/", params={"q": "valet"}).json()["items"]) == 3
+        # Too short for trigrams - ILIKE fallback
+        assert len(client.get("/projects/", params={"q": "ha"}).json()["items"]) == 2
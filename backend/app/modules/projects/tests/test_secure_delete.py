@@ -0,0 +1,42 @@
+"""Tests for chunked secure delete and batch shredding."""
+import os
+
+import pytest
+
+from app.modules.projects import secure_delete
+from app.modules.projects.secure_delete import shred_file, shred_files
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """Small overwrite buffer so multi-chunk files stay small."""
+    monkeypatch.setattr(secure_delete, "SHRED_CHUNK_SIZE", 1024)
+    monkeypatch.setattr(secure_delete, "_ZEROS", bytes(1024))
+
+
+class TestSecureDelete:
+    """Test overwrite reaches the file's blocks and the file is removed."""
+
+    @pytest.mark.parametrize("passes", [1, 3])
+    def test_overwrites_then_unlinks(self, tmp_path, small_chunks, passes):
+        """Test content is zeroed in place (seen through a hard link) before unlink."""
+        path = tmp_path / "blob.bin"
+        path.write_bytes(os.urandom(5 * 1024 + 7))
+        witness = tmp_path / "witness"
+        os.link(path, witness)
+
+        assert shred_file(path, passes=passes) is True
+        assert not path.exists()
+        assert witness.read_bytes() == bytes(5 * 1024 + 7)
+
+    def test_missing_file(self, tmp_path):
+        """Test shredding a missing file is a no-op."""
+        assert shred_file(tmp_path / "missing.bin") is False
+
+    def test_batch(self, tmp_path, small_chunks):
+        """Test batch shredding on the thread pool counts removed files."""
+        paths = [tmp_path / f"{i}.bin" for i in range(6)]
+        for path in paths:
+            path.write_bytes(os.urandom(3000))
+        assert shred_files(paths + [tmp_path / "missing.bin"], max_workers=3) == 6
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,53 @@
+"""Tests for async storage facade (blob I/O on the storage pool)."""
+import asyncio
+import hashlib
+import os
+import threading
+
+import pytest
+from cryptography.fernet import Fernet
+
+from app.modules.projects import file_storage, storage_async
+
+
+@pytest.fixture
+def storage(monkeypatch, tmp_path):
+    """Temp storage dir + fresh PROJECT_FILES_KEY, fresh pool per test."""
+    monkeypatch.setenv("PROJECT_FILES_KEY", Fernet.generate_key().decode())
+    monkeypatch.setattr(file_storage, "_STORAGE_DIR", tmp_path)
+    monkeypatch.setattr(storage_async, "_stats", {})
+    yield tmp_path
+    storage_async.stop()
+
+
+class TestStorageAsync:
+    """Test facade round trip, pool threads and metrics."""
+
+    def test_round_trip_and_stats(self, storage):
+        """Test store/iter/delete run on storage-io threads and are timed."""
+        data = os.urandom(3 * 1024 * 1024 + 11)
+        sha256 = hashlib.sha256(data).hexdigest()
+
+        async def scenario():
+            await storage_async.store_file(data, sha256)
+            assert await storage_async.blob_exists(sha256)
+            chunks = [chunk async for chunk in storage_async.iter_file(sha256, 10, 2 * 1024 * 1024)]
+            thread_name = await storage_async.run("probe", lambda: threading.current_thread().name)
+            await storage_async.delete_file(sha256)
+            return b"".join(chunks), thread_name
+
+        ranged, thread_name = asyncio.run(scenario())
+        assert ranged == data[10:2 * 1024 * 1024]
+        assert thread_name.startswith("storage-io")
+        assert not file_storage.blob_path(sha256).exists()
+
+        stats = storage_async.stats()
+        assert stats["store"]["calls"] == 1
+        assert stats["read_frame"]["calls"] == 3  # 2 frames + end of stream
+        assert stats["delete"]["errors"] == 0
+
+    def test_errors_counted(self, storage):
+        """Test failing operations propagate and are counted."""
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(storage_async.retrieve_file("0" * 64))
+        assert storage_async.stats()["retrieve"]["errors"] == 1
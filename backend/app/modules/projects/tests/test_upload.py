@@ -0,0 +1,85 @@
+"""Tests for streamed project file upload (early rejection, incremental storage, dedup)."""
+import hashlib
+import os
+import sys
+from datetime import date, datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import database
+from app.modules.projects import file_storage
+from app.modules.projects.models import Project
+from app.modules.projects.router import router
+
+# Module, not the APIRouter re-exported by the package
+projects_router = sys.modules["app.modules.projects.router"]
+
+app = FastAPI()
+app.include_router(router, prefix="/projects")
+client = TestClient(app)
+
+PDF = b"%PDF-1.7\n" + os.urandom(5000)
+
+
+@pytest.fixture
+def storage(sqlite_db, blob_storage, monkeypatch):
+    """SQLite database + temp storage, two projects, 1KB chunks and 8KB limit."""
+    monkeypatch.setattr(projects_router, "UPLOAD_CHUNK_SIZE", 1024)
+    monkeypatch.setattr(projects_router, "MAX_PROJECT_FILE_SIZE", 8192)
+
+    now = datetime.utcnow()
+    with database.get_db() as db:
+        for name in ("a", "b"):
+            db.add(Project(name=name, sensitivity="standard", status="active", start_date=date.today(), created_at=now, updated_at=now))
+        db.commit()
+    return blob_storage
+
+
+def _upload(project_id: int, content: bytes, filename: str = "doc.pdf", **headers):
+    return client.post(f"/projects/{project_id}/files", files={"file": (filename, content)}, headers=headers)
+
+
+def _stored(storage_dir) -> list:
+    """Blobs and temp blobs in storage (not the blob index)."""
+    return sorted(path.name for path in storage_dir.rglob("*") if path.suffix in (".bin", ".tmp"))
+
+
+class TestStreamedUpload:
+    """Test streamed upload path."""
+
+    def test_streamed_upload_round_trips(self, storage):
+        """Test chunked upload stores one encrypted blob that decrypts to the upload."""
+        response = _upload(1, PDF)
+        assert response.status_code == 201
+        sha256 = hashlib.sha256(PDF).hexdigest()
+        assert (response.json()["sha256"], response.json()["size_bytes"]) == (sha256, len(PDF))
+        assert file_storage.retrieve_file(sha256) == PDF
+        assert _stored(storage) == [f"{sha256}.bin"]
+
+        # Same content, other project, no header - encrypted to temp, dropped as duplicate
+        assert _upload(2, PDF).status_code == 201
+        assert _stored(storage) == [f"{sha256}.bin"]
+
+    def test_rejected_early_and_nothing_left(self, storage):
+        """Test wrong format fails on the first chunk, oversize fails mid-stream - no temp blobs left."""
+        assert _upload(1, b"MZ\x90\x00" + os.urandom(5000), filename="tool.exe").status_code == 415
+        assert _upload(1, b"%PDF" + os.urandom(9000)).status_code == 415
+        assert _stored(storage) == []
+
+    def test_declared_hash_of_stored_blob_skips_encryption(self, storage, monkeypatch):
+        """Test X-Content-SHA256 of a stored blob only hashes the upload; a wrong hash is refused."""
+        sha256 = hashlib.sha256(PDF).hexdigest()
+        assert _upload(1, PDF).status_code == 201
+
+        def _no_writer():
+            raise AssertionError("BlobWriter used for known content")
+
+        monkeypatch.setattr(projects_router, "BlobWriter", _no_writer)
+        response = _upload(2, PDF, **{"X-Content-SHA256": sha256})
+        assert response.status_code == 201 and response.json()["sha256"] == sha256
+
+        other = b"%PDF-1.4\n" + os.urandom(100)
+        assert _upload(2, other, **{"X-Content-SHA256": sha256}).status_code == 422
+        assert _stored(storage) == [f"{sha256}.bin"]
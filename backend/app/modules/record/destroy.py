@@ -0,0 +1,165 @@
+"""Two-phase destroy of records (audio + transcript + related rows + export ZIPs).
+
+Phase 1 - mark: audio assets of all targeted transcripts are set to
+destroy_status="pending" (one UPDATE, committed). Pending audio is no longer
+served or exported (get_audio_asset only returns destroy_status="none").
+
+Phase 2 - delete, per batch of DESTROY_BATCH_SIZE transcripts (one
+transaction): blob references released in one locked query, child rows and
+transcripts removed with one DELETE ... WHERE IN per table.
+
+Phase 3 - shred: blobs whose last reference is gone and the records' export
+ZIPs are shredded in parallel (SECURE_DELETE_WORKERS threads).
+
+Rows go before blobs: asset rows reference storage_blobs (FK), and a blob may
+still be shared with assets that are not destroyed (see blob_store).
+
+Crash recovery (resume_pending, run at startup):
+- Crash after phase 1: assets are still pending - phases 2 and 3 run again
+- Crash after phase 2: blobs are left at ref_count 0 - collected by
+  blob_store.collect_unreferenced()
+"""
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.logging import logger
+from app.modules.projects import activity, blob_store, merkle
+from app.modules.projects.secure_delete import shred_files
+from app.modules.record.models import AudioAsset, ExportJob
+from app.modules.transcripts import export_cache
+from app.modules.transcripts.models import Transcript, TranscriptAuditEvent, TranscriptSegment, TranscriptStats
+
+# Rows referencing transcripts.id (deleted before the transcripts)
+CHILD_MODELS = (TranscriptSegment, TranscriptStats, TranscriptAuditEvent, AudioAsset, ExportJob)
+
+
+def _batches(ids: List[int], size: int) -> Iterable[List[int]]:
+    for i in range(0, len(ids), size):
+        yield ids[i:i + size]
+
+
+def mark_pending(transcript_ids: Iterable[int]) -> int:
+    """Phase 1: mark audio assets of transcripts as pending destroy (committed).
+
+    Args:
+        transcript_ids: Transcripts to destroy
+
+    Returns:
+        Number of assets marked
+    """
+    ids = sorted(set(transcript_ids))
+    marked = 0
+    with get_db() as db:
+        for batch in _batches(ids, max(1, settings.destroy_batch_size)):
+            marked += db.query(AudioAsset).filter(
+                AudioAsset.transcript_id.in_(batch),
+                AudioAsset.destroy_status == "none",
+            ).update({"destroy_status": "pending"}, synchronize_session=False)
+        db.commit()
+    return marked
+
+
+def delete_records(db: Session, transcript_ids: List[int]) -> Tuple[List[str], List[Path]]:
+    """Phase 2: release blob references and bulk-delete records (caller commits).
+
+    Args:
+        db: Database session
+        transcript_ids: Transcripts to delete
+
+    Returns:
+        Tuple of (released blob hashes - one per asset, registered export ZIP paths)
+    """
+    # One row per audio asset - shared blobs appear once per reference
+    sha256_values = [
+        row.sha256
+        for row in db.query(AudioAsset.sha256).filter(
+            AudioAsset.transcript_id.in_(transcript_ids),
+            AudioAsset.destroy_status != "destroyed",
+        )
+    ]
+    zip_paths = [
+        Path(row.zip_path)
+        for row in db.query(ExportJob.zip_path).filter(
+            ExportJob.transcript_id.in_(transcript_ids),
+            ExportJob.zip_path.isnot(None),
+        )
+    ]
+
+    blob_store.release_many(db, sha256_values)
+    merkle.remove_transcripts(db, transcript_ids)
+    activity.remove_transcripts(db, transcript_ids)
+
+    # Children first (portable - no reliance on DB-level ON DELETE CASCADE)
+    for model in CHILD_MODELS:
+        db.query(model).filter(model.transcript_id.in_(transcript_ids)).delete(synchronize_session=False)
+    db.query(Transcript).filter(Transcript.id.in_(transcript_ids)).delete(synchronize_session=False)
+    return sha256_values, zip_paths
+
+
+def shred(sha256_values: List[str], zip_paths: List[Path]) -> Tuple[int, int]:
+    """Phase 3: shred unreferenced blobs and export ZIPs (parallel, best effort).
+
+    Returns:
+        Tuple of (blobs shredded, export ZIPs shredded)
+    """
+    return blob_store.collect(sha256_values), shred_files(zip_paths)
+
+
+def _delete_and_shred(transcript_ids: List[int]) -> Dict[str, Any]:
+    """Run phases 2 and 3 batch by batch."""
+    result = {"transcripts": 0, "files_deleted": 0, "exports_deleted": 0, "batches": 0}
+    for batch in _batches(transcript_ids, max(1, settings.destroy_batch_size)):
+        with get_db() as db:
+            sha256_values, zip_paths = delete_records(db, batch)
+            db.commit()
+        export_cache.invalidate_many(batch)
+
+        files_deleted, exports_deleted = shred(sha256_values, zip_paths)
+        result["transcripts"] += len(batch)
+        result["files_deleted"] += files_deleted
+        result["exports_deleted"] += exports_deleted
+        result["batches"] += 1
+    return result
+
+
+def destroy_transcripts(transcript_ids: Iterable[int]) -> Dict[str, Any]:
+    """Destroy transcripts with their audio, rows and export ZIPs (all three phases).
+
+    Raises on database errors after phase 1 - assets stay pending and are
+    finished by a retry or resume_pending().
+
+    Args:
+        transcript_ids: Transcripts to destroy (missing ids are skipped)
+
+    Returns:
+        Dict with transcripts, files_deleted, exports_deleted, batches
+    """
+    ids = sorted(set(transcript_ids))
+    mark_pending(ids)
+    result = _delete_and_shred(ids)
+    logger.info("record_destroy_complete", extra=dict(result))
+    return result
+
+
+def resume_pending() -> Dict[str, Any]:
+    """Finish destroys interrupted by a crash or restart (best effort).
+
+    Returns:
+        Dict with transcripts, files_deleted, exports_deleted, batches, collected
+    """
+    with get_db() as db:
+        ids = sorted(
+            row.transcript_id
+            for row in db.query(AudioAsset.transcript_id).filter(
+                AudioAsset.destroy_status == "pending",
+            ).distinct()
+        )
+    result = _delete_and_shred(ids)
+    result["collected"] = blob_store.collect_unreferenced()
+    if ids or result["collected"]:
+        logger.info("record_destroy_resumed", extra=dict(result))
+    return result
@@ -1,43 +1,117 @@
-"""Export download endpoint - streams ZIP files to client.
+"""Export download endpoints - job status and ZIP download.
 
-This endpoint allows clients to download export ZIPs by package_id.
-ZIP files are stored in /app/data/export-{package_id}.zip.
+Exports are built by background jobs (export_jobs). Clients poll
+/export/{package_id}/status and download the ZIP when status is "done".
+The ZIP path and size come from the export registry (export_jobs row) -
+packages without a row are unknown (404), no path guessing.
 """
-from pathlib import Path
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import FileResponse
+import os
+from typing import Any, BinaryIO, Dict, Iterator
+
+from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import Response, StreamingResponse
 
 from app.core.logging import logger
+from app.modules.record import export_jobs
+from app.modules.record.http_range import RangeNotSatisfiable, content_range, parse_range
 
 router = APIRouter()
 
+# Read size when streaming ZIP files
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _iter_file_range(fileobj: BinaryIO, start: int, end: int) -> Iterator[bytes]:
+    """Yield bytes [start, end) of an open file in chunks (closes it)."""
+    with fileobj as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = f.read(min(DOWNLOAD_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+@router.get("/export/{package_id}/status")
+async def export_status(package_id: str) -> Dict[str, Any]:
+    """Get export job status and progress.
+
+    Args:
+        package_id: Export package ID (from export endpoint)
+
+    Returns:
+        Job info (status queued|running|done|failed, progress, zip_path when done)
+    """
+    job = export_jobs.get_job(package_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Export job not found",
+        )
+    return job
+
 
 @router.get("/export/{package_id}/download")
-async def download_export(package_id: str):
-    """Download export ZIP file by package_id.
-    
+async def download_export(package_id: str, request: Request):
+    """Download export ZIP file by package_id (supports `Range` for resume).
+
     Args:
         package_id: Export package ID (UUID from export endpoint)
-        
+        request: FastAPI request (Range header)
+
     Returns:
-        ZIP file as FileResponse with Content-Type: application/zip
+        ZIP file stream (200 full, 206 partial) with Content-Type: application/zip
     """
-    # Construct ZIP file path
-    zip_path = Path("/app/data") / f"export-{package_id}.zip"
-    
-    # Check if file exists
-    if not zip_path.exists():
+    job = export_jobs.get_job(package_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Export not found",
+        )
+    if job["status"] != "done":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"status": job["status"], "progress": job["progress"]},
+        )
+
+    # Open instead of exists() + stat(): the handle stays valid even if purge unlinks the file
+    try:
+        zip_file = open(job["zip_path"], "rb") if job["zip_path"] else None
+    except FileNotFoundError:
+        zip_file = None
+    if zip_file is None:
         logger.warning("export_download_not_found", extra={"package_id": package_id})
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Export file not found",
         )
-    
-    # Return file with proper content type
-    logger.info("export_download", extra={"package_id": package_id})
-    return FileResponse(
-        path=str(zip_path),
+
+    # Size from registry (rows from before the registry: fstat of the open file)
+    size = job["size_bytes"] if job["size_bytes"] is not None else os.fstat(zip_file.fileno()).st_size
+    try:
+        byte_range = parse_range(request.headers.get("range"), size)
+    except RangeNotSatisfiable:
+        zip_file.close()
+        return Response(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={"Content-Range": f"bytes */{size}", "Accept-Ranges": "bytes"},
+        )
+
+    start, end = byte_range if byte_range else (0, size)
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Length": str(end - start),
+        "Content-Disposition": f'attachment; filename="export-{package_id}.zip"',
+    }
+    if byte_range:
+        headers["Content-Range"] = content_range(start, end, size)
+
+    logger.info("export_download", extra={"package_id": package_id, "partial": byte_range is not None})
+    return StreamingResponse(
+        _iter_file_range(zip_file, start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT if byte_range else status.HTTP_200_OK,
         media_type="application/zip",
-        filename=f"export-{package_id}.zip",
+        headers=headers,
     )
-
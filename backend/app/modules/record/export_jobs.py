@@ -0,0 +1,325 @@
+"""Background export jobs - record packages built off the request path.
+
+POST /export creates an export_jobs row (status=queued) and submits it to a
+bounded worker pool (EXPORT_MAX_WORKERS threads). Workers build the ZIP with
+service.build_export_package and persist progress (audio bytes copied).
+
+Lifecycle: queued -> running -> done | failed
+
+Durability:
+- Job state lives in the DB; startup re-queues queued/running jobs and
+  shreds their half-written temp ZIPs (may hold decrypted audio)
+- Shutdown interrupts running jobs at the next chunk and puts them back to queued
+- Jobs that already failed EXPORT_MAX_ATTEMPTS times are marked failed instead of retried
+
+Registry: the row is also the export registry - done jobs record zip_path,
+size_bytes and expires_at (EXPORT_RETENTION_DAYS after finishing). Downloads
+look packages up here and purge deletes them by the indexed expires_at.
+
+Reason is validated but never stored (same as the export audit event).
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Optional
+from uuid import uuid4
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.logging import logger
+from app.modules.audit import pipeline as audit_pipeline
+from app.modules.projects.secure_delete import shred_file
+from app.modules.record import service
+from app.modules.record.models import AudioAsset, ExportJob
+from app.modules.transcripts.models import Transcript
+
+
+# Min seconds between progress writes per job (progress is reported per 1MiB chunk)
+PROGRESS_WRITE_INTERVAL = 0.5
+
+_state_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+_stopping = threading.Event()
+
+
+class _Interrupted(Exception):
+    """Raised inside a running job when the pool is shutting down."""
+
+
+def _has_db() -> bool:
+    """Check if database is available."""
+    # Import engine from module to get current value (not cached import)
+    from app.core.database import engine
+    return engine is not None and settings.database_url is not None
+
+
+def job_dict(job: ExportJob) -> Dict[str, Any]:
+    """Serialize export job (NO CONTENT, only metadata)."""
+    percent = 100.0 if job.status == "done" else (
+        round(job.bytes_done * 100.0 / job.bytes_total, 1) if job.bytes_total else 0.0
+    )
+    return {
+        "package_id": job.id,
+        "receipt_id": job.receipt_id,
+        "transcript_id": job.transcript_id,
+        "status": job.status,
+        "audio_mode": job.audio_mode,
+        "progress": {
+            "bytes_done": job.bytes_done,
+            "bytes_total": job.bytes_total,
+            "percent": percent,
+        },
+        "zip_path": job.zip_path,
+        "size_bytes": job.size_bytes,
+        "error_type": job.error_type,
+        "attempts": job.attempts,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+        "expires_at": job.expires_at.isoformat() if job.expires_at else None,
+        "warnings": service.export_warnings(job.audio_mode),
+    }
+
+
+def create_job(
+    transcript_id: int,
+    confirm: bool = False,
+    reason: Optional[str] = None,
+    export_audio_mode: str = "encrypted",
+) -> Dict[str, Any]:
+    """Validate export request, persist job and submit it to the worker pool.
+
+    Args:
+        transcript_id: Transcript ID
+        confirm: Confirmation required
+        reason: Reason for export (validated, not stored)
+        export_audio_mode: "encrypted" (default) or "decrypted"
+
+    Returns:
+        Job dict (status=queued)
+
+    Raises:
+        ValueError: If validation fails, transcript/audio not found or DB unavailable
+    """
+    service.validate_export_request(confirm, reason, export_audio_mode)
+
+    if not _has_db():
+        raise ValueError("Database not available")
+
+    with get_db() as db:
+        transcript = db.query(Transcript).filter(Transcript.id == transcript_id).first()
+        if not transcript:
+            raise ValueError(f"Transcript {transcript_id} not found")
+
+        audio_asset = db.query(AudioAsset).filter(AudioAsset.transcript_id == transcript_id).first()
+        if not audio_asset:
+            raise ValueError(f"No audio asset found for transcript {transcript_id}")
+
+        job = ExportJob(
+            id=str(uuid4()),
+            receipt_id=str(uuid4()),
+            transcript_id=transcript_id,
+            audio_mode=export_audio_mode,
+            status="queued",
+            bytes_done=0,
+            bytes_total=audio_asset.size_bytes,
+            attempts=0,
+            created_at=datetime.utcnow(),
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        result = job_dict(job)
+
+    submit(result["package_id"])
+    return result
+
+
+def get_job(package_id: str) -> Optional[Dict[str, Any]]:
+    """Get export job by package_id.
+
+    Returns:
+        Job dict, or None if not found (or DB unavailable)
+    """
+    if not _has_db():
+        return None
+    with get_db() as db:
+        job = db.query(ExportJob).filter(ExportJob.id == package_id).first()
+        return job_dict(job) if job else None
+
+
+def submit(package_id: str) -> None:
+    """Submit job to the worker pool (started lazily)."""
+    _ensure_started().submit(run_job, package_id)
+
+
+def start() -> int:
+    """Start worker pool and re-queue jobs interrupted by a restart.
+
+    Returns:
+        Number of jobs re-queued
+    """
+    _stopping.clear()
+    _ensure_started()
+    if not _has_db():
+        return 0
+
+    with get_db() as db:
+        jobs = db.query(ExportJob).filter(
+            ExportJob.status.in_(("queued", "running"))
+        ).order_by(ExportJob.created_at).all()
+        resumed = []
+        stale_tmp = 0
+        for job in jobs:
+            # Left behind by a crash mid-build
+            stale_tmp += shred_file(service.export_tmp_path(service.export_zip_path(job.id)))
+            if job.attempts >= settings.export_max_attempts:
+                job.status = "failed"
+                job.error_type = job.error_type or "MaxAttemptsExceeded"
+                job.finished_at = datetime.utcnow()
+                job.expires_at = service.export_expires_at(job.finished_at)
+            else:
+                job.status = "queued"
+                job.bytes_done = 0
+                resumed.append(job.id)
+        db.commit()
+
+    for package_id in resumed:
+        submit(package_id)
+    if jobs:
+        logger.info("export_jobs_resumed", extra={
+            "resumed": len(resumed),
+            "failed": len(jobs) - len(resumed),
+            "stale_tmp_shredded": stale_tmp,
+        })
+    return len(resumed)
+
+
+def stop(wait: bool = True) -> None:
+    """Stop worker pool; running jobs are interrupted and left queued for next start."""
+    global _executor
+    _stopping.set()
+    with _state_lock:
+        executor = _executor
+        _executor = None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
+        logger.info("export_jobs_stopped")
+
+
+def _ensure_started() -> ThreadPoolExecutor:
+    """Create worker pool on first use."""
+    global _executor
+    with _state_lock:
+        if _executor is None:
+            _stopping.clear()
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, settings.export_max_workers),
+                thread_name_prefix="export-worker",
+            )
+        return _executor
+
+
+def run_job(package_id: str) -> None:
+    """Build package for a queued job (worker thread; also callable inline).
+
+    Args:
+        package_id: Export job ID
+    """
+    with get_db() as db:
+        job = db.query(ExportJob).filter(ExportJob.id == package_id).first()
+        if not job or job.status != "queued":
+            return  # Deleted (transcript destroyed) or already picked up
+        job.status = "running"
+        job.started_at = datetime.utcnow()
+        job.attempts += 1
+        db.commit()
+        transcript_id = job.transcript_id
+        audio_mode = job.audio_mode
+        created_at = job.created_at
+        # Mirrored audit events keep the project copy if the record is destroyed before the flush
+        project_id = db.query(Transcript.project_id).filter(Transcript.id == transcript_id).scalar()
+
+    last_write = [0.0]
+
+    def _progress(bytes_done: int, bytes_total: int) -> None:
+        if _stopping.is_set():
+            raise _Interrupted()
+        now = time.monotonic()
+        if now - last_write[0] < PROGRESS_WRITE_INTERVAL:
+            return
+        last_write[0] = now
+        _update(package_id, bytes_done=bytes_done, bytes_total=bytes_total)
+
+    started = time.monotonic()
+    try:
+        zip_path = service.build_export_package(
+            transcript_id=transcript_id,
+            package_id=package_id,
+            created_at=created_at,
+            export_audio_mode=audio_mode,
+            progress=_progress,
+        )
+    except _Interrupted:
+        _update(package_id, status="queued", bytes_done=0)
+        logger.info("export_job_interrupted", extra={"package_id": package_id})
+        return
+    except Exception as e:
+        finished_at = datetime.utcnow()
+        _update(
+            package_id,
+            status="failed",
+            error_type=type(e).__name__,
+            finished_at=finished_at,
+            expires_at=service.export_expires_at(finished_at),
+        )
+        logger.error("export_job_failed", extra={"package_id": package_id, "error_type": type(e).__name__})
+        audit_pipeline.emit_transcript_event(
+            transcript_id=transcript_id,
+            action="export_failed",
+            metadata={"package_id": package_id, "audio_mode": audio_mode, "error_type": type(e).__name__},
+            project_id=project_id,
+            mirror_to_project=True,
+        )
+        return
+
+    size_bytes = zip_path.stat().st_size
+    finished_at = datetime.utcnow()
+    _update(
+        package_id,
+        status="done",
+        zip_path=str(zip_path),
+        size_bytes=size_bytes,
+        finished_at=finished_at,
+        expires_at=service.export_expires_at(finished_at),
+        set_done=True,
+    )
+    logger.info(
+        "export_job_done",
+        extra={
+            "package_id": package_id,
+            "size_bytes": size_bytes,
+            "duration_ms": int((time.monotonic() - started) * 1000),
+        },
+    )
+    audit_pipeline.emit_transcript_event(
+        transcript_id=transcript_id,
+        action="exported",
+        metadata={"format": "zip", "package_id": package_id, "audio_mode": audio_mode},
+        project_id=project_id,
+        mirror_to_project=True,
+    )
+
+
+def _update(package_id: str, set_done: bool = False, **fields: Any) -> None:
+    """Update job columns (no-op if job was deleted meanwhile)."""
+    with get_db() as db:
+        job = db.query(ExportJob).filter(ExportJob.id == package_id).first()
+        if not job:
+            return
+        for key, value in fields.items():
+            setattr(job, key, value)
+        if set_done:
+            job.bytes_done = job.bytes_total
+        db.commit()
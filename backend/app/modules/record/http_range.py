@@ -0,0 +1,64 @@
+"""HTTP Range header parsing (RFC 9110, single byte range).
+
+Only single ranges are served as 206. Multi-range requests and malformed
+headers fall back to the full body (200), which RFC 9110 allows.
+"""
+from typing import Optional, Tuple
+
+
+class RangeNotSatisfiable(ValueError):
+    """Range is syntactically valid but outside the resource (-> 416)."""
+
+    def __init__(self, size: int) -> None:
+        super().__init__(f"Range not satisfiable for size {size}")
+        self.size = size
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """Parse a Range header into a byte span.
+
+    Supported forms: `bytes=a-b`, `bytes=a-` and `bytes=-n` (suffix).
+
+    Args:
+        header: Range header value (or None)
+        size: Resource size in bytes
+
+    Returns:
+        (start, end) with end exclusive, or None to serve the full body
+
+    Raises:
+        RangeNotSatisfiable: If the range starts beyond the resource
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or not spec or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    if not sep:
+        return None
+    first, last = first.strip(), last.strip()
+    if (first and not first.isdigit()) or (last and not last.isdigit()):
+        return None
+
+    if not first:
+        # Suffix range: last n bytes
+        if not last:
+            return None
+        length = int(last)
+        if length == 0 or size == 0:
+            raise RangeNotSatisfiable(size)
+        return max(size - length, 0), size
+
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable(size)
+    end = size if not last else min(int(last) + 1, size)
+    return start, end
+
+
+def content_range(start: int, end: int, size: int) -> str:
+    """Content-Range header value for span [start, end)."""
+    return f"bytes {start}-{end - 1}/{size}"
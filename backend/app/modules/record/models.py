@@ -1,7 +1,7 @@
 """Record module models - Audio assets."""
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Index
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Integer, String, Index
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -15,10 +15,10 @@ class AudioAsset(Base):
     id = Column(Integer, primary_key=True)
     project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=True, index=True)
     transcript_id = Column(Integer, ForeignKey("transcripts.id", ondelete="CASCADE"), nullable=False, index=True)
-    sha256 = Column(String, nullable=False, unique=True, index=True)  # Content hash
+    sha256 = Column(String, ForeignKey("storage_blobs.sha256"), nullable=False, index=True)  # Content hash (shared blob)
     mime_type = Column(String, nullable=False)  # audio/wav, audio/mpeg, etc.
     size_bytes = Column(Integer, nullable=False)
-    storage_path = Column(String, nullable=False)  # Internal path: {sha256}.bin
+    storage_path = Column(String, nullable=False)  # Internal path: ab/cd/{sha256}.bin (legacy: {sha256}.bin)
     destroy_status = Column(String, nullable=False, default="none", index=True)  # none|pending|destroyed
     destroyed_at = Column(DateTime, nullable=True)  # Set when destroyed
     created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
@@ -33,3 +33,29 @@ class AudioAsset(Base):
         Index("idx_audio_project", "project_id"),
     )
 
+
+
+class ExportJob(Base):
+    """Export job - background build of a record export package (NO CONTENT, reason not stored).
+
+    Also the export registry: every package on disk has a row (zip_path,
+    size_bytes), and purge removes packages by the indexed expires_at.
+    """
+
+    __tablename__ = "export_jobs"
+
+    id = Column(String(36), primary_key=True)  # package_id (UUID)
+    receipt_id = Column(String(36), nullable=False)
+    transcript_id = Column(Integer, ForeignKey("transcripts.id", ondelete="CASCADE"), nullable=False, index=True)
+    audio_mode = Column(String, nullable=False)  # encrypted|decrypted
+    status = Column(String, nullable=False, default="queued", index=True)  # queued|running|done|failed
+    bytes_done = Column(Integer, nullable=False, default=0)  # Audio bytes copied into the ZIP
+    bytes_total = Column(Integer, nullable=False, default=0)
+    zip_path = Column(String, nullable=True)  # Set when done
+    size_bytes = Column(BigInteger, nullable=True)  # ZIP size, set when done
+    error_type = Column(String, nullable=True)  # Exception class name only
+    attempts = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    expires_at = Column(DateTime, nullable=True, index=True)  # Set when done/failed - purged after this
@@ -7,30 +7,57 @@ Best-effort: Never raises exceptions that stop the app.
 Purges:
 - Expired transcripts (based on created_at)
 - Audio files (encrypted .bin files)
-- Export ZIP files (export-*.zip in /app/data)
-- All related DB records (CASCADE deletes)
+- Export ZIP files of purged records, and expired exports (export registry:
+  export_jobs.expires_at, indexed - no directory scan)
+- All related DB records (segments, stats, audit events, audio assets, export jobs)
+
+Batched engine (bounded memory, few round trips):
+1. Expired ids are read in keyset order (id > last_id LIMIT batch_size)
+2. Per batch: one IN query for audio hashes, blob references released in one
+   locked query, each table cleared with one DELETE ... WHERE IN, one commit
+3. Blobs whose last reference is gone are shredded in parallel (same
+   delete/shred phases as record destroy, see destroy.py)
+4. last_id is checkpointed (RECORDER_PURGE_CHECKPOINT_PATH) - an interrupted
+   run resumes after the last finished batch with the same cutoff date
 """
+import json
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, or_
 
 from app.core.config import settings
 from app.core.database import get_db
 from app.core.logging import logger
-from app.modules.record.models import AudioAsset
+from app.modules.record import destroy
+from app.modules.record.models import AudioAsset, ExportJob
 from app.modules.transcripts.models import Transcript
-from app.modules.projects.file_storage import delete_file
+from app.modules.projects.secure_delete import shred_file, shred_files
+from app.modules.transcripts import export_cache
 
+# Stats restored from checkpoint on resume
+_RESUMABLE_STATS = ("purged_count", "files_deleted", "exports_deleted", "errors", "batches")
 
-def purge_expired_records(dry_run: bool = None, retention_days: int = None) -> Dict[str, Any]:
+
+def purge_expired_records(
+    dry_run: bool = None,
+    retention_days: int = None,
+    batch_size: int = None,
+    sweep_unregistered: bool = False,
+) -> Dict[str, Any]:
     """Purge records older than retention period.
     
     Args:
         dry_run: If True, only log what would be deleted (default: settings.recorder_purge_dry_run)
         retention_days: Override retention days (default: settings.recorder_retention_days)
+        batch_size: Transcripts per batch (default: settings.recorder_purge_batch_size)
+        sweep_unregistered: Also scan /app/data for export ZIPs without registry row
+            (created before the export registry) older than the cutoff
         
     Returns:
-        Dict with purge statistics (purged_count, files_deleted, exports_deleted, errors)
+        Dict with purge statistics (purged_count, files_deleted, exports_deleted, errors, batches, resumed)
     """
     if dry_run is None:
         dry_run = settings.recorder_purge_dry_run
@@ -38,13 +65,19 @@ def purge_expired_records(dry_run: bool = None, retention_days: int = None) -> D
     if retention_days is None:
         retention_days = settings.recorder_retention_days
     
+    if batch_size is None:
+        batch_size = settings.recorder_purge_batch_size
+    
     cutoff_date = datetime.utcnow() - timedelta(days=retention_days)
+    last_id = 0
     
     stats = {
         "purged_count": 0,
         "files_deleted": 0,
         "exports_deleted": 0,
         "errors": 0,
+        "batches": 0,
+        "resumed": False,
         "dry_run": dry_run,
         "retention_days": retention_days,
         "cutoff_date": cutoff_date.isoformat(),
@@ -54,118 +87,229 @@ def purge_expired_records(dry_run: bool = None, retention_days: int = None) -> D
         logger.info("record_purge_skipped", extra={"reason": "database_not_configured"})
         return stats
     
+    # Dry runs change nothing - they never resume or write checkpoints
+    checkpoint = None if dry_run else _load_checkpoint(retention_days)
+    if checkpoint:
+        cutoff_date = datetime.fromisoformat(checkpoint["cutoff_date"])
+        last_id = checkpoint["last_id"]
+        for key in _RESUMABLE_STATS:
+            stats[key] = checkpoint["stats"].get(key, 0)
+        stats["resumed"] = True
+        stats["cutoff_date"] = cutoff_date.isoformat()
+    
     try:
-        with get_db() as db:
-            # Find expired transcripts (created before cutoff_date)
-            expired_transcripts = db.query(Transcript).filter(
-                Transcript.created_at < cutoff_date
-            ).all()
-            
-            if not expired_transcripts:
-                logger.info("record_purge_complete", extra={
-                    "purged_count": 0,
-                    "dry_run": dry_run,
-                })
-                return stats
-            
-            logger.info("record_purge_start", extra={
-                "expired_count": len(expired_transcripts),
-                "dry_run": dry_run,
-                "retention_days": retention_days,
-            })
-            
-            for transcript in expired_transcripts:
-                transcript_id = transcript.id
-                age_days = (datetime.utcnow() - transcript.created_at).days
-                
-                try:
-                    # Get audio assets for this transcript
-                    audio_assets = db.query(AudioAsset).filter(
-                        AudioAsset.transcript_id == transcript_id
-                    ).all()
-                    
-                    # Collect sha256 values for file deletion
-                    sha256_values = [a.sha256 for a in audio_assets]
-                    
-                    if dry_run:
-                        # Log what would be purged (privacy-safe)
-                        logger.info("record_purge_candidate", extra={
-                            "transcript_id": transcript_id,
-                            "age_days": age_days,
-                            "audio_files_count": len(sha256_values),
-                            "reason": "retention_expired",
-                        })
-                        stats["purged_count"] += 1
-                        stats["files_deleted"] += len(sha256_values)
-                    else:
-                        # Delete audio files from disk (best-effort)
-                        for sha256 in sha256_values:
-                            try:
-                                delete_file(sha256)
-                                stats["files_deleted"] += 1
-                            except Exception:
-                                # Best effort - file may already be deleted
-                                stats["errors"] += 1
-                                pass
-                        
-                        # Delete transcript (CASCADE will delete segments, audit events, audio assets)
-                        db.delete(transcript)
-                        db.commit()
-                        
-                        # Log purge (privacy-safe: no content, no paths)
-                        logger.info("record_purged", extra={
-                            "transcript_id": transcript_id,
-                            "age_days": age_days,
-                            "reason": "retention_expired",
-                            "files_deleted": len(sha256_values),
-                        })
-                        stats["purged_count"] += 1
-                
-                except Exception as e:
-                    # Best effort - log error but continue with next record
-                    error_type = type(e).__name__
-                    logger.error("record_purge_failed", extra={
-                        "transcript_id": transcript_id,
-                        "error_type": error_type,
-                    })
-                    stats["errors"] += 1
-                    db.rollback()
-                    continue
+        logger.info("record_purge_start", extra={
+            "dry_run": dry_run,
+            "retention_days": retention_days,
+            "batch_size": batch_size,
+            "resumed": stats["resumed"],
+        })
+        
+        while True:
+            with get_db() as db:
+                ids = [
+                    row.id
+                    for row in db.query(Transcript.id).filter(
+                        Transcript.created_at < cutoff_date,
+                        Transcript.id > last_id,
+                    ).order_by(Transcript.id).limit(batch_size)
+                ]
+            if not ids:
+                break
             
-            # Clean up orphaned export ZIP files in /app/data (older than retention)
             try:
-                _purge_orphaned_exports(cutoff_date, dry_run, stats)
+                _purge_batch(ids, dry_run, stats)
             except Exception as e:
-                # Best effort - log but don't fail
-                logger.error("export_purge_failed", extra={"error_type": type(e).__name__})
+                # Best effort - skip batch, retried by the next full run
+                logger.error("record_purge_batch_failed", extra={
+                    "error_type": type(e).__name__,
+                    "batch_size": len(ids),
+                })
                 stats["errors"] += 1
             
-            logger.info("record_purge_complete", extra={
-                "purged_count": stats["purged_count"],
-                "files_deleted": stats["files_deleted"],
-                "exports_deleted": stats["exports_deleted"],
-                "errors": stats["errors"],
-                "dry_run": dry_run,
-            })
-            
-            return stats
+            last_id = ids[-1]
+            stats["batches"] += 1
+            if not dry_run:
+                _save_checkpoint(cutoff_date, retention_days, last_id, stats)
+        
+        # Expired export packages (registry, indexed expires_at)
+        try:
+            _purge_expired_exports(datetime.utcnow(), dry_run, batch_size, stats)
+            if sweep_unregistered:
+                _sweep_unregistered_exports(cutoff_date, dry_run, stats)
+        except Exception as e:
+            # Best effort - log but don't fail
+            logger.error("export_purge_failed", extra={"error_type": type(e).__name__})
+            stats["errors"] += 1
+        
+        if not dry_run:
+            _clear_checkpoint()
+        
+        logger.info("record_purge_complete", extra={
+            "purged_count": stats["purged_count"],
+            "files_deleted": stats["files_deleted"],
+            "exports_deleted": stats["exports_deleted"],
+            "errors": stats["errors"],
+            "batches": stats["batches"],
+            "dry_run": dry_run,
+        })
+        
+        return stats
     
     except Exception as e:
-        # Never fail the app - log and return stats
+        # Never fail the app - log and return stats (checkpoint kept for resume)
         error_type = type(e).__name__
         logger.error("record_purge_critical_failed", extra={"error_type": error_type})
         stats["errors"] += 1
         return stats
 
 
-def _purge_orphaned_exports(cutoff_date: datetime, dry_run: bool, stats: Dict[str, Any]) -> None:
-    """Purge orphaned export ZIP files older than cutoff_date.
+def _purge_batch(ids: List[int], dry_run: bool, stats: Dict[str, Any]) -> None:
+    """Purge one batch of expired transcripts (one transaction)."""
+    with get_db() as db:
+        if dry_run:
+            audio_files_count = db.query(AudioAsset.id).filter(AudioAsset.transcript_id.in_(ids)).count()
+            # Log what would be purged (privacy-safe)
+            logger.info("record_purge_candidates", extra={
+                "count": len(ids),
+                "audio_files_count": audio_files_count,
+                "reason": "retention_expired",
+            })
+            stats["purged_count"] += len(ids)
+            stats["files_deleted"] += audio_files_count
+            return
+        
+        # Release blob references + one DELETE ... WHERE IN per table
+        sha256_values, zip_paths = destroy.delete_records(db, ids)
+        db.commit()
+    
+    export_cache.invalidate_many(ids)
     
-    Export ZIPs are created in /app/data/export-{package_id}.zip.
-    Since package_id is not stored in DB, we purge based on file mtime.
-    This covers both:
-    - Export ZIPs for purged records (orphaned after record deletion)
-    - Export ZIPs for records that were destroyed before purge
+    # Shred blobs whose last reference is gone + export ZIPs of purged records (parallel, best-effort)
+    files_deleted, exports_deleted = destroy.shred(sha256_values, zip_paths)
+    
+    stats["purged_count"] += len(ids)
+    stats["files_deleted"] += files_deleted
+    stats["exports_deleted"] += exports_deleted
+    
+    # Log purge (privacy-safe: no content, no paths)
+    logger.info("record_purge_batch", extra={
+        "purged_count": len(ids),
+        "files_deleted": files_deleted,
+        "exports_deleted": exports_deleted,
+        "last_transcript_id": ids[-1],
+        "reason": "retention_expired",
+    })
+
+
+def _load_checkpoint(retention_days: int) -> Optional[Dict[str, Any]]:
+    """Load checkpoint of an interrupted run (same retention only)."""
+    path = Path(settings.recorder_purge_checkpoint_path)
+    try:
+        checkpoint = json.loads(path.read_text())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("record_purge_checkpoint_invalid", extra={"error_type": type(e).__name__})
+        return None
+    if checkpoint.get("retention_days") != retention_days:
+        return None  # Different policy - start over with a fresh cutoff
+    return checkpoint
+
+
+def _save_checkpoint(cutoff_date: datetime, retention_days: int, last_id: int, stats: Dict[str, Any]) -> None:
+    """Persist progress after a batch (atomic replace)."""
+    path = Path(settings.recorder_purge_checkpoint_path)
+    checkpoint = {
+        "cutoff_date": cutoff_date.isoformat(),
+        "retention_days": retention_days,
+        "last_id": last_id,
+        "stats": {key: stats[key] for key in _RESUMABLE_STATS},
+        "updated_at": datetime.utcnow().isoformat(),
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(checkpoint))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        # Best effort - a lost checkpoint only means re-scanning from the start
+        logger.warning("record_purge_checkpoint_failed", extra={"error_type": type(e).__name__})
+
+
+def _clear_checkpoint() -> None:
+    """Remove checkpoint after a completed run."""
+    try:
+        Path(settings.recorder_purge_checkpoint_path).unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning("record_purge_checkpoint_failed", extra={"error_type": type(e).__name__})
+
+
+def _expired_exports_filter(now: datetime):
+    """Registry rows whose package has expired.
+    
+    Rows from before the registry have no expires_at - they expire
+    EXPORT_RETENTION_DAYS after created_at (unless still queued/running).
+    """
+    legacy_cutoff = now - timedelta(days=settings.export_retention_days)
+    return or_(
+        ExportJob.expires_at < now,
+        and_(
+            ExportJob.expires_at.is_(None),
+            ExportJob.status.in_(("done", "failed")),
+            ExportJob.created_at < legacy_cutoff,
+        ),
+    )
+
+
+def _purge_expired_exports(now: datetime, dry_run: bool, batch_size: int, stats: Dict[str, Any]) -> None:
+    """Delete expired export packages (registry rows + ZIP files) in batches.
+    
+    Args:
+        now: Expiry reference time
+        dry_run: If True, only count expired packages
+        batch_size: Registry rows per batch
+        stats: Stats dict to update
+    """
+    if dry_run:
+        with get_db() as db:
+            count = db.query(ExportJob.id).filter(_expired_exports_filter(now)).count()
+        if count:
+            logger.info("export_purge_candidates", extra={"count": count, "reason": "export_expired"})
+        stats["exports_deleted"] += count
+        return
+    
+    while True:
+        with get_db() as db:
+            rows = db.query(ExportJob.id, ExportJob.zip_path).filter(
+                _expired_exports_filter(now)
+            ).order_by(ExportJob.expires_at).limit(batch_size).all()
+            if not rows:
+                return
+            db.query(ExportJob).filter(
+                ExportJob.id.in_([row.id for row in rows])
+            ).delete(synchronize_session=False)
+            db.commit()
+        
+        # May contain decrypted audio - overwrite before unlink (failed jobs have no ZIP)
+        exports_deleted = shred_files(Path(row.zip_path) for row in rows if row.zip_path)
+        stats["exports_deleted"] += exports_deleted
+        logger.info("export_purge_batch", extra={
+            "expired_count": len(rows),
+            "exports_deleted": exports_deleted,
+            "reason": "export_expired",
+        })
+
+
+def _sweep_unregistered_exports(cutoff_date: datetime, dry_run: bool, stats: Dict[str, Any]) -> None:
+    """Purge export ZIP files in /app/data that have no registry row, older than cutoff_date.
+    
+    Also purges temp ZIPs (.export-*.zip.tmp) older than cutoff_date - left
+    behind by a crash mid-build, may contain decrypted audio.
+    
+    Only needed once for packages created before the export registry
+    (purge_runner --sweep-unregistered) - scans the directory and stats
+    every file, so it is not part of the regular run.
     
     Args:
         cutoff_date: Delete files older than this date
@@ -176,10 +320,12 @@ def _purge_orphaned_exports(cutoff_date: datetime, dry_run: bool, stats: Dict[st
     if not data_dir.exists():
         return
     
-    # Find export-*.zip files
-    export_files = list(data_dir.glob("export-*.zip"))
+    with get_db() as db:
+        registered = {row.zip_path for row in db.query(ExportJob.zip_path).filter(ExportJob.zip_path.isnot(None))}
     
-    for zip_path in export_files:
+    for zip_path in [*data_dir.glob("export-*.zip"), *data_dir.glob(".export-*.zip.tmp")]:
+        if str(zip_path) in registered:
+            continue
         try:
             # Check file modification time
             mtime = datetime.fromtimestamp(zip_path.stat().st_mtime)
@@ -191,7 +337,8 @@ def _purge_orphaned_exports(cutoff_date: datetime, dry_run: bool, stats: Dict[st
                     })
                     stats["exports_deleted"] += 1
                 else:
-                    zip_path.unlink()
+                    # May contain decrypted audio - overwrite before unlink
+                    shred_file(zip_path)
                     logger.info("export_orphan_purged", extra={
                         "file_age_days": (datetime.utcnow() - mtime).days,
                         "reason": "retention_expired",
@@ -200,4 +347,3 @@ def _purge_orphaned_exports(cutoff_date: datetime, dry_run: bool, stats: Dict[st
         except Exception:
             # Best effort - file may not exist or be inaccessible
             pass
-
@@ -1,7 +1,8 @@
 """CLI entrypoint for Record purge (GDPR retention).
 
 Usage:
-    python -m app.modules.record.purge_runner [--dry-run] [--retention-days N]
+    python -m app.modules.record.purge_runner [--dry-run] [--retention-days N] [--batch-size N]
+                                               [--sweep-unregistered]
 
 This is a standalone CLI tool - not part of the API.
 Purge should be run explicitly (cron, manual, etc) - never per request.
@@ -37,6 +38,12 @@ Examples:
   
   # Dry run with custom retention
   python -m app.modules.record.purge_runner --dry-run --retention-days 30
+  
+  # Smaller batches (an interrupted run resumes after the last finished batch)
+  python -m app.modules.record.purge_runner --batch-size 100
+  
+  # One-off: also remove old export ZIPs created before the export registry
+  python -m app.modules.record.purge_runner --sweep-unregistered
         """,
     )
     parser.add_argument(
@@ -50,6 +57,18 @@ Examples:
         help=f"Override retention days (default: {settings.recorder_retention_days} from RECORDER_RETENTION_DAYS)",
     )
     
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        help=f"Transcripts per batch (default: {settings.recorder_purge_batch_size} from RECORDER_PURGE_BATCH_SIZE)",
+    )
+    
+    parser.add_argument(
+        "--sweep-unregistered",
+        action="store_true",
+        help="Also scan /app/data for export ZIPs without registry row (pre-registry exports) and stale temp ZIPs",
+    )
+    
     args = parser.parse_args()
     
     # Determine dry_run mode
@@ -69,12 +88,19 @@ Examples:
             "retention_days": effective_retention,
         })
         
-        result = purge_expired_records(dry_run=dry_run, retention_days=retention_override)
+        result = purge_expired_records(
+            dry_run=dry_run,
+            retention_days=retention_override,
+            batch_size=args.batch_size,
+            sweep_unregistered=args.sweep_unregistered,
+        )
         
         # Print summary to stdout (for cron logs, etc)
         print(f"Purge complete:")
         print(f"  Dry run: {result['dry_run']}")
         print(f"  Retention days: {result['retention_days']}")
+        print(f"  Resumed: {result['resumed']}")
+        print(f"  Batches: {result['batches']}")
         print(f"  Purged records: {result['purged_count']}")
         print(f"  Files deleted: {result['files_deleted']}")
         print(f"  Exports deleted: {result['exports_deleted']}")
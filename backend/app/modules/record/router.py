@@ -1,19 +1,18 @@
 """Record router - API endpoints for audio recording and management."""
 import os
-from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException, status, Request
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
 
 from app.core.logging import logger
 from app.core.config import settings
-from app.core.database import get_db
-from app.core.privacy_guard import sanitize_for_logging, assert_no_content
-from app.modules.record import service
+from app.modules.audit import pipeline as audit_pipeline
+from app.modules.projects import storage_async
+from app.modules.record import export_jobs, service
 from app.modules.record.download import router as download_router
-from app.modules.projects.models import ProjectAuditEvent
-from app.modules.transcripts.models import TranscriptAuditEvent
+from app.modules.record.http_range import RangeNotSatisfiable, content_range, parse_range
 
 
 router = APIRouter()
@@ -45,6 +44,11 @@ class DestroyRequest(BaseModel):
     reason: Optional[str] = Field(None, min_length=1, max_length=500, description="Reason for destruction")
 
 
+class ProjectDestroyRequest(DestroyRequest):
+    """Request model for bulk destruction of a project's records."""
+    transcript_ids: Optional[List[int]] = Field(None, max_length=10000, description="Records to destroy (default: all in project)")
+
+
 def _has_db() -> bool:
     """Check if database is available."""
     # Import engine from module to get current value (not cached import)
@@ -60,47 +64,23 @@ def _create_audit_event(
     request_id: Optional[str] = None,
     metadata: Optional[Dict[str, Any]] = None,
 ) -> None:
-    """Create audit event (sanitized for privacy)."""
+    """Create audit event (sanitized for privacy, queued).
+    
+    Written as transcript event and mirrored to the project trail
+    (project_id is looked up from the transcript if not provided).
+    """
     if not _has_db():
         return
     
-    # Sanitize metadata
-    if metadata:
-        metadata = sanitize_for_logging(metadata, context="audit")
-        assert_no_content(metadata, context="audit")
-    
-    with get_db() as db:
-        # Get project_id from transcript if not provided
-        if project_id is None:
-            from app.modules.transcripts.models import Transcript
-            transcript = db.query(Transcript).filter(Transcript.id == transcript_id).first()
-            if transcript:
-                project_id = transcript.project_id
-        
-        # Create transcript audit event
-        audit = TranscriptAuditEvent(
-            transcript_id=transcript_id,
-            action=action,
-            actor=actor,
-            created_at=datetime.utcnow(),
-            metadata_json=metadata,
-        )
-        db.add(audit)
-        
-        # Create project audit event if project_id exists
-        if project_id:
-            project_audit = ProjectAuditEvent(
-                project_id=project_id,
-                action=action,
-                severity="info",
-                actor=actor,
-                request_id=request_id,
-                created_at=datetime.utcnow(),
-                metadata_json=metadata,
-            )
-            db.add(project_audit)
-        
-        db.commit()
+    audit_pipeline.emit_transcript_event(
+        transcript_id=transcript_id,
+        action=action,
+        actor=actor,
+        request_id=request_id,
+        metadata=metadata,
+        project_id=project_id,
+        mirror_to_project=True,
+    )
 
 
 @router.post("/create", status_code=status.HTTP_201_CREATED)
@@ -192,17 +172,15 @@ async def upload_audio_file(
         )
     
     try:
-        # Read file content
-        file_content = await file.read()
-        
         # Validate and upload (validation uses magic bytes + extension, not MIME type)
         # Get filename safely (don't log it)
         filename = file.filename if hasattr(file, 'filename') else None
         
         try:
-            result = service.upload_audio(
+            # Streamed in chunks: hashed + encrypted incrementally (bounded memory)
+            result = await service.upload_audio_stream(
                 transcript_id=transcript_id,
-                file_content=file_content,
+                upload=file,
                 mime_type=file.content_type,  # Optional, used for metadata only
                 filename=filename,  # Optional, used for extension validation
             )
@@ -262,13 +240,96 @@ async def upload_audio_file(
         )
 
 
-@router.post("/{transcript_id}/export")
+@router.get("/{transcript_id}/audio")
+async def stream_audio_file(
+    transcript_id: int,
+    request: Request,
+):
+    """Stream decrypted audio (supports single-range `Range` requests).
+
+    Only the encrypted frames covering the requested range are read and
+    decrypted, so seeking in a long recording costs ~1MiB, not the whole file.
+
+    Args:
+        transcript_id: Transcript ID
+        request: FastAPI request (Range header, request_id)
+
+    Returns:
+        StreamingResponse (200 full body, 206 partial) - 416 if range is unsatisfiable
+    """
+    if not _has_db():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database not available",
+        )
+
+    asset = service.get_audio_asset(transcript_id)
+    if not asset or not await storage_async.blob_exists(asset["sha256"]):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Audio not found",
+        )
+
+    size = asset["size_bytes"]
+    try:
+        byte_range = parse_range(request.headers.get("range"), size)
+    except RangeNotSatisfiable:
+        return Response(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={"Content-Range": f"bytes */{size}", "Accept-Ranges": "bytes"},
+        )
+
+    start, end = byte_range if byte_range else (0, size)
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Length": str(end - start),
+    }
+    if byte_range:
+        headers["Content-Range"] = content_range(start, end, size)
+
+    # Every access is audited (offsets/sizes only)
+    request_id = getattr(request.state, "request_id", None)
+    _create_audit_event(
+        project_id=asset["project_id"],
+        transcript_id=transcript_id,
+        action="audio_accessed",
+        actor="system",
+        request_id=request_id,
+        metadata={
+            "range_start": start,
+            "range_bytes": end - start,
+            "size_bytes": size,
+            "partial": byte_range is not None,
+        },
+    )
+    logger.info(
+        "audio_stream",
+        extra={
+            "transcript_id": transcript_id,
+            "partial": byte_range is not None,
+            "range_bytes": end - start,
+        },
+    )
+
+    # Frames are read + decrypted on the storage pool
+    return StreamingResponse(
+        storage_async.iter_file(asset["sha256"], start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT if byte_range else status.HTTP_200_OK,
+        media_type=asset["mime_type"],
+        headers=headers,
+    )
+
+
+@router.post("/{transcript_id}/export", status_code=status.HTTP_202_ACCEPTED)
 async def export_record(
     transcript_id: int,
     data: ExportRequest,
     request: Request,
 ) -> Dict[str, Any]:
-    """Export record package (zip with transcript + audio + audit).
+    """Queue export of record package (zip with transcript + audio + audit).
+    
+    The package is built by a background worker; poll
+    GET /export/{package_id}/status and fetch it from /export/{package_id}/download.
     
     Args:
         transcript_id: Transcript ID
@@ -276,7 +337,7 @@ async def export_record(
         request: FastAPI request (for request_id)
         
     Returns:
-        ZIP file as bytes with Content-Type: application/zip
+        Job info (status=queued, package_id, receipt_id, audio_mode, warnings, status_url, download_url)
     """
     if not _has_db():
         raise HTTPException(
@@ -298,37 +359,38 @@ async def export_record(
             )
     
     try:
-        result = service.export_record_package(
+        job = await run_in_threadpool(
+            export_jobs.create_job,
             transcript_id=transcript_id,
             confirm=data.confirm,
             reason=data.reason,
             export_audio_mode=data.export_audio_mode,
         )
         
-        # Create audit event
+        # Create audit event ("exported" is written by the worker when the package is done)
         request_id = getattr(request.state, "request_id", None)
-        audit_metadata = {
-            "format": "zip",
-            "package_id": result["package_id"],
-            "audio_mode": result["audio_mode"],
-        }
         _create_audit_event(
             project_id=None,
             transcript_id=transcript_id,
-            action="exported",
+            action="export_queued",
             actor="system",
             request_id=request_id,
-            metadata=audit_metadata,
+            metadata={
+                "format": "zip",
+                "package_id": job["package_id"],
+                "audio_mode": job["audio_mode"],
+            },
         )
         
-        # Return JSON response with zip_path (for live_verify compatibility)
+        package_id = job["package_id"]
         return {
-            "status": result["status"],
-            "package_id": result["package_id"],
-            "receipt_id": result["receipt_id"],
-            "zip_path": result["zip_path"],
-            "audio_mode": result["audio_mode"],
-            "warnings": result.get("warnings", []),
+            "status": job["status"],
+            "package_id": package_id,
+            "receipt_id": job["receipt_id"],
+            "audio_mode": job["audio_mode"],
+            "warnings": job["warnings"],
+            "status_url": f"/api/v1/record/export/{package_id}/status",
+            "download_url": f"/api/v1/record/export/{package_id}/download",
         }
     except ValueError as e:
         raise HTTPException(
@@ -336,7 +398,7 @@ async def export_record(
             detail=str(e),
         )
     except Exception as e:
-        logger.error("export_failed", extra={"error": str(e)})
+        logger.error("export_failed", extra={"error_type": type(e).__name__})
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to export record",
@@ -366,7 +428,9 @@ async def destroy_record(
         )
     
     try:
-        result = service.destroy_record(
+        # DB work + parallel shredding - off the event loop
+        result = await run_in_threadpool(
+            service.destroy_record,
             transcript_id=transcript_id,
             dry_run=data.dry_run,
             confirm=data.confirm,
@@ -404,3 +468,59 @@ async def destroy_record(
             detail="Failed to destroy record",
         )
 
+
+
+@router.post("/project/{project_id}/destroy")
+async def destroy_project_records(
+    project_id: int,
+    data: ProjectDestroyRequest,
+    request: Request,
+) -> Dict[str, Any]:
+    """Destroy many records of a project in one job (instead of one call per record).
+    
+    Args:
+        project_id: Project ID
+        data: Destroy request (dry_run, confirm, reason, optional transcript_ids)
+        request: FastAPI request (for request_id)
+        
+    Returns:
+        Destruction result (status, receipt_id, destroyed_at, counts)
+    """
+    if not _has_db():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database not available",
+        )
+    
+    try:
+        # Batched DB work + parallel shredding - off the event loop
+        result = await run_in_threadpool(
+            service.destroy_project_records,
+            project_id=project_id,
+            transcript_ids=data.transcript_ids,
+            dry_run=data.dry_run,
+            confirm=data.confirm,
+            reason=data.reason,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error("project_destroy_failed", extra={"error_type": type(e).__name__})
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to destroy records",
+        )
+    
+    if result["status"] == "destroyed":
+        # Project survives - audit on the project trail (counts only)
+        audit_pipeline.emit_project_event(
+            project_id=project_id,
+            action="records_destroyed",
+            request_id=getattr(request.state, "request_id", None),
+            metadata={"receipt_id": result["receipt_id"], **result["counts"]},
+        )
+    
+    return result
@@ -2,19 +2,25 @@
 import os
 import json
 import zipfile
-from io import BytesIO
 from pathlib import Path
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Optional
+from datetime import datetime, timedelta
 from uuid import uuid4
 
+from starlette.concurrency import run_in_threadpool
+
 from app.core.config import settings
 from app.core.database import get_db
 from app.core.privacy_guard import sanitize_for_logging, assert_no_content, compute_integrity_hash
 from app.modules.projects.models import Project
 from app.modules.transcripts.models import Transcript
-from app.modules.projects.file_storage import store_file, retrieve_file, compute_file_hash, delete_file
-from app.modules.record.models import AudioAsset
+from app.modules.projects import blob_store
+from app.modules.projects import activity, merkle
+from app.modules.projects import storage_async
+from app.modules.projects.file_storage import BlobWriter, blob_path, open_blob, store_file, compute_file_hash
+from app.modules.projects.secure_delete import shred_file
+from app.modules.record import destroy
+from app.modules.record.models import AudioAsset, ExportJob
 
 
 def _has_db() -> bool:
@@ -42,6 +48,23 @@ MAGIC_BYTES = {
 # Max file size: 200MB
 MAX_FILE_SIZE = 200 * 1024 * 1024
 
+# Streaming upload read size (memory per upload is bounded by this)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Export copy size for the audio entry (memory per export is bounded by this)
+EXPORT_CHUNK_SIZE = 1024 * 1024
+
+# Detected format -> MIME type
+_FORMAT_TO_MIME = {
+    "wav": "audio/wav",
+    "mp3": "audio/mpeg",
+    "m4a": "audio/mp4",
+    "aac": "audio/aac",
+    "mp4": "audio/mp4",
+    "ogg": "audio/ogg",
+    "webm": "audio/webm",
+}
+
 
 def validate_audio_file(file_content: bytes, filename: Optional[str] = None) -> tuple:
     """Validate audio file using extension + magic bytes.
@@ -62,25 +85,39 @@ def validate_audio_file(file_content: bytes, filename: Optional[str] = None) ->
     if len(file_content) > MAX_FILE_SIZE:
         raise ValueError(f"File too large (max: {MAX_FILE_SIZE} bytes)")
     
+    return detect_audio_format(file_content, filename), True
+
+
+def detect_audio_format(header: bytes, filename: Optional[str] = None) -> str:
+    """Detect audio format from magic bytes (first chunk is enough) + extension.
+    
+    Args:
+        header: First bytes of file (at least 8 for MP4 detection)
+        filename: Optional filename (for extension check)
+        
+    Returns:
+        Detected format (wav|mp3|m4a|aac|mp4|ogg|webm)
+        
+    Raises:
+        ValueError: If format is unsupported (safe error message, no filename/path)
+    """
     # Check magic bytes (first bytes of file)
     detected_format = None
     for magic, fmt in MAGIC_BYTES.items():
-        if file_content.startswith(magic):
+        if header.startswith(magic):
             detected_format = fmt
             break
     
     # For MP4/M4A, check at offset 4
-    if not detected_format and len(file_content) >= 8:
-        if file_content[4:8] == b"ftyp":
+    if not detected_format and len(header) >= 8:
+        if header[4:8] == b"ftyp":
             detected_format = "mp4"
     
     # Check extension if filename provided
-    extension_match = False
     if filename:
         ext = filename.lower()
         for allowed_ext in ALLOWED_EXTENSIONS:
             if ext.endswith(allowed_ext):
-                extension_match = True
                 if not detected_format:
                     # Infer from extension
                     detected_format = allowed_ext.lstrip(".")
@@ -91,10 +128,10 @@ def validate_audio_file(file_content: bytes, filename: Optional[str] = None) ->
         raise ValueError("Unsupported file format")
     
     # Verify detected format is in allowed list
-    if detected_format not in {"wav", "mp3", "m4a", "aac", "mp4", "ogg", "webm"}:
+    if detected_format not in _FORMAT_TO_MIME:
         raise ValueError("Unsupported file format")
     
-    return detected_format, True
+    return detected_format
 
 
 def create_record_project(
@@ -129,6 +166,8 @@ def create_record_project(
                 updated_at=datetime.utcnow(),
             )
             db.add(project)
+            db.flush()
+            activity.create(db, project.id, at=project.updated_at)
             db.commit()
             db.refresh(project)
             project_id = project.id
@@ -150,6 +189,7 @@ def create_record_project(
             updated_at=datetime.utcnow(),
         )
         db.add(transcript)
+        activity.record(db, project_id, transcripts=1, at=transcript.updated_at)
         db.commit()
         db.refresh(transcript)
         
@@ -188,17 +228,7 @@ def upload_audio(
         # Re-raise with safe error (no filename/path leakage)
         raise ValueError(str(e))
     
-    # Map detected format to MIME type
-    format_to_mime = {
-        "wav": "audio/wav",
-        "mp3": "audio/mpeg",
-        "m4a": "audio/mp4",
-        "aac": "audio/aac",
-        "mp4": "audio/mp4",
-        "ogg": "audio/ogg",
-        "webm": "audio/webm",
-    }
-    validated_mime_type = format_to_mime.get(detected_format, "audio/wav")
+    validated_mime_type = _FORMAT_TO_MIME.get(detected_format, "audio/wav")
     
     size_bytes = len(file_content)
     
@@ -210,28 +240,141 @@ def upload_audio(
         logger.error("upload_hash_failed", extra={"error_type": type(e).__name__})
         raise ValueError(f"Failed to compute file hash: {type(e).__name__}")
     
-    # Store encrypted file
+    # Store encrypted file (skipped if the blob already exists) once a reference is held
     try:
-        storage_path = store_file(file_content, sha256)
+        return _save_audio_asset(
+            transcript_id,
+            sha256,
+            validated_mime_type,
+            size_bytes,
+            place=lambda: store_file(file_content, sha256),
+        )
+    except ValueError:
+        raise
     except Exception as e:
         from app.core.logging import logger
         logger.error("upload_storage_failed", extra={"error_type": type(e).__name__})
         raise ValueError(f"Failed to store file: {type(e).__name__}")
+
+
+async def upload_audio_stream(
+    transcript_id: int,
+    upload: Any,
+    mime_type: Optional[str] = None,
+    filename: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Upload and encrypt audio file in chunks (bounded memory).
+    
+    Magic bytes are validated from the first chunk; SHA256 and encryption are
+    updated per chunk into a temp file that is atomically moved into place.
+    
+    Args:
+        transcript_id: Transcript ID
+        upload: Upload with async read(size) (FastAPI UploadFile)
+        mime_type: Optional MIME type (validated but not required)
+        filename: Optional filename (for extension validation)
+        
+    Returns:
+        Dict with status, file_id, sha256, size_bytes, mime_type
+        
+    Raises:
+        ValueError: If transcript missing, file invalid/too large or storage failed
+    """
+    if not _has_db():
+        raise ValueError("Database not available")
     
+    # Fail fast before reading the body
+    with get_db() as db:
+        if not db.query(Transcript.id).filter(Transcript.id == transcript_id).first():
+            raise ValueError(f"Transcript {transcript_id} not found")
+    
+    first_chunk = await upload.read(UPLOAD_CHUNK_SIZE)
+    if not first_chunk:
+        raise ValueError("File is empty")
+    detected_format = detect_audio_format(first_chunk, filename)
+    validated_mime_type = _FORMAT_TO_MIME.get(detected_format, "audio/wav")
+    
+    try:
+        with BlobWriter() as writer:
+            chunk = first_chunk
+            while chunk:
+                if writer.size_bytes + len(chunk) > MAX_FILE_SIZE:
+                    raise ValueError(f"File too large (max: {MAX_FILE_SIZE} bytes)")
+                # Hash + encrypt off the event loop
+                await storage_async.run("encrypt_chunk", writer.write, chunk)
+                chunk = await upload.read(UPLOAD_CHUNK_SIZE)
+            sha256, size_bytes = await storage_async.run("finish", writer.finish)
+            # Temp file is moved into place (or dropped as duplicate) once a reference is held
+            return await run_in_threadpool(
+                _save_audio_asset,
+                transcript_id,
+                sha256,
+                validated_mime_type,
+                size_bytes,
+                writer.place,
+            )
+    except ValueError:
+        raise
+    except Exception as e:
+        from app.core.logging import logger
+        logger.error("upload_storage_failed", extra={"error_type": type(e).__name__})
+        raise ValueError(f"Failed to store file: {type(e).__name__}")
+
+
+def _record_audio_leaf(db, project_id: Optional[int], asset_id: int, sha256: str) -> None:
+    """Record the audio blob's ciphertext hash in the project integrity manifest."""
+    if project_id is None:
+        return
+    ciphertext = merkle.blob_leaves([sha256]).get(sha256)
+    if ciphertext is not None:
+        merkle.update(db, project_id, set_leaves={f"audio/{asset_id}": ciphertext})
+
+
+def _save_audio_asset(
+    transcript_id: int,
+    sha256: str,
+    mime_type: str,
+    size_bytes: int,
+    place: Callable[[], str],
+) -> Dict[str, Any]:
+    """Create or update audio asset row and store its blob.
+    
+    A blob reference is acquired before place() runs, so a shared blob can't
+    be shredded while it is being deduplicated against.
+    
+    Args:
+        transcript_id: Transcript ID
+        sha256: Content hash
+        mime_type: Validated MIME type
+        size_bytes: Plaintext size
+        place: Stores the blob, returns storage path (skips existing blobs)
+    
+    Returns:
+        Dict with status, file_id, sha256, size_bytes, mime_type
+    """
+    replaced_sha256 = None
     with get_db() as db:
         # Verify transcript exists
         transcript = db.query(Transcript).filter(Transcript.id == transcript_id).first()
         if not transcript:
             raise ValueError(f"Transcript {transcript_id} not found")
         
+        blob_store.acquire(db, sha256, size_bytes)
+        storage_path = place()
+        
         # Check if audio asset already exists
         existing = db.query(AudioAsset).filter(AudioAsset.transcript_id == transcript_id).first()
         if existing:
-            # Update existing
+            # Update existing (drop reference to the previous blob)
+            blob_store.release(db, existing.sha256)
+            if existing.sha256 != sha256:
+                replaced_sha256 = existing.sha256
+            activity.record(db, transcript.project_id, bytes_stored=size_bytes - existing.size_bytes)
             existing.sha256 = sha256
-            existing.mime_type = validated_mime_type
+            existing.mime_type = mime_type
             existing.size_bytes = size_bytes
             existing.storage_path = storage_path
+            _record_audio_leaf(db, transcript.project_id, existing.id, sha256)
             db.commit()
             db.refresh(existing)
             file_id = existing.id
@@ -241,42 +384,143 @@ def upload_audio(
                 project_id=transcript.project_id,
                 transcript_id=transcript_id,
                 sha256=sha256,
-                mime_type=validated_mime_type,
+                mime_type=mime_type,
                 size_bytes=size_bytes,
                 storage_path=storage_path,
                 destroy_status="none",  # Explicit default
                 created_at=datetime.utcnow(),
             )
             db.add(audio_asset)
+            db.flush()
+            _record_audio_leaf(db, transcript.project_id, audio_asset.id, sha256)
+            activity.record(db, transcript.project_id, audio=1, bytes_stored=size_bytes, at=audio_asset.created_at)
             db.commit()
             db.refresh(audio_asset)
             file_id = audio_asset.id
-        
-        return {
-            "status": "ok",
-            "file_id": file_id,
-            "sha256": sha256,
-            "size_bytes": size_bytes,
-            "mime_type": validated_mime_type,
-        }
+    
+    if replaced_sha256:
+        blob_store.collect([replaced_sha256])
+    
+    return {
+        "status": "ok",
+        "file_id": file_id,
+        "sha256": sha256,
+        "size_bytes": size_bytes,
+        "mime_type": mime_type,
+    }
 
 
-def export_record_package(
-    transcript_id: int,
-    confirm: bool = False,
-    reason: Optional[str] = None,
-    export_audio_mode: str = "encrypted",
-) -> Dict[str, Any]:
-    """Export record package (zip with transcript + audio + audit).
-    
+def get_audio_asset(transcript_id: int) -> Optional[Dict[str, Any]]:
+    """Get playable audio asset for transcript.
+
     Args:
         transcript_id: Transcript ID
-        confirm: Confirmation required
-        reason: Reason for export
-        export_audio_mode: "encrypted" (default) or "decrypted" (requires extra confirmation)
-        
+
     Returns:
-        Dict with status, package_id, receipt_id, warnings
+        Dict with project_id, sha256, mime_type, size_bytes - or None if the
+        transcript has no audio (or it is being destroyed)
+    """
+    if not _has_db():
+        raise ValueError("Database not available")
+
+    with get_db() as db:
+        audio_asset = db.query(AudioAsset).filter(
+            AudioAsset.transcript_id == transcript_id,
+            AudioAsset.destroy_status == "none",
+        ).first()
+        if not audio_asset:
+            return None
+        return {
+            "project_id": audio_asset.project_id,
+            "sha256": audio_asset.sha256,
+            "mime_type": audio_asset.mime_type,
+            "size_bytes": audio_asset.size_bytes,
+        }
+
+
+def _copy_chunks(
+    chunks: Iterable[bytes],
+    out: BinaryIO,
+    bytes_total: int,
+    progress: Optional[Callable[[int, int], None]],
+) -> None:
+    """Copy chunks to out, reporting progress after each chunk."""
+    bytes_done = 0
+    for chunk in chunks:
+        out.write(chunk)
+        bytes_done += len(chunk)
+        if progress:
+            progress(bytes_done, bytes_total)
+
+
+def _write_export_zip(
+    zip_path: Path,
+    transcript_data: Dict[str, Any],
+    audit_data: List[Dict[str, Any]],
+    manifest: Dict[str, Any],
+    audio_sha256: str,
+    export_audio_mode: str,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> None:
+    """Stream export package to disk (bounded memory, atomic rename).
+
+    JSON entries are deflated; the audio entry is ZIP_STORED (encrypted or
+    compressed audio doesn't deflate) and copied from storage in chunks.
+
+    Args:
+        zip_path: Final ZIP path
+        transcript_data: transcript.json content
+        audit_data: audit.json content
+        manifest: manifest.json content
+        audio_sha256: Audio blob hash
+        export_audio_mode: "encrypted" (audio.bin, raw blob) or "decrypted" (audio.dec)
+        progress: Optional callback(bytes_done, bytes_total) after each audio chunk
+
+    Raises:
+        ValueError: If audio blob is missing
+    """
+    storage_path = blob_path(audio_sha256)
+    if not storage_path.exists():
+        raise ValueError(f"Audio file not found: {audio_sha256}")
+
+    tmp_path = export_tmp_path(zip_path)
+    try:
+        with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            # transcript.json (metadata + segments)
+            zip_file.writestr("transcript.json", json.dumps(transcript_data, indent=2, ensure_ascii=False))
+
+            # audio.bin (encrypted) or audio.dec (decrypted)
+            audio_name = "audio.dec" if export_audio_mode == "decrypted" else "audio.bin"
+            info = zipfile.ZipInfo(audio_name, date_time=datetime.utcnow().timetuple()[:6])
+            info.compress_type = zipfile.ZIP_STORED
+            with zip_file.open(info, "w", force_zip64=True) as audio_entry:
+                if export_audio_mode == "decrypted":
+                    with open_blob(audio_sha256) as reader:
+                        _copy_chunks(reader.iter_range(), audio_entry, reader.size, progress)
+                else:
+                    # Default: export encrypted blob as stored (no decryption)
+                    with open(storage_path, "rb") as blob:
+                        chunks = iter(lambda: blob.read(EXPORT_CHUNK_SIZE), b"")
+                        _copy_chunks(chunks, audio_entry, storage_path.stat().st_size, progress)
+
+            zip_file.writestr("audit.json", json.dumps(audit_data, indent=2, ensure_ascii=False))
+            zip_file.writestr("manifest.json", json.dumps(manifest, indent=2, ensure_ascii=False))
+        os.replace(tmp_path, zip_path)
+    except BaseException:
+        # May contain decrypted audio - overwrite before unlink
+        shred_file(tmp_path)
+        raise
+
+
+def validate_export_request(
+    confirm: bool,
+    reason: Optional[str],
+    export_audio_mode: str,
+) -> None:
+    """Validate export request parameters.
+    
+    Raises:
+        ValueError: If confirm/reason missing or export_audio_mode invalid
     """
     if not confirm:
         raise ValueError("Export requires confirm=true")
@@ -286,15 +530,53 @@ def export_record_package(
     
     if export_audio_mode not in ("encrypted", "decrypted"):
         raise ValueError(f"export_audio_mode must be 'encrypted' or 'decrypted', got '{export_audio_mode}'")
-    
-    # Decrypted requires extra confirmation
+
+
+def export_warnings(export_audio_mode: str) -> List[str]:
+    """Warnings returned with an export of the given audio mode."""
     if export_audio_mode == "decrypted":
-        # This should be checked at router level, but double-check here
-        pass
-    
-    if not _has_db():
-        raise ValueError("Database not available")
+        return ["Audio exported as decrypted. Handle with extreme care."]
+    return []
+
+
+def export_tmp_path(zip_path: Path) -> Path:
+    """Temp path an export ZIP is written to before the atomic rename."""
+    return zip_path.with_name(f".{zip_path.name}.tmp")
+
+
+def export_zip_path(package_id: str) -> Path:
+    """Path of export ZIP for package_id (/app/data/export-{package_id}.zip)."""
+    # Use /app/data directory (mounted volume, accessible from container)
+    return Path("/app/data") / f"export-{package_id}.zip"
+
+
+def export_expires_at(finished_at: datetime) -> datetime:
+    """Registry expiry of an export package finished at finished_at (EXPORT_RETENTION_DAYS)."""
+    return finished_at + timedelta(days=settings.export_retention_days)
+
+
+def build_export_package(
+    transcript_id: int,
+    package_id: str,
+    created_at: datetime,
+    export_audio_mode: str,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Path:
+    """Build export package ZIP on disk (zip with transcript + audio + audit).
     
+    Args:
+        transcript_id: Transcript ID
+        package_id: Package ID (ZIP filename + manifest)
+        created_at: Package creation time (manifest)
+        export_audio_mode: "encrypted" or "decrypted"
+        progress: Optional callback(bytes_done, bytes_total) while audio is copied
+        
+    Returns:
+        Path to ZIP file
+        
+    Raises:
+        ValueError: If transcript or audio asset not found
+    """
     with get_db() as db:
         # Get transcript
         transcript = db.query(Transcript).filter(Transcript.id == transcript_id).first()
@@ -318,11 +600,6 @@ def export_record_package(
             TranscriptAuditEvent.transcript_id == transcript_id
         ).order_by(TranscriptAuditEvent.created_at).all()
         
-        # Create package
-        package_id = str(uuid4())
-        receipt_id = str(uuid4())
-        created_at = datetime.utcnow()
-        
         # Compute integrity hashes (avoid "transcript" keyword for privacy-safe manifest)
         integrity_hashes = {
             "t_id": transcript.id,  # "t_id" instead of "transcript_id" to avoid forbidden key match
@@ -331,99 +608,159 @@ def export_record_package(
         if transcript.raw_integrity_hash:
             integrity_hashes["t_hash"] = transcript.raw_integrity_hash  # "t_hash" instead of "transcript_hash"
         
-        # Create zip in memory
-        zip_buffer = BytesIO()
+        # Project integrity manifest: root + this record's group (checkable with an inclusion proof)
+        if transcript.project_id is not None:
+            project_root = merkle.get_root(db, transcript.project_id)
+            if project_root:
+                integrity_hashes["project_root"] = project_root
+                integrity_hashes["t_node"] = merkle.get_node(db, transcript.project_id, f"transcripts/{transcript.id}")
         
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-                # transcript.json (metadata + segments)
-                transcript_data = {
-                    "id": transcript.id,
-                    "title": transcript.title,
-                    "source": transcript.source,
-                    "language": transcript.language,
-                    "duration_seconds": transcript.duration_seconds,
-                    "status": transcript.status,
-                    "created_at": transcript.created_at.isoformat(),
-                    "updated_at": transcript.updated_at.isoformat(),
-                    "segments": [
-                        {
-                            "start_ms": s.start_ms,
-                            "end_ms": s.end_ms,
-                            "speaker_label": s.speaker_label,
-                            "text": s.text,
-                            "confidence": s.confidence,
-                        }
-                        for s in segments
-                    ],
-                }
-                zip_file.writestr("transcript.json", json.dumps(transcript_data, indent=2, ensure_ascii=False))
-                
-                # audio.bin (encrypted) or audio.dec (decrypted)
-                if export_audio_mode == "decrypted":
-                    # Decrypt audio for decrypted export
-                    audio_content = retrieve_file(audio_asset.sha256)
-                    zip_file.writestr("audio.dec", audio_content)
-                else:
-                    # Default: export encrypted blob (read from disk without decrypting)
-                    from app.modules.projects.file_storage import _ensure_storage_dir
-                    storage_dir = _ensure_storage_dir()
-                    storage_path = storage_dir / f"{audio_asset.sha256}.bin"
-                    if not storage_path.exists():
-                        raise ValueError(f"Audio file not found: {audio_asset.sha256}")
-                    encrypted_content = storage_path.read_bytes()
-                    zip_file.writestr("audio.bin", encrypted_content)
-                
-                # audit.json (process log without content)
-                audit_data = [
-                    {
-                        "id": e.id,
-                        "action": e.action,
-                        "actor": e.actor,
-                        "created_at": e.created_at.isoformat(),
-                        "metadata": e.metadata_json,  # Already sanitized
-                    }
-                    for e in audit_events
-                ]
-                zip_file.writestr("audit.json", json.dumps(audit_data, indent=2, ensure_ascii=False))
-                
-                # manifest.json (package metadata)
-                manifest = {
-                    "package_id": package_id,
-                    "created_at": created_at.isoformat(),
-                    "audio_mode": export_audio_mode,
-                    "counts": {
-                        "segments": len(segments),
-                        "audit_events": len(audit_events),
-                    },
-                    "integrity_hashes": integrity_hashes,
+        # Serialize small entries while the session is open; audio is streamed below
+        transcript_data = {
+            "id": transcript.id,
+            "title": transcript.title,
+            "source": transcript.source,
+            "language": transcript.language,
+            "duration_seconds": transcript.duration_seconds,
+            "status": transcript.status,
+            "created_at": transcript.created_at.isoformat(),
+            "updated_at": transcript.updated_at.isoformat(),
+            "segments": [
+                {
+                    "start_ms": s.start_ms,
+                    "end_ms": s.end_ms,
+                    "speaker_label": s.speaker_label,
+                    "text": s.text,
+                    "confidence": s.confidence,
                 }
-                zip_file.writestr("manifest.json", json.dumps(manifest, indent=2, ensure_ascii=False))
-        
-        # Get zip bytes
-        zip_buffer.seek(0)
-        zip_bytes = zip_buffer.read()
-        
-        # Save ZIP to temporary file on disk (for live_verify compatibility)
-        # Use /app/data directory (mounted volume, accessible from container)
-        data_dir = Path("/app/data")
-        data_dir.mkdir(exist_ok=True)
-        zip_filename = f"export-{package_id}.zip"
-        zip_path = data_dir / zip_filename
-        zip_path.write_bytes(zip_bytes)
+                for s in segments
+            ],
+        }
         
-        # Build response with warnings
-        warnings = []
-        if export_audio_mode == "decrypted":
-            warnings.append("Audio exported as decrypted. Handle with extreme care.")
+        # audit.json (process log without content)
+        audit_data = [
+            {
+                "id": e.id,
+                "action": e.action,
+                "actor": e.actor,
+                "created_at": e.created_at.isoformat(),
+                "metadata": e.metadata_json,  # Already sanitized
+            }
+            for e in audit_events
+        ]
         
-        return {
-            "status": "ok",
+        # manifest.json (package metadata)
+        manifest = {
             "package_id": package_id,
-            "receipt_id": receipt_id,
-            "zip_path": str(zip_path),  # Path to ZIP file on disk
+            "created_at": created_at.isoformat(),
             "audio_mode": export_audio_mode,
-            "warnings": warnings,
+            "counts": {
+                "segments": len(segments),
+                "audit_events": len(audit_events),
+            },
+            "integrity_hashes": integrity_hashes,
         }
+        audio_sha256 = audio_asset.sha256
+    
+    # Write ZIP straight to disk (for live_verify compatibility)
+    zip_path = export_zip_path(package_id)
+    zip_path.parent.mkdir(exist_ok=True)
+    _write_export_zip(
+        zip_path,
+        transcript_data=transcript_data,
+        audit_data=audit_data,
+        manifest=manifest,
+        audio_sha256=audio_sha256,
+        export_audio_mode=export_audio_mode,
+        progress=progress,
+    )
+    return zip_path
+
+
+def export_record_package(
+    transcript_id: int,
+    confirm: bool = False,
+    reason: Optional[str] = None,
+    export_audio_mode: str = "encrypted",
+) -> Dict[str, Any]:
+    """Export record package synchronously (zip with transcript + audio + audit).
+    
+    The API queues exports as background jobs (export_jobs); this builds the
+    package in the calling thread (scripts, tests).
+    
+    Args:
+        transcript_id: Transcript ID
+        confirm: Confirmation required
+        reason: Reason for export
+        export_audio_mode: "encrypted" (default) or "decrypted" (requires extra confirmation)
+        
+    Returns:
+        Dict with status, package_id, receipt_id, zip_path, audio_mode, warnings
+    """
+    validate_export_request(confirm, reason, export_audio_mode)
+    
+    if not _has_db():
+        raise ValueError("Database not available")
+    
+    # Create package
+    package_id = str(uuid4())
+    receipt_id = str(uuid4())
+    created_at = datetime.utcnow()
+    zip_path = build_export_package(
+        transcript_id=transcript_id,
+        package_id=package_id,
+        created_at=created_at,
+        export_audio_mode=export_audio_mode,
+    )
+    
+    # Register package (download lookup + purge by expires_at)
+    size_bytes = zip_path.stat().st_size
+    finished_at = datetime.utcnow()
+    with get_db() as db:
+        db.add(ExportJob(
+            id=package_id,
+            receipt_id=receipt_id,
+            transcript_id=transcript_id,
+            audio_mode=export_audio_mode,
+            status="done",
+            bytes_done=0,
+            bytes_total=0,
+            zip_path=str(zip_path),
+            size_bytes=size_bytes,
+            attempts=1,
+            created_at=created_at,
+            started_at=created_at,
+            finished_at=finished_at,
+            expires_at=export_expires_at(finished_at),
+        ))
+        db.commit()
+    
+    return {
+        "status": "ok",
+        "package_id": package_id,
+        "receipt_id": receipt_id,
+        "zip_path": str(zip_path),  # Path to ZIP file on disk
+        "audio_mode": export_audio_mode,
+        "warnings": export_warnings(export_audio_mode),
+    }
+
+def _destroy_counts(db, transcript_ids: List[int]) -> Dict[str, int]:
+    """Counts of what a destroy removes (count queries, nothing loaded)."""
+    from app.modules.transcripts.models import TranscriptSegment
+    return {
+        "files": db.query(AudioAsset.id).filter(AudioAsset.transcript_id.in_(transcript_ids)).count(),
+        "segments": db.query(TranscriptSegment.id).filter(TranscriptSegment.transcript_id.in_(transcript_ids)).count(),
+        "notes": 0,  # Notes are project-level, not transcript-level
+    }
+
+
+def _validate_destroy_request(confirm: bool, reason: Optional[str]) -> None:
+    """Require confirmation and reason for an actual destroy."""
+    if not confirm:
+        raise ValueError("Destruction requires confirm=true")
+    
+    if not reason:
+        raise ValueError("Destruction requires reason")
 
 
 def destroy_record(
@@ -432,7 +769,7 @@ def destroy_record(
     confirm: bool = False,
     reason: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Destroy record (audio + transcript + related artifacts) - atomic two-phase.
+    """Destroy record (audio + transcript + related artifacts) - two-phase (see destroy.py).
     
     Args:
         transcript_id: Transcript ID
@@ -447,9 +784,8 @@ def destroy_record(
         raise ValueError("Database not available")
     
     with get_db() as db:
-        # Get transcript
-        transcript = db.query(Transcript).filter(Transcript.id == transcript_id).first()
-        if not transcript:
+        exists = db.query(Transcript.id).filter(Transcript.id == transcript_id).first() is not None
+        if not exists:
             # Idempotent: if transcript already deleted, return success
             if not dry_run:
                 return {
@@ -461,69 +797,93 @@ def destroy_record(
                 }
             raise ValueError(f"Transcript {transcript_id} not found")
         
-        # Get audio assets
-        audio_assets = db.query(AudioAsset).filter(AudioAsset.transcript_id == transcript_id).all()
-        from app.modules.transcripts.models import TranscriptSegment
-        segments = db.query(TranscriptSegment).filter(
-            TranscriptSegment.transcript_id == transcript_id
-        ).all()
-        
-        counts = {
-            "files": len(audio_assets),
-            "segments": len(segments),
-            "notes": 0,  # Notes are project-level, not transcript-level
+        counts = _destroy_counts(db, [transcript_id])
+    
+    if dry_run:
+        return {
+            "status": "dry_run",
+            "would_delete": counts,
+            "transcript_id": transcript_id,
+            "destroy_status": "none",
         }
+    
+    _validate_destroy_request(confirm, reason)
+    
+    receipt_id = str(uuid4())
+    destroyed_at = datetime.utcnow()
+    
+    try:
+        destroy.destroy_transcripts([transcript_id])
+    except Exception as e:
+        # Assets stay "pending" - a retry or the startup resumer finishes the destroy
+        error_type = type(e).__name__
+        raise ValueError(f"Destruction failed (status: pending, can be resumed): {error_type}")
+    
+    return {
+        "status": "destroyed",
+        "receipt_id": receipt_id,
+        "destroyed_at": destroyed_at.isoformat(),
+        "counts": counts,
+        "destroy_status": "destroyed",
+    }
+
+
+def destroy_project_records(
+    project_id: int,
+    transcript_ids: Optional[List[int]] = None,
+    dry_run: bool = True,
+    confirm: bool = False,
+    reason: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Destroy many records of a project in one job (batched two-phase destroy).
+    
+    Args:
+        project_id: Project ID
+        transcript_ids: Records to destroy (default: all records in the project;
+            ids outside the project are ignored)
+        dry_run: If True, only return what would be deleted
+        confirm: Confirmation required (if dry_run=False)
+        reason: Reason for destruction (validated, not stored)
         
-        # Check if already pending or destroyed
-        pending_assets = [a for a in audio_assets if a.destroy_status == "pending"]
-        destroyed_assets = [a for a in audio_assets if a.destroy_status == "destroyed"]
-        
-        if dry_run:
-            return {
-                "status": "dry_run",
-                "would_delete": counts,
-                "transcript_id": transcript_id,
-                "destroy_status": "none",
-            }
-        
-        # Require confirmation
-        if not confirm:
-            raise ValueError("Destruction requires confirm=true")
-        
-        if not reason:
-            raise ValueError("Destruction requires reason")
-        
-        receipt_id = str(uuid4())
-        destroyed_at = datetime.utcnow()
+    Returns:
+        Dict with status, receipt_id, destroyed_at, counts (records, files, segments, notes), destroy_status
+    """
+    if not _has_db():
+        raise ValueError("Database not available")
+    
+    with get_db() as db:
+        if db.query(Project.id).filter(Project.id == project_id).first() is None:
+            raise ValueError(f"Project {project_id} not found")
         
-        # Perform deletions in single transaction
-        try:
-            # Collect sha256 values BEFORE any deletions (need them for file deletion)
-            sha256_values = [a.sha256 for a in audio_assets if a.destroy_status != "destroyed"]
-            
-            # Delete audio files from disk (do this before DB deletions)
-            for sha256 in sha256_values:
-                try:
-                    delete_file(sha256)
-                except Exception:
-                    pass  # Best effort - file may already be deleted
-            
-            # Delete transcript (CASCADE will automatically delete segments, audit events, and audio assets)
-            db.delete(transcript)
-            
-            db.commit()
-            
-            return {
-                "status": "destroyed",
-                "receipt_id": receipt_id,
-                "destroyed_at": destroyed_at.isoformat(),
-                "counts": counts,
-                "destroy_status": "destroyed",
-            }
-        except Exception as e:
-            # On error, status remains "pending" - can be resumed
-            db.rollback()
-            error_type = type(e).__name__
-            # Re-raise with error type for better debugging
-            raise ValueError(f"Destruction failed (status: pending, can be resumed): {error_type}")
-
+        query = db.query(Transcript.id).filter(Transcript.project_id == project_id)
+        if transcript_ids is not None:
+            query = query.filter(Transcript.id.in_(transcript_ids))
+        ids = [row.id for row in query.order_by(Transcript.id)]
+        counts = {"records": len(ids), **_destroy_counts(db, ids)}
+    
+    if dry_run:
+        return {
+            "status": "dry_run",
+            "would_delete": counts,
+            "project_id": project_id,
+            "destroy_status": "none",
+        }
+    
+    _validate_destroy_request(confirm, reason)
+    
+    receipt_id = str(uuid4())
+    destroyed_at = datetime.utcnow()
+    
+    try:
+        destroy.destroy_transcripts(ids)
+    except Exception as e:
+        error_type = type(e).__name__
+        raise ValueError(f"Destruction failed (status: pending, can be resumed): {error_type}")
+    
+    return {
+        "status": "destroyed",
+        "receipt_id": receipt_id,
+        "destroyed_at": destroyed_at.isoformat(),
+        "counts": counts,
+        "destroy_status": "destroyed",
+    }
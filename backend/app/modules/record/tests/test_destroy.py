@@ -0,0 +1,106 @@
+"""Tests for two-phase record destroy (pending marker, resume, project bulk destroy)."""
+import os
+from datetime import date, datetime
+
+import pytest
+
+from app.core import database
+from app.core.config import settings
+from app.modules.projects import blob_store, file_storage
+from app.modules.projects.models import Project, StorageBlob
+from app.modules.record import destroy, service
+from app.modules.record.models import AudioAsset, ExportJob
+from app.modules.transcripts.models import Transcript, TranscriptSegment
+
+SHARED = b"RIFF" + os.urandom(4096)
+
+
+@pytest.fixture
+def db(sqlite_db, blob_storage, monkeypatch, tmp_path):
+    """SQLite database + temp storage, project 1 with 4 records, project 2 with 1.
+
+    Records 3 and 4 (project 1) and record 5 (project 2) share one blob;
+    record 1 has an export ZIP.
+    """
+    monkeypatch.setattr(settings, "destroy_batch_size", 2)
+
+    now = datetime.utcnow()
+    with database.get_db() as session:
+        projects = []
+        for name in ("a", "b"):
+            project = Project(name=name, sensitivity="standard", status="active", start_date=date.today(), created_at=now, updated_at=now)
+            session.add(project)
+            session.flush()
+            projects.append(project.id)
+        for i in range(5):
+            transcript = Transcript(title="t", source="interview", language="sv", status="ready", project_id=projects[i // 4], created_at=now, updated_at=now)
+            session.add(transcript)
+            session.flush()
+            session.add(TranscriptSegment(transcript_id=transcript.id, start_ms=0, end_ms=1, speaker_label="SPEAKER_1", text="x", created_at=now))
+            content = SHARED if i >= 2 else b"RIFF" + os.urandom(1024)
+            sha256 = file_storage.compute_file_hash(content)
+            blob_store.acquire(session, sha256, len(content))
+            file_storage.store_file(content, sha256)
+            session.add(AudioAsset(
+                project_id=projects[i // 4], transcript_id=transcript.id, sha256=sha256, mime_type="audio/wav",
+                size_bytes=len(content), storage_path=file_storage.relative_blob_path(sha256), destroy_status="none", created_at=now,
+            ))
+        zip_path = tmp_path / "export-1.zip"
+        zip_path.write_bytes(b"PK" + os.urandom(64))
+        session.add(ExportJob(
+            id="pkg-1", receipt_id="r", transcript_id=1, audio_mode="decrypted", status="done",
+            zip_path=str(zip_path), created_at=now,
+        ))
+        session.commit()
+    return tmp_path
+
+
+def _count(model) -> int:
+    with database.get_db() as session:
+        return session.query(model).count()
+
+
+class TestDestroy:
+    """Test pending marker, crash recovery and bulk destroy."""
+
+    def test_interrupted_destroy_is_resumed(self, db, monkeypatch):
+        """Test crash after phase 1 leaves assets pending (not served), resume finishes it."""
+        real_delete = destroy.delete_records
+
+        def _crash(session, transcript_ids):
+            raise RuntimeError("connection lost")
+
+        monkeypatch.setattr(destroy, "delete_records", _crash)
+        with pytest.raises(ValueError, match="pending"):
+            service.destroy_record(1, dry_run=False, confirm=True, reason="källskydd")
+        with database.get_db() as session:
+            assert session.query(AudioAsset).filter(AudioAsset.destroy_status == "pending").count() == 1
+        assert service.get_audio_asset(1) is None
+        assert _count(Transcript) == 5
+
+        monkeypatch.setattr(destroy, "delete_records", real_delete)
+        result = destroy.resume_pending()
+        assert (result["transcripts"], result["files_deleted"], result["exports_deleted"]) == (1, 1, 1)
+        assert _count(Transcript) == 4
+        assert not (db / "export-1.zip").exists()
+
+    def test_project_bulk_destroy(self, db):
+        """Test one call destroys a project's records in batches; shared blob survives."""
+        dry = service.destroy_project_records(1)
+        assert dry["would_delete"] == {"records": 4, "files": 4, "segments": 4, "notes": 0}
+        assert _count(Transcript) == 5
+
+        with pytest.raises(ValueError):
+            service.destroy_project_records(1, dry_run=False, confirm=True)
+
+        result = service.destroy_project_records(1, dry_run=False, confirm=True, reason="projekt avslutat")
+        assert result["status"] == "destroyed"
+        assert _count(Transcript) == 1
+        assert _count(TranscriptSegment) == 1
+        assert _count(ExportJob) == 0
+
+        # Record 5 (project 2) still holds the shared blob
+        with database.get_db() as session:
+            assert [blob.ref_count for blob in session.query(StorageBlob)] == [1]
+        assert len(list(file_storage.iter_blob_paths())) == 1
+        assert file_storage.retrieve_file(file_storage.compute_file_hash(SHARED)) == SHARED
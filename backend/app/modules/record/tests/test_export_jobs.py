@@ -0,0 +1,125 @@
+"""Tests for background export jobs (state transitions, resume after restart)."""
+import os
+import zipfile
+from datetime import date, datetime
+
+import pytest
+
+from app.core import database
+from app.core.config import settings
+from app.modules.projects import file_storage
+from app.modules.projects.models import Project
+from app.modules.record import export_jobs, service
+from app.modules.record.models import AudioAsset, ExportJob
+from app.modules.transcripts.models import Transcript
+
+AUDIO = b"RIFF" + os.urandom(3 * 1024 * 1024)
+
+
+@pytest.fixture
+def db(sqlite_db, blob_storage, monkeypatch, tmp_path):
+    """SQLite database + temp storage/export dirs, one transcript with audio."""
+    monkeypatch.setattr(service, "export_zip_path", lambda package_id: tmp_path / f"export-{package_id}.zip")
+
+    submitted = []
+    monkeypatch.setattr(export_jobs, "submit", submitted.append)  # Run jobs inline in tests
+
+    sha256 = file_storage.compute_file_hash(AUDIO)
+    file_storage.store_file(AUDIO, sha256)
+    now = datetime.utcnow()
+    with database.get_db() as session:
+        project = Project(name="p", sensitivity="standard", status="active", start_date=date.today(), created_at=now, updated_at=now)
+        session.add(project)
+        session.flush()
+        transcript = Transcript(title="t", source="interview", language="sv", status="ready", project_id=project.id, created_at=now, updated_at=now)
+        session.add(transcript)
+        session.flush()
+        session.add(AudioAsset(
+            project_id=project.id, transcript_id=transcript.id, sha256=sha256, mime_type="audio/wav",
+            size_bytes=len(AUDIO), storage_path=f"{sha256}.bin", destroy_status="none", created_at=now,
+        ))
+        session.commit()
+    return submitted
+
+
+def _status(package_id: str) -> str:
+    return export_jobs.get_job(package_id)["status"]
+
+
+class TestExportJobs:
+    """Test export job lifecycle."""
+
+    def test_queued_then_done(self, db):
+        """Test job is persisted as queued and the worker builds the ZIP."""
+        job = export_jobs.create_job(1, confirm=True, reason="granskning", export_audio_mode="decrypted")
+        assert job["status"] == "queued"
+        assert db == [job["package_id"]]
+
+        export_jobs.run_job(job["package_id"])
+
+        done = export_jobs.get_job(job["package_id"])
+        assert done["status"] == "done"
+        assert done["progress"]["percent"] == 100.0
+        assert done["size_bytes"] == os.path.getsize(done["zip_path"])
+        assert done["expires_at"] > done["finished_at"]
+        with zipfile.ZipFile(done["zip_path"]) as zf:
+            assert zf.getinfo("audio.dec").compress_type == zipfile.ZIP_STORED
+            assert zf.read("audio.dec") == AUDIO
+
+    def test_validation(self, db):
+        """Test reason/confirm are required before a job is created."""
+        with pytest.raises(ValueError):
+            export_jobs.create_job(1, confirm=False, reason="x")
+        with pytest.raises(ValueError):
+            export_jobs.create_job(999, confirm=True, reason="x")
+        with database.get_db() as session:
+            assert session.query(ExportJob).count() == 0
+
+    def test_failure_records_error_type(self, db, monkeypatch):
+        """Test failed build marks job failed with exception class only."""
+        job = export_jobs.create_job(1, confirm=True, reason="granskning")
+
+        def _fail(**kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(service, "build_export_package", _fail)
+        export_jobs.run_job(job["package_id"])
+
+        failed = export_jobs.get_job(job["package_id"])
+        assert failed["status"] == "failed"
+        assert failed["error_type"] == "OSError"
+
+    def test_interrupted_job_is_requeued(self, db, monkeypatch):
+        """Test shutdown mid-build leaves job queued, and start() resumes it."""
+        job = export_jobs.create_job(1, confirm=True, reason="granskning")
+        monkeypatch.setattr(export_jobs, "_ensure_started", lambda: None)
+        export_jobs._stopping.set()
+        try:
+            export_jobs.run_job(job["package_id"])
+        finally:
+            export_jobs._stopping.clear()
+        assert _status(job["package_id"]) == "queued"
+        tmp_path = service.export_tmp_path(service.export_zip_path(job["package_id"]))
+        assert not tmp_path.exists()  # Shredded when the build was interrupted
+
+        # Simulate a crash while running: start() shreds the temp ZIP and re-queues it
+        with database.get_db() as session:
+            session.query(ExportJob).update({"status": "running"})
+            session.commit()
+        tmp_path.write_bytes(b"PK partial")
+        db.clear()
+        assert export_jobs.start() == 1
+        assert db == [job["package_id"]] and not tmp_path.exists()
+        export_jobs.run_job(job["package_id"])
+        assert _status(job["package_id"]) == "done"
+
+    def test_max_attempts(self, db, monkeypatch):
+        """Test job that keeps crashing is marked failed on start()."""
+        job = export_jobs.create_job(1, confirm=True, reason="granskning")
+        monkeypatch.setattr(export_jobs, "_ensure_started", lambda: None)
+        with database.get_db() as session:
+            session.query(ExportJob).update({"status": "running", "attempts": settings.export_max_attempts})
+            session.commit()
+
+        assert export_jobs.start() == 0
+        assert _status(job["package_id"]) == "failed"
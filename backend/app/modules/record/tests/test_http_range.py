@@ -0,0 +1,38 @@
+"""Tests for HTTP Range header parsing."""
+import pytest
+
+from app.modules.record.http_range import RangeNotSatisfiable, content_range, parse_range
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        ("bytes=0-99", (0, 100)),
+        ("bytes=100-", (100, 1000)),
+        ("bytes=-10", (990, 1000)),
+        ("bytes=-5000", (0, 1000)),
+        ("bytes=900-5000", (900, 1000)),
+        ("BYTES = 5-5", (5, 6)),
+    ],
+)
+def test_parse_single_range(header, expected):
+    assert parse_range(header, 1000) == expected
+
+
+@pytest.mark.parametrize(
+    "header",
+    [None, "", "items=0-1", "bytes=0-1,5-6", "bytes=a-b", "bytes=5-1", "bytes=-", "bytes=5"],
+)
+def test_unsupported_or_malformed_serves_full_body(header):
+    assert parse_range(header, 1000) is None
+
+
+@pytest.mark.parametrize("header,size", [("bytes=1000-", 1000), ("bytes=-0", 1000), ("bytes=0-", 0)])
+def test_unsatisfiable(header, size):
+    with pytest.raises(RangeNotSatisfiable) as exc:
+        parse_range(header, size)
+    assert exc.value.size == size
+
+
+def test_content_range():
+    assert content_range(0, 100, 1000) == "bytes 0-99/1000"
@@ -0,0 +1,120 @@
+"""Tests for batched, resumable retention purge."""
+import os
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.core import database
+from app.core.config import settings
+from app.modules.projects import blob_store, file_storage
+from app.modules.projects.models import Project, StorageBlob
+from app.modules.record import purge
+from app.modules.record.models import AudioAsset, ExportJob
+from app.modules.transcripts.models import Transcript, TranscriptSegment
+
+SHARED = b"RIFF" + os.urandom(4096)
+
+
+@pytest.fixture
+def db(sqlite_db, blob_storage, monkeypatch, tmp_path):
+    """SQLite database + temp storage, 5 expired transcripts and 1 fresh one.
+
+    Expired transcripts 1-5 have their own audio; transcript 5 and the fresh
+    transcript share one blob.
+    """
+    monkeypatch.setattr(settings, "recorder_purge_checkpoint_path", str(tmp_path / "purge-checkpoint.json"))
+
+    now = datetime.utcnow()
+    old = now - timedelta(days=60)
+    with database.get_db() as session:
+        project = Project(name="p", sensitivity="standard", status="active", start_date=date.today(), created_at=now, updated_at=now)
+        session.add(project)
+        session.flush()
+        for i in range(6):
+            created = now if i == 5 else old
+            transcript = Transcript(title="t", source="interview", language="sv", status="ready", project_id=project.id, created_at=created, updated_at=created)
+            session.add(transcript)
+            session.flush()
+            session.add(TranscriptSegment(transcript_id=transcript.id, start_ms=0, end_ms=1, speaker_label="SPEAKER_1", text="x", created_at=now))
+            content = SHARED if i >= 4 else b"RIFF" + os.urandom(1024)
+            sha256 = file_storage.compute_file_hash(content)
+            blob_store.acquire(session, sha256, len(content))
+            file_storage.store_file(content, sha256)
+            session.add(AudioAsset(
+                project_id=project.id, transcript_id=transcript.id, sha256=sha256, mime_type="audio/wav",
+                size_bytes=len(content), storage_path=file_storage.relative_blob_path(sha256), destroy_status="none", created_at=now,
+            ))
+        session.commit()
+    return tmp_path
+
+
+def _count(model) -> int:
+    with database.get_db() as session:
+        return session.query(model).count()
+
+
+class TestPurge:
+    """Test batches, shared blobs and resume after interruption."""
+
+    def test_dry_run_changes_nothing(self, db):
+        """Test dry run counts candidates without deleting or checkpointing."""
+        stats = purge.purge_expired_records(dry_run=True, retention_days=14, batch_size=2)
+        assert (stats["purged_count"], stats["files_deleted"], stats["batches"]) == (5, 5, 3)
+        assert _count(Transcript) == 6
+        assert not (db / "purge-checkpoint.json").exists()
+
+    def test_resume_after_interruption(self, db, monkeypatch):
+        """Test interrupted run resumes after the last checkpointed batch."""
+        real_batch = purge._purge_batch
+        calls = []
+
+        def _interrupt_second(ids, dry_run, stats):
+            calls.append(ids)
+            if len(calls) == 2:
+                raise KeyboardInterrupt
+            real_batch(ids, dry_run, stats)
+
+        monkeypatch.setattr(purge, "_purge_batch", _interrupt_second)
+        with pytest.raises(KeyboardInterrupt):
+            purge.purge_expired_records(dry_run=False, retention_days=14, batch_size=2)
+        assert _count(Transcript) == 4
+        assert (db / "purge-checkpoint.json").exists()
+
+        monkeypatch.setattr(purge, "_purge_batch", real_batch)
+        stats = purge.purge_expired_records(dry_run=False, retention_days=14, batch_size=2)
+        assert stats["resumed"] is True
+        assert (stats["purged_count"], stats["files_deleted"], stats["errors"]) == (5, 4, 0)
+        assert not (db / "purge-checkpoint.json").exists()
+
+        # Fresh transcript and its (shared) blob survive
+        assert _count(Transcript) == 1
+        assert _count(TranscriptSegment) == 1
+        assert _count(AudioAsset) == 1
+        with database.get_db() as session:
+            assert [blob.ref_count for blob in session.query(StorageBlob)] == [1]
+        assert len(list(file_storage.iter_blob_paths())) == 1
+
+    def test_expired_exports_by_registry(self, db):
+        """Test export packages are purged by expires_at, live ones are kept."""
+        now = datetime.utcnow()
+        paths = {}
+        with database.get_db() as session:
+            fresh_id = session.query(Transcript.id).filter(Transcript.created_at > now - timedelta(days=1)).scalar()
+            for name, expires_at in [("expired", now - timedelta(hours=1)), ("live", now + timedelta(days=1))]:
+                paths[name] = db / f"export-{name}.zip"
+                paths[name].write_bytes(b"PK" + os.urandom(64))
+                session.add(ExportJob(
+                    id=name, receipt_id=name, transcript_id=fresh_id, audio_mode="encrypted", status="done",
+                    zip_path=str(paths[name]), size_bytes=66, created_at=now, finished_at=now, expires_at=expires_at,
+                ))
+            session.commit()
+
+        assert purge.purge_expired_records(dry_run=True, retention_days=14)["exports_deleted"] == 1
+        assert paths["expired"].exists()
+
+        stats = purge.purge_expired_records(dry_run=False, retention_days=14)
+        assert stats["exports_deleted"] == 1
+        assert not paths["expired"].exists()
+        assert paths["live"].exists()
+        with database.get_db() as session:
+            assert [job.id for job in session.query(ExportJob)] == ["live"]
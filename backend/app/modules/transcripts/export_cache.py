@@ -0,0 +1,198 @@
+"""Export artifact cache - rendered SRT/VTT/quotes keyed by transcript version.
+
+Artifacts contain transcript text, so they are held in process memory only
+(never written to disk). Entries are keyed by (transcript_id, version, format)
+where version is the transcript's updated_at, and are dropped when:
+- segments are upserted or the transcript is deleted/destroyed/purged
+- they are older than TEMP_FILE_TTL_HOURS
+- the cache exceeds its entry/byte budget (LRU eviction)
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from app.core.config import settings
+
+
+# Cache budget (artifacts are text, typically a few KB - 1MB each)
+_MAX_ENTRIES = 256
+_MAX_BYTES = 32 * 1024 * 1024  # 32MB
+
+_CacheKey = Tuple[int, str, str]  # (transcript_id, version, format)
+
+
+@dataclass(frozen=True)
+class ExportArtifact:
+    """Rendered export payload with its strong ETag."""
+
+    payload: Dict[str, Any]
+    etag: str
+    size_bytes: int
+    created_at: float
+
+
+_lock = threading.Lock()
+_entries: "OrderedDict[_CacheKey, ExportArtifact]" = OrderedDict()
+_total_bytes = 0
+
+
+def _ttl_seconds() -> float:
+    """Cache TTL (never longer than temp file TTL)."""
+    return settings.temp_file_ttl_hours * 3600
+
+
+def compute_etag(transcript_id: int, format: str, payload: Dict[str, Any]) -> str:
+    """Compute strong ETag from rendered payload.
+
+    Args:
+        transcript_id: Transcript ID
+        format: Export format
+        payload: Rendered payload
+
+    Returns:
+        Quoted ETag value
+    """
+    digest = hashlib.sha256(
+        json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+    return f'"t{transcript_id}-{format}-{digest[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check If-None-Match header against ETag (weak comparison, RFC 9110).
+
+    Args:
+        if_none_match: Raw If-None-Match header value
+        etag: Current ETag
+
+    Returns:
+        True if client copy is current
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    current = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == current:
+            return True
+    return False
+
+
+def get(transcript_id: int, version: str, format: str) -> Optional[ExportArtifact]:
+    """Get cached artifact (None on miss or expiry).
+
+    Args:
+        transcript_id: Transcript ID
+        version: Transcript version (updated_at)
+        format: Export format
+
+    Returns:
+        Cached artifact or None
+    """
+    key = (transcript_id, version, format)
+    with _lock:
+        artifact = _entries.get(key)
+        if artifact is None:
+            return None
+        if time.monotonic() - artifact.created_at > _ttl_seconds():
+            _remove(key)
+            return None
+        _entries.move_to_end(key)
+        return artifact
+
+
+def put(transcript_id: int, version: str, format: str, payload: Dict[str, Any]) -> ExportArtifact:
+    """Store rendered artifact.
+
+    Older versions of the same transcript are dropped (only current version is useful).
+
+    Args:
+        transcript_id: Transcript ID
+        version: Transcript version (updated_at)
+        format: Export format
+        payload: Rendered payload
+
+    Returns:
+        Cached artifact (with ETag)
+    """
+    global _total_bytes
+
+    etag = compute_etag(transcript_id, format, payload)
+    size_bytes = len(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+    artifact = ExportArtifact(
+        payload=payload,
+        etag=etag,
+        size_bytes=size_bytes,
+        created_at=time.monotonic(),
+    )
+
+    if size_bytes > _MAX_BYTES:
+        return artifact  # Too large to cache - serve uncached
+
+    key = (transcript_id, version, format)
+    with _lock:
+        stale = [k for k in _entries if k[0] == transcript_id and k[1] != version]
+        for k in stale:
+            _remove(k)
+        if key in _entries:
+            _remove(key)
+        _entries[key] = artifact
+        _total_bytes += size_bytes
+        while _entries and (len(_entries) > _MAX_ENTRIES or _total_bytes > _MAX_BYTES):
+            oldest = next(iter(_entries))
+            _remove(oldest)
+
+    return artifact
+
+
+def invalidate(transcript_id: int) -> None:
+    """Drop all cached artifacts for a transcript.
+
+    Args:
+        transcript_id: Transcript ID
+    """
+    invalidate_many([transcript_id])
+
+
+def invalidate_many(transcript_ids: Iterable[int]) -> None:
+    """Drop all cached artifacts for several transcripts.
+
+    Args:
+        transcript_ids: Transcript IDs
+    """
+    ids = set(transcript_ids)
+    if not ids:
+        return
+    with _lock:
+        for key in [k for k in _entries if k[0] in ids]:
+            _remove(key)
+
+
+def clear() -> None:
+    """Drop all cached artifacts."""
+    global _total_bytes
+    with _lock:
+        _entries.clear()
+        _total_bytes = 0
+
+
+def stats() -> Dict[str, int]:
+    """Cache statistics (counts only, no content)."""
+    with _lock:
+        return {"entries": len(_entries), "bytes": _total_bytes}
+
+
+def _remove(key: _CacheKey) -> None:
+    """Remove entry (caller holds lock)."""
+    global _total_bytes
+    artifact = _entries.pop(key, None)
+    if artifact is not None:
+        _total_bytes -= artifact.size_bytes
@@ -0,0 +1,373 @@
+"""In-memory transcript store for no-DB mode (demos, edge devices).
+
+Compact slotted records with indexes maintained on write:
+- secondary indexes on status, language and source
+- created_at ordering (sorted list, bisect on insert)
+- lowercase token index over title, speaker labels and segment text for `q`,
+  plus a trigram -> token map for partial words
+- bounded ring buffer for audit events (NO content, only metadata)
+
+Search semantics match DB mode (case-insensitive substring): the token index
+narrows candidates, then the pre-lowercased text is checked.
+"""
+import re
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+# Max audit events kept in memory (oldest dropped first)
+AUDIT_CAPACITY = 10_000
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Gram length of the partial-word index (shorter partial words don't narrow)
+_GRAM = 3
+
+
+@dataclass(slots=True)
+class MemoryTranscript:
+    """Transcript record."""
+
+    id: int
+    title: str
+    source: str
+    language: str
+    duration_seconds: Optional[int]
+    status: str
+    created_at: datetime
+    updated_at: datetime
+    title_lower: str
+
+
+@dataclass(slots=True)
+class MemorySegment:
+    """Transcript segment record."""
+
+    id: int
+    transcript_id: int
+    start_ms: int
+    end_ms: int
+    speaker_label: str
+    text: str
+    confidence: Optional[float]
+    created_at: datetime
+    search_lower: str  # "speaker_label\ntext", lowercased once on write
+
+
+@dataclass(slots=True)
+class MemoryAuditEvent:
+    """Audit event record - NO CONTENT, only metadata."""
+
+    id: int
+    transcript_id: int
+    action: str
+    actor: str
+    created_at: datetime
+    metadata_json: Optional[Dict[str, Any]]
+
+
+class MemoryTranscriptStore:
+    """Indexed in-memory transcript store (single process, not thread-safe across writers)."""
+
+    def __init__(self, audit_capacity: int = AUDIT_CAPACITY) -> None:
+        self.transcripts: Dict[int, MemoryTranscript] = {}
+        self.segments: Dict[int, List[MemorySegment]] = {}
+        self.audit: Deque[MemoryAuditEvent] = deque(maxlen=audit_capacity)
+        self._next_id = 1
+        self._next_audit_id = 1
+        self._by_status: Dict[str, Set[int]] = {}
+        self._by_language: Dict[str, Set[int]] = {}
+        self._by_source: Dict[str, Set[int]] = {}
+        self._order: List[Tuple[datetime, int]] = []  # (created_at, id) ascending
+        self._tokens: Dict[str, Set[int]] = {}  # token -> transcript ids
+        self._tokens_of: Dict[int, Set[str]] = {}  # transcript id -> tokens
+        self._grams: Dict[str, Set[str]] = {}  # trigram -> tokens containing it
+
+    def __len__(self) -> int:
+        return len(self.transcripts)
+
+    def next_id(self) -> int:
+        """Allocate next transcript ID."""
+        transcript_id = self._next_id
+        self._next_id += 1
+        return transcript_id
+
+    def get(self, transcript_id: int) -> Optional[MemoryTranscript]:
+        """Get transcript by ID."""
+        return self.transcripts.get(transcript_id)
+
+    def add(
+        self,
+        title: str,
+        source: str,
+        language: str,
+        duration_seconds: Optional[int],
+        status: str,
+        created_at: datetime,
+    ) -> MemoryTranscript:
+        """Insert a transcript and index it.
+
+        Returns:
+            Created record
+        """
+        transcript = MemoryTranscript(
+            id=self.next_id(),
+            title=title,
+            source=source,
+            language=language,
+            duration_seconds=duration_seconds,
+            status=status,
+            created_at=created_at,
+            updated_at=created_at,
+            title_lower=title.lower(),
+        )
+        self.transcripts[transcript.id] = transcript
+        self.segments[transcript.id] = []
+        _index_add(self._by_status, status, transcript.id)
+        _index_add(self._by_language, language, transcript.id)
+        _index_add(self._by_source, source, transcript.id)
+        insort(self._order, (created_at, transcript.id))
+        self._reindex_tokens(transcript.id)
+        return transcript
+
+    def set_status(self, transcript_id: int, status: str, updated_at: datetime) -> None:
+        """Update status (keeps status index in sync)."""
+        transcript = self.transcripts[transcript_id]
+        if transcript.status != status:
+            _index_remove(self._by_status, transcript.status, transcript_id)
+            _index_add(self._by_status, status, transcript_id)
+            transcript.status = status
+        transcript.updated_at = updated_at
+
+    def replace_segments(
+        self,
+        transcript_id: int,
+        segments: Iterable[Dict[str, Any]],
+        created_at: datetime,
+    ) -> List[MemorySegment]:
+        """Replace all segments of a transcript (input sorted by start_ms).
+
+        Returns:
+            Stored segment records
+        """
+        records = [
+            MemorySegment(
+                id=idx,
+                transcript_id=transcript_id,
+                start_ms=seg["start_ms"],
+                end_ms=seg["end_ms"],
+                speaker_label=seg["speaker_label"],
+                text=seg["text"],
+                confidence=seg.get("confidence"),
+                created_at=seg.get("created_at", created_at),
+                search_lower=f"{seg['speaker_label']}\n{seg['text']}".lower(),
+            )
+            for idx, seg in enumerate(segments, start=1)
+        ]
+        self.segments[transcript_id] = records
+        self._reindex_tokens(transcript_id)
+        return records
+
+    def delete(self, transcript_id: int) -> None:
+        """Remove transcript, its segments and index entries (audit is kept)."""
+        transcript = self.transcripts.pop(transcript_id)
+        self.segments.pop(transcript_id, None)
+        _index_remove(self._by_status, transcript.status, transcript_id)
+        _index_remove(self._by_language, transcript.language, transcript_id)
+        _index_remove(self._by_source, transcript.source, transcript_id)
+        pos = bisect_left(self._order, (transcript.created_at, transcript_id))
+        if pos < len(self._order) and self._order[pos] == (transcript.created_at, transcript_id):
+            del self._order[pos]
+        for token in self._tokens_of.pop(transcript_id, ()):
+            self._remove_token(token, transcript_id)
+
+    def record_audit(
+        self,
+        transcript_id: int,
+        action: str,
+        metadata: Optional[Dict[str, Any]],
+        created_at: datetime,
+        actor: str = "system",
+    ) -> MemoryAuditEvent:
+        """Append audit event (metadata must already be sanitized).
+
+        Returns:
+            Stored audit event
+        """
+        event = MemoryAuditEvent(
+            id=self._next_audit_id,
+            transcript_id=transcript_id,
+            action=action,
+            actor=actor,
+            created_at=created_at,
+            metadata_json=metadata,
+        )
+        self._next_audit_id += 1
+        self.audit.append(event)
+        return event
+
+    def search(
+        self,
+        q: Optional[str] = None,
+        status: Optional[str] = None,
+        language: Optional[str] = None,
+        source: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+    ) -> List[MemoryTranscript]:
+        """Filter and search transcripts, newest first.
+
+        Args:
+            q: Case-insensitive substring (title, speaker_label, segment text)
+            status: Filter by status
+            language: Filter by language
+            source: Filter by source
+            date_from: Created at or after
+            date_to: Created at or before
+
+        Returns:
+            Matching records ordered by created_at desc
+        """
+        candidates: Optional[Set[int]] = None
+        for index, value in (
+            (self._by_status, status),
+            (self._by_language, language),
+            (self._by_source, source),
+        ):
+            if value:
+                candidates = _intersect(candidates, index.get(value, set()))
+
+        q_lower = q.lower() if q else None
+        if q_lower:
+            candidates = _intersect(candidates, self._token_candidates(q_lower))
+
+        # Date range on the created_at ordering
+        lo = 0 if date_from is None else bisect_left(self._order, (date_from, 0))
+        hi = len(self._order)
+        if date_to is not None:
+            hi = bisect_right(self._order, (date_to, float("inf")))
+
+        results: List[MemoryTranscript] = []
+        if candidates is not None and len(candidates) * 4 < hi - lo:
+            # Small candidate set - sort it instead of walking the ordering
+            for transcript_id in candidates:
+                transcript = self.transcripts[transcript_id]
+                if date_from is not None and transcript.created_at < date_from:
+                    continue
+                if date_to is not None and transcript.created_at > date_to:
+                    continue
+                results.append(transcript)
+            results.sort(key=lambda t: (t.created_at, t.id), reverse=True)
+        else:
+            for _, transcript_id in reversed(self._order[lo:hi]):
+                if candidates is None or transcript_id in candidates:
+                    results.append(self.transcripts[transcript_id])
+
+        if q_lower:
+            results = [t for t in results if self._matches(t, q_lower)]
+        return results
+
+    def _matches(self, transcript: MemoryTranscript, q_lower: str) -> bool:
+        """Exact substring check on pre-lowercased text."""
+        if q_lower in transcript.title_lower:
+            return True
+        return any(q_lower in seg.search_lower for seg in self.segments.get(transcript.id, ()))
+
+    def _token_candidates(self, q_lower: str) -> Set[int]:
+        """Transcripts whose tokens could contain the query substring.
+
+        A query word with a non-word character on both sides (inside the
+        query) is a whole token - one dict lookup. Words touching an end of
+        the query may be partial and are looked up through the trigram map;
+        partial words shorter than a trigram don't narrow. The result is a
+        superset of the exact matches.
+        """
+        exact: Set[str] = set()
+        partial: Set[str] = set()
+        for match in _TOKEN_RE.finditer(q_lower):
+            if match.start() > 0 and match.end() < len(q_lower):
+                exact.add(match.group())
+            elif len(match.group()) >= _GRAM:
+                partial.add(match.group())
+        if not exact and not partial:
+            return set(self.transcripts)  # Nothing selective - no narrowing
+
+        result: Optional[Set[int]] = None
+        for token in exact:
+            result = _intersect(result, self._tokens.get(token, set()))
+            if not result:
+                return set()
+        for query_token in sorted(partial, key=len, reverse=True):
+            ids: Set[int] = set()
+            for token in self._partial_tokens(query_token):
+                ids |= self._tokens[token]
+            result = _intersect(result, ids)
+            if not result:
+                return set()
+        return result or set()
+
+    def _partial_tokens(self, query_token: str) -> Set[str]:
+        """Indexed tokens containing query_token (at least _GRAM chars long)."""
+        gram_sets = sorted(
+            (self._grams.get(gram, set()) for gram in _grams_of(query_token)),
+            key=len,
+        )
+        tokens: Set[str] = set()
+        if gram_sets[0]:
+            tokens = set.intersection(*gram_sets)
+        return {token for token in tokens if query_token in token}
+
+    def _reindex_tokens(self, transcript_id: int) -> None:
+        """Rebuild token index entries for one transcript."""
+        for token in self._tokens_of.pop(transcript_id, ()):
+            self._remove_token(token, transcript_id)
+        transcript = self.transcripts[transcript_id]
+        tokens = set(_TOKEN_RE.findall(transcript.title_lower))
+        for seg in self.segments.get(transcript_id, ()):
+            tokens.update(_TOKEN_RE.findall(seg.search_lower))
+        for token in tokens:
+            self._add_token(token, transcript_id)
+        self._tokens_of[transcript_id] = tokens
+
+    def _add_token(self, token: str, transcript_id: int) -> None:
+        """Index token for a transcript (new tokens enter the trigram map)."""
+        if token not in self._tokens:
+            for gram in _grams_of(token):
+                self._grams.setdefault(gram, set()).add(token)
+        _index_add(self._tokens, token, transcript_id)
+
+    def _remove_token(self, token: str, transcript_id: int) -> None:
+        """Unindex token for a transcript (unused tokens leave the trigram map)."""
+        _index_remove(self._tokens, token, transcript_id)
+        if token in self._tokens:
+            return
+        for gram in _grams_of(token):
+            tokens = self._grams.get(gram)
+            if tokens is None:
+                continue
+            tokens.discard(token)
+            if not tokens:
+                del self._grams[gram]
+
+
+def _index_add(index: Dict[str, Set[int]], key: str, transcript_id: int) -> None:
+    index.setdefault(key, set()).add(transcript_id)
+
+
+def _index_remove(index: Dict[str, Set[int]], key: str, transcript_id: int) -> None:
+    ids = index.get(key)
+    if ids is None:
+        return
+    ids.discard(transcript_id)
+    if not ids:
+        del index[key]
+
+
+def _intersect(current: Optional[Set[int]], other: Set[int]) -> Set[int]:
+    return set(other) if current is None else current & other
+
+
+def _grams_of(token: str) -> Set[str]:
+    return {token[i:i + _GRAM] for i in range(len(token) - _GRAM + 1)}
@@ -41,6 +41,7 @@ class Transcript(Base):
 
     # Relationships
     segments = relationship("TranscriptSegment", back_populates="transcript", cascade="all, delete-orphan")
+    stats = relationship("TranscriptStats", back_populates="transcript", uselist=False, cascade="all, delete-orphan")
     audit_events = relationship("TranscriptAuditEvent", back_populates="transcript", cascade="all, delete-orphan")
 
 
@@ -67,6 +68,26 @@ class TranscriptSegment(Base):
     )
 
 
+class TranscriptStats(Base):
+    """Transcript statistics projection - maintained on segment writes.
+
+    One row per transcript so listings and checks never scan segments.
+    """
+
+    __tablename__ = "transcript_stats"
+
+    transcript_id = Column(Integer, ForeignKey("transcripts.id", ondelete="CASCADE"), primary_key=True)
+    segments_count = Column(Integer, nullable=False, default=0)
+    total_chars = Column(Integer, nullable=False, default=0)
+    avg_confidence = Column(Float, nullable=True)  # Mean over segments with confidence
+    preview = Column(Text, nullable=False, default="")  # First 240 chars of first 3 segments
+    last_segment_end_ms = Column(Integer, nullable=True)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relationships
+    transcript = relationship("Transcript", back_populates="stats")
+
+
 class TranscriptAuditEvent(Base):
     """Transcript audit event - NO CONTENT, only metadata."""
 
@@ -82,3 +103,10 @@ class TranscriptAuditEvent(Base):
     # Relationships
     transcript = relationship("Transcript", back_populates="audit_events")
 
+    # Indexes for audit trail queries (keyset on created_at)
+    __table_args__ = (
+        Index("idx_transcript_audit_transcript_created", "transcript_id", "created_at"),
+        Index("idx_transcript_audit_action_created", "action", "created_at"),
+        Index("idx_transcript_audit_created", "created_at"),
+    )
+
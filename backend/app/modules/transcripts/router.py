@@ -1,14 +1,20 @@
 """Transcripts router - API endpoints for transcript management."""
 from typing import Optional, List, Dict, Any
-from fastapi import APIRouter, Query, HTTPException, status
+from fastapi import APIRouter, Header, Query, HTTPException, status
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
 
 from app.core.logging import logger
-from app.modules.transcripts import service, export
+from app.modules.audit import pipeline as audit_pipeline
+from app.modules.transcripts import service, export, export_cache
 
 
 router = APIRouter()
 
+# Supported export formats
+_EXPORT_FORMATS = ("srt", "vtt", "quotes")
+
 
 # Request/Response models
 class TranscriptCreate(BaseModel):
@@ -210,12 +216,17 @@ async def upsert_segments(transcript_id: int, data: SegmentsUpsert) -> Dict[str,
 async def export_transcript(
     transcript_id: int,
     format: str = Query(..., description="Export format: srt, vtt, or quotes"),
-) -> Dict[str, Any]:
+    if_none_match: Optional[str] = Header(None),
+) -> Response:
     """Export transcript in specified format.
     
+    Rendered artifacts are cached per transcript version. Responses carry an
+    ETag; a matching If-None-Match returns 304 without a body.
+    
     Args:
         transcript_id: Transcript ID
         format: Export format (srt, vtt, quotes)
+        if_none_match: Optional If-None-Match header
         
     Returns:
         Export data (format-specific)
@@ -230,6 +241,45 @@ async def export_transcript(
         },
     )
     
+    if format not in _EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid format: {format}. Must be srt, vtt, or quotes",
+        )
+    
+    # Version lookup (no segments) - cache key is (id, updated_at, format)
+    meta = service.get_transcript(transcript_id, include_segments=False)
+    if not meta:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Transcript {transcript_id} not found")
+    version = meta["updated_at"]
+    
+    artifact = export_cache.get(transcript_id, version, format)
+    cache_hit = artifact is not None
+    if artifact is None:
+        payload = _render_export(transcript_id, format)
+        artifact = export_cache.put(transcript_id, version, format, payload)
+    
+    if export_cache.etag_matches(if_none_match, artifact.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": artifact.etag})
+    
+    _log_export_audit(transcript_id, format)
+    logger.info(
+        "transcript_export_served",
+        extra={"transcript_id": transcript_id, "format": format, "cache_hit": cache_hit},
+    )
+    return JSONResponse(content=artifact.payload, headers={"ETag": artifact.etag})
+
+
+def _render_export(transcript_id: int, format: str) -> Dict[str, Any]:
+    """Render export payload from current segments.
+    
+    Args:
+        transcript_id: Transcript ID
+        format: Export format (srt, vtt, quotes)
+        
+    Returns:
+        Export payload
+    """
     # Get transcript with segments
     transcript = service.get_transcript(transcript_id, include_segments=True)
     if not transcript:
@@ -250,63 +300,20 @@ async def export_transcript(
         for s in segments
     ]
     
-    # Export based on format
     if format == "srt":
-        content = export.export_srt(segments_for_export)
-        # Audit event
-        _log_export_audit(transcript_id, "srt")
-        return {"format": "srt", "content": content}
-    elif format == "vtt":
-        content = export.export_vtt(segments_for_export)
-        _log_export_audit(transcript_id, "vtt")
-        return {"format": "vtt", "content": content}
-    elif format == "quotes":
-        items = export.export_quotes(segments_for_export)
-        _log_export_audit(transcript_id, "quotes")
-        return {"format": "quotes", "items": items}
-    else:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid format: {format}. Must be srt, vtt, or quotes",
-        )
+        return {"format": "srt", "content": export.export_srt(segments_for_export)}
+    if format == "vtt":
+        return {"format": "vtt", "content": export.export_vtt(segments_for_export)}
+    return {"format": "quotes", "items": export.export_quotes(segments_for_export)}
 
 
 def _log_export_audit(transcript_id: int, format: str) -> None:
-    """Log export audit event (non-blocking)."""
+    """Log export audit event (non-blocking, queued)."""
     try:
-        from datetime import datetime
-        from app.modules.transcripts.service import _has_db
-        
-        if _has_db():
-            from app.core.database import get_db
-            from app.modules.transcripts.models import TranscriptAuditEvent
-            
-            with get_db() as db:
-                # Audit event (sanitized for privacy)
-                audit_metadata = sanitize_for_logging({"format": format}, context="audit")
-                assert_no_content(audit_metadata, context="audit")
-                audit = TranscriptAuditEvent(
-                    transcript_id=transcript_id,
-                    action="exported",
-                    actor="system",
-                    created_at=datetime.utcnow(),
-                    metadata_json=audit_metadata,
-                )
-                db.add(audit)
-                db.commit()
+        if service._has_db():
+            audit_pipeline.emit_transcript_event(transcript_id, "exported", metadata={"format": format})
         else:
-            # Memory store audit (sanitized for privacy)
-            from app.modules.transcripts.service import _MEMORY_AUDIT
-            audit_metadata = sanitize_for_logging({"format": format}, context="audit")
-            assert_no_content(audit_metadata, context="audit")
-            _MEMORY_AUDIT.append({
-                "id": len(_MEMORY_AUDIT) + 1,
-                "transcript_id": transcript_id,
-                "action": "exported",
-                "actor": "system",
-                "created_at": datetime.utcnow(),
-                "metadata_json": audit_metadata,
-            })
+            service.record_memory_audit(transcript_id, "exported", {"format": format})
     except Exception:
         # Non-blocking - don't fail export if audit fails
         pass
@@ -332,7 +339,8 @@ async def delete_transcript(transcript_id: int) -> Dict[str, Any]:
     )
     
     try:
-        result = service.delete_transcript(transcript_id)
+        # Audio blobs may be shredded - off the event loop
+        result = await run_in_threadpool(service.delete_transcript, transcript_id)
         return result
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -1,91 +1,125 @@
 """Transcript service - handles DB and memory fallback."""
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
 from uuid import uuid4
 
-from sqlalchemy import or_, func
+from sqlalchemy import or_
 
 from app.core.config import settings
 from app.core.database import get_db
 from app.core.privacy_guard import sanitize_for_logging, assert_no_content
-from app.modules.transcripts.models import Transcript, TranscriptSegment, TranscriptAuditEvent
+from app.modules.transcripts import export_cache
+from app.modules.transcripts.memory_store import MemoryTranscript, MemoryTranscriptStore
+from app.modules.transcripts.models import Transcript, TranscriptSegment, TranscriptAuditEvent, TranscriptStats
+from app.modules.transcripts.stats import build_preview, resolve_stats, write_stats
 
 
 # Memory store for no-DB mode
-_MEMORY_STORE: Dict[int, Dict[str, Any]] = {}
-_MEMORY_SEGMENTS: Dict[int, List[Dict[str, Any]]] = {}
-_MEMORY_AUDIT: List[Dict[str, Any]] = []
-_NEXT_ID = 1
+_MEMORY = MemoryTranscriptStore()
+_MEMORY_AUDIT = _MEMORY.audit  # Bounded ring buffer
 
 
 def _seed_memory_store() -> None:
     """Seed memory store with sample transcripts for dev."""
-    global _NEXT_ID
-    
-    if _MEMORY_STORE:
+    if len(_MEMORY):
         return  # Already seeded
     
     # Seed transcript 1
-    t1_id = _NEXT_ID
-    _MEMORY_STORE[t1_id] = {
-        "id": t1_id,
-        "title": "Intervju: Kommunalrådet om skolnedläggningen",
-        "source": "interview",
-        "language": "sv",
-        "duration_seconds": 840,
-        "status": "ready",
-        "created_at": datetime.utcnow(),
-        "updated_at": datetime.utcnow(),
-    }
-    _MEMORY_SEGMENTS[t1_id] = [
+    now = datetime.utcnow()
+    t1 = _MEMORY.add(
+        title="Intervju: Kommunalrådet om skolnedläggningen",
+        source="interview",
+        language="sv",
+        duration_seconds=840,
+        status="ready",
+        created_at=now,
+    )
+    _MEMORY.replace_segments(t1.id, [
         {
-            "id": 1,
-            "transcript_id": t1_id,
             "start_ms": 0,
             "end_ms": 3500,
             "speaker_label": "SPEAKER_1",
             "text": "Det är ett tufft beslut, men vi måste se till ekonomin. Vi har inget val.",
             "confidence": 0.95,
-            "created_at": datetime.utcnow(),
         },
         {
-            "id": 2,
-            "transcript_id": t1_id,
             "start_ms": 3500,
             "end_ms": 7200,
             "speaker_label": "SPEAKER_2",
             "text": "Men vad säger föräldrarna? De har rätt att vara oroliga.",
             "confidence": 0.92,
-            "created_at": datetime.utcnow(),
         },
-    ]
-    _NEXT_ID += 1
+    ], created_at=now)
     
     # Seed transcript 2
-    t2_id = _NEXT_ID
-    _MEMORY_STORE[t2_id] = {
-        "id": t2_id,
-        "title": "Presskonferens Polisen",
-        "source": "meeting",
-        "language": "sv",
-        "duration_seconds": 525,
-        "status": "ready",
-        "created_at": datetime.utcnow(),
-        "updated_at": datetime.utcnow(),
-    }
-    _MEMORY_SEGMENTS[t2_id] = [
+    t2 = _MEMORY.add(
+        title="Presskonferens Polisen",
+        source="meeting",
+        language="sv",
+        duration_seconds=525,
+        status="ready",
+        created_at=datetime.utcnow(),
+    )
+    _MEMORY.replace_segments(t2.id, [
         {
-            "id": 3,
-            "transcript_id": t2_id,
             "start_ms": 0,
             "end_ms": 8000,
             "speaker_label": "SPEAKER_1",
             "text": "Vi kan bekräfta att en person är frihetsberövad. Utredningen pågår.",
             "confidence": 0.98,
-            "created_at": datetime.utcnow(),
         },
-    ]
-    _NEXT_ID += 1
+    ], created_at=now)
+
+
+def _memory_transcript_dict(transcript: MemoryTranscript) -> Dict[str, Any]:
+    """Serialize memory transcript record."""
+    return {
+        "id": transcript.id,
+        "title": transcript.title,
+        "source": transcript.source,
+        "language": transcript.language,
+        "duration_seconds": transcript.duration_seconds,
+        "status": transcript.status,
+        "created_at": transcript.created_at.isoformat(),
+        "updated_at": transcript.updated_at.isoformat(),
+    }
+
+
+def _parse_date_filter(value: Optional[str]) -> Optional[datetime]:
+    """Parse ISO date filter to naive UTC (memory store uses naive UTC)."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def record_memory_audit(
+    transcript_id: int,
+    action: str,
+    metadata: Optional[Dict[str, Any]] = None,
+    created_at: Optional[datetime] = None,
+) -> None:
+    """Record audit event in memory store (sanitized for privacy).
+    
+    Args:
+        transcript_id: Transcript ID
+        action: Action type
+        metadata: Metadata (counts/ids/format only)
+        created_at: Event time (default: now)
+    """
+    audit_metadata = sanitize_for_logging(metadata or {}, context="audit")
+    assert_no_content(audit_metadata, context="audit")
+    _MEMORY.record_audit(
+        transcript_id=transcript_id,
+        action=action,
+        metadata=audit_metadata,
+        created_at=created_at or datetime.utcnow(),
+    )
 
 
 def _has_db() -> bool:
@@ -182,25 +216,18 @@ def _list_transcripts_db(
         # Count total
         total = query.count()
         
-        # Get items
-        transcripts = query.order_by(Transcript.created_at.desc()).offset(offset).limit(limit).all()
+        # Get items (stats projection joined - no per-row segment queries)
+        rows = query.outerjoin(
+            TranscriptStats, TranscriptStats.transcript_id == Transcript.id
+        ).add_entity(TranscriptStats).order_by(
+            Transcript.created_at.desc()
+        ).offset(offset).limit(limit).all()
         
+        # Rows missing from the projection are computed from segments
+        resolved = resolve_stats(db, [(t.id, stats) for t, stats in rows])
         items = []
-        for t in transcripts:
-            # Get segments count
-            segments_count = db.query(func.count(TranscriptSegment.id)).filter(
-                TranscriptSegment.transcript_id == t.id
-            ).scalar() or 0
-            
-            # Get preview (first 240 chars from segments)
-            preview = ""
-            first_segments = db.query(TranscriptSegment).filter(
-                TranscriptSegment.transcript_id == t.id
-            ).order_by(TranscriptSegment.start_ms).limit(3).all()
-            if first_segments:
-                preview_text = " ".join(s.text for s in first_segments)
-                preview = preview_text[:240] + ("..." if len(preview_text) > 240 else "")
-            
+        for t, _ in rows:
+            transcript_stats = resolved[t.id]
             items.append({
                 "id": t.id,
                 "title": t.title,
@@ -210,8 +237,8 @@ def _list_transcripts_db(
                 "status": t.status,
                 "created_at": t.created_at.isoformat(),
                 "updated_at": t.updated_at.isoformat(),
-                "segments_count": segments_count,
-                "preview": preview,
+                "segments_count": transcript_stats["segments_count"],
+                "preview": transcript_stats["preview"],
             })
         
         return {
@@ -235,59 +262,28 @@ def _list_transcripts_memory(
     """List transcripts from memory store."""
     _seed_memory_store()
     
-    items = []
-    for t_id, t in _MEMORY_STORE.items():
-        # Filters
-        if status and t["status"] != status:
-            continue
-        if language and t["language"] != language:
-            continue
-        if source and t["source"] != source:
-            continue
-        
-        # Search
-        if q:
-            q_lower = q.lower()
-            if q_lower not in t["title"].lower():
-                # Check segments
-                found = False
-                for seg in _MEMORY_SEGMENTS.get(t_id, []):
-                    if q_lower in seg.get("speaker_label", "").lower() or q_lower in seg.get("text", "").lower():
-                        found = True
-                        break
-                if not found:
-                    continue
-        
-        items.append(t)
-    
-    # Sort by created_at desc
-    items.sort(key=lambda x: x["created_at"], reverse=True)
+    matches = _MEMORY.search(
+        q=q,
+        status=status,
+        language=language,
+        source=source,
+        date_from=_parse_date_filter(date_from),
+        date_to=_parse_date_filter(date_to),
+    )
     
     # Add segments_count and preview
     result_items = []
-    for t in items[offset:offset + limit]:
-        segments = _MEMORY_SEGMENTS.get(t["id"], [])
-        preview = ""
-        if segments:
-            preview_text = " ".join(s.get("text", "") for s in segments[:3])
-            preview = preview_text[:240] + ("..." if len(preview_text) > 240 else "")
-        
+    for t in matches[offset:offset + limit]:
+        segments = _MEMORY.segments.get(t.id, [])
         result_items.append({
-            "id": t["id"],
-            "title": t["title"],
-            "source": t["source"],
-            "language": t["language"],
-            "duration_seconds": t["duration_seconds"],
-            "status": t["status"],
-            "created_at": t["created_at"].isoformat(),
-            "updated_at": t["updated_at"].isoformat(),
+            **_memory_transcript_dict(t),
             "segments_count": len(segments),
-            "preview": preview,
+            "preview": build_preview(s.text for s in segments),
         })
     
     return {
         "items": result_items,
-        "total": len(items),
+        "total": len(matches),
         "limit": limit,
         "offset": offset,
     }
@@ -351,34 +347,24 @@ def _get_transcript_memory(transcript_id: int, include_segments: bool) -> Option
     """Get transcript from memory store."""
     _seed_memory_store()
     
-    transcript = _MEMORY_STORE.get(transcript_id)
+    transcript = _MEMORY.get(transcript_id)
     if not transcript:
         return None
     
-    result = {
-        "id": transcript["id"],
-        "title": transcript["title"],
-        "source": transcript["source"],
-        "language": transcript["language"],
-        "duration_seconds": transcript["duration_seconds"],
-        "status": transcript["status"],
-        "created_at": transcript["created_at"].isoformat(),
-        "updated_at": transcript["updated_at"].isoformat(),
-    }
+    result = _memory_transcript_dict(transcript)
     
     if include_segments:
-        segments = _MEMORY_SEGMENTS.get(transcript_id, [])
         result["segments"] = [
             {
-                "id": s["id"],
-                "start_ms": s["start_ms"],
-                "end_ms": s["end_ms"],
-                "speaker_label": s["speaker_label"],
-                "text": s["text"],
-                "confidence": s.get("confidence"),
-                "created_at": s["created_at"].isoformat(),
+                "id": s.id,
+                "start_ms": s.start_ms,
+                "end_ms": s.end_ms,
+                "speaker_label": s.speaker_label,
+                "text": s.text,
+                "confidence": s.confidence,
+                "created_at": s.created_at.isoformat(),
             }
-            for s in segments
+            for s in _MEMORY.segments.get(transcript_id, [])
         ]
     
     return result
@@ -464,48 +450,22 @@ def _create_transcript_memory(
     status: str,
 ) -> Dict[str, Any]:
     """Create transcript in memory store."""
-    global _NEXT_ID
     _seed_memory_store()
     
-    transcript_id = _NEXT_ID
-    _NEXT_ID += 1
-    
     now = datetime.utcnow()
-    transcript = {
-        "id": transcript_id,
-        "title": title,
-        "source": source,
-        "language": language,
-        "duration_seconds": duration_seconds,
-        "status": status,
-        "created_at": now,
-        "updated_at": now,
-    }
-    _MEMORY_STORE[transcript_id] = transcript
-    _MEMORY_SEGMENTS[transcript_id] = []
+    transcript = _MEMORY.add(
+        title=title,
+        source=source,
+        language=language,
+        duration_seconds=duration_seconds,
+        status=status,
+        created_at=now,
+    )
     
     # Audit event (sanitized for privacy)
-    audit_metadata = sanitize_for_logging({"title": title, "source": source}, context="audit")
-    assert_no_content(audit_metadata, context="audit")
-    _MEMORY_AUDIT.append({
-        "id": len(_MEMORY_AUDIT) + 1,
-        "transcript_id": transcript_id,
-        "action": "created",
-        "actor": "system",
-        "created_at": now,
-        "metadata_json": audit_metadata,
-    })
+    record_memory_audit(transcript.id, "created", {"title": title, "source": source}, created_at=now)
     
-    return {
-        "id": transcript["id"],
-        "title": transcript["title"],
-        "source": transcript["source"],
-        "language": transcript["language"],
-        "duration_seconds": transcript["duration_seconds"],
-        "status": transcript["status"],
-        "created_at": transcript["created_at"].isoformat(),
-        "updated_at": transcript["updated_at"].isoformat(),
-    }
+    return _memory_transcript_dict(transcript)
 
 
 def upsert_segments(transcript_id: int, segments: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -527,9 +487,13 @@ def upsert_segments(transcript_id: int, segments: List[Dict[str, Any]]) -> Dict[
     segments = sorted(segments, key=lambda x: x["start_ms"])
     
     if _has_db():
-        return _upsert_segments_db(transcript_id, segments)
+        result = _upsert_segments_db(transcript_id, segments)
     else:
-        return _upsert_segments_memory(transcript_id, segments)
+        result = _upsert_segments_memory(transcript_id, segments)
+    
+    # Cached exports are stale now
+    export_cache.invalidate(transcript_id)
+    return result
 
 
 def _upsert_segments_db(transcript_id: int, segments: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -544,6 +508,7 @@ def _upsert_segments_db(transcript_id: int, segments: List[Dict[str, Any]]) -> D
         db.query(TranscriptSegment).filter(TranscriptSegment.transcript_id == transcript_id).delete()
         
         # Insert new segments
+        rows = []
         for seg in segments:
             segment = TranscriptSegment(
                 transcript_id=transcript_id,
@@ -555,10 +520,28 @@ def _upsert_segments_db(transcript_id: int, segments: List[Dict[str, Any]]) -> D
                 created_at=datetime.utcnow(),
             )
             db.add(segment)
+            rows.append(segment)
+        
+        # Stats projection (same transaction as the segments)
+        write_stats(db, transcript_id, segments)
+        
+        # Project integrity manifest: segment leaves replaced (same transaction)
+        if transcript.project_id is not None:
+            from app.modules.projects import merkle
+            db.flush()
+            merkle.update(
+                db,
+                transcript.project_id,
+                set_leaves={f"transcripts/{transcript_id}/s{row.id}": merkle.segment_leaf(row.text) for row in rows},
+                remove_prefixes=[f"transcripts/{transcript_id}/s"],
+            )
         
         # Update transcript
         transcript.updated_at = datetime.utcnow()
         transcript.status = "ready"  # Auto-set to ready when segments added
+        if transcript.project_id is not None:
+            from app.modules.projects import activity
+            activity.record(db, transcript.project_id, at=transcript.updated_at)
         
         # Audit event (sanitized for privacy)
         audit_metadata = sanitize_for_logging({"segments_saved": len(segments)}, context="audit")
@@ -581,38 +564,18 @@ def _upsert_segments_memory(transcript_id: int, segments: List[Dict[str, Any]])
     """Upsert segments in memory store."""
     _seed_memory_store()
     
-    if transcript_id not in _MEMORY_STORE:
+    if _MEMORY.get(transcript_id) is None:
         raise ValueError(f"Transcript {transcript_id} not found")
     
-    # Replace all segments
-    _MEMORY_SEGMENTS[transcript_id] = []
-    for idx, seg in enumerate(segments, start=1):
-        _MEMORY_SEGMENTS[transcript_id].append({
-            "id": idx,
-            "transcript_id": transcript_id,
-            "start_ms": seg["start_ms"],
-            "end_ms": seg["end_ms"],
-            "speaker_label": seg["speaker_label"],
-            "text": seg["text"],
-            "confidence": seg.get("confidence"),
-            "created_at": datetime.utcnow(),
-        })
+    # Replace all segments (reindexes search tokens)
+    now = datetime.utcnow()
+    _MEMORY.replace_segments(transcript_id, segments, created_at=now)
     
     # Update transcript
-    _MEMORY_STORE[transcript_id]["updated_at"] = datetime.utcnow()
-    _MEMORY_STORE[transcript_id]["status"] = "ready"
+    _MEMORY.set_status(transcript_id, "ready", updated_at=now)
     
     # Audit event (sanitized for privacy)
-    audit_metadata = sanitize_for_logging({"segments_saved": len(segments)}, context="audit")
-    assert_no_content(audit_metadata, context="audit")
-    _MEMORY_AUDIT.append({
-        "id": len(_MEMORY_AUDIT) + 1,
-        "transcript_id": transcript_id,
-        "action": "segments_upserted",
-        "actor": "system",
-        "created_at": datetime.utcnow(),
-        "metadata_json": audit_metadata,
-    })
+    record_memory_audit(transcript_id, "segments_upserted", {"segments_saved": len(segments)}, created_at=now)
     
     return {"status": "ok", "segments_saved": len(segments)}
 
@@ -634,6 +597,8 @@ def delete_transcript(transcript_id: int) -> Dict[str, Any]:
     else:
         _delete_transcript_memory(transcript_id, receipt_id, deleted_at)
     
+    export_cache.invalidate(transcript_id)
+    
     return {
         "status": "deleted",
         "receipt_id": receipt_id,
@@ -642,12 +607,31 @@ def delete_transcript(transcript_id: int) -> Dict[str, Any]:
 
 
 def _delete_transcript_db(transcript_id: int, receipt_id: str, deleted_at: datetime) -> None:
-    """Delete transcript from database."""
+    """Delete transcript from database (audio blobs released, shredded if unshared)."""
+    from app.modules.projects import blob_store
+    from app.modules.record.models import AudioAsset
+    
     with get_db() as db:
         transcript = db.query(Transcript).filter(Transcript.id == transcript_id).first()
         if not transcript:
             raise ValueError(f"Transcript {transcript_id} not found")
         
+        # Release audio blob references (asset rows go with CASCADE)
+        sha256_values = [
+            row.sha256
+            for row in db.query(AudioAsset.sha256).filter(
+                AudioAsset.transcript_id == transcript_id,
+                AudioAsset.destroy_status != "destroyed",
+            )
+        ]
+        for sha256 in sha256_values:
+            blob_store.release(db, sha256)
+        
+        # Drop segments and audio from the project integrity manifest and activity counts
+        from app.modules.projects import activity, merkle
+        merkle.remove_transcripts(db, [transcript_id])
+        activity.remove_transcripts(db, [transcript_id])
+        
         # Audit event (before delete)
         audit = TranscriptAuditEvent(
             transcript_id=transcript_id,
@@ -661,29 +645,19 @@ def _delete_transcript_db(transcript_id: int, receipt_id: str, deleted_at: datet
         # Hard delete (CASCADE will delete segments and audit events)
         db.delete(transcript)
         db.commit()
+    
+    blob_store.collect(sha256_values)
 
 
 def _delete_transcript_memory(transcript_id: int, receipt_id: str, deleted_at: datetime) -> None:
     """Delete transcript from memory store."""
     _seed_memory_store()
     
-    if transcript_id not in _MEMORY_STORE:
+    if _MEMORY.get(transcript_id) is None:
         raise ValueError(f"Transcript {transcript_id} not found")
     
     # Audit event (sanitized for privacy)
-    audit_metadata = sanitize_for_logging({"receipt_id": receipt_id, "mode": "hard"}, context="audit")
-    assert_no_content(audit_metadata, context="audit")
-    _MEMORY_AUDIT.append({
-        "id": len(_MEMORY_AUDIT) + 1,
-        "transcript_id": transcript_id,
-        "action": "deleted",
-        "actor": "system",
-        "created_at": deleted_at,
-        "metadata_json": audit_metadata,
-    })
+    record_memory_audit(transcript_id, "deleted", {"receipt_id": receipt_id, "mode": "hard"}, created_at=deleted_at)
     
     # Hard delete
-    del _MEMORY_STORE[transcript_id]
-    if transcript_id in _MEMORY_SEGMENTS:
-        del _MEMORY_SEGMENTS[transcript_id]
-
+    _MEMORY.delete(transcript_id)
@@ -0,0 +1,184 @@
+"""Transcript statistics projection (transcript_stats).
+
+Derived values (segment count, total characters, average confidence, preview,
+last segment end) are computed once when segments are written, in the same
+transaction, so readers fetch one row instead of scanning transcript_segments.
+
+Rows are removed together with the transcript (FK CASCADE / ORM cascade).
+Migration 008 backfills a row for every existing transcript. A transcript
+that still lacks one is computed from its segments on read (resolve_stats())
+until `python -m app.modules.transcripts.stats_backfill` fills it in.
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.modules.transcripts.models import Transcript, TranscriptSegment, TranscriptStats
+
+
+# Preview: first N segments, truncated to N chars
+PREVIEW_SEGMENTS = 3
+PREVIEW_CHARS = 240
+
+
+def build_preview(texts: Iterable[str]) -> str:
+    """Build listing preview from segment texts (ordered by start_ms).
+
+    Args:
+        texts: Segment texts
+
+    Returns:
+        Preview (max PREVIEW_CHARS, "..." appended when truncated)
+    """
+    preview_text = " ".join(list(texts)[:PREVIEW_SEGMENTS])
+    return preview_text[:PREVIEW_CHARS] + ("..." if len(preview_text) > PREVIEW_CHARS else "")
+
+
+def compute_stats(segments: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Compute statistics for a transcript's segments.
+
+    Args:
+        segments: Segment dicts sorted by start_ms (text, end_ms, confidence)
+
+    Returns:
+        Dict with segments_count, total_chars, avg_confidence, preview, last_segment_end_ms
+    """
+    confidences = [s["confidence"] for s in segments if s.get("confidence") is not None]
+    return {
+        "segments_count": len(segments),
+        "total_chars": sum(len(s["text"]) for s in segments),
+        "avg_confidence": sum(confidences) / len(confidences) if confidences else None,
+        "preview": build_preview(s["text"] for s in segments),
+        "last_segment_end_ms": max((s["end_ms"] for s in segments), default=None),
+    }
+
+
+def write_stats(db: Session, transcript_id: int, segments: List[Dict[str, Any]]) -> TranscriptStats:
+    """Insert or update the stats row (caller commits).
+
+    Args:
+        db: Database session (same transaction as the segment write)
+        transcript_id: Transcript ID
+        segments: Segment dicts sorted by start_ms
+
+    Returns:
+        Stats row
+    """
+    values = compute_stats(segments)
+    row = db.get(TranscriptStats, transcript_id)
+    if row is None:
+        row = TranscriptStats(transcript_id=transcript_id)
+        db.add(row)
+    for key, value in values.items():
+        setattr(row, key, value)
+    row.updated_at = datetime.utcnow()
+    return row
+
+
+def empty_stats() -> Dict[str, Any]:
+    """Stats for a transcript without segments (or without a stats row)."""
+    return compute_stats([])
+
+
+def stats_dict(row: Optional[TranscriptStats]) -> Dict[str, Any]:
+    """Stats row as dict (empty stats if row is missing).
+
+    Args:
+        row: Stats row or None
+
+    Returns:
+        Dict with segments_count, total_chars, avg_confidence, preview, last_segment_end_ms
+    """
+    if row is None:
+        return empty_stats()
+    return {
+        "segments_count": row.segments_count,
+        "total_chars": row.total_chars,
+        "avg_confidence": row.avg_confidence,
+        "preview": row.preview,
+        "last_segment_end_ms": row.last_segment_end_ms,
+    }
+
+
+def _load_segments(db: Session, transcript_ids: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+    """Segment dicts per transcript, sorted by start_ms (one query)."""
+    segments_by_transcript: Dict[int, List[Dict[str, Any]]] = {tid: [] for tid in transcript_ids}
+    rows = db.query(
+        TranscriptSegment.transcript_id,
+        TranscriptSegment.text,
+        TranscriptSegment.end_ms,
+        TranscriptSegment.confidence,
+    ).filter(
+        TranscriptSegment.transcript_id.in_(transcript_ids)
+    ).order_by(TranscriptSegment.transcript_id, TranscriptSegment.start_ms).all()
+    for transcript_id, text, end_ms, confidence in rows:
+        segments_by_transcript[transcript_id].append(
+            {"text": text, "end_ms": end_ms, "confidence": confidence}
+        )
+    return segments_by_transcript
+
+
+def resolve_stats(
+    db: Session,
+    rows: Iterable[Tuple[int, Optional[TranscriptStats]]],
+) -> Dict[int, Dict[str, Any]]:
+    """Stats for transcripts from their projection rows, computed where a row is missing.
+
+    Args:
+        db: Database session
+        rows: (transcript_id, stats row or None) - e.g. from an outer join
+
+    Returns:
+        Dict transcript_id -> stats dict
+    """
+    resolved: Dict[int, Dict[str, Any]] = {}
+    missing: List[int] = []
+    for transcript_id, row in rows:
+        if row is None:
+            missing.append(transcript_id)
+        else:
+            resolved[transcript_id] = stats_dict(row)
+    if missing:
+        for transcript_id, segments in _load_segments(db, missing).items():
+            resolved[transcript_id] = compute_stats(segments)
+    return resolved
+
+
+def backfill_stats(db: Session, batch_size: int = 500, only_missing: bool = True) -> Dict[str, int]:
+    """Recompute stats rows from transcript_segments.
+
+    Works in batches of transcripts (one segment query per batch) and commits
+    per batch, so it can be interrupted and re-run.
+
+    Args:
+        db: Database session
+        batch_size: Transcripts per batch
+        only_missing: Only transcripts without a stats row
+
+    Returns:
+        Dict with transcripts_processed and batches
+    """
+    processed = 0
+    batches = 0
+    last_id = 0
+
+    while True:
+        query = db.query(Transcript.id).filter(Transcript.id > last_id)
+        if only_missing:
+            query = query.outerjoin(
+                TranscriptStats, TranscriptStats.transcript_id == Transcript.id
+            ).filter(TranscriptStats.transcript_id.is_(None))
+        ids = [row[0] for row in query.order_by(Transcript.id).limit(batch_size).all()]
+        if not ids:
+            break
+
+        for transcript_id, segments in _load_segments(db, ids).items():
+            write_stats(db, transcript_id, segments)
+        db.commit()
+
+        processed += len(ids)
+        batches += 1
+        last_id = ids[-1]
+
+    return {"transcripts_processed": processed, "batches": batches}
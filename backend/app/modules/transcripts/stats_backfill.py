@@ -0,0 +1,80 @@
+"""CLI entrypoint for transcript_stats backfill.
+
+Usage:
+    python -m app.modules.transcripts.stats_backfill [--all] [--batch-size N]
+
+This is a standalone CLI tool - not part of the API.
+Migration 008 backfills existing transcripts; the default run only fills
+transcripts still without a row. --all rebuilds every row.
+"""
+import argparse
+import sys
+
+from app.core.config import settings
+from app.core.database import get_db, init_db
+from app.core.logging import logger
+from app.modules.transcripts.stats import backfill_stats
+
+
+def main() -> int:
+    """CLI entrypoint for stats backfill.
+
+    Returns:
+        0 on success, 1 on error
+    """
+    parser = argparse.ArgumentParser(
+        description="Backfill transcript statistics (transcript_stats)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Fill in transcripts without a stats row
+  python -m app.modules.transcripts.stats_backfill
+
+  # Rebuild all stats rows
+  python -m app.modules.transcripts.stats_backfill --all
+        """,
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Recompute every transcript (default: only transcripts without stats)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="Transcripts per batch/commit (default: 500)",
+    )
+
+    args = parser.parse_args()
+
+    try:
+        if not settings.database_url:
+            print("Error: DATABASE_URL not set", file=sys.stderr)
+            return 1
+        init_db(settings.database_url)
+
+        logger.info("stats_backfill_started", extra={"rebuild_all": args.all})
+
+        with get_db() as db:
+            result = backfill_stats(db, batch_size=args.batch_size, only_missing=not args.all)
+
+        print("Stats backfill complete:")
+        print(f"  Transcripts processed: {result['transcripts_processed']}")
+        print(f"  Batches: {result['batches']}")
+
+        logger.info("stats_backfill_complete", extra=result)
+        return 0
+
+    except KeyboardInterrupt:
+        logger.warning("stats_backfill_interrupted")
+        return 130  # Standard exit code for SIGINT
+    except Exception as e:
+        error_type = type(e).__name__
+        logger.error("stats_backfill_failed", extra={"error_type": error_type})
+        print(f"Error: {error_type}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""Tests for transcript export artifact cache."""
+import pytest
+
+from app.modules.transcripts import export_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    export_cache.clear()
+    yield
+    export_cache.clear()
+
+
+class TestExportCache:
+    """Test cache keying, invalidation and budget."""
+    
+    def test_hit_same_version(self):
+        """Test cache hit for same transcript version and format."""
+        stored = export_cache.put(1, "v1", "srt", {"format": "srt", "content": "x"})
+        cached = export_cache.get(1, "v1", "srt")
+        assert cached is not None
+        assert cached.etag == stored.etag
+    
+    def test_miss_other_version_or_format(self):
+        """Test cache miss for new version or other format."""
+        export_cache.put(1, "v1", "srt", {"format": "srt", "content": "x"})
+        assert export_cache.get(1, "v2", "srt") is None
+        assert export_cache.get(1, "v1", "vtt") is None
+    
+    def test_new_version_drops_old(self):
+        """Test that storing a new version evicts older versions."""
+        export_cache.put(1, "v1", "srt", {"format": "srt", "content": "x"})
+        export_cache.put(1, "v2", "srt", {"format": "srt", "content": "y"})
+        assert export_cache.get(1, "v1", "srt") is None
+        assert export_cache.stats()["entries"] == 1
+    
+    def test_invalidate(self):
+        """Test invalidation drops all formats of a transcript only."""
+        export_cache.put(1, "v1", "srt", {"format": "srt", "content": "x"})
+        export_cache.put(1, "v1", "vtt", {"format": "vtt", "content": "x"})
+        export_cache.put(2, "v1", "srt", {"format": "srt", "content": "x"})
+        export_cache.invalidate(1)
+        assert export_cache.get(1, "v1", "srt") is None
+        assert export_cache.get(1, "v1", "vtt") is None
+        assert export_cache.get(2, "v1", "srt") is not None
+    
+    def test_entry_budget(self, monkeypatch):
+        """Test LRU eviction when entry budget is exceeded."""
+        monkeypatch.setattr(export_cache, "_MAX_ENTRIES", 2)
+        export_cache.put(1, "v1", "srt", {"content": "a"})
+        export_cache.put(2, "v1", "srt", {"content": "b"})
+        export_cache.get(1, "v1", "srt")  # Touch 1 -> 2 is least recent
+        export_cache.put(3, "v1", "srt", {"content": "c"})
+        assert export_cache.get(2, "v1", "srt") is None
+        assert export_cache.get(1, "v1", "srt") is not None
+
+
+class TestETag:
+    """Test ETag computation and If-None-Match matching."""
+    
+    def test_etag_depends_on_content(self):
+        """Test ETag changes when rendered content changes."""
+        a = export_cache.compute_etag(1, "srt", {"content": "a"})
+        b = export_cache.compute_etag(1, "srt", {"content": "b"})
+        assert a != b
+        assert a.startswith('"') and a.endswith('"')
+    
+    def test_if_none_match(self):
+        """Test If-None-Match list, weak and wildcard matching."""
+        etag = export_cache.compute_etag(1, "srt", {"content": "a"})
+        assert export_cache.etag_matches(etag, etag)
+        assert export_cache.etag_matches(f'"other", W/{etag}', etag)
+        assert export_cache.etag_matches("*", etag)
+        assert not export_cache.etag_matches('"other"', etag)
+        assert not export_cache.etag_matches(None, etag)
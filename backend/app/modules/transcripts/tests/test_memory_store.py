@@ -0,0 +1,101 @@
+"""Tests for indexed in-memory transcript store (no-DB mode)."""
+from datetime import datetime, timedelta
+
+from app.modules.transcripts.memory_store import MemoryTranscriptStore
+
+
+def _store() -> MemoryTranscriptStore:
+    store = MemoryTranscriptStore(audit_capacity=3)
+    base = datetime(2025, 1, 1)
+    t1 = store.add("Intervju: Kommunalrådet", "interview", "sv", 60, "ready", base)
+    store.add("Presskonferens Polisen", "meeting", "sv", 30, "uploaded", base + timedelta(days=1))
+    t3 = store.add("Council meeting", "meeting", "en", None, "ready", base + timedelta(days=2))
+    store.replace_segments(t1.id, [
+        {"start_ms": 0, "end_ms": 10, "speaker_label": "SPEAKER_1", "text": "Vi har inget val."},
+    ], created_at=base)
+    store.replace_segments(t3.id, [
+        {"start_ms": 0, "end_ms": 10, "speaker_label": "CHAIR", "text": "The budget vote passed."},
+    ], created_at=base)
+    return store
+
+
+class TestMemoryStoreSearch:
+    """Test filtering, ordering and search."""
+    
+    def test_order_newest_first(self):
+        """Test results are ordered by created_at desc."""
+        store = _store()
+        assert [t.id for t in store.search()] == [3, 2, 1]
+    
+    def test_secondary_indexes(self):
+        """Test status/language/source filters."""
+        store = _store()
+        assert [t.id for t in store.search(status="ready")] == [3, 1]
+        assert [t.id for t in store.search(language="en")] == [3]
+        assert [t.id for t in store.search(source="meeting", status="ready")] == [3]
+        assert store.search(source="unknown") == []
+    
+    def test_q_substring_semantics(self):
+        """Test q matches case-insensitive substrings in title, speaker and text."""
+        store = _store()
+        assert [t.id for t in store.search(q="KOMMUNAL")] == [1]
+        assert [t.id for t in store.search(q="chair")] == [3]
+        assert [t.id for t in store.search(q="budget vote")] == [3]
+        assert [t.id for t in store.search(q="inget val.")] == [1]
+        assert store.search(q="vote budget") == []
+    
+    def test_date_range(self):
+        """Test created_at range uses ordering index."""
+        store = _store()
+        base = datetime(2025, 1, 1)
+        ids = [t.id for t in store.search(date_from=base + timedelta(hours=1), date_to=base + timedelta(days=1))]
+        assert ids == [2]
+    
+    def test_reindex_on_segment_replace(self):
+        """Test token index follows segment replacement."""
+        store = _store()
+        store.replace_segments(3, [
+            {"start_ms": 0, "end_ms": 10, "speaker_label": "CHAIR", "text": "Adjourned."},
+        ], created_at=datetime(2025, 1, 5))
+        assert store.search(q="budget") == []
+        assert [t.id for t in store.search(q="adjourn")] == [3]
+    
+    def test_status_update_and_delete(self):
+        """Test indexes stay consistent on status change and delete."""
+        store = _store()
+        store.set_status(2, "ready", updated_at=datetime(2025, 1, 5))
+        assert [t.id for t in store.search(status="ready")] == [3, 2, 1]
+        store.delete(3)
+        assert [t.id for t in store.search(status="ready")] == [2, 1]
+        assert store.search(q="budget") == []
+        assert [t.id for t in store.search()] == [2, 1]
+    
+    def test_q_inner_words_exact_outer_partial(self):
+        """Test inner query words must be whole tokens, outer ones may be partial."""
+        store = _store()
+        assert [t.id for t in store.search(q="he budget vo")] == [3]
+        assert store.search(q="the budge vote") == []
+        assert [t.id for t in store.search(q="ar inget va")] == [1]
+        assert [t.id for t in store.search(q="er_1")] == [1]
+        assert [t.id for t in store.search(q="RÅ")] == [1]  # Shorter than a trigram
+    
+    def test_gram_index_follows_vocabulary(self):
+        """Test trigram map drops tokens no transcript uses anymore."""
+        store = _store()
+        assert "budget" in store._grams["bud"]
+        store.delete(3)
+        assert "bud" not in store._grams
+        assert all("budget" not in tokens for tokens in store._grams.values())
+        assert store.search(q="udge") == []
+
+
+class TestMemoryStoreAudit:
+    """Test bounded audit ring buffer."""
+    
+    def test_ring_buffer_bounded(self):
+        """Test oldest audit events are dropped at capacity."""
+        store = _store()
+        for i in range(5):
+            store.record_audit(1, "exported", {"format": "srt"}, created_at=datetime(2025, 1, 1))
+        assert len(store.audit) == 3
+        assert [e.id for e in store.audit] == [3, 4, 5]
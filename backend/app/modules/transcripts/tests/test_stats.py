@@ -0,0 +1,115 @@
+"""Tests for transcript_stats projection."""
+from datetime import date, datetime
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core import database
+from app.core.database import Base
+from app.modules.autonomy_guard.checks import check_project
+from app.modules.projects import models as _project_models  # noqa: F401 - FK targets
+from app.modules.projects.models import Project
+from app.modules.transcripts import service
+from app.modules.transcripts.models import Transcript, TranscriptSegment, TranscriptStats
+from app.modules.transcripts.stats import backfill_stats, compute_stats
+
+
+def _session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)()
+
+
+def _add_transcript(db, segment_texts):
+    now = datetime(2025, 1, 1)
+    transcript = Transcript(title="t", source="interview", language="sv", status="ready", created_at=now, updated_at=now)
+    db.add(transcript)
+    db.flush()
+    for idx, text in enumerate(segment_texts):
+        db.add(TranscriptSegment(
+            transcript_id=transcript.id,
+            start_ms=idx * 1000,
+            end_ms=idx * 1000 + 900,
+            speaker_label="SPEAKER_1",
+            text=text,
+            confidence=0.5 + idx * 0.1,
+            created_at=now,
+        ))
+    db.commit()
+    return transcript.id
+
+
+class TestComputeStats:
+    """Test stats computation."""
+
+    def test_empty(self):
+        """Test transcript without segments."""
+        assert compute_stats([]) == {
+            "segments_count": 0,
+            "total_chars": 0,
+            "avg_confidence": None,
+            "preview": "",
+            "last_segment_end_ms": None,
+        }
+
+    def test_values(self):
+        """Test counts, confidence (ignoring None) and preview truncation."""
+        segments = [
+            {"text": "a" * 200, "end_ms": 10, "confidence": 0.6},
+            {"text": "b" * 100, "end_ms": 20, "confidence": None},
+            {"text": "c", "end_ms": 30, "confidence": 0.8},
+            {"text": "d", "end_ms": 40},
+        ]
+        stats = compute_stats(segments)
+        assert stats["segments_count"] == 4
+        assert stats["total_chars"] == 302
+        assert abs(stats["avg_confidence"] - 0.7) < 1e-9
+        assert stats["preview"] == ("a" * 200 + " " + "b" * 39) + "..."
+        assert stats["last_segment_end_ms"] == 40
+
+
+class TestBackfill:
+    """Test backfill and cascade."""
+
+    def test_backfill_missing_rows(self):
+        """Test backfill fills every transcript once, in batches."""
+        db = _session()
+        first = _add_transcript(db, ["hej", "då"])
+        _add_transcript(db, [])
+        _add_transcript(db, ["x"])
+
+        result = backfill_stats(db, batch_size=2)
+        assert result == {"transcripts_processed": 3, "batches": 2}
+        assert db.get(TranscriptStats, first).total_chars == 5
+        assert backfill_stats(db)["transcripts_processed"] == 0
+
+    def test_deleted_with_transcript(self):
+        """Test stats row is removed with its transcript."""
+        db = _session()
+        transcript_id = _add_transcript(db, ["hej"])
+        backfill_stats(db)
+        db.delete(db.get(Transcript, transcript_id))
+        db.commit()
+        assert db.query(TranscriptStats).count() == 0
+
+
+class TestMissingRow:
+    """Test readers compute stats for transcripts without a projection row."""
+
+    def test_list_and_checks_use_segments(self, sqlite_db):
+        """Test listing and autonomy checks report real counts, not 0, without a stats row."""
+        with database.get_db() as db:
+            now = datetime(2025, 1, 1)
+            db.add(Project(name="p", sensitivity="standard", status="active", start_date=date.today(), created_at=now, updated_at=now))
+            db.flush()
+            transcript_id = _add_transcript(db, ["x" * 80, "y" * 40])
+            db.query(Transcript).filter(Transcript.id == transcript_id).update({"project_id": 1})
+            db.commit()
+            assert db.query(TranscriptStats).count() == 0
+
+        item = service.list_transcripts()["items"][0]
+        assert item["segments_count"] == 2
+        assert item["preview"] == "x" * 80 + " " + "y" * 40
+        messages = [check["message"] for check in check_project(1)]
+        assert not any("ovanligt kort" in message for message in messages)
+        assert any("låg genomsnittlig konfidens (55.0%)" in message for message in messages)
@@ -4,6 +4,7 @@ import os
 from fastapi import APIRouter
 
 from app.core.config import settings
+from app.modules.projects import scrubber, storage_async
 
 router = APIRouter()
 
@@ -13,11 +14,14 @@ async def meta() -> dict:
     """Meta information endpoint.
 
     Returns:
-        Version, build, and commit information
+        Version, build, and commit information, storage I/O timings,
+        integrity scrubber progress
     """
     return {
         "version": settings.app_version,
         "build": os.getenv("BUILD_ID", "local"),
         "commit": os.getenv("GIT_COMMIT", "unknown"),
+        "storage_io": storage_async.stats(),
+        "integrity_scrubber": scrubber.progress(),
     }
 
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Benchmark project list counts: per-project queries vs grouped aggregation vs projection.
+
+Builds a fixture of 1,000 projects (notes, files, transcripts) in SQLite and
+times one list page three ways, counting SQL statements and sessions:
+per-project queries, grouped aggregation (projects without a project_activity
+row) and the project_activity projection.
+
+Usage:
+    python scripts/bench_project_counts.py [--projects N] [--page-size N] [--db PATH]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.core import database  # noqa: E402
+from app.modules.projects import activity  # noqa: E402
+from app.modules.projects.counts import get_project_counts  # noqa: E402
+from app.modules.projects.models import Project, ProjectFile, ProjectNote  # noqa: E402
+from app.modules.record.models import AudioAsset  # noqa: E402,F401 - registers audio_assets table
+from app.modules.transcripts.models import Transcript  # noqa: E402
+
+
+def build_fixture(engine, projects: int) -> None:
+    """Insert projects with 0-4 notes, 0-2 files and 0-6 transcripts each."""
+    database.Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    now = datetime.utcnow()
+    rows = []
+    for i in range(projects):
+        rows.append(Project(
+            name=f"Projekt {i}", sensitivity="standard", status="active",
+            start_date=date.today(), created_at=now - timedelta(days=i), updated_at=now - timedelta(days=i),
+        ))
+    session.add_all(rows)
+    session.flush()
+    for i, project in enumerate(rows):
+        stamp = now - timedelta(hours=i)
+        for n in range(i % 5):
+            session.add(ProjectNote(project_id=project.id, title="n", body_text="x", note_integrity_hash="0" * 64, created_at=stamp, updated_at=stamp))
+        for n in range(i % 3):
+            session.add(ProjectFile(
+                project_id=project.id, original_filename="f.pdf", sha256=f"{i:032x}{n:032x}", mime_type="application/pdf",
+                size_bytes=1024, storage_path="x", created_at=stamp,
+            ))
+        for n in range(i % 7):
+            session.add(Transcript(title="t", source="interview", language="sv", status="ready", project_id=project.id, created_at=stamp, updated_at=stamp))
+    session.commit()
+    session.close()
+
+
+def legacy_counts(project_id: int) -> dict:
+    """Previous implementation: new session, eight queries per project."""
+    with database.get_db() as db:
+        transcripts_count = db.query(Transcript).filter(Transcript.project_id == project_id).count()
+        notes_count = db.query(ProjectNote).filter(ProjectNote.project_id == project_id).count()
+        files_count = db.query(ProjectFile).filter(ProjectFile.project_id == project_id).count()
+        last_activity = db.query(Project).filter(Project.id == project_id).first().updated_at
+        note = db.query(ProjectNote).filter(ProjectNote.project_id == project_id).order_by(ProjectNote.updated_at.desc()).first()
+        if note and note.updated_at > last_activity:
+            last_activity = note.updated_at
+        file = db.query(ProjectFile).filter(ProjectFile.project_id == project_id).order_by(ProjectFile.created_at.desc()).first()
+        if file and file.created_at > last_activity:
+            last_activity = file.created_at
+        transcript = db.query(Transcript).filter(Transcript.project_id == project_id).order_by(Transcript.updated_at.desc()).first()
+        if transcript and transcript.updated_at > last_activity:
+            last_activity = transcript.updated_at
+        return {
+            "transcripts_count": transcripts_count,
+            "notes_count": notes_count,
+            "files_count": files_count,
+            "last_activity_at": last_activity.isoformat(),
+        }
+
+
+def _page_counts(page) -> dict:
+    legacy_keys = ("transcripts_count", "notes_count", "files_count", "last_activity_at")
+    with database.get_db() as db:
+        counts = get_project_counts(db, page)
+    return {project_id: {key: values[key] for key in legacy_keys} for project_id, values in counts.items()}
+
+
+def _rebuild_projection() -> None:
+    with database.get_db() as db:
+        activity.rebuild(db)
+        db.commit()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=1000, help="Projects in fixture (default: 1000)")
+    parser.add_argument("--page-size", type=int, default=200, help="Projects per list page (default: 200, API max)")
+    parser.add_argument("--db", help="SQLite file (default: temp file)")
+    args = parser.parse_args()
+
+    path = args.db or os.path.join(tempfile.mkdtemp(), "bench.sqlite3")
+    engine = create_engine(f"sqlite:///{path}")
+    database.engine = engine
+    database.SessionLocal = sessionmaker(bind=engine)
+    build_fixture(engine, args.projects)
+
+    statements = {"count": 0}
+    sessions = {"count": 0}
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count_statement(*_):
+        statements["count"] += 1
+
+    @event.listens_for(database.SessionLocal, "after_begin")
+    def _count_session(*_):
+        sessions["count"] += 1
+
+    with database.get_db() as db:
+        page = db.query(Project).order_by(Project.created_at.desc()).limit(args.page_size).all()
+        db.expunge_all()
+
+    results = {}
+    for name, run in (
+        ("per-project", lambda: {p.id: legacy_counts(p.id) for p in page}),
+        ("grouped", lambda: _page_counts(page)),
+        ("projection", lambda: _page_counts(page)),
+    ):
+        if name == "projection":
+            _rebuild_projection()
+        statements["count"] = sessions["count"] = 0
+        started = time.perf_counter()
+        results[name] = run()
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"{name:12} {elapsed:8.1f} ms  {statements['count']:5} statements  {sessions['count']:4} sessions")
+
+    if not results["per-project"] == results["grouped"] == results["projection"]:
+        print("ERROR: results differ", file=sys.stderr)
+        return 1
+    print(f"OK: identical counts for {len(page)} projects ({args.projects} in fixture)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
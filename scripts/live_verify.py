@@ -337,11 +337,25 @@ def test_record_live(project_ids: Dict[str, Any]) -> Dict[str, Any]:
             },
             timeout=30,
         )
-        if response.status_code != 200:
+        if response.status_code != 202:
             log_fail(f"Export returned {response.status_code}", response.text)
         data = response.json()
-        if data["status"] != "ok":
-            log_fail("Export status is not 'ok'")
+        if data["status"] != "queued":
+            log_fail("Export status is not 'queued'")
+        
+        # Export is built by a background job - poll status until done
+        package_id = data["package_id"]
+        for _ in range(60):
+            status_response = session.get(
+                f"{BACKEND_URL}/api/v1/record/export/{package_id}/status",
+                timeout=10,
+            )
+            data = status_response.json()
+            if data["status"] in ("done", "failed"):
+                break
+            time.sleep(0.5)
+        if data["status"] != "done":
+            log_fail(f"Export job did not finish: {data['status']}", data.get("error_type"))
         if data["audio_mode"] != "encrypted":
             log_fail(f"Export audio_mode is not 'encrypted': {data['audio_mode']}")
         if "zip_path" not in data:
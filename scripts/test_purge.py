@@ -81,7 +81,16 @@ def export_record(transcript_id: int) -> dict:
         },
     )
     response.raise_for_status()
-    result = response.json()
+    package_id = response.json()["package_id"]
+    
+    # Export is built by a background job - poll status until done
+    for _ in range(60):
+        result = requests.get(f"{BACKEND_URL}/api/v1/record/export/{package_id}/status").json()
+        if result["status"] in ("done", "failed"):
+            break
+        time.sleep(0.5)
+    if result["status"] != "done":
+        raise RuntimeError(f"Export job did not finish: {result['status']}")
     print(f"✅ Exported: package_id={result['package_id']}, zip_path={result['zip_path']}")
     return result
 